@@ -0,0 +1,33 @@
+"""add_content_and_chunk_hashes
+
+Revision ID: 3c7a9e21b4f8
+Revises: d9a4adacfa57
+Create Date: 2026-10-16 10:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7a9e21b4f8'
+down_revision: Union[str, Sequence[str], None] = 'd9a4adacfa57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add document and per-chunk content hashes to content."""
+    op.add_column('content', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('content', sa.Column('chunk_hashes', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.create_index(op.f('ix_content_content_hash'), 'content', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Remove content hash columns."""
+    op.drop_index(op.f('ix_content_content_hash'), table_name='content')
+    op.drop_column('content', 'chunk_hashes')
+    op.drop_column('content', 'content_hash')
@@ -0,0 +1,7 @@
+"""
+Performance benchmarks for the TellMeMo backend.
+
+Run from backend/:
+    python -m benchmarks.bench_ingestion --help
+    python -m benchmarks.bench_two_stage --help
+"""
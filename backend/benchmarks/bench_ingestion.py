@@ -0,0 +1,344 @@
+"""
+Ingestion hot-path benchmark.
+
+Stages (input: transcripts in test_data/, scaled to --target-words):
+- chunking:             ChunkingService.chunk_text
+- intelligent_chunking: IntelligentChunkingService.chunk_meeting_content
+- speaker_turns:        AdvancedTranscriptProcessor._extract_speaker_turns on a synthetic
+                        --num-turns transcript (default 5,000 turns)
+- embeddings:           EmbeddingService.generate_embeddings_batch (batch-size sweep)
+- qdrant_insert:        MultiTenantVectorStore.insert_vectors on Qdrant :memory: (batch-size sweep)
+
+Each stage runs in a fresh process by default so peak RSS is per stage.
+
+Usage (from backend/):
+    python -m benchmarks.bench_ingestion
+    python -m benchmarks.bench_ingestion --stages chunking,qdrant_insert --output results/bench.json
+    python -m benchmarks.bench_ingestion --compare results/bench_main.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from benchmarks.common import (
+    BACKEND_DIR,
+    LatencyRecorder,
+    compare_reports,
+    load_transcripts,
+    peak_rss_mb,
+    pick_best_batch_size,
+    run_metadata,
+    scale_transcript,
+    write_report,
+)
+
+STAGES = ("chunking", "intelligent_chunking", "speaker_turns", "embeddings", "qdrant_insert")
+DEFAULT_OUTPUT = BACKEND_DIR / "benchmarks" / "results" / "ingestion.json"
+
+
+def _build_documents(options: Dict[str, Any]) -> List[str]:
+    """Scaled transcripts used as benchmark input."""
+    transcripts = load_transcripts()
+    return [
+        scale_transcript(text, options["target_words"])
+        for text in transcripts.values()
+    ]
+
+
+def _build_chunk_texts(options: Dict[str, Any]) -> List[str]:
+    """Chunk texts (as produced at ingest) for embedding/insert stages."""
+    from services.rag.chunking_service import ChunkingService
+
+    chunker = ChunkingService(
+        chunk_size_words=options["chunk_size_words"],
+        overlap_words=options["chunk_overlap_words"]
+    )
+    texts = [
+        chunk.text
+        for document in _build_documents(options)
+        for chunk in chunker.chunk_text(document)
+    ]
+    # Repeat to reach the requested corpus size
+    while len(texts) < options["num_texts"]:
+        texts.extend(texts[:options["num_texts"] - len(texts)])
+    return texts[:options["num_texts"]]
+
+
+# ============================================================================
+# Stages
+# ============================================================================
+
+async def bench_chunking(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark ChunkingService.chunk_text per document."""
+    from services.rag.chunking_service import ChunkingService
+
+    chunker = ChunkingService(
+        chunk_size_words=options["chunk_size_words"],
+        overlap_words=options["chunk_overlap_words"]
+    )
+    documents = _build_documents(options)
+
+    recorder = LatencyRecorder()
+    chunk_count = 0
+    for _ in range(options["iterations"]):
+        for document in documents:
+            with recorder.measure(items=1):
+                chunks = chunker.chunk_text(document)
+            chunk_count += len(chunks)
+
+    summary = recorder.summary()
+    summary["chunks_per_document"] = round(chunk_count / max(summary["calls"], 1), 2)
+    summary["words_per_document"] = int(np.mean([len(d.split()) for d in documents]))
+    return {"unit": "documents", "best": summary}
+
+
+async def bench_intelligent_chunking(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark IntelligentChunkingService.chunk_meeting_content per transcript."""
+    from services.rag.intelligent_chunking import intelligent_chunking_service
+    from services.transcription.advanced_transcript_parser import advanced_transcript_processor
+
+    # Transcript analysis is an input to this stage, not part of it
+    analyses = [
+        await advanced_transcript_processor.process_transcript(document, title=f"bench-{i}")
+        for i, document in enumerate(_build_documents(options))
+    ]
+
+    recorder = LatencyRecorder()
+    chunk_count = 0
+    for _ in range(options["iterations"]):
+        for analysis in analyses:
+            with recorder.measure(items=1):
+                chunks = await intelligent_chunking_service.chunk_meeting_content(analysis)
+            chunk_count += len(chunks)
+
+    summary = recorder.summary()
+    summary["chunks_per_document"] = round(chunk_count / max(summary["calls"], 1), 2)
+    summary["turns_per_document"] = int(np.mean([len(a.speaker_turns) for a in analyses]))
+    return {"unit": "documents", "best": summary}
+
+
+async def bench_speaker_turns(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark AdvancedTranscriptProcessor._extract_speaker_turns on a long synthetic meeting."""
+    import re
+
+    from services.transcription.advanced_transcript_parser import advanced_transcript_processor
+    from services.transcription.transcript_parser import ParsedTranscript
+
+    # Sentences from the sample transcripts, cycled into num_turns turns
+    sentences = [
+        sentence.strip()
+        for text in load_transcripts().values()
+        for sentence in re.split(r"(?<=[.!?])\s+", text)
+        if sentence.strip()
+    ]
+    speakers = ["Alice", "Bob", "Carol", "Dan", "Erin", "Frank"]
+    dialogue = [
+        {
+            "speaker": speakers[i % len(speakers)],
+            "timestamp": f"{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+            "text": " ".join(sentences[(i * 3 + k) % len(sentences)] for k in range(3)),
+        }
+        for i in range(options["num_turns"])
+    ]
+    parsed = ParsedTranscript(
+        title="bench", duration=None, participants=[], dialogue=dialogue,
+        decisions=[], action_items=[], raw_content="", format_type="structured_text"
+    )
+
+    recorder = LatencyRecorder()
+    for _ in range(options["iterations"]):
+        with recorder.measure(items=len(dialogue)):
+            turns = await advanced_transcript_processor._extract_speaker_turns(parsed)
+
+    summary = recorder.summary()
+    summary["turns_per_document"] = len(turns)
+    return {"unit": "turns", "best": summary}
+
+
+async def bench_embeddings(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark EmbeddingService.generate_embeddings_batch across batch sizes."""
+    from services.rag.embedding_service import embedding_service
+
+    texts = _build_chunk_texts(options)
+    await embedding_service.warm_up()
+
+    runs: Dict[int, Dict[str, Any]] = {}
+    for batch_size in options["batch_sizes"]:
+        recorder = LatencyRecorder()
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            with recorder.measure(items=len(batch)):
+                # Bypass the embedding cache so every run measures inference
+                await embedding_service.generate_embeddings_batch(
+                    batch, batch_size=batch_size, use_cache=False
+                )
+        runs[batch_size] = recorder.summary()
+
+    best = pick_best_batch_size(runs)
+    return {
+        "unit": "texts",
+        "backend": embedding_service.get_model_info().get("active_backend"),
+        "batch_sizes": runs,
+        "best_batch_size": best,
+        "best": runs[best],
+    }
+
+
+async def bench_qdrant_insert(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Benchmark MultiTenantVectorStore.insert_vectors on an in-process Qdrant."""
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import PointStruct
+
+    from config import get_settings
+    from db.multi_tenant_vector_store import MultiTenantVectorStore
+
+    settings = get_settings()
+    texts = _build_chunk_texts(options)
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((len(texts), settings.embedding_dimension)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    runs: Dict[int, Dict[str, Any]] = {}
+    for batch_size in options["batch_sizes"]:
+        store = MultiTenantVectorStore()
+        store._client = QdrantClient(":memory:")
+        store.use_async_client = False
+        organization_id = str(uuid.uuid4())
+        await store.ensure_organization_collections(organization_id)
+
+        recorder = LatencyRecorder()
+        for start in range(0, len(texts), batch_size):
+            with recorder.measure(items=min(batch_size, len(texts) - start)):
+                points = [
+                    PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector=store.build_mrl_vectors(vectors[i]) if settings.enable_mrl else vectors[i].tolist(),
+                        payload={
+                            "content_id": "bench",
+                            "project_id": "bench",
+                            "chunk_index": i,
+                            "text": texts[i],
+                            "word_count": len(texts[i].split()),
+                        }
+                    )
+                    for i in range(start, min(start + batch_size, len(texts)))
+                ]
+                await store.insert_vectors(organization_id, points)
+        runs[batch_size] = recorder.summary()
+        store._client.close()
+
+    best = pick_best_batch_size(runs)
+    return {
+        "unit": "points",
+        "mrl_enabled": settings.enable_mrl,
+        "batch_sizes": runs,
+        "best_batch_size": best,
+        "best": runs[best],
+    }
+
+
+STAGE_FUNCTIONS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "chunking": bench_chunking,
+    "intelligent_chunking": bench_intelligent_chunking,
+    "speaker_turns": bench_speaker_turns,
+    "embeddings": bench_embeddings,
+    "qdrant_insert": bench_qdrant_insert,
+}
+
+
+def run_stage(stage: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a single stage and attach its peak RSS (process-wide)."""
+    try:
+        result = asyncio.run(STAGE_FUNCTIONS[stage](options))
+    except Exception as e:
+        result = {"error": f"{type(e).__name__}: {e}"}
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def _print_stage(stage: str, result: Dict[str, Any]) -> None:
+    if "error" in result:
+        print(f"✗ {stage}: {result['error']}")
+        return
+    best = result["best"]
+    batch = f" (best batch size {result['best_batch_size']})" if result.get("best_batch_size") else ""
+    print(
+        f"✓ {stage:<22} {best['items_per_sec']:>10.1f} {result['unit']}/s  "
+        f"p50 {best['p50_ms']:.2f} ms  p95 {best['p95_ms']:.2f} ms  p99 {best['p99_ms']:.2f} ms  "
+        f"peak RSS {result['peak_rss_mb']:.0f} MB{batch}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stages", default=",".join(STAGES),
+                        help=f"Comma-separated stages to run ({', '.join(STAGES)})")
+    parser.add_argument("--batch-sizes", default="8,16,32,64,128",
+                        help="Comma-separated batch sizes for embeddings/qdrant_insert")
+    parser.add_argument("--num-texts", type=int, default=512, help="Chunk texts for embeddings/qdrant_insert")
+    parser.add_argument("--target-words", type=int, default=5000, help="Scale each transcript to ~N words")
+    parser.add_argument("--num-turns", type=int, default=5000, help="Turns in the synthetic speaker_turns transcript")
+    parser.add_argument("--iterations", type=int, default=5, help="Repetitions for chunking stages")
+    parser.add_argument("--chunk-size-words", type=int, default=300)
+    parser.add_argument("--chunk-overlap-words", type=int, default=50)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON report path")
+    parser.add_argument("--compare", type=Path, help="Previous JSON report to compare against")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="Run all stages in this process (peak RSS becomes cumulative)")
+    args = parser.parse_args()
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    options = {
+        "batch_sizes": [int(b) for b in args.batch_sizes.split(",") if b.strip()],
+        "num_texts": args.num_texts,
+        "target_words": args.target_words,
+        "num_turns": args.num_turns,
+        "iterations": args.iterations,
+        "chunk_size_words": args.chunk_size_words,
+        "chunk_overlap_words": args.chunk_overlap_words,
+    }
+
+    report: Dict[str, Any] = {
+        "benchmark": "ingestion",
+        "meta": run_metadata({**options, "stages": stages, "isolated": not args.no_isolate}),
+        "stages": {},
+    }
+
+    for stage in stages:
+        print(f"→ Running {stage}...")
+        if args.no_isolate:
+            result = run_stage(stage, options)
+        else:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_stage, stage, options).result()
+        report["stages"][stage] = result
+        _print_stage(stage, result)
+
+    write_report(report, args.output)
+    print(f"Report written to {args.output}")
+
+    if args.compare:
+        previous = json.loads(args.compare.read_text())
+        print(f"\nComparison with {args.compare} ({(previous.get('meta', {}).get('commit') or 'unknown')[:12]}):")
+        for line in compare_reports(previous, report):
+            print(f"  {line}")
+
+    return 1 if any("error" in r for r in report["stages"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
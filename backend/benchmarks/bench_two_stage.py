@@ -0,0 +1,215 @@
+"""
+Two-stage MRL search benchmark: recall and latency of the legacy path vs query_points prefetch.
+
+- legacy:   128d filtered search, then an unfiltered 768d search (limit=initial_limit*2)
+            intersected with the stage-1 IDs in Python (the pre-prefetch implementation)
+- prefetch: MultiTenantVectorStore.search_vectors_two_stage (128d prefetch -> 768d rescoring,
+            tenant/project filter on both stages, one round trip)
+
+Ground truth is exact 768d cosine top-k within the queried project (numpy brute force).
+The corpus is synthetic with MRL-like energy decay across dimensions, spread across
+several projects of one organization so filter leakage is visible.
+
+Qdrant :memory: is exact (no HNSW/quantization); pass --qdrant-url to measure against a
+real server.
+
+Usage (from backend/):
+    python -m benchmarks.bench_two_stage
+    python -m benchmarks.bench_two_stage --points 20000 --projects 8 --qdrant-url http://localhost:6333
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from benchmarks.common import BACKEND_DIR, LatencyRecorder, run_metadata, write_report
+
+DEFAULT_OUTPUT = BACKEND_DIR / "benchmarks" / "results" / "two_stage.json"
+FULL_DIM = 768
+
+
+def build_corpus(num_points: int, num_projects: int, decay: float, seed: int) -> Dict[str, np.ndarray]:
+    """Normalized vectors whose variance decays across dimensions (MRL-like prefixes)."""
+    rng = np.random.default_rng(seed)
+    scale = np.exp(-decay * np.arange(FULL_DIM) / FULL_DIM).astype(np.float32)
+    vectors = rng.standard_normal((num_points, FULL_DIM)).astype(np.float32) * scale
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    projects = rng.integers(0, num_projects, size=num_points)
+    return {"vectors": vectors, "projects": projects}
+
+
+def build_queries(corpus: Dict[str, np.ndarray], num_queries: int, noise: float, seed: int) -> List[Dict[str, Any]]:
+    """Queries are noisy copies of corpus points, scoped to that point's project."""
+    rng = np.random.default_rng(seed + 1)
+    picks = rng.choice(len(corpus["vectors"]), size=num_queries, replace=False)
+    queries = []
+    for idx in picks:
+        vector = corpus["vectors"][idx] + noise * rng.standard_normal(FULL_DIM).astype(np.float32) / np.sqrt(FULL_DIM)
+        vector /= np.linalg.norm(vector)
+        queries.append({"vector": vector, "project": int(corpus["projects"][idx])})
+    return queries
+
+
+def ground_truth(corpus: Dict[str, np.ndarray], ids: List[str], query: Dict[str, Any], k: int) -> List[str]:
+    """Exact 768d top-k within the query's project."""
+    mask = corpus["projects"] == query["project"]
+    candidates = np.flatnonzero(mask)
+    scores = corpus["vectors"][candidates] @ query["vector"]
+    top = candidates[np.argsort(-scores)[:k]]
+    return [ids[i] for i in top]
+
+
+async def legacy_two_stage(store, organization_id: str, query_vector: List[float],
+                           filter_dict: Dict[str, Any], initial_limit: int, final_limit: int) -> List[Dict[str, Any]]:
+    """Pre-prefetch implementation: filtered 128d search + unfiltered 768d search, intersected."""
+    fast_results = await store.search_vectors(
+        organization_id=organization_id,
+        query_vector=query_vector,
+        limit=initial_limit,
+        score_threshold=0.2,
+        filter_dict=filter_dict,
+        vector_dimension=128
+    )
+    if not fast_results:
+        return []
+
+    collection_name = store._get_collection_name(organization_id)
+    response = await asyncio.get_event_loop().run_in_executor(
+        None,
+        lambda: store.client.query_points(
+            collection_name=collection_name,
+            query=query_vector[:FULL_DIM],
+            using=f"vector_{FULL_DIM}",
+            limit=initial_limit * 2,
+            score_threshold=0.1,
+            with_payload=True
+        )
+    )
+    candidate_ids = {r["id"] for r in fast_results}
+    reranked = [p for p in response.points if str(p.id) in candidate_ids]
+    reranked.sort(key=lambda p: p.score, reverse=True)
+    results = [{"id": str(p.id), "score": p.score, "payload": p.payload} for p in reranked[:final_limit]]
+    return results or fast_results[:final_limit]
+
+
+async def run(options: Dict[str, Any]) -> Dict[str, Any]:
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import PointStruct
+
+    from config import get_settings
+    from db.multi_tenant_vector_store import MultiTenantVectorStore
+
+    settings = get_settings()
+    settings.enable_mrl = True
+
+    corpus = build_corpus(options["points"], options["projects"], options["decay"], options["seed"])
+    queries = build_queries(corpus, options["queries"], options["noise"], options["seed"])
+    project_ids = [str(uuid.uuid4()) for _ in range(options["projects"])]
+    ids = [str(uuid.uuid4()) for _ in range(len(corpus["vectors"]))]
+
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(url=options["qdrant_url"]) if options["qdrant_url"] else QdrantClient(":memory:")
+    store.use_async_client = False
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+
+    for start in range(0, len(ids), 256):
+        points = [
+            PointStruct(
+                id=ids[i],
+                vector=store.build_mrl_vectors(corpus["vectors"][i]),
+                payload={"project_id": project_ids[corpus["projects"][i]], "chunk_index": i}
+            )
+            for i in range(start, min(start + 256, len(ids)))
+        ]
+        await store.insert_vectors(organization_id, points)
+
+    k, initial_limit = options["k"], options["initial_limit"]
+    variants = {
+        "legacy": lambda q, f: legacy_two_stage(store, organization_id, q, f, initial_limit, k),
+        "prefetch": lambda q, f: store.search_vectors_two_stage(
+            organization_id=organization_id,
+            query_vector=q,
+            initial_limit=initial_limit,
+            final_limit=k,
+            filter_dict=f
+        ),
+    }
+
+    report: Dict[str, Any] = {}
+    try:
+        for name, search in variants.items():
+            recorder = LatencyRecorder()
+            recalls, leaked, returned = [], 0, 0
+            for query in queries:
+                project_id = project_ids[query["project"]]
+                vector = query["vector"].tolist()
+                with recorder.measure(items=1):
+                    results = await search(vector, {"project_id": project_id})
+                truth = set(ground_truth(corpus, ids, query, k))
+                recalls.append(len(truth & {r["id"] for r in results}) / max(len(truth), 1))
+                leaked += sum(1 for r in results if (r.get("payload") or {}).get("project_id") != project_id)
+                returned += len(results)
+
+            report[name] = {
+                **recorder.summary(),
+                f"recall_at_{k}": round(float(np.mean(recalls)), 4),
+                "avg_results": round(returned / len(queries), 2),
+                "cross_project_results": leaked,
+            }
+    finally:
+        if options["qdrant_url"]:
+            await store.delete_organization_collections(organization_id)
+        store._client.close()
+
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10, help="final_limit")
+    parser.add_argument("--initial-limit", type=int, default=50, help="Stage-1 candidates")
+    parser.add_argument("--decay", type=float, default=3.0, help="Per-dimension energy decay (MRL-like)")
+    parser.add_argument("--noise", type=float, default=0.6, help="Query noise relative to its seed point")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--qdrant-url", default="", help="Qdrant server URL (default: in-process :memory:)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON report path")
+    args = parser.parse_args()
+
+    options = {
+        "points": args.points,
+        "projects": args.projects,
+        "queries": args.queries,
+        "k": args.k,
+        "initial_limit": args.initial_limit,
+        "decay": args.decay,
+        "noise": args.noise,
+        "seed": args.seed,
+        "qdrant_url": args.qdrant_url,
+    }
+
+    results = asyncio.run(run(options))
+    report = {"benchmark": "two_stage", "meta": run_metadata(options), "variants": results}
+
+    for name, summary in results.items():
+        print(
+            f"✓ {name:<9} recall@{args.k} {summary[f'recall_at_{args.k}']:.3f}  "
+            f"p50 {summary['p50_ms']:.2f} ms  p95 {summary['p95_ms']:.2f} ms  "
+            f"avg results {summary['avg_results']:.1f}  cross-project {summary['cross_project_results']}"
+        )
+
+    write_report(report, args.output)
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Shared helpers for benchmarks: corpus loading, timing, memory and JSON reports."""
+
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+TEST_DATA_DIR = BACKEND_DIR.parent / "test_data"
+
+
+def load_transcripts(data_dir: Path = TEST_DATA_DIR) -> Dict[str, str]:
+    """
+    Load the sample transcripts used as benchmark input.
+
+    Args:
+        data_dir: Directory containing *.txt transcripts
+
+    Returns:
+        Mapping of file stem to transcript text
+    """
+    transcripts = {
+        path.stem: path.read_text(encoding="utf-8")
+        for path in sorted(data_dir.glob("*.txt"))
+    }
+    if not transcripts:
+        raise FileNotFoundError(f"No transcripts found in {data_dir}")
+    return transcripts
+
+
+def scale_transcript(text: str, target_words: int) -> str:
+    """
+    Repeat a transcript until it reaches roughly target_words words.
+
+    Args:
+        text: Source transcript
+        target_words: Desired length in words
+
+    Returns:
+        Scaled transcript (paragraph-separated repetitions)
+    """
+    words = max(len(text.split()), 1)
+    repeats = max(1, -(-target_words // words))  # ceil division
+    return "\n\n".join([text.strip()] * repeats)
+
+
+def latency_stats(latencies_s: List[float]) -> Dict[str, float]:
+    """
+    Summarize per-call latencies in milliseconds.
+
+    Args:
+        latencies_s: Latencies in seconds
+
+    Returns:
+        Dict with p50/p95/p99/mean/max in milliseconds
+    """
+    if not latencies_s:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "mean_ms": 0.0, "max_ms": 0.0}
+
+    values = np.asarray(latencies_s, dtype=np.float64) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(values.mean()), 3),
+        "max_ms": round(float(values.max()), 3),
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class LatencyRecorder:
+    """Collects per-call latencies and item counts for one benchmark run."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.items = 0
+        self._elapsed = 0.0
+
+    @contextmanager
+    def measure(self, items: int = 1) -> Iterator[None]:
+        """Time one call that processes `items` texts/points."""
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        self.latencies.append(elapsed)
+        self._elapsed += elapsed
+        self.items += items
+
+    def summary(self) -> Dict[str, Any]:
+        """Throughput and latency summary for the recorded calls."""
+        return {
+            "calls": len(self.latencies),
+            "items": self.items,
+            "total_s": round(self._elapsed, 4),
+            "items_per_sec": round(self.items / self._elapsed, 2) if self._elapsed else 0.0,
+            **latency_stats(self.latencies),
+        }
+
+
+def pick_best_batch_size(runs: Dict[int, Dict[str, Any]]) -> Optional[int]:
+    """Batch size with the highest items/sec (ties go to the smaller batch)."""
+    if not runs:
+        return None
+    return max(sorted(runs), key=lambda size: runs[size]["items_per_sec"])
+
+
+def git_commit() -> Optional[str]:
+    """Current git commit hash, if available."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=BACKEND_DIR,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def run_metadata(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Environment metadata recorded with every report."""
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "args": args,
+    }
+
+
+def write_report(report: Dict[str, Any], path: Path) -> None:
+    """Write a benchmark report as pretty-printed JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, default=str))
+
+
+def compare_reports(previous: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Compare best-batch throughput and p99 latency per stage between two reports.
+
+    Returns:
+        Human-readable comparison lines
+    """
+    lines = []
+    for stage, result in current.get("stages", {}).items():
+        old = previous.get("stages", {}).get(stage)
+        if not old or "best" not in result or "best" not in old:
+            continue
+        new_tps, old_tps = result["best"]["items_per_sec"], old["best"]["items_per_sec"]
+        new_p99, old_p99 = result["best"]["p99_ms"], old["best"]["p99_ms"]
+        change = ((new_tps - old_tps) / old_tps * 100) if old_tps else 0.0
+        lines.append(
+            f"{stage:<22} {old_tps:>10.1f} → {new_tps:>10.1f} items/s ({change:+.1f}%)   "
+            f"p99 {old_p99:.1f} → {new_p99:.1f} ms"
+        )
+    return lines
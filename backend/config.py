@@ -36,6 +36,11 @@ class Settings(BaseSettings):
     qdrant_host: str = Field(default="localhost", env="QDRANT_HOST")
     qdrant_port: int = Field(default=6333, env="QDRANT_PORT")
     qdrant_collection: str = Field(default="pm_master_vectors", env="QDRANT_COLLECTION")
+    qdrant_grpc_port: int = Field(default=6334, env="QDRANT_GRPC_PORT")
+    qdrant_prefer_grpc: bool = Field(default=True, env="QDRANT_PREFER_GRPC")
+    qdrant_use_async_client: bool = Field(default=False, env="QDRANT_USE_ASYNC_CLIENT")  # Native asyncio client instead of sync client + thread pool
+    qdrant_pool_size: int = Field(default=8, env="QDRANT_POOL_SIZE")  # gRPC channels / HTTP connections for the async client
+    qdrant_collection_registry_ttl_seconds: int = Field(default=300, env="QDRANT_COLLECTION_REGISTRY_TTL_SECONDS")  # How long a known collection skips the existence check
     
     # Claude API Configuration
     anthropic_api_key: str = Field(default="", env="ANTHROPIC_API_KEY")
@@ -146,6 +151,40 @@ class Settings(BaseSettings):
     mrl_rerank_dimension: int = Field(default=768, env="MRL_RERANK_DIMENSION")  # Precise rerank
     rag_use_two_stage_search: bool = Field(default=True, env="RAG_USE_TWO_STAGE_SEARCH")  # Use two-stage MRL search for better quality
 
+    # Embedding Inference Backend (torch = PyTorch fp32, onnx = ONNX Runtime fp32, onnx-int8 = dynamic int8)
+    embedding_backend: str = Field(default="torch", env="EMBEDDING_BACKEND")
+    embedding_onnx_dir: str = Field(default="", env="EMBEDDING_ONNX_DIR")  # Export dir (default: ~/.cache/sentence_transformers/embeddinggemma-300m-onnx)
+    embedding_onnx_quantization: str = Field(default="avx512_vnni", env="EMBEDDING_ONNX_QUANTIZATION")  # arm64, avx2, avx512, avx512_vnni
+
+    # Embedding Micro-Batching (coalesces concurrent embedding calls on one inference thread)
+    enable_embedding_batching: bool = Field(default=True, env="ENABLE_EMBEDDING_BATCHING")
+    embedding_batch_max_wait_ms: float = Field(default=5.0, env="EMBEDDING_BATCH_MAX_WAIT_MS")  # Max time the first request waits for others
+    embedding_batch_max_size: int = Field(default=64, env="EMBEDDING_BATCH_MAX_SIZE")  # Max texts per model.encode call
+
+    # Embedding Cache (content-addressed: model + normalize + text hash)
+    enable_embedding_cache: bool = Field(default=True, env="ENABLE_EMBEDDING_CACHE")
+    embedding_cache_max_mb: int = Field(default=64, env="EMBEDDING_CACHE_MAX_MB")  # In-process LRU size (vector bytes)
+    embedding_cache_ttl_seconds: int = Field(default=86400, env="EMBEDDING_CACHE_TTL_SECONDS")  # 0 = no expiry
+    embedding_cache_redis_enabled: bool = Field(default=False, env="EMBEDDING_CACHE_REDIS_ENABLED")  # Shared tier across workers
+    embedding_cache_redis_dtype: str = Field(default="float16", env="EMBEDDING_CACHE_REDIS_DTYPE")  # float16 or float32 blobs
+
+    # RAG Answer Cache (keyed by org, project, normalized question, strategy, prompt version; requires Redis)
+    enable_rag_answer_cache: bool = Field(default=True, env="ENABLE_RAG_ANSWER_CACHE")
+    rag_answer_cache_ttl_seconds: int = Field(default=3600, env="RAG_ANSWER_CACHE_TTL_SECONDS")  # 0 = no expiry
+    rag_answer_cache_memory_entries: int = Field(default=1000, env="RAG_ANSWER_CACHE_MEMORY_ENTRIES")  # In-process LRU size
+    rag_answer_cache_semantic_enabled: bool = Field(default=False, env="RAG_ANSWER_CACHE_SEMANTIC_ENABLED")  # Reuse answers for near-identical questions
+    rag_answer_cache_semantic_threshold: float = Field(default=0.95, env="RAG_ANSWER_CACHE_SEMANTIC_THRESHOLD")  # Cosine similarity of question embeddings
+    rag_answer_cache_semantic_max_entries: int = Field(default=500, env="RAG_ANSWER_CACHE_SEMANTIC_MAX_ENTRIES")  # Cached questions per project/strategy
+
+    # Content Ingestion Pipeline (chunks -> embedding batches -> vector upsert batches)
+    ingestion_batch_size: int = Field(default=32, env="INGESTION_BATCH_SIZE")  # Chunks per embedding call and per Qdrant upsert
+    ingestion_queue_depth: int = Field(default=2, env="INGESTION_QUEUE_DEPTH")  # Batches buffered between stages (bounds memory)
+
+    # Project Scope Cache (project -> organization/program/portfolio lookups shared by RAG services)
+    enable_project_scope_cache: bool = Field(default=True, env="ENABLE_PROJECT_SCOPE_CACHE")
+    project_scope_cache_max_entries: int = Field(default=10000, env="PROJECT_SCOPE_CACHE_MAX_ENTRIES")  # In-process LRU size
+    project_scope_cache_ttl_seconds: int = Field(default=300, env="PROJECT_SCOPE_CACHE_TTL_SECONDS")  # 0 = no expiry; bounds staleness in other processes
+
     # Multilingual Support
     enable_multilingual: bool = Field(default=True, env="ENABLE_MULTILINGUAL")
     supported_languages: str = Field(default="en,es,fr,de,zh,ja,ar,hi,pt,ru", env="SUPPORTED_LANGUAGES")
@@ -177,6 +216,12 @@ class Settings(BaseSettings):
     hybrid_max_results_per_method: int = Field(default=30, env="HYBRID_MAX_RESULTS_PER_METHOD")  # Increased from 20
     hybrid_final_result_count: int = Field(default=15, env="HYBRID_FINAL_RESULT_COUNT")
     diversity_boost: float = Field(default=0.1, env="DIVERSITY_BOOST")
+    enable_keyword_index: bool = Field(default=True, env="ENABLE_KEYWORD_INDEX")  # Redis inverted index for BM25 (falls back to scanning Qdrant)
+    enable_sparse_vectors: bool = Field(default=True, env="ENABLE_SPARSE_VECTORS")  # BM25 sparse vectors stored next to MRL vectors
+    hybrid_server_side_fusion: bool = Field(default=False, env="HYBRID_SERVER_SIDE_FUSION")  # Dense + sparse RRF in one Qdrant query
+    rerank_cache_size: int = Field(default=10000, env="RERANK_CACHE_SIZE")  # Cached (query, chunk) cross-encoder scores
+    rerank_batch_max_wait_ms: float = Field(default=5.0, env="RERANK_BATCH_MAX_WAIT_MS")  # Max time the first rerank request waits for others
+    rerank_batch_max_size: int = Field(default=128, env="RERANK_BATCH_MAX_SIZE")  # Max pairs per cross-encoder predict call
     
     # Meeting Intelligence
     engagement_threshold_very_high: float = Field(default=0.8, env="ENGAGEMENT_THRESHOLD_VERY_HIGH")
@@ -1,11 +1,14 @@
 """Multi-tenant vector store management with per-organization collections."""
 
 import asyncio
+import time
 import uuid
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from contextlib import asynccontextmanager
 
-from qdrant_client import QdrantClient
+import numpy as np
+
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     VectorParams,
     Distance,
@@ -22,9 +25,20 @@ from qdrant_client.models import (
     PayloadSchemaType,
     FieldCondition,
     MatchValue,
-    HasIdCondition
+    MatchAny,
+    PointIdsList,
+    FilterSelector,
+    Prefetch,
+    QueryRequest,
+    SparseVectorParams,
+    SparseIndexParams,
+    Modifier,
+    FusionQuery,
+    Fusion,
+    SetPayload,
+    SetPayloadOperation
 )
-from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+from qdrant_client.http.exceptions import ResponseHandlingException
 
 from config import get_settings
 from utils.logger import get_logger, sanitize_for_log
@@ -33,6 +47,68 @@ settings = get_settings()
 logger = get_logger(__name__)
 
 
+class CollectionRegistry:
+    """
+    In-process registry of collections known to exist in Qdrant.
+
+    Entries expire after ttl_seconds so collections deleted outside this process
+    are eventually re-checked; a "Not found" response invalidates an entry immediately.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._expires_at: Dict[str, float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def contains(self, collection_name: str) -> bool:
+        """Check whether a collection is known to exist (counts as a hit or miss)."""
+        expires_at = self._expires_at.get(collection_name)
+        if expires_at is not None and expires_at > time.monotonic():
+            self._hits += 1
+            return True
+
+        if expires_at is not None:
+            del self._expires_at[collection_name]
+        self._misses += 1
+        return False
+
+    def add(self, collection_name: str) -> None:
+        """Record that a collection exists."""
+        self._expires_at[collection_name] = time.monotonic() + self.ttl_seconds
+
+    def reset(self, collection_names: Iterable[str]) -> None:
+        """Replace the registry contents with the given existing collections."""
+        self._expires_at.clear()
+        for collection_name in collection_names:
+            self.add(collection_name)
+
+    def discard(self, collection_name: str) -> None:
+        """Forget a collection (deleted or reported missing by Qdrant)."""
+        if self._expires_at.pop(collection_name, None) is not None:
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        """Forget all collections."""
+        self._expires_at.clear()
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Registry size and hit rate."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._expires_at),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self._invalidations,
+        }
+
+
 class MultiTenantVectorStore:
     """Manages per-organization Qdrant collections for multi-tenant vector storage."""
 
@@ -43,9 +119,18 @@ class MultiTenantVectorStore:
     CONTENT_COLLECTION = "content"
     SUMMARIES_COLLECTION = "summaries"
 
+    # Named sparse vector holding BM25 term weights (content collections)
+    SPARSE_VECTOR_NAME = "text_sparse"
+
     def __init__(self):
         self._client: Optional[QdrantClient] = None
-        self._collection_cache: Dict[str, bool] = {}  # Cache for existing collections
+        self._async_client: Optional[AsyncQdrantClient] = None
+        # Native asyncio client keeps vector traffic off the default thread pool
+        self.use_async_client = settings.qdrant_use_async_client
+        # Registry of collections known to exist (skips per-request existence checks)
+        self._collection_cache = CollectionRegistry(settings.qdrant_collection_registry_ttl_seconds)
+        # Whether each collection has the sparse vector (collections created before it existed do not)
+        self._sparse_support: Dict[str, bool] = {}
 
     @property
     def client(self) -> QdrantClient:
@@ -54,11 +139,38 @@ class MultiTenantVectorStore:
             self._client = QdrantClient(
                 host=settings.qdrant_host,
                 port=settings.qdrant_port,
+                grpc_port=settings.qdrant_grpc_port,
                 timeout=30,
-                prefer_grpc=True  # Use gRPC for better performance
+                prefer_grpc=settings.qdrant_prefer_grpc  # Use gRPC for better performance
             )
         return self._client
 
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        """Get or create the asyncio Qdrant client (gRPC channel / HTTP connection pool)."""
+        if self._async_client is None:
+            self._async_client = AsyncQdrantClient(
+                host=settings.qdrant_host,
+                port=settings.qdrant_port,
+                grpc_port=settings.qdrant_grpc_port,
+                timeout=30,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                pool_size=settings.qdrant_pool_size
+            )
+        return self._async_client
+
+    async def _run(self, operation: Callable[[Any], Any]) -> Any:
+        """
+        Run a Qdrant client operation.
+
+        The operation receives the client to call. With the async client it runs
+        natively on the event loop; otherwise the sync client runs in the default
+        thread pool.
+        """
+        if self.use_async_client:
+            return await operation(self.async_client)
+        return await asyncio.get_event_loop().run_in_executor(None, operation, self.client)
+
     def _get_collection_name(self, organization_id: str, collection_type: str = CONTENT_COLLECTION) -> str:
         """Generate collection name for an organization."""
         # Format: org_{organization_id}_{collection_type}
@@ -96,18 +208,14 @@ class MultiTenantVectorStore:
         for attempt in range(max_retries):
             try:
                 # Test connection
-                client = self.client
-                collections_response = await asyncio.get_event_loop().run_in_executor(
-                    None, client.get_collections
-                )
+                collections_response = await self._run(lambda client: client.get_collections())
 
                 logger.info(f"Connected to Qdrant successfully. Found {len(collections_response.collections)} collections")
 
-                # Refresh collection cache
-                self._collection_cache = {
-                    col.name: True
-                    for col in collections_response.collections
-                }
+                # Refresh collection registry
+                self._collection_cache.reset(
+                    col.name for col in collections_response.collections
+                )
 
                 break
 
@@ -129,9 +237,8 @@ class MultiTenantVectorStore:
         for collection_type in collection_types:
             collection_name = self._get_collection_name(organization_id, collection_type)
 
-            # Check cache first
-            if collection_name in self._collection_cache:
-                logger.debug(f"Collection '{collection_name}' exists (cached)")
+            # Check registry first (no Qdrant round trip)
+            if self._collection_cache.contains(collection_name):
                 continue
 
             try:
@@ -142,37 +249,36 @@ class MultiTenantVectorStore:
                     logger.info(f"Creating collection: {collection_name}")
 
                     # Create collection with optimized configuration
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        self._create_collection,
-                        collection_name
-                    )
+                    await self._create_collection(collection_name)
 
-                    # Update cache
-                    self._collection_cache[collection_name] = True
+                    # Update registry
+                    self._collection_cache.add(collection_name)
 
                     logger.info(f"Collection '{collection_name}' created successfully")
                 else:
-                    # Update cache
-                    self._collection_cache[collection_name] = True
-                    logger.info(f"Collection '{collection_name}' already exists")
+                    logger.debug(f"Collection '{collection_name}' already exists")
 
             except Exception as e:
                 logger.error(f"Failed to ensure collection '{collection_name}' exists: {e}")
                 raise
 
+    @staticmethod
+    def _is_collection_not_found(error: Exception) -> bool:
+        """Whether a Qdrant error (REST, gRPC or local) reports a missing collection."""
+        return "not found" in str(error).lower()
+
     async def _collection_exists(self, collection_name: str) -> bool:
-        """Check if a collection exists."""
+        """Check if a collection exists in Qdrant (existing collections are added to the registry)."""
         try:
-            collections = await asyncio.get_event_loop().run_in_executor(
-                None, self.client.get_collections
-            )
-            return any(col.name == collection_name for col in collections.collections)
+            exists = await self._run(lambda client: client.collection_exists(collection_name))
+            if exists:
+                self._collection_cache.add(collection_name)
+            return exists
         except Exception as e:
             logger.error(f"Failed to check collection existence: {e}")
             return False
 
-    def _create_collection(self, collection_name: str) -> None:
+    async def _create_collection(self, collection_name: str) -> None:
         """Create a collection with MRL support for multiple embedding dimensions."""
         # Create collection with multiple vector configurations for MRL
         if settings.enable_mrl:
@@ -206,9 +312,20 @@ class MultiTenantVectorStore:
                 )
             )
 
-        self.client.create_collection(
+        # Sparse BM25 vector next to the named MRL vectors; Qdrant applies IDF at query time
+        sparse_vectors_config = None
+        if self._sparse_vectors_enabled():
+            sparse_vectors_config = {
+                self.SPARSE_VECTOR_NAME: SparseVectorParams(
+                    index=SparseIndexParams(on_disk=False),
+                    modifier=Modifier.IDF
+                )
+            }
+
+        await self._run(lambda client: client.create_collection(
             collection_name=collection_name,
             vectors_config=vectors_config,
+            sparse_vectors_config=sparse_vectors_config,
             optimizers_config=OptimizersConfigDiff(
                 default_segment_number=4,  # Increase for better parallelism
                 max_segment_size=200000,  # Increase from 100k for larger segments
@@ -226,30 +343,52 @@ class MultiTenantVectorStore:
                     always_ram=True  # Keep quantized vectors in RAM for speed
                 )
             )
-        )
+        ))
+
+        self._sparse_support[collection_name] = sparse_vectors_config is not None
 
         # Create payload indexes for common filter fields
-        self._create_payload_indexes(collection_name)
+        await self._create_payload_indexes(collection_name)
+
+    @staticmethod
+    def _sparse_vectors_enabled() -> bool:
+        """Sparse vectors are stored alongside named MRL vectors only."""
+        return settings.enable_sparse_vectors and settings.enable_mrl
 
-    def _create_payload_indexes(self, collection_name: str) -> None:
+    async def _supports_sparse(self, collection_name: str) -> bool:
+        """Whether a collection has the sparse vector configured (cached per collection)."""
+        if not self._sparse_vectors_enabled():
+            return False
+        if collection_name not in self._sparse_support:
+            try:
+                info = await self._run(lambda client: client.get_collection(collection_name))
+                sparse_vectors = info.config.params.sparse_vectors or {}
+                self._sparse_support[collection_name] = self.SPARSE_VECTOR_NAME in sparse_vectors
+            except Exception as e:
+                logger.warning(f"Could not read sparse vector config for '{collection_name}': {e}")
+                return False
+        return self._sparse_support[collection_name]
+
+    async def _create_payload_indexes(self, collection_name: str) -> None:
         """Create indexes for common filter fields to improve search performance."""
         indexes = [
-            ("project_id", PayloadSchemaType.INTEGER),
+            ("project_id", PayloadSchemaType.KEYWORD),  # UUID strings; also used for group_by
             ("content_type", PayloadSchemaType.KEYWORD),
             ("date", PayloadSchemaType.DATETIME),
             ("content_id", PayloadSchemaType.INTEGER),
             ("title", PayloadSchemaType.TEXT),
             ("chunk_index", PayloadSchemaType.INTEGER),
+            ("chunk_hash", PayloadSchemaType.KEYWORD),  # SHA-256 of chunk text (incremental re-indexing)
             ("organization_id", PayloadSchemaType.KEYWORD),  # Add organization_id index
         ]
 
         for field_name, field_type in indexes:
             try:
-                self.client.create_payload_index(
+                await self._run(lambda client: client.create_payload_index(
                     collection_name=collection_name,
                     field_name=field_name,
                     field_schema=PayloadFieldSchema(data_type=field_type)
-                )
+                ))
                 logger.debug(f"Created payload index for field '{field_name}' with type {field_type}")
             except Exception as e:
                 # Index might already exist, which is fine
@@ -268,19 +407,16 @@ class MultiTenantVectorStore:
                     logger.info(f"Deleting collection: {sanitize_for_log(collection_name)}")
 
                     # Delete collection
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        self.client.delete_collection,
-                        collection_name
-                    )
-
-                    # Remove from cache
-                    self._collection_cache.pop(collection_name, None)
+                    await self._run(lambda client: client.delete_collection(collection_name))
 
                     logger.info(f"Collection '{sanitize_for_log(collection_name)}' deleted successfully")
                 else:
                     logger.debug(f"Collection '{sanitize_for_log(collection_name)}' does not exist, skipping deletion")
 
+                # Remove from registry
+                self._collection_cache.discard(collection_name)
+                self._sparse_support.pop(collection_name, None)
+
             except Exception as e:
                 logger.error(f"Failed to delete collection '{sanitize_for_log(collection_name)}': {e}")
                 # Continue with other collections even if one fails
@@ -288,9 +424,7 @@ class MultiTenantVectorStore:
     async def list_organization_collections(self, organization_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all collections, optionally filtered by organization."""
         try:
-            collections = await asyncio.get_event_loop().run_in_executor(
-                None, self.client.get_collections
-            )
+            collections = await self._run(lambda client: client.get_collections())
 
             result = []
             for col in collections.collections:
@@ -304,9 +438,7 @@ class MultiTenantVectorStore:
 
                     # Get collection info
                     try:
-                        info = await asyncio.get_event_loop().run_in_executor(
-                            None, self.client.get_collection, col.name
-                        )
+                        info = await self._run(lambda client: client.get_collection(col.name))
 
                         result.append({
                             "name": col.name,
@@ -325,6 +457,26 @@ class MultiTenantVectorStore:
             logger.error(f"Failed to list organization collections: {e}")
             return []
 
+    @staticmethod
+    def build_mrl_vectors(full_vector: Union[List[float], np.ndarray]) -> Dict[str, List[float]]:
+        """
+        Build MRL named vectors (vector_128, vector_256, ...) from a full embedding.
+
+        Arrays are converted to a Python list once; every named vector is a
+        prefix slice of that list.
+
+        Args:
+            full_vector: Full-dimension embedding (list or 1-D array)
+
+        Returns:
+            Dict mapping vector name to truncated embedding
+        """
+        values = full_vector.tolist() if isinstance(full_vector, np.ndarray) else full_vector
+        return {
+            f"vector_{dim}": values[:dim]
+            for dim in settings.mrl_dimensions_list
+        }
+
     async def insert_vectors(
         self,
         organization_id: str,
@@ -342,11 +494,17 @@ class MultiTenantVectorStore:
             for point in points:
                 # If point has a single vector list, convert to named vectors dict
                 if isinstance(point.vector, list):
-                    full_vector = point.vector
-                    named_vectors = {}
-                    for dim in settings.mrl_dimensions_list:
-                        named_vectors[f"vector_{dim}"] = full_vector[:dim]
-                    point.vector = named_vectors
+                    point.vector = self.build_mrl_vectors(point.vector)
+
+        # Attach BM25 sparse vectors computed from the chunk text
+        if collection_type == self.CONTENT_COLLECTION and await self._supports_sparse(collection_name):
+            from services.rag.sparse_encoder import sparse_encoder
+
+            for point in points:
+                if isinstance(point.vector, dict) and self.SPARSE_VECTOR_NAME not in point.vector:
+                    point.vector[self.SPARSE_VECTOR_NAME] = sparse_encoder.encode_document(
+                        (point.payload or {}).get("text", "")
+                    )
 
         # Add organization_id to each point's payload
         for point in points:
@@ -356,12 +514,16 @@ class MultiTenantVectorStore:
                 point.payload = {"organization_id": str(organization_id)}
 
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.client.upsert,
-                collection_name,
-                points
-            )
+            try:
+                await self._run(lambda client: client.upsert(collection_name, points))
+            except Exception as e:
+                if not self._is_collection_not_found(e):
+                    raise
+                # Collection was removed outside this process; recreate it and retry once
+                logger.warning(f"Collection '{collection_name}' not found, recreating before retry")
+                self._collection_cache.discard(collection_name)
+                await self.ensure_organization_collections(organization_id)
+                await self._run(lambda client: client.upsert(collection_name, points))
 
             logger.info(f"Inserted {len(points)} vectors into collection '{collection_name}'")
             return True
@@ -370,54 +532,69 @@ class MultiTenantVectorStore:
             logger.error(f"Failed to insert vectors: {e}")
             raise
 
+    @staticmethod
+    def _build_search_filter(organization_id: str, filter_dict: Optional[Dict] = None) -> Filter:
+        """Build the tenant filter (organization_id plus exact-match or match-any payload filters)."""
+        must_conditions = [
+            FieldCondition(
+                key="organization_id",
+                match=MatchValue(value=str(organization_id))
+            )
+        ]
+
+        # Add additional filters if provided (lists match any of their values)
+        if filter_dict:
+            for key, value in filter_dict.items():
+                if key == "organization_id":  # Skip if already added
+                    continue
+                if isinstance(value, (list, tuple, set)):
+                    match = MatchAny(any=list(value))
+                else:
+                    match = MatchValue(value=value)
+                must_conditions.append(FieldCondition(key=key, match=match))
+
+        return Filter(must=must_conditions)
+
+    @staticmethod
+    def _default_search_params() -> SearchParams:
+        """HNSW search params with quantized search and full-precision rescoring."""
+        return SearchParams(
+            hnsw_ef=256,  # Increase for better recall
+            exact=False,  # Use approximate search
+            quantization=QuantizationSearchParams(
+                ignore=False,
+                rescore=True,  # Rescore with full precision
+                oversampling=2.0  # Oversample for better quality
+            )
+        )
+
     async def search_vectors(
         self,
         organization_id: str,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         collection_type: str = CONTENT_COLLECTION,
         limit: int = 5,
         score_threshold: Optional[float] = None,
         filter_dict: Optional[Dict] = None,
         search_params: Optional[SearchParams] = None,
         with_payload: bool = True,
-        with_vectors: bool = False,
+        with_vectors: Union[bool, List[str]] = False,  # True, or named vectors to return
         vector_dimension: Optional[int] = None  # For MRL support
     ) -> List[Dict[str, Any]]:
         """Search for similar vectors in an organization's collection."""
         collection_name = self._get_collection_name(organization_id, collection_type)
 
+        if isinstance(query_vector, np.ndarray):
+            query_vector = query_vector.tolist()
+
         # Ensure collection exists
         await self.ensure_organization_collections(organization_id)
 
-        # Build filter with organization_id
-        must_conditions = [
-            FieldCondition(
-                key="organization_id",
-                match=MatchValue(value=str(organization_id))
-            )
-        ]
-
-        # Add additional filters if provided
-        if filter_dict:
-            for key, value in filter_dict.items():
-                if key != "organization_id":  # Skip if already added
-                    must_conditions.append(
-                        FieldCondition(key=key, match=MatchValue(value=value))
-                    )
-
-        filter_obj = Filter(must=must_conditions) if must_conditions else None
+        filter_obj = self._build_search_filter(organization_id, filter_dict)
 
         # Set search params with quantization
         if not search_params:
-            search_params = SearchParams(
-                hnsw_ef=256,  # Increase for better recall
-                exact=False,  # Use approximate search
-                quantization=QuantizationSearchParams(
-                    ignore=False,
-                    rescore=True,  # Rescore with full precision
-                    oversampling=2.0  # Oversample for better quality
-                )
-            )
+            search_params = self._default_search_params()
 
         try:
             # Handle MRL named vectors vs single vector
@@ -427,9 +604,8 @@ class MultiTenantVectorStore:
                 vector_name = f"vector_{search_dim}"
 
                 # Use query_points for named vectors (recommended by Qdrant docs)
-                response = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.client.query_points(
+                response = await self._run(
+                    lambda client: client.query_points(
                         collection_name=collection_name,
                         query=query_vector[:search_dim],  # Truncate to search dimension
                         using=vector_name,  # Specify which named vector to use
@@ -445,9 +621,8 @@ class MultiTenantVectorStore:
                 results = response.points if hasattr(response, 'points') else response
             else:
                 # For single vector, use query_points (search method deprecated in qdrant-client 1.16+)
-                response = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.client.query_points(
+                response = await self._run(
+                    lambda client: client.query_points(
                         collection_name=collection_name,
                         query=query_vector,
                         limit=limit,
@@ -472,19 +647,35 @@ class MultiTenantVectorStore:
                 for result in results
             ]
 
-        except UnexpectedResponse as e:
-            if "Not found" in str(e):
+        except Exception as e:
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process; re-check on next call
+                self._collection_cache.discard(collection_name)
                 logger.warning(f"Collection '{collection_name}' not found, returning empty results")
                 return []
-            raise
-        except Exception as e:
             logger.error(f"Failed to search vectors: {e}")
             raise
 
+    @staticmethod
+    def _two_stage_prefetch(
+        query_vector: List[float],
+        filter_obj: Filter,
+        search_params: SearchParams,
+        initial_limit: int
+    ) -> Prefetch:
+        """Stage-1 prefetch: fast 128d candidate retrieval under the tenant filter."""
+        return Prefetch(
+            query=query_vector[:128],
+            using="vector_128",
+            filter=filter_obj,
+            params=search_params,
+            limit=initial_limit
+        )
+
     async def search_vectors_two_stage(
         self,
         organization_id: str,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         collection_type: str = CONTENT_COLLECTION,
         initial_limit: int = 50,  # Get more candidates in stage 1
         final_limit: int = 10,    # Return fewer high-quality results
@@ -496,8 +687,12 @@ class MultiTenantVectorStore:
         """
         Two-stage MRL search for better quality results.
 
-        Stage 1: Fast search with 128d vectors to get candidates
-        Stage 2: Rerank candidates with 768d vectors for precision
+        Runs as a single query_points request:
+        Stage 1: Prefetch candidates with fast 128d vectors
+        Stage 2: Rescore exactly those candidates with 768d vectors
+
+        The tenant/project filter is applied to both stages, so candidates can
+        never come from outside the organization or requested project.
 
         Args:
             organization_id: Organization ID
@@ -505,7 +700,7 @@ class MultiTenantVectorStore:
             collection_type: Type of collection to search
             initial_limit: Number of candidates to retrieve in stage 1
             final_limit: Number of final results to return
-            score_threshold: Minimum score threshold
+            score_threshold: Minimum score threshold (applied to 768d scores)
             filter_dict: Additional filters
             with_payload: Include payload in results
             with_vectors: Include vectors in results
@@ -513,6 +708,9 @@ class MultiTenantVectorStore:
         Returns:
             List of search results with high precision
         """
+        if isinstance(query_vector, np.ndarray):
+            query_vector = query_vector.tolist()
+
         if not settings.enable_mrl:
             # Fall back to regular search if MRL is not enabled
             return await self.search_vectors(
@@ -526,151 +724,376 @@ class MultiTenantVectorStore:
                 with_vectors=with_vectors
             )
 
-        logger.info(f"🔍 Starting two-stage MRL search: {initial_limit} candidates -> {final_limit} results")
-
-        # Stage 1: Fast search with 128d vectors
-        fast_results = await self.search_vectors(
-            organization_id=organization_id,
-            query_vector=query_vector,
-            collection_type=collection_type,
-            limit=initial_limit,
-            score_threshold=0.2,  # Lower threshold for initial candidates
-            filter_dict=filter_dict,
-            vector_dimension=128,  # Use fast 128d vectors
-            with_payload=True,  # Need payload for stage 2
-            with_vectors=False
-        )
+        collection_name = self._get_collection_name(organization_id, collection_type)
 
-        if not fast_results:
-            logger.debug("No candidates found in stage 1")
-            return []
+        # Ensure collection exists
+        await self.ensure_organization_collections(organization_id)
 
-        logger.info(f"📊 Stage 1: Found {len(fast_results)} candidates with 128d search")
+        filter_obj = self._build_search_filter(organization_id, filter_dict)
+        search_params = self._default_search_params()
+        initial_limit = max(initial_limit, final_limit)
 
-        # Stage 2: Rerank with 768d vectors for precision
-        # Get the IDs of candidates
-        candidate_ids = [result['id'] for result in fast_results]
+        logger.info(f"🔍 Two-stage MRL search: {initial_limit} candidates (128d) -> {final_limit} results (768d)")
 
-        logger.info(f"🔍 Stage 2 starting with {len(candidate_ids)} candidate IDs")
-        logger.debug(f"First 5 candidate IDs: {candidate_ids[:5]}")
+        try:
+            response = await self._run(
+                lambda client: client.query_points(
+                    collection_name=collection_name,
+                    prefetch=self._two_stage_prefetch(query_vector, filter_obj, search_params, initial_limit),
+                    # Rescores only the prefetched candidates with full 768d vectors
+                    query=query_vector[:768],
+                    using="vector_768",
+                    query_filter=filter_obj,
+                    search_params=search_params,
+                    score_threshold=score_threshold,
+                    limit=final_limit,
+                    with_payload=with_payload,
+                    with_vectors=with_vectors
+                )
+            )
+            results = response.points if hasattr(response, 'points') else response
 
-        # Search again with full 768d vectors, but only among candidates
-        collection_name = self._get_collection_name(organization_id, collection_type)
+            final_results = [
+                {
+                    "id": str(result.id),
+                    "score": result.score,
+                    "payload": result.payload if with_payload else None,
+                    "vector": result.vector if with_vectors else None
+                }
+                for result in results
+            ]
 
-        # For reranking, we only want to search among the candidates from stage 1
-        try:
-            # Use full 768d vectors for precise reranking
-            search_dim = 768
-            vector_name = f"vector_{search_dim}"
+            logger.info(f"✅ Two-stage search returned {len(final_results)} results")
+            return final_results
 
-            # Proper implementation using HasIdCondition filter
-            from qdrant_client.models import Filter, HasIdCondition
+        except Exception as e:
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process; re-check on next call
+                self._collection_cache.discard(collection_name)
+                logger.warning(f"Collection '{collection_name}' not found, returning empty results")
+                return []
+            logger.error(f"Failed two-stage search: {e}")
+            raise
 
-            # Ensure IDs are properly formatted as strings (UUIDs)
-            formatted_ids = [str(cid) for cid in candidate_ids]
+    async def search_vectors_batch(
+        self,
+        organization_id: str,
+        queries: List[Dict[str, Any]],
+        collection_type: str = CONTENT_COLLECTION,
+        with_payload: bool = True,
+        with_vectors: Union[bool, List[str]] = False
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches against one organization's collection in a single request.
 
-            logger.info(f"🔄 Performing 768d search with HasIdCondition filter")
-            logger.debug(f"Filtering to {len(formatted_ids)} specific IDs: {formatted_ids[:3]}...")
+        Each query is a dict with:
+            query_vector: Query embedding (list or np.ndarray), required
+            limit: Number of results (default 5)
+            score_threshold: Minimum score threshold (default None)
+            filter_dict: Additional exact-match filters (default None)
+            vector_dimension: MRL dimension for single-stage search (default mrl_search_dimension)
+            two_stage: Use 128d prefetch -> 768d rescoring (MRL only, default False)
+            initial_limit: Stage-1 candidates for two-stage queries (default limit * 3)
 
-            # Create HasIdCondition filter to search only among candidates
-            id_filter = Filter(
-                must=[
-                    HasIdCondition(has_id=formatted_ids)
-                ]
+        Args:
+            organization_id: Organization ID
+            queries: Per-query vectors, filters and limits
+            collection_type: Type of collection to search
+            with_payload: Include payload in results
+            with_vectors: Include vectors in results (True, or a list of vector names)
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        if not queries:
+            return []
+
+        collection_name = self._get_collection_name(organization_id, collection_type)
+
+        # Ensure collection exists
+        await self.ensure_organization_collections(organization_id)
+
+        search_params = self._default_search_params()
+        requests = []
+        for query in queries:
+            query_vector = query["query_vector"]
+            if isinstance(query_vector, np.ndarray):
+                query_vector = query_vector.tolist()
+
+            limit = query.get("limit", 5)
+            filter_obj = self._build_search_filter(organization_id, query.get("filter_dict"))
+            request_args = dict(
+                filter=filter_obj,
+                params=search_params,
+                score_threshold=query.get("score_threshold"),
+                limit=limit,
+                with_payload=with_payload,
+                with_vector=with_vectors
             )
 
-            # Since HasIdCondition with query_points doesn't work with named vectors,
-            # use the working approach: broader search + manual filtering
-            logger.info(f"🔄 Performing 768d search and filtering to candidate IDs")
+            if settings.enable_mrl and query.get("two_stage"):
+                initial_limit = max(query.get("initial_limit", limit * 3), limit)
+                requests.append(QueryRequest(
+                    prefetch=self._two_stage_prefetch(query_vector, filter_obj, search_params, initial_limit),
+                    query=query_vector[:768],
+                    using="vector_768",
+                    **request_args
+                ))
+            elif settings.enable_mrl:
+                search_dim = query.get("vector_dimension") or settings.mrl_search_dimension
+                requests.append(QueryRequest(
+                    query=query_vector[:search_dim],
+                    using=f"vector_{search_dim}",
+                    **request_args
+                ))
+            else:
+                requests.append(QueryRequest(query=query_vector, **request_args))
 
-            # Do a broader search with 768d vectors to get more results than needed
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.query_points(
+        try:
+            responses = await self._run(
+                lambda client: client.query_batch_points(
                     collection_name=collection_name,
-                    query=query_vector[:search_dim],
-                    using=vector_name,  # Use 768d vectors
-                    limit=initial_limit * 2,  # Get more results to filter from
-                    with_payload=with_payload,
-                    with_vectors=with_vectors,
-                    score_threshold=0.1,  # Lower threshold to ensure we get candidates
-                    search_params=SearchParams(
-                        hnsw_ef=256,
-                        exact=False  # Use HNSW for efficiency
-                    )
+                    requests=requests
                 )
             )
 
-            # Extract points from response
-            all_768_results = response.points if hasattr(response, 'points') else response
+            logger.debug(f"🔍 Batch search: {len(requests)} queries in one request")
+
+            return [
+                [
+                    {
+                        "id": str(result.id),
+                        "score": result.score,
+                        "payload": result.payload if with_payload else None,
+                        "vector": result.vector if with_vectors else None
+                    }
+                    for result in response.points
+                ]
+                for response in responses
+            ]
+
+        except Exception as e:
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process; re-check on next call
+                self._collection_cache.discard(collection_name)
+                logger.warning(f"Collection '{collection_name}' not found, returning empty results")
+                return [[] for _ in queries]
+            logger.error(f"Failed to batch search vectors: {e}")
+            raise
+
+    async def search_vectors_by_project(
+        self,
+        organization_id: str,
+        query_vector: Union[List[float], np.ndarray],
+        project_ids: List[str],
+        per_project_limit: int,
+        total_limit: Optional[int] = None,
+        collection_type: str = CONTENT_COLLECTION,
+        score_threshold: Optional[float] = None,
+        two_stage: bool = False,
+        initial_limit: Optional[int] = None,
+        with_payload: bool = True,
+        with_vectors: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several projects with one grouped query and a per-project quota.
+
+        Runs a single query_points_groups request with a match-any project filter,
+        grouped by project_id, so each project contributes at most per_project_limit
+        results and no project can crowd out the others.
+
+        Args:
+            organization_id: Organization ID
+            query_vector: Query embedding
+            project_ids: Projects to search
+            per_project_limit: Maximum results per project
+            total_limit: Maximum results overall (after merging by score)
+            collection_type: Type of collection to search
+            score_threshold: Minimum score threshold
+            two_stage: Use 128d prefetch -> 768d rescoring (MRL only)
+            initial_limit: Stage-1 candidates for two-stage search
+                (default per_project_limit * len(project_ids) * 3)
+            with_payload: Include payload in results
+            with_vectors: Include vectors in results
+
+        Returns:
+            Results from all projects sorted by score
+        """
+        if not project_ids:
+            return []
 
-            logger.info(f"📊 768d search returned {len(all_768_results) if all_768_results else 0} total results")
+        if isinstance(query_vector, np.ndarray):
+            query_vector = query_vector.tolist()
 
-            # Filter to only include our candidate IDs (this is the effective "HasIdCondition")
-            candidate_id_set = set(formatted_ids)
+        collection_name = self._get_collection_name(organization_id, collection_type)
 
-            # Filter and keep only candidates from stage 1
-            reranked_points = []
-            for point in all_768_results:
-                point_id = str(point.id)
-                if point_id in candidate_id_set:
-                    reranked_points.append(point)
-                    logger.debug(f"✓ Found candidate {point_id} with score {point.score:.3f}")
+        # Ensure collection exists
+        await self.ensure_organization_collections(organization_id)
 
-            logger.info(f"📈 Filtered to {len(reranked_points)} candidates from Stage 1")
+        filter_obj = self._build_search_filter(
+            organization_id, {"project_id": [str(pid) for pid in project_ids]}
+        )
+        search_params = self._default_search_params()
 
-            # Sort by score and take top results
-            reranked_points.sort(key=lambda x: x.score, reverse=True)
-            final_points = reranked_points[:final_limit]
+        query_args = dict(
+            collection_name=collection_name,
+            group_by="project_id",
+            limit=len(project_ids),
+            group_size=per_project_limit,
+            query_filter=filter_obj,
+            search_params=search_params,
+            score_threshold=score_threshold,
+            with_payload=with_payload,
+            with_vectors=with_vectors
+        )
+        if settings.enable_mrl and two_stage:
+            initial_limit = initial_limit or per_project_limit * len(project_ids) * 3
+            query_args.update(
+                prefetch=self._two_stage_prefetch(query_vector, filter_obj, search_params, initial_limit),
+                query=query_vector[:768],
+                using="vector_768"
+            )
+        elif settings.enable_mrl:
+            search_dim = settings.mrl_search_dimension
+            query_args.update(query=query_vector[:search_dim], using=f"vector_{search_dim}")
+        else:
+            query_args.update(query=query_vector)
 
-            logger.info(f"🎯 Final selection: {len(final_points)} results")
+        try:
+            response = await self._run(
+                lambda client: client.query_points_groups(**query_args)
+            )
 
-            # Format results
-            final_results = [
+            results = [
                 {
-                    "id": str(result.id),
-                    "score": result.score,
-                    "payload": result.payload if with_payload else None,
-                    "vector": result.vector if with_vectors else None
+                    "id": str(hit.id),
+                    "score": hit.score,
+                    "payload": hit.payload if with_payload else None,
+                    "vector": hit.vector if with_vectors else None
                 }
-                for result in final_points
+                for group in response.groups
+                for hit in group.hits
             ]
+            results.sort(key=lambda r: r["score"], reverse=True)
 
-            # Log score improvements
-            if final_results and fast_results:
-                stage1_scores = [r['score'] for r in fast_results[:final_limit]]
-                stage2_scores = [r['score'] for r in final_results]
+            logger.info(
+                f"🔍 Grouped search: {len(response.groups)}/{len(project_ids)} projects with results, "
+                f"{len(results)} hits"
+            )
+            return results[:total_limit] if total_limit else results
 
-                avg_stage1 = sum(stage1_scores) / len(stage1_scores) if stage1_scores else 0
-                avg_stage2 = sum(stage2_scores) / len(stage2_scores) if stage2_scores else 0
+        except Exception as e:
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process; re-check on next call
+                self._collection_cache.discard(collection_name)
+                logger.warning(f"Collection '{collection_name}' not found, returning empty results")
+                return []
+            logger.error(f"Failed grouped project search: {e}")
+            raise
 
-                logger.info(f"📊 Score improvement: Stage 1 avg={avg_stage1:.3f} → Stage 2 avg={avg_stage2:.3f} (Δ={avg_stage2-avg_stage1:+.3f})")
+    async def search_hybrid(
+        self,
+        organization_id: str,
+        query_vector: Union[List[float], np.ndarray],
+        query_text: str,
+        limit: int = 10,
+        dense_limit: int = 30,
+        sparse_limit: int = 30,
+        filter_dict: Optional[Dict] = None,
+        two_stage: bool = True,
+        with_payload: bool = True,
+        with_vectors: Union[bool, List[str]] = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Dense + sparse (BM25) retrieval fused with Reciprocal Rank Fusion in one query_points call.
 
-            # Log individual candidate matches for debugging
-            for result in final_results[:5]:  # Log first 5
-                logger.debug(f"✓ Reranked candidate {result['id']} with score {result['score']:.3f}")
+        Both prefetches run under the tenant/project filter. The dense branch is the
+        128d -> 768d MRL two-stage search when two_stage is set.
 
-            logger.info(f"🎯 Stage 2 completed: {len(final_results)} results with HasIdCondition")
+        Args:
+            organization_id: Organization ID
+            query_vector: Full query embedding (768d)
+            query_text: Query text for the sparse branch
+            limit: Number of fused results
+            dense_limit: Candidates from the dense branch
+            sparse_limit: Candidates from the sparse branch
+            filter_dict: Additional filters
+            two_stage: Use 128d prefetch before 768d scoring in the dense branch
+            with_payload: Include payload in results
+            with_vectors: Include vectors in results (True, or a list of vector names)
 
-            # If we got no results from reranking, fall back to stage 1
-            if not final_results:
-                logger.warning("⚠️ Stage 2 produced no results, falling back to Stage 1 results")
-                final_results = fast_results[:final_limit]
+        Returns:
+            Results ordered by RRF score (score is the fused score), or None when the
+            collection has no sparse vector and fusion is not possible
+        """
+        if isinstance(query_vector, np.ndarray):
+            query_vector = query_vector.tolist()
 
-            logger.info(
-                f"✅ Stage 2: Reranked to {len(final_results)} results with 768d vectors. "
-                f"Score improvement: {sum(r['score'] for r in final_results[:5]) / min(5, len(final_results)) if final_results else 0:.3f}"
+        collection_name = self._get_collection_name(organization_id, self.CONTENT_COLLECTION)
+        await self.ensure_organization_collections(organization_id)
+
+        if not await self._supports_sparse(collection_name):
+            return None
+
+        from services.rag.sparse_encoder import sparse_encoder
+
+        filter_obj = self._build_search_filter(organization_id, filter_dict)
+        search_params = self._default_search_params()
+
+        dense_prefetch = Prefetch(
+            prefetch=(
+                self._two_stage_prefetch(query_vector, filter_obj, search_params, dense_limit * 3)
+                if two_stage else None
+            ),
+            query=query_vector[:768],
+            using="vector_768",
+            filter=filter_obj,
+            params=search_params,
+            limit=dense_limit
+        )
+        prefetches = [dense_prefetch]
+
+        sparse_query = sparse_encoder.encode_query(query_text)
+        if sparse_query.indices:
+            prefetches.append(Prefetch(
+                query=sparse_query,
+                using=self.SPARSE_VECTOR_NAME,
+                filter=filter_obj,
+                limit=sparse_limit
+            ))
+
+        try:
+            response = await self._run(
+                lambda client: client.query_points(
+                    collection_name=collection_name,
+                    prefetch=prefetches,
+                    query=FusionQuery(fusion=Fusion.RRF),
+                    limit=limit,
+                    with_payload=with_payload,
+                    with_vectors=with_vectors
+                )
             )
+            results = response.points if hasattr(response, 'points') else response
 
-            return final_results
+            logger.info(f"🔍 Hybrid RRF search returned {len(results)} results ({len(prefetches)} branches)")
+            return [
+                {
+                    "id": str(result.id),
+                    "score": result.score,
+                    "payload": result.payload if with_payload else None,
+                    "vector": result.vector if with_vectors else None
+                }
+                for result in results
+            ]
 
         except Exception as e:
-            logger.error(f"❌ Failed in stage 2 reranking: {e}", exc_info=True)
-            logger.warning("⚠️ Falling back to Stage 1 results due to error")
-            # Fall back to stage 1 results
-            final_results = fast_results[:final_limit]
-            logger.info(f"📌 Returning {len(final_results)} results from Stage 1 fallback")
-            return final_results
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process; re-check on next call
+                self._collection_cache.discard(collection_name)
+                logger.warning(f"Collection '{collection_name}' not found, returning empty results")
+                return []
+            logger.error(f"Failed hybrid search: {e}")
+            raise
 
     async def delete_vectors(
         self,
@@ -682,42 +1105,29 @@ class MultiTenantVectorStore:
         """Delete vectors from an organization's collection."""
         collection_name = self._get_collection_name(organization_id, collection_type)
 
-        if not await self._collection_exists(collection_name):
+        if not self._collection_cache.contains(collection_name) and not await self._collection_exists(collection_name):
             logger.warning(f"Collection '{collection_name}' does not exist, nothing to delete")
             return True
 
         try:
             if points_selector:
                 # Delete specific points by ID
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.client.delete,
-                    collection_name,
-                    HasIdCondition(has_id=points_selector)
+                await self._run(
+                    lambda client: client.delete(
+                        collection_name,
+                        points_selector=PointIdsList(points=points_selector)
+                    )
                 )
                 logger.info(f"Deleted {len(points_selector)} vectors from '{collection_name}'")
             elif filter_dict:
                 # Delete by filter
-                must_conditions = [
-                    FieldCondition(
-                        key="organization_id",
-                        match=MatchValue(value=str(organization_id))
-                    )
-                ]
+                filter_obj = self._build_search_filter(organization_id, filter_dict)
 
-                for key, value in filter_dict.items():
-                    if key != "organization_id":
-                        must_conditions.append(
-                            FieldCondition(key=key, match=MatchValue(value=value))
-                        )
-
-                filter_obj = Filter(must=must_conditions)
-
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.client.delete,
-                    collection_name,
-                    filter_obj
+                await self._run(
+                    lambda client: client.delete(
+                        collection_name,
+                        points_selector=FilterSelector(filter=filter_obj)
+                    )
                 )
                 logger.info(f"Deleted vectors matching filter from '{collection_name}'")
             else:
@@ -727,15 +1137,169 @@ class MultiTenantVectorStore:
             return True
 
         except Exception as e:
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process; re-check on next call
+                self._collection_cache.discard(collection_name)
+                self._sparse_support.pop(collection_name, None)
+                logger.warning(f"Collection '{collection_name}' not found, nothing to delete")
+                return True
             logger.error(f"Failed to delete vectors: {e}")
             raise
 
+    async def get_points(
+        self,
+        organization_id: str,
+        point_ids: List[str],
+        collection_type: str = CONTENT_COLLECTION,
+        with_payload: bool = True,
+        with_vectors: Union[bool, List[str]] = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch points by ID, preserving the order of point_ids (missing IDs are skipped).
+
+        Args:
+            organization_id: Organization ID
+            point_ids: Point IDs to fetch
+            collection_type: Type of collection
+            with_payload: Include payload in results
+            with_vectors: Include vectors in results (True, or a list of vector names)
+
+        Returns:
+            List of {id, payload, vector} dicts
+        """
+        if not point_ids:
+            return []
+
+        collection_name = self._get_collection_name(organization_id, collection_type)
+
+        try:
+            points = await self._run(
+                lambda client: client.retrieve(
+                    collection_name,
+                    ids=point_ids,
+                    with_payload=with_payload,
+                    with_vectors=with_vectors
+                )
+            )
+        except Exception as e:
+            if self._is_collection_not_found(e):
+                self._collection_cache.discard(collection_name)
+                return []
+            logger.error(f"Failed to retrieve points: {e}")
+            raise
+
+        by_id = {str(point.id): point for point in points}
+        return [
+            {
+                "id": point_id,
+                "payload": by_id[point_id].payload if with_payload else None,
+                "vector": by_id[point_id].vector if with_vectors else None
+            }
+            for point_id in map(str, point_ids)
+            if point_id in by_id
+        ]
+
+    async def find_points(
+        self,
+        organization_id: str,
+        filter_dict: Dict[str, Any],
+        collection_type: str = CONTENT_COLLECTION,
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: Union[bool, List[str]] = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every point matching a payload filter (lists match any of their values).
+
+        Unlike scroll_documents, errors other than a missing collection are raised,
+        so callers can rely on an empty result meaning "no such points".
+
+        Args:
+            organization_id: Organization ID
+            filter_dict: Payload filters (scoped to the organization)
+            collection_type: Type of collection
+            with_payload: Include payload in results (True, or a list of payload keys)
+            with_vectors: Include vectors in results (True, or a list of vector names)
+
+        Returns:
+            List of {id, payload, vector} dicts
+        """
+        collection_name = self._get_collection_name(organization_id, collection_type)
+        filter_obj = self._build_search_filter(organization_id, filter_dict)
+
+        found: List[Dict[str, Any]] = []
+        offset = None
+        try:
+            while True:
+                points, offset = await self._run(
+                    lambda client: client.scroll(
+                        collection_name=collection_name,
+                        scroll_filter=filter_obj,
+                        limit=256,
+                        offset=offset,
+                        with_payload=with_payload,
+                        with_vectors=with_vectors
+                    )
+                )
+                found.extend(
+                    {
+                        "id": str(point.id),
+                        "payload": point.payload if with_payload else None,
+                        "vector": point.vector if with_vectors else None
+                    }
+                    for point in points
+                )
+                if offset is None:
+                    break
+        except Exception as e:
+            if self._is_collection_not_found(e):
+                self._collection_cache.discard(collection_name)
+                return []
+            logger.error(f"Failed to find points: {e}")
+            raise
+
+        return found
+
+    async def update_payloads(
+        self,
+        organization_id: str,
+        payloads: Dict[str, Dict[str, Any]],
+        collection_type: str = CONTENT_COLLECTION
+    ) -> None:
+        """
+        Merge new payload values into existing points in one batch request.
+
+        Args:
+            organization_id: Organization ID
+            payloads: Point ID -> payload keys to set
+            collection_type: Type of collection
+        """
+        if not payloads:
+            return
+
+        collection_name = self._get_collection_name(organization_id, collection_type)
+        operations = [
+            SetPayloadOperation(set_payload=SetPayload(payload=payload, points=[point_id]))
+            for point_id, payload in payloads.items()
+        ]
+        try:
+            await self._run(lambda client: client.batch_update_points(collection_name, operations))
+        except Exception as e:
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process, and the points with it
+                self._collection_cache.discard(collection_name)
+                self._sparse_support.pop(collection_name, None)
+                logger.warning(f"Collection '{collection_name}' not found, no payloads to update")
+                return
+            logger.error(f"Failed to update payloads: {e}")
+            raise
+        logger.debug(f"Updated payload of {len(operations)} points in '{collection_name}'")
+
     async def get_collection_info(self, organization_id: str, collection_type: str = CONTENT_COLLECTION) -> Dict[str, Any]:
         """Get information about an organization's collection."""
         collection_name = self._get_collection_name(organization_id, collection_type)
 
         try:
-            if not await self._collection_exists(collection_name):
+            if not self._collection_cache.contains(collection_name) and not await self._collection_exists(collection_name):
                 return {
                     "name": collection_name,
                     "exists": False,
@@ -743,9 +1307,7 @@ class MultiTenantVectorStore:
                     "collection_type": collection_type
                 }
 
-            info = await asyncio.get_event_loop().run_in_executor(
-                None, self.client.get_collection, collection_name
-            )
+            info = await self._run(lambda client: client.get_collection(collection_name))
 
             # Handle both single vector and named vectors (MRL)
             vectors_config = info.config.params.vectors
@@ -802,11 +1364,7 @@ class MultiTenantVectorStore:
 
         try:
             # Count total points to migrate
-            count_result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.client.count,
-                source_collection
-            )
+            count_result = await self._run(lambda client: client.count(source_collection))
             total_points = count_result.count
 
             if total_points == 0:
@@ -820,14 +1378,14 @@ class MultiTenantVectorStore:
 
             while migrated < total_points:
                 # Scroll through points in batches
-                results, next_offset = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.client.scroll,
-                    source_collection,
-                    limit=batch_size,
-                    offset=offset,
-                    with_payload=True,
-                    with_vectors=True
+                results, next_offset = await self._run(
+                    lambda client: client.scroll(
+                        source_collection,
+                        limit=batch_size,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=True
+                    )
                 )
 
                 if not results:
@@ -849,12 +1407,7 @@ class MultiTenantVectorStore:
 
                 # Insert into target collection
                 if points:
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        self.client.upsert,
-                        target_collection,
-                        points
-                    )
+                    await self._run(lambda client: client.upsert(target_collection, points))
                     migrated += len(points)
                     logger.info(f"Migrated {migrated}/{total_points} points")
 
@@ -893,9 +1446,9 @@ class MultiTenantVectorStore:
         Returns:
             List of documents with their metadata
         """
-        try:
-            collection_name = self._get_collection_name(organization_id, collection_type)
+        collection_name = self._get_collection_name(organization_id, collection_type)
 
+        try:
             # Ensure collections exist
             await self.ensure_organization_collections(organization_id)
 
@@ -922,9 +1475,8 @@ class MultiTenantVectorStore:
 
             while True:
                 # Scroll through documents
-                scroll_result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.client.scroll(
+                scroll_result = await self._run(
+                    lambda client: client.scroll(
                         collection_name=collection_name,
                         scroll_filter=qdrant_filter,
                         limit=batch_size,
@@ -960,29 +1512,47 @@ class MultiTenantVectorStore:
             return all_documents
 
         except Exception as e:
+            if self._is_collection_not_found(e):
+                # Collection was removed outside this process; re-check on next call
+                self._collection_cache.discard(collection_name)
+                self._sparse_support.pop(collection_name, None)
+                logger.warning(f"Collection '{collection_name}' not found, returning no documents")
+                return []
             logger.error(f"Failed to scroll documents: {e}")
             return []
 
     async def check_connection(self) -> bool:
         """Check if Qdrant connection is healthy."""
         try:
-            client = self.client
-            collections = await asyncio.get_event_loop().run_in_executor(
-                None, client.get_collections
-            )
+            await self._run(lambda client: client.get_collections())
             return True
         except Exception as e:
             logger.error(f"Qdrant health check failed: {e}")
             return False
 
     async def close(self) -> None:
-        """Close the Qdrant client connection."""
+        """Close the Qdrant client connections."""
         if self._client:
             self._client.close()
             self._client = None
             self._collection_cache.clear()
             logger.info("Qdrant client connection closed")
 
+        if self._async_client:
+            await self._async_client.close()
+            self._async_client = None
+            self._collection_cache.clear()
+            logger.info("Async Qdrant client connection closed")
+
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the active Qdrant client has been created."""
+        return (self._async_client if self.use_async_client else self._client) is not None
+
+    def get_collection_registry_stats(self) -> Dict[str, Any]:
+        """Size and hit rate of the known-collections registry."""
+        return self._collection_cache.get_stats()
+
 
 # Create a singleton instance
 multi_tenant_vector_store = MultiTenantVectorStore()
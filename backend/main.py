@@ -25,6 +25,7 @@ from utils.logger import get_logger
 from db.database import init_database, close_database
 from db.multi_tenant_vector_store import multi_tenant_vector_store
 from services.rag.embedding_service import init_embedding_service
+from services.rag.model_registry import preload_shared_models, release_shared_models
 from services.scheduling.scheduler_service import scheduler_service
 from services.scheduler.digest_scheduler import digest_scheduler
 from services.llm.multi_llm_client import get_multi_llm_client
@@ -145,6 +146,27 @@ async def lifespan(app: FastAPI):
         logger.error("Please check your HF_TOKEN and network connectivity")
         raise RuntimeError(f"Cannot start application without embedding service: {e}")
 
+    # Pre-load the models shared by the RAG and transcript services in a thread pool,
+    # so the first request doesn't load them on the event loop
+    from services.rag.hybrid_search import hybrid_search_service
+    from services.rag.intelligent_chunking import intelligent_chunking_service
+    from services.rag.multi_query_retrieval import multi_query_retrieval_service
+    from services.intelligence.meeting_intelligence import meeting_intelligence_service
+    from services.transcription.advanced_transcript_parser import advanced_transcript_processor
+    model_services = [
+        hybrid_search_service,
+        intelligent_chunking_service,
+        multi_query_retrieval_service,
+        meeting_intelligence_service,
+        advanced_transcript_processor,
+    ]
+    try:
+        await preload_shared_models(*model_services)
+        logger.info("✅ Shared ML models pre-loaded successfully")
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to pre-load shared ML models: {e}")
+        # Continue running - models will load on first use
+
     # Initialize zero-shot validator (MANDATORY - app will not start without it)
     if settings.enable_zeroshot_validation:
         try:
@@ -238,6 +260,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error shutting down telemetry: {e}")
 
+    release_shared_models(*model_services)
+
     await close_database()
     await multi_tenant_vector_store.close()
 
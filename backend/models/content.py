@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, date
 from sqlalchemy import Column, String, Text, DateTime, Date, ForeignKey, Boolean, Integer, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
 
@@ -30,6 +30,10 @@ class Content(Base):
     uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     uploaded_by = Column(String(255), nullable=True)
     chunk_count = Column(Integer, default=0, nullable=False)
+    # SHA-256 of the whitespace-normalized text (whole-document duplicate detection)
+    content_hash = Column(String(64), nullable=True, index=True)
+    # SHA-256 per chunk in chunk order (incremental re-indexing); mirrored in the Qdrant payload
+    chunk_hashes = Column(JSONB, nullable=True)
     summary_generated = Column(Boolean, default=False, nullable=False)
     
     is_demo = Column(Boolean, default=False, nullable=False, server_default="false")
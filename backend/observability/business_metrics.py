@@ -120,6 +120,18 @@ class BusinessMetrics:
             unit="score",
         )
 
+        self.answer_cache_lookups = self.meter.create_counter(
+            name="business.rag.answer_cache.lookups",
+            description="RAG answer cache lookups by result (hit/miss) and tier (hit rate = hits / lookups)",
+            unit="lookups",
+        )
+
+        self.answer_cache_tokens_saved = self.meter.create_counter(
+            name="business.rag.answer_cache.tokens_saved",
+            description="LLM tokens not spent because an answer was served from the cache",
+            unit="tokens",
+        )
+
         # === LLM COST METRICS ===
         self.llm_cost_per_user = self.meter.create_histogram(
             name="business.llm.cost.per_user",
@@ -373,6 +385,24 @@ class BusinessMetrics:
         except Exception as e:
             logger.error(f"Failed to record meeting processed metrics: {e}")
 
+    def record_answer_cache_lookup(
+        self,
+        hit: bool,
+        tier: Optional[str] = None,
+        tokens_saved: int = 0,
+        organization_id: Optional[str] = None,
+    ):
+        """Record a RAG answer cache lookup and the LLM tokens a hit saved."""
+        try:
+            attributes = {"result": "hit" if hit else "miss", "tier": tier or "none"}
+            if organization_id:
+                attributes["organization_id"] = organization_id
+            self.answer_cache_lookups.add(1, attributes)
+            if hit and tokens_saved > 0:
+                self.answer_cache_tokens_saved.add(tokens_saved, attributes)
+        except Exception as e:
+            logger.error(f"Failed to record answer cache metrics: {e}")
+
     def record_project_created(self, user_id: str, organization_id: Optional[str] = None):
         """Record a new project creation."""
         try:
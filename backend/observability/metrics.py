@@ -109,6 +109,54 @@ class TellMeMoMetrics:
             unit="texts",
         )
 
+        self.embedding_batch_size = self.meter.create_histogram(
+            name="embedding.batch.size",
+            description="Number of texts encoded per micro-batch",
+            unit="texts",
+        )
+
+        self.embedding_batch_requests = self.meter.create_histogram(
+            name="embedding.batch.requests",
+            description="Number of caller requests coalesced per micro-batch",
+            unit="requests",
+        )
+
+        self.embedding_batch_wait = self.meter.create_histogram(
+            name="embedding.batch.wait",
+            description="Time a request waited in the embedding queue before encoding",
+            unit="ms",
+        )
+
+        self.embedding_cache_hits = self.meter.create_counter(
+            name="embedding.cache.hits",
+            description="Total number of embedding cache hits",
+            unit="texts",
+        )
+
+        self.embedding_cache_misses = self.meter.create_counter(
+            name="embedding.cache.misses",
+            description="Total number of embedding cache misses",
+            unit="texts",
+        )
+
+        self.rerank_cache_hits = self.meter.create_counter(
+            name="rerank.cache.hits",
+            description="Total number of cross-encoder score cache hits",
+            unit="pairs",
+        )
+
+        self.rerank_cache_misses = self.meter.create_counter(
+            name="rerank.cache.misses",
+            description="Total number of cross-encoder score cache misses",
+            unit="pairs",
+        )
+
+        self.embedding_queue_depth = self.meter.create_histogram(
+            name="embedding.queue.depth",
+            description="Pending embedding requests observed after each micro-batch",
+            unit="requests",
+        )
+
         # === Meeting Intelligence Metrics ===
         self.meetings_transcribed_total = self.meter.create_counter(
             name="meetings.transcribed.total",
@@ -291,6 +339,36 @@ class TellMeMoMetrics:
         if success:
             self.embedding_texts_processed.add(text_count, attributes)
 
+    def record_embedding_batch(
+        self,
+        batch_size: int,
+        request_count: int,
+        wait_times_ms: list,
+        queue_depth: int,
+        scheduler: str = "embedding",
+    ):
+        """Record metrics for an inference micro-batch (embedding or rerank scheduler)."""
+        attributes = {"batch.scheduler": scheduler}
+        self.embedding_batch_size.record(batch_size, attributes)
+        self.embedding_batch_requests.record(request_count, attributes)
+        for wait_ms in wait_times_ms:
+            self.embedding_batch_wait.record(wait_ms, attributes)
+        self.embedding_queue_depth.record(queue_depth, attributes)
+
+    def record_embedding_cache(self, hits: int, misses: int):
+        """Record embedding cache lookups."""
+        if hits:
+            self.embedding_cache_hits.add(hits)
+        if misses:
+            self.embedding_cache_misses.add(misses)
+
+    def record_rerank_cache(self, hits: int, misses: int):
+        """Record cross-encoder score cache lookups."""
+        if hits:
+            self.rerank_cache_hits.add(hits)
+        if misses:
+            self.rerank_cache_misses.add(misses)
+
     def record_transcription(self, service: str, duration: float, success: bool = True):
         """Record metrics for transcription."""
         attributes = {
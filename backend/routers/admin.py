@@ -6,6 +6,7 @@ from config import get_settings
 from utils.logger import get_logger
 from db.database import db_manager
 from db.multi_tenant_vector_store import multi_tenant_vector_store
+from services.rag.keyword_index import keyword_index
 
 router = APIRouter()
 settings = get_settings()
@@ -171,6 +172,7 @@ async def reset_database(
                 vectors_count = collection.get("vectors_count", 0) or 0
                 deleted_counts["vectors"] += vectors_count
                 await multi_tenant_vector_store.delete_organization_collections(org_id)
+                await keyword_index.remove_organization(org_id)
 
         logger.info(f"Cleared {len(org_collections)} organization collections")
 
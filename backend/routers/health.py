@@ -7,6 +7,7 @@ from config import get_settings
 from utils.logger import get_logger
 from db.database import db_manager
 from db.multi_tenant_vector_store import multi_tenant_vector_store
+from services.rag.model_registry import model_registry
 
 settings = get_settings()
 router = APIRouter()
@@ -42,7 +43,8 @@ async def health_check():
             qdrant_info = {
                 "total_collections": len(org_collections),
                 "organizations": len(set(c.get("organization_id") for c in org_collections)),
-                "total_vectors": sum(c.get("vectors_count", 0) for c in org_collections)
+                "total_vectors": sum(c.get("vectors_count", 0) for c in org_collections),
+                "collection_registry": multi_tenant_vector_store.get_collection_registry_stats()
             }
         
         services_status = {
@@ -60,7 +62,9 @@ async def health_check():
                 "port": settings.qdrant_port,
                 "collection": settings.qdrant_collection,
                 **qdrant_info
-            }
+            },
+            # ML models resident in this process (loaded lazily, shared across services)
+            "models": model_registry.get_stats()
         }
         
         # Overall status is healthy only if all critical services are healthy
@@ -10,6 +10,7 @@ from dependencies.auth import get_current_organization, get_current_user, requir
 from models.organization import Organization
 from models.user import User
 from services.hierarchy.hierarchy_service import HierarchyService
+from services.cache.project_scope_cache import project_scope_cache
 from utils.logger import get_logger
 
 router = APIRouter(prefix="/api/v1/hierarchy", tags=["hierarchy"])
@@ -333,6 +334,7 @@ async def bulk_delete_items(
                     project = await session.get(Project, item_uuid)
                     if project:
                         await session.delete(project)
+                        project_scope_cache.invalidate([item_uuid])
                         deleted_count += 1
                 
                 elif item_type == 'program':
@@ -358,6 +360,7 @@ async def bulk_delete_items(
                                 reassigned_count += 1
                         
                         await session.delete(program)
+                        project_scope_cache.invalidate_program(item_uuid)
                         deleted_count += 1
                 
                 elif item_type == 'portfolio':
@@ -394,6 +397,7 @@ async def bulk_delete_items(
                                 reassigned_count += 1
                         
                         await session.delete(portfolio)
+                        project_scope_cache.invalidate_portfolio(item_uuid)
                         deleted_count += 1
                 
             except ValueError:
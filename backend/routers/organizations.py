@@ -620,8 +620,10 @@ async def delete_organization(
 
         # Clean up Qdrant collections for this organization
         from db.multi_tenant_vector_store import multi_tenant_vector_store
+        from services.rag.keyword_index import keyword_index
         try:
             await multi_tenant_vector_store.delete_organization_collections(str(organization_id))
+            await keyword_index.remove_organization(str(organization_id))
             logger.info(f"Deleted Qdrant collections for organization {sanitize_for_log(organization_id)}")
         except Exception as qdrant_error:
             logger.error(f"Failed to delete Qdrant collections for organization {sanitize_for_log(organization_id)}: {qdrant_error}")
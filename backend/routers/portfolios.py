@@ -20,6 +20,7 @@ from pydantic import BaseModel
 from services.rag.enhanced_rag_service_refactored import enhanced_rag_service, RAGStrategy
 from services.summaries.summary_service_refactored import summary_service
 from services.activity.activity_service import ActivityService
+from services.cache.project_scope_cache import project_scope_cache
 from services.prompts.portfolio_prompts import (
     get_portfolio_query_prompt
     # Portfolio summary generation moved to hierarchy_summaries.py router
@@ -468,6 +469,7 @@ async def delete_portfolio(
     # due to the SET NULL foreign key constraint we configured
     await db.delete(portfolio)
     await db.commit()
+    project_scope_cache.invalidate(p["id"] for p in affected_entities["projects"])
 
     return {
         "message": f"Portfolio deleted successfully. {'All related entities deleted.' if cascade_delete else 'Related entities are now standalone.'}",
@@ -15,6 +15,7 @@ from models.portfolio import Portfolio
 from models.program import Program
 from models.project import Project, ProjectStatus
 from pydantic import BaseModel
+from services.cache.project_scope_cache import project_scope_cache
 
 
 router = APIRouter(prefix="/api/v1/programs", tags=["programs"])
@@ -459,6 +460,7 @@ async def delete_program(
     # due to the SET NULL foreign key constraint, making them standalone while keeping their portfolio_id
     await db.delete(program)
     await db.commit()
+    project_scope_cache.invalidate(p["id"] for p in affected_entities["projects"])
 
     return {
         "message": f"Program deleted successfully. {'All related projects deleted.' if cascade_delete else 'Related projects are now standalone.'}",
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, update
 from datetime import datetime
@@ -17,6 +18,8 @@ from services.rag.enhanced_rag_service_refactored import enhanced_rag_service
 from services.rag.conversation_context_service import conversation_context_service
 from services.activity.activity_service import ActivityService
 from utils.logger import get_logger, sanitize_for_log
+import asyncio
+import json
 import uuid
 
 router = APIRouter()
@@ -196,48 +199,9 @@ async def query_project(
     logger.info(f"Querying project {sanitize_for_log(project_id)}: {sanitize_for_log(request.question)}")
 
     try:
-        # Verify project exists and belongs to current organization
-        result = await session.execute(
-            select(Project).where(
-                and_(
-                    Project.id == project_id,
-                    Project.organization_id == current_org.id
-                )
-            )
+        conversation, actual_question, is_followup = await _prepare_project_question(
+            session, project_id, request, current_org
         )
-        project = result.scalar_one_or_none()
-
-        if not project:
-            raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
-
-        # Handle conversation context
-        conversation = None
-        conversation_messages = []
-        is_followup = False
-        actual_question = request.question
-
-        if request.conversation_id:
-            # Get existing conversation context
-            conversation, conversation_messages = await conversation_context_service.get_conversation_context(
-                conversation_id=request.conversation_id,
-                session=session,
-                organization_id=str(current_org.id)
-            )
-
-            if conversation:
-                # Detect if this is a follow-up question
-                is_followup = await conversation_context_service.detect_followup_question(
-                    question=request.question,
-                    conversation_messages=conversation_messages
-                )
-
-                if is_followup:
-                    # Enhance query with conversation context
-                    actual_question = await conversation_context_service.enhance_query_with_context(
-                        question=request.question,
-                        conversation_messages=conversation_messages
-                    )
-                    logger.info(f"Enhanced follow-up question with context for conversation {sanitize_for_log(request.conversation_id)}")
 
         # Execute enhanced RAG query with context-aware question
         response = await enhanced_rag_service.query_project(
@@ -245,60 +209,10 @@ async def query_project(
             question=actual_question
         )
 
-        # Create or update conversation
-        conversation_id = request.conversation_id
-
-        if not conversation:
-            # Create new conversation
-            conversation_title = conversation_context_service.create_conversation_title(request.question)
-            new_conversation = Conversation(
-                project_id=uuid.UUID(project_id),
-                organization_id=current_org.id,
-                title=conversation_title,
-                messages=[],
-                created_by=current_user.email or "unknown",
-                created_at=datetime.utcnow(),
-                last_accessed_at=datetime.utcnow()
-            )
-            session.add(new_conversation)
-            await session.flush()  # Get the ID
-            conversation_id = str(new_conversation.id)
-            conversation = new_conversation
-
-        # Add current Q&A to conversation messages
-        new_message = conversation_context_service.format_message_for_storage(
-            question=request.question,
-            answer=response['answer'],
-            sources=response['sources'],
-            confidence=response['confidence']
+        conversation_id = await _save_project_exchange(
+            session, project_id, request, conversation, response, current_org, current_user
         )
 
-        # Update conversation with new message and last accessed time
-        updated_messages = (conversation.messages or []) + [new_message]
-        await session.execute(
-            update(Conversation)
-            .where(Conversation.id == conversation_id)
-            .values(
-                messages=updated_messages,
-                last_accessed_at=datetime.utcnow()
-            )
-        )
-
-        # Log activity for query submission
-        try:
-            project_uuid = uuid.UUID(project_id)
-            await ActivityService.log_query_submitted(
-                db=session,
-                project_id=project_uuid,
-                query_text=request.question,
-                user_name=current_user.email or "unknown"
-            )
-            await session.commit()
-        except Exception as e:
-            logger.warning(f"Failed to log query activity: {e}")
-            # Still commit conversation updates
-            await session.commit()
-
         logger.info(f"Query completed - conversation_id: {sanitize_for_log(conversation_id)}, is_followup: {sanitize_for_log(is_followup)}")
 
         return QueryResponse(
@@ -316,6 +230,222 @@ async def query_project(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/{project_id}/query/stream")
+async def query_project_stream(
+    request_obj: Request,
+    project_id: str,
+    request: QueryRequest,
+    session: AsyncSession = Depends(get_db),
+    current_org: Organization = Depends(get_current_organization),
+    current_user: User = Depends(get_current_user),
+    _: str = Depends(require_role("member"))
+):
+    """
+    Query project content with the answer streamed as Server-Sent Events.
+
+    Events, in order:
+    - sources: answer sources and confidence, sent as soon as retrieval finishes
+    - token: answer text deltas as the LLM produces them ({"text": ...})
+    - done: the same fields as QueryResponse plus response_time_ms and time_to_first_token_ms
+    - error: sent instead of done if the query fails mid-stream
+
+    Args:
+        project_id: UUID of the project
+        request: Query request containing the question and optional conversation_id
+        session: Database session
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    logger.info(f"Streaming query for project {sanitize_for_log(project_id)}: {sanitize_for_log(request.question)}")
+
+    try:
+        conversation, actual_question, is_followup = await _prepare_project_question(
+            session, project_id, request, current_org
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Query failed for project {sanitize_for_log(project_id)}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def event_generator():
+        try:
+            async for event in enhanced_rag_service.stream_query_project(
+                project_id=project_id,
+                question=actual_question,
+                user_id=current_user.email,
+                organization_id=str(current_org.id)
+            ):
+                if event['event'] != 'done':
+                    if event['event'] == 'sources':
+                        event['data']['sources'] = event['data']['sources'][:10]
+                    yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+                    continue
+
+                response = event['data']
+                conversation_id = await _save_project_exchange(
+                    session, project_id, request, conversation, response, current_org, current_user
+                )
+                done_data = {
+                    "answer": response['answer'],
+                    "sources": response['sources'][:10],
+                    "confidence": response['confidence'],
+                    "conversation_id": conversation_id,
+                    "is_followup": is_followup,
+                    "response_time_ms": response.get('response_time_ms'),
+                    "time_to_first_token_ms": response.get('time_to_first_token_ms')
+                }
+                logger.info(f"Streaming query completed - conversation_id: {sanitize_for_log(conversation_id)}")
+                yield f"event: done\ndata: {json.dumps(done_data)}\n\n"
+
+        except asyncio.CancelledError:
+            logger.info(f"Query stream cancelled for project {sanitize_for_log(project_id)}")
+            raise
+        except Exception as e:
+            logger.error(f"Streaming query failed for project {sanitize_for_log(project_id)}: {sanitize_for_log(str(e))}", exc_info=True)
+            yield f"event: error\ndata: {json.dumps({'message': 'Internal error occurred'})}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        }
+    )
+
+
+async def _prepare_project_question(
+    session: AsyncSession,
+    project_id: str,
+    request: QueryRequest,
+    current_org: Organization
+) -> Tuple[Optional[Conversation], str, bool]:
+    """
+    Verify project access and resolve the question to ask in conversation context.
+
+    Returns:
+        Tuple of (existing conversation or None, context-aware question, is_followup)
+    """
+    # Verify project exists and belongs to current organization
+    result = await session.execute(
+        select(Project).where(
+            and_(
+                Project.id == project_id,
+                Project.organization_id == current_org.id
+            )
+        )
+    )
+    project = result.scalar_one_or_none()
+
+    if not project:
+        raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+
+    # Handle conversation context
+    conversation = None
+    conversation_messages = []
+    is_followup = False
+    actual_question = request.question
+
+    if request.conversation_id:
+        # Get existing conversation context
+        conversation, conversation_messages = await conversation_context_service.get_conversation_context(
+            conversation_id=request.conversation_id,
+            session=session,
+            organization_id=str(current_org.id)
+        )
+
+        if conversation:
+            # Detect if this is a follow-up question
+            is_followup = await conversation_context_service.detect_followup_question(
+                question=request.question,
+                conversation_messages=conversation_messages
+            )
+
+            if is_followup:
+                # Enhance query with conversation context
+                actual_question = await conversation_context_service.enhance_query_with_context(
+                    question=request.question,
+                    conversation_messages=conversation_messages
+                )
+                logger.info(f"Enhanced follow-up question with context for conversation {sanitize_for_log(request.conversation_id)}")
+
+    return conversation, actual_question, is_followup
+
+
+async def _save_project_exchange(
+    session: AsyncSession,
+    project_id: str,
+    request: QueryRequest,
+    conversation: Optional[Conversation],
+    response: Dict[str, Any],
+    current_org: Organization,
+    current_user: User
+) -> str:
+    """
+    Append a Q&A to the project conversation (creating it if needed) and log the activity.
+
+    Returns:
+        The conversation ID
+    """
+    conversation_id = request.conversation_id
+
+    if not conversation:
+        # Create new conversation
+        conversation_title = conversation_context_service.create_conversation_title(request.question)
+        new_conversation = Conversation(
+            project_id=uuid.UUID(project_id),
+            organization_id=current_org.id,
+            title=conversation_title,
+            messages=[],
+            created_by=current_user.email or "unknown",
+            created_at=datetime.utcnow(),
+            last_accessed_at=datetime.utcnow()
+        )
+        session.add(new_conversation)
+        await session.flush()  # Get the ID
+        conversation_id = str(new_conversation.id)
+        conversation = new_conversation
+
+    # Add current Q&A to conversation messages
+    new_message = conversation_context_service.format_message_for_storage(
+        question=request.question,
+        answer=response['answer'],
+        sources=response['sources'],
+        confidence=response['confidence']
+    )
+
+    # Update conversation with new message and last accessed time
+    updated_messages = (conversation.messages or []) + [new_message]
+    await session.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(
+            messages=updated_messages,
+            last_accessed_at=datetime.utcnow()
+        )
+    )
+
+    # Log activity for query submission
+    try:
+        project_uuid = uuid.UUID(project_id)
+        await ActivityService.log_query_submitted(
+            db=session,
+            project_id=project_uuid,
+            query_text=request.question,
+            user_name=current_user.email or "unknown"
+        )
+        await session.commit()
+    except Exception as e:
+        logger.warning(f"Failed to log query activity: {e}")
+        # Still commit conversation updates
+        await session.commit()
+
+    return conversation_id
+
+
 @router.post("/program/{program_id}/query", response_model=QueryResponse)
 async def query_program(
     request_obj: Request,
@@ -0,0 +1,205 @@
+"""
+Export EmbeddingGemma to ONNX and validate it against the PyTorch model.
+
+Produces the artifacts used by EMBEDDING_BACKEND=onnx / onnx-int8:
+- <output-dir>/onnx/model.onnx                      (ONNX Runtime fp32)
+- <output-dir>/onnx/model_qint8_<quantization>.onnx (dynamic int8)
+
+After exporting, every backend encodes the same sample set and is compared
+with the PyTorch fp32 reference (cosine agreement per text, latency).
+
+Usage (from backend/):
+    python scripts/export_embedding_onnx.py
+    python scripts/export_embedding_onnx.py --backend onnx-int8 --quantization avx2
+    python scripts/export_embedding_onnx.py --skip-export --json onnx_report.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from config import get_settings  # noqa: E402
+from services.rag.embedding_service import ONNX_BACKENDS, embedding_service  # noqa: E402
+
+settings = get_settings()
+
+DEFAULT_SAMPLE_FILES = sorted((BACKEND_DIR.parent / "test_data").glob("*.txt"))
+
+
+def load_samples(files: List[Path], limit: int) -> List[str]:
+    """Load non-trivial lines from sample files (falls back to built-in sentences)."""
+    texts: List[str] = []
+    for path in files:
+        for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+            line = line.strip()
+            if len(line.split()) >= 4:
+                texts.append(line)
+
+    if not texts:
+        texts = [
+            "We agreed to move the launch date to the end of the quarter.",
+            "The vendor contract renewal is blocked on legal review.",
+            "Sarah will prepare the budget forecast before Friday.",
+            "Customer churn increased after the pricing change in March.",
+            "¿Podemos revisar los riesgos del proyecto la próxima semana?",
+        ]
+
+    # Deterministic mix of short lines and longer multi-line passages
+    passages = [" ".join(texts[i:i + 8]) for i in range(0, len(texts), 8)]
+    samples = list(dict.fromkeys(texts + passages))
+    return samples[:limit]
+
+
+def export(backend: str, output_dir: Path, quantization: str, reference) -> None:
+    """Export the reference model to the requested ONNX variant."""
+    from sentence_transformers import SentenceTransformer
+
+    fp32_file = output_dir / "onnx" / "model.onnx"
+    if not fp32_file.exists():
+        print(f"→ Exporting ONNX fp32 to {fp32_file}")
+        # Save the torch model first so the ONNX export has a local source
+        reference.save(str(output_dir))
+        onnx_model = SentenceTransformer(str(output_dir), device="cpu", backend="onnx")
+        onnx_model.save_pretrained(str(output_dir))
+    else:
+        print(f"✓ ONNX fp32 already exported: {fp32_file}")
+
+    if backend == "onnx-int8":
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        print(f"→ Exporting dynamic int8 ONNX ({quantization})")
+        onnx_model = SentenceTransformer(
+            str(output_dir),
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"file_name": "onnx/model.onnx"}
+        )
+        export_dynamic_quantized_onnx_model(
+            onnx_model,
+            quantization_config=quantization,
+            model_name_or_path=str(output_dir)
+        )
+
+
+def encode(model, texts: List[str], batch_size: int) -> Dict[str, Any]:
+    """Encode texts and time the run (after one warm-up batch)."""
+    model.encode(texts[:batch_size], batch_size=batch_size, normalize_embeddings=True)
+
+    start = time.perf_counter()
+    embeddings = model.encode(
+        texts,
+        batch_size=batch_size,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+    elapsed = time.perf_counter() - start
+
+    return {
+        "embeddings": np.asarray(embeddings, dtype=np.float32),
+        "seconds": elapsed,
+    }
+
+
+def compare(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """Cosine agreement between row-aligned normalized embeddings."""
+    cosines = np.sum(reference * candidate, axis=1)
+
+    # Rank agreement: does each text's nearest neighbour stay the same?
+    ref_sim = reference @ reference.T
+    cand_sim = candidate @ candidate.T
+    np.fill_diagonal(ref_sim, -np.inf)
+    np.fill_diagonal(cand_sim, -np.inf)
+    nn_agreement = float(np.mean(ref_sim.argmax(axis=1) == cand_sim.argmax(axis=1)))
+
+    return {
+        "cosine_mean": round(float(cosines.mean()), 6),
+        "cosine_min": round(float(cosines.min()), 6),
+        "cosine_p01": round(float(np.percentile(cosines, 1)), 6),
+        "nearest_neighbour_agreement": round(nn_agreement, 4),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["onnx", "onnx-int8", "all"], default="all")
+    parser.add_argument("--output-dir", type=Path, default=embedding_service.onnx_dir)
+    parser.add_argument("--quantization", default=settings.embedding_onnx_quantization,
+                        choices=["arm64", "avx2", "avx512", "avx512_vnni"])
+    parser.add_argument("--samples", type=int, default=256, help="Maximum number of sample texts")
+    parser.add_argument("--sample-file", type=Path, action="append", dest="sample_files",
+                        help="Text file(s) with sample content (default: test_data/*.txt)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--min-cosine", type=float, default=0.99,
+                        help="Fail if any backend's minimum cosine agreement is below this")
+    parser.add_argument("--skip-export", action="store_true", help="Only validate existing exports")
+    parser.add_argument("--json", type=Path, help="Write the validation report to this file")
+    args = parser.parse_args()
+
+    backends = list(ONNX_BACKENDS) if args.backend == "all" else [args.backend]
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("→ Loading PyTorch reference model")
+    reference_model = embedding_service._load_torch_model()
+
+    if not args.skip_export:
+        for backend in backends:
+            export(backend, args.output_dir, args.quantization, reference_model)
+
+    samples = load_samples(args.sample_files or DEFAULT_SAMPLE_FILES, args.samples)
+    print(f"→ Validating on {len(samples)} sample texts")
+
+    reference_run = encode(reference_model, samples, args.batch_size)
+    report: Dict[str, Any] = {
+        "samples": len(samples),
+        "output_dir": str(args.output_dir),
+        "backends": {
+            "torch": {
+                "ms_per_text": round(reference_run["seconds"] * 1000 / len(samples), 3),
+            }
+        },
+    }
+
+    failed = False
+    embedding_service.onnx_dir = args.output_dir
+    settings.embedding_onnx_quantization = args.quantization
+    for backend in backends:
+        model = embedding_service._load_onnx_model(backend)
+        if model is None:
+            report["backends"][backend] = {"error": "export not found or failed to load"}
+            failed = True
+            continue
+
+        run = encode(model, samples, args.batch_size)
+        metrics = compare(reference_run["embeddings"], run["embeddings"])
+        metrics["ms_per_text"] = round(run["seconds"] * 1000 / len(samples), 3)
+        metrics["speedup_vs_torch"] = round(reference_run["seconds"] / run["seconds"], 2)
+        metrics["file"] = embedding_service.get_onnx_model_file(backend)
+        report["backends"][backend] = metrics
+
+        if metrics["cosine_min"] < args.min_cosine:
+            failed = True
+
+    print(json.dumps(report, indent=2))
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"✓ Report written to {args.json}")
+
+    if failed:
+        print(f"❌ Validation failed (min cosine threshold {args.min_cosine})")
+        return 1
+
+    print("✅ All backends agree with the PyTorch reference")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
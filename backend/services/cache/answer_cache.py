@@ -0,0 +1,391 @@
+"""
+RAG Answer Cache
+
+Caches complete RAG results (answer, sources, confidence) so a repeated
+question skips strategy execution, retrieval, reranking and the LLM call.
+
+Keys combine organization, project, normalized question, strategy and
+RAG_PROMPT_VERSION with the project's content version. The content version
+is a Redis counter that ContentService bumps whenever it indexes or removes
+a project's chunks, so new uploads and deletions invalidate cached answers
+without scanning keys (stale entries simply stop being addressed and expire
+by TTL).
+
+Tiers:
+- Exact: in-process LRU in front of Redis, keyed by the question hash
+- Semantic (optional): per-scope Redis hash of question embeddings; an answer
+  is reused when a cached question is above the similarity threshold
+
+Both tiers need Redis for the content version; without it the cache is bypassed.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from config import get_settings
+from services.cache.redis_client import LazyRedisClient
+from services.prompts.rag_prompts import RAG_PROMPT_VERSION
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class AnswerCacheLookup:
+    """Result of a cache lookup; pass it back to store() on a miss."""
+    scope: str
+    question_digest: str
+    result: Optional[Dict[str, Any]] = None
+    tier: Optional[str] = None  # "memory", "redis" or "semantic" on a hit
+    question_embedding: Optional[np.ndarray] = None
+
+    @property
+    def hit(self) -> bool:
+        return self.result is not None
+
+
+class AnswerCache:
+    """Content-versioned cache for RAG answers."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        ttl_seconds: int = 3600,
+        max_memory_entries: int = 1000,
+        semantic_enabled: bool = False,
+        semantic_threshold: float = 0.95,
+        semantic_max_entries: int = 500,
+        key_prefix: str = "rag_answer"
+    ):
+        """
+        Initialize the answer cache.
+
+        Args:
+            enabled: Whether the cache is used at all (bypass flag)
+            ttl_seconds: Expiry for cached answers (0 disables expiry)
+            max_memory_entries: Size of the in-process LRU
+            semantic_enabled: Whether near-identical questions reuse answers
+            semantic_threshold: Minimum cosine similarity for a semantic hit
+            semantic_max_entries: Maximum cached questions per scope in the semantic tier
+            key_prefix: Redis key prefix
+        """
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.semantic_enabled = semantic_enabled
+        self.semantic_threshold = semantic_threshold
+        self.semantic_max_entries = semantic_max_entries
+        self.key_prefix = key_prefix
+
+        self._memory: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._redis = LazyRedisClient("RAG answer cache", "caching bypassed")
+
+        self._stats = {
+            'memory_hits': 0,
+            'redis_hits': 0,
+            'semantic_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'tokens_saved': 0,
+            'bypassed': 0,
+            'redis_errors': 0,
+        }
+
+    # ==================== Keys ====================
+
+    @staticmethod
+    def normalize_question(question: str) -> str:
+        """Lowercase, collapse whitespace and drop trailing punctuation."""
+        return re.sub(r"\s+", " ", question.strip().lower()).rstrip("?!. ")
+
+    @staticmethod
+    def question_digest(normalized_question: str) -> str:
+        return hashlib.sha256(normalized_question.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_scope(organization_id: str, project_id: str, content_version: int, strategy: str) -> str:
+        """Everything except the question that an answer depends on."""
+        return f"{organization_id}:{project_id}:v{content_version}:{strategy}:p{RAG_PROMPT_VERSION}"
+
+    def _version_key(self, organization_id: str, project_id: str) -> str:
+        return f"{self.key_prefix}:ver:{organization_id}:{project_id}"
+
+    def _answer_key(self, scope: str, digest: str) -> str:
+        return f"{self.key_prefix}:ans:{scope}:{digest}"
+
+    def _semantic_key(self, scope: str) -> str:
+        return f"{self.key_prefix}:sem:{scope}"
+
+    # ==================== Content Versions ====================
+
+    async def get_content_version(self, organization_id: str, project_id: str) -> Optional[int]:
+        """Current content version of a project (None when Redis is unavailable)."""
+        client = await self._redis.get()
+        if client is None:
+            return None
+        try:
+            value = await client.get(self._version_key(organization_id, project_id))
+            return int(value) if value is not None else 0
+        except Exception as e:
+            self._on_redis_error(e)
+            return None
+
+    async def bump_content_version(self, organization_id: str, project_ids: Iterable[str]) -> None:
+        """Invalidate cached answers of projects whose content changed."""
+        project_ids = {str(project_id) for project_id in project_ids if project_id}
+        if not self.enabled or not project_ids:
+            return
+
+        client = await self._redis.get()
+        if client is None:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for project_id in project_ids:
+                    pipe.incr(self._version_key(organization_id, project_id))
+                await pipe.execute()
+            logger.debug(f"Bumped answer cache content version for {len(project_ids)} project(s)")
+        except Exception as e:
+            self._on_redis_error(e)
+
+    # ==================== Public API ====================
+
+    async def lookup(
+        self,
+        organization_id: str,
+        project_id: str,
+        question: str,
+        strategy: str
+    ) -> Optional[AnswerCacheLookup]:
+        """
+        Look up a cached answer.
+
+        Args:
+            organization_id: Organization ID
+            project_id: Project ID
+            question: Question as asked
+            strategy: Resolved RAG strategy value
+
+        Returns:
+            Lookup with result set on a hit, without result on a miss, or None
+            when the cache is disabled or the content version is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        version = await self.get_content_version(organization_id, project_id)
+        if version is None:
+            self._stats['bypassed'] += 1
+            return None
+
+        normalized = self.normalize_question(question)
+        lookup = AnswerCacheLookup(
+            scope=self.make_scope(organization_id, project_id, version, strategy),
+            question_digest=self.question_digest(normalized)
+        )
+        key = self._answer_key(lookup.scope, lookup.question_digest)
+
+        payload = self._memory_get(key)
+        if payload is not None:
+            lookup.tier = "memory"
+        else:
+            payload = await self._redis_get(key)
+            if payload is not None:
+                lookup.tier = "redis"
+                self._memory_put(key, payload)
+
+        if payload is None and self.semantic_enabled:
+            lookup.question_embedding = await self._embed_question(normalized)
+            payload = await self._semantic_get(lookup)
+            if payload is not None:
+                lookup.tier = "semantic"
+
+        if payload is None:
+            self._stats['misses'] += 1
+        else:
+            lookup.result = json.loads(payload)
+            self._stats[f"{lookup.tier}_hits"] += 1
+            self._stats['tokens_saved'] += int(lookup.result.get('token_count', 0) or 0)
+
+        self._export_metrics(lookup, organization_id)
+        return lookup
+
+    async def store(self, lookup: AnswerCacheLookup, result: Dict[str, Any]) -> None:
+        """
+        Cache a freshly computed answer under a lookup that missed.
+
+        Args:
+            lookup: Lookup returned by lookup() for the same question
+            result: RAG result dict (must be JSON-serializable, non-JSON values become strings)
+        """
+        if not self.enabled or lookup is None or lookup.hit:
+            return
+
+        payload = json.dumps(result, default=str)
+        key = self._answer_key(lookup.scope, lookup.question_digest)
+        self._memory_put(key, payload)
+        self._stats['stores'] += 1
+
+        client = await self._redis.get()
+        if client is None:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                if self.ttl_seconds:
+                    pipe.setex(key, self.ttl_seconds, payload)
+                else:
+                    pipe.set(key, payload)
+                if self.semantic_enabled and lookup.question_embedding is not None:
+                    semantic_key = self._semantic_key(lookup.scope)
+                    if await client.hlen(semantic_key) < self.semantic_max_entries:
+                        pipe.hset(
+                            semantic_key,
+                            lookup.question_digest,
+                            lookup.question_embedding.astype(np.float16).tobytes()
+                        )
+                        if self.ttl_seconds:
+                            pipe.expire(semantic_key, self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            self._on_redis_error(e)
+
+    async def clear(self) -> None:
+        """Clear the in-process tier (Redis entries expire by TTL)."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters, saved tokens and memory usage
+        """
+        hits = self._stats['memory_hits'] + self._stats['redis_hits'] + self._stats['semantic_hits']
+        lookups = hits + self._stats['misses']
+        return {
+            'enabled': self.enabled,
+            'semantic_enabled': self.semantic_enabled,
+            'redis_connected': self._redis.connected,
+            'ttl_seconds': self.ttl_seconds,
+            'memory_entries': len(self._memory),
+            'max_memory_entries': self.max_memory_entries,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            **self._stats,
+        }
+
+    # ==================== Semantic Tier ====================
+
+    @staticmethod
+    async def _embed_question(normalized_question: str) -> Optional[np.ndarray]:
+        try:
+            from services.rag.embedding_service import embedding_service
+            vector = (await embedding_service.encode_array([normalized_question]))[0]
+            norm = np.linalg.norm(vector)
+            return (vector / norm).astype(np.float32) if norm else None
+        except Exception as e:
+            logger.warning(f"Answer cache could not embed question, skipping semantic tier: {e}")
+            return None
+
+    async def _semantic_get(self, lookup: AnswerCacheLookup) -> Optional[str]:
+        if lookup.question_embedding is None:
+            return None
+        client = await self._redis.get()
+        if client is None:
+            return None
+
+        try:
+            entries = await client.hgetall(self._semantic_key(lookup.scope))
+            if not entries:
+                return None
+            digests = list(entries)
+            matrix = np.stack([np.frombuffer(entries[d], dtype=np.float16) for d in digests]).astype(np.float32)
+            similarities = matrix @ lookup.question_embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.semantic_threshold:
+                return None
+
+            digest = digests[best].decode() if isinstance(digests[best], bytes) else digests[best]
+            payload = await client.get(self._answer_key(lookup.scope, digest))
+            return payload.decode("utf-8") if payload is not None else None
+        except Exception as e:
+            self._on_redis_error(e)
+            return None
+
+    # ==================== Memory Tier ====================
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at and expires_at < time.monotonic():
+                self._memory.pop(key)
+                return None
+            self._memory.move_to_end(key)
+            return payload
+
+    def _memory_put(self, key: str, payload: str) -> None:
+        if self.max_memory_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            self._memory[key] = (payload, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    # ==================== Redis Tier ====================
+
+    async def _redis_get(self, key: str) -> Optional[str]:
+        client = await self._redis.get()
+        if client is None:
+            return None
+        try:
+            payload = await client.get(key)
+            return payload.decode("utf-8") if payload is not None else None
+        except Exception as e:
+            self._on_redis_error(e)
+            return None
+
+    def _on_redis_error(self, error: Exception) -> None:
+        self._stats['redis_errors'] += 1
+        self._redis.drop(error)
+
+    # ==================== Metrics ====================
+
+    @staticmethod
+    def _export_metrics(lookup: AnswerCacheLookup, organization_id: str) -> None:
+        try:
+            from observability.business_metrics import get_business_metrics
+            get_business_metrics().record_answer_cache_lookup(
+                hit=lookup.hit,
+                tier=lookup.tier,
+                tokens_saved=int(lookup.result.get('token_count', 0) or 0) if lookup.hit else 0,
+                organization_id=organization_id
+            )
+        except Exception as e:
+            logger.debug(f"Failed to export answer cache metrics: {e}")
+
+
+# Singleton instance
+answer_cache = AnswerCache(
+    enabled=settings.enable_rag_answer_cache,
+    ttl_seconds=settings.rag_answer_cache_ttl_seconds,
+    max_memory_entries=settings.rag_answer_cache_memory_entries,
+    semantic_enabled=settings.rag_answer_cache_semantic_enabled,
+    semantic_threshold=settings.rag_answer_cache_semantic_threshold,
+    semantic_max_entries=settings.rag_answer_cache_semantic_max_entries,
+)
@@ -0,0 +1,300 @@
+"""
+Content-Addressed Embedding Cache
+
+Caches embedding vectors keyed by (model name, inference backend, normalize
+flag, text hash) so repeated texts skip model inference entirely. The backend
+is part of the key so e.g. int8-quantized vectors are never served to a
+full-precision instance through the shared Redis tier.
+
+Tiers:
+- Memory: in-process LRU bounded by total vector bytes
+- Redis (optional): shared across workers, vectors stored as compact
+  float16/float32 binary blobs
+
+Both tiers honour the same TTL. Redis failures degrade to memory-only.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from config import get_settings
+from services.cache.redis_client import LazyRedisClient
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class EmbeddingCache:
+    """Two-tier (memory LRU + optional Redis) cache for embedding vectors."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: int = 86400,
+        redis_enabled: bool = False,
+        redis_dtype: str = "float16",
+        key_prefix: str = "emb"
+    ):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            enabled: Whether the cache is used at all (bypass flag)
+            max_memory_bytes: Upper bound on vector bytes held in memory
+            ttl_seconds: Expiry for entries in both tiers (0 disables expiry)
+            redis_enabled: Whether to use the shared Redis tier
+            redis_dtype: Blob dtype for Redis entries ("float16" or "float32")
+            key_prefix: Redis key prefix
+        """
+        self.enabled = enabled
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+        self.redis_enabled = redis_enabled
+        self.redis_dtype = np.dtype(redis_dtype if redis_dtype in ("float16", "float32") else "float16")
+        self.key_prefix = key_prefix
+
+        self._memory: "OrderedDict[str, tuple[np.ndarray, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self._redis = LazyRedisClient("Embedding cache", "using memory only")
+
+        self._stats = {
+            'memory_hits': 0,
+            'redis_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'expired': 0,
+            'redis_errors': 0,
+        }
+
+    # ==================== Keys ====================
+
+    @staticmethod
+    def make_key(model_name: str, normalize: bool, text: str, backend: str = "torch") -> str:
+        """
+        Build the content-addressed key for a text.
+
+        Args:
+            model_name: Embedding model identifier
+            normalize: Whether embeddings are L2-normalized
+            text: Text that was embedded
+            backend: Inference backend/quantization that produced the vector
+
+        Returns:
+            Cache key string
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model_name}:{backend}:{int(normalize)}:{digest}"
+
+    # ==================== Public API ====================
+
+    async def get_many(
+        self,
+        texts: Sequence[str],
+        model_name: str,
+        normalize: bool,
+        backend: str = "torch"
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Look up cached embeddings for texts.
+
+        Args:
+            texts: Texts to look up
+            model_name: Embedding model identifier
+            normalize: Whether embeddings are L2-normalized
+            backend: Inference backend/quantization the caller encodes with
+
+        Returns:
+            List aligned with texts; float32 vector on hit, None on miss
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        if not self.enabled or not texts:
+            return results
+
+        keys = [self.make_key(model_name, normalize, text, backend) for text in texts]
+        missing: List[int] = []
+
+        for i, key in enumerate(keys):
+            vector = self._memory_get(key)
+            if vector is not None:
+                results[i] = vector
+                self._stats['memory_hits'] += 1
+            else:
+                missing.append(i)
+
+        if missing and self.redis_enabled:
+            blobs = await self._redis_get_many([keys[i] for i in missing])
+            still_missing = []
+            for i, blob in zip(missing, blobs):
+                if blob is None:
+                    still_missing.append(i)
+                    continue
+                vector = np.frombuffer(blob, dtype=self.redis_dtype).astype(np.float32)
+                results[i] = vector
+                self._memory_put(keys[i], vector)
+                self._stats['redis_hits'] += 1
+            missing = still_missing
+
+        self._stats['misses'] += len(missing)
+        self._export_metrics(hits=len(texts) - len(missing), misses=len(missing))
+        return results
+
+    async def put_many(
+        self,
+        texts: Sequence[str],
+        vectors: np.ndarray,
+        model_name: str,
+        normalize: bool,
+        backend: str = "torch"
+    ) -> None:
+        """
+        Store embeddings for texts in every enabled tier.
+
+        Args:
+            texts: Texts that were embedded
+            vectors: 2-D array with one row per text
+            model_name: Embedding model identifier
+            normalize: Whether embeddings are L2-normalized
+            backend: Inference backend/quantization that produced the vectors
+        """
+        if not self.enabled or not len(texts):
+            return
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        keys = [self.make_key(model_name, normalize, text, backend) for text in texts]
+
+        for key, vector in zip(keys, vectors):
+            # Copy so cached rows don't pin the caller's whole batch array
+            self._memory_put(key, vector.copy())
+        self._stats['stores'] += len(keys)
+
+        if self.redis_enabled:
+            await self._redis_set_many(keys, vectors)
+
+    async def clear(self) -> None:
+        """Clear the in-process tier (the Redis tier expires by TTL)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and memory usage
+        """
+        hits = self._stats['memory_hits'] + self._stats['redis_hits']
+        lookups = hits + self._stats['misses']
+        return {
+            'enabled': self.enabled,
+            'redis_enabled': self.redis_enabled,
+            'redis_connected': self._redis.connected,
+            'redis_dtype': self.redis_dtype.name,
+            'ttl_seconds': self.ttl_seconds,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_bytes,
+            'max_memory_bytes': self.max_memory_bytes,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            **self._stats,
+        }
+
+    # ==================== Memory Tier ====================
+
+    def _memory_get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            vector, expires_at = entry
+            if expires_at and expires_at < time.monotonic():
+                self._memory.pop(key)
+                self._memory_bytes -= vector.nbytes
+                self._stats['expired'] += 1
+                return None
+            self._memory.move_to_end(key)
+            return vector
+
+    def _memory_put(self, key: str, vector: np.ndarray) -> None:
+        if vector.nbytes > self.max_memory_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous[0].nbytes
+            self._memory[key] = (vector, expires_at)
+            self._memory_bytes += vector.nbytes
+
+            while self._memory_bytes > self.max_memory_bytes and self._memory:
+                _, (evicted, _) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted.nbytes
+                self._stats['evictions'] += 1
+
+    # ==================== Redis Tier ====================
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{self.redis_dtype.name}:{key}"
+
+    async def _redis_get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        client = await self._redis.get()
+        if client is None:
+            return [None] * len(keys)
+
+        try:
+            return await client.mget([self._redis_key(key) for key in keys])
+        except Exception as e:
+            self._on_redis_error(e)
+            return [None] * len(keys)
+
+    async def _redis_set_many(self, keys: List[str], vectors: np.ndarray) -> None:
+        client = await self._redis.get()
+        if client is None:
+            return
+
+        try:
+            blobs = vectors.astype(self.redis_dtype).tobytes()
+            row_bytes = vectors.shape[1] * self.redis_dtype.itemsize
+            async with client.pipeline(transaction=False) as pipe:
+                for i, key in enumerate(keys):
+                    blob = blobs[i * row_bytes:(i + 1) * row_bytes]
+                    if self.ttl_seconds:
+                        pipe.setex(self._redis_key(key), self.ttl_seconds, blob)
+                    else:
+                        pipe.set(self._redis_key(key), blob)
+                await pipe.execute()
+        except Exception as e:
+            self._on_redis_error(e)
+
+    def _on_redis_error(self, error: Exception) -> None:
+        self._stats['redis_errors'] += 1
+        self._redis.drop(error)
+
+    # ==================== Metrics ====================
+
+    @staticmethod
+    def _export_metrics(hits: int, misses: int) -> None:
+        try:
+            from observability.metrics import get_metrics
+            get_metrics().record_embedding_cache(hits=hits, misses=misses)
+        except Exception as e:
+            logger.debug(f"Failed to export embedding cache metrics: {e}")
+
+
+# Singleton instance
+embedding_cache = EmbeddingCache(
+    enabled=settings.enable_embedding_cache,
+    max_memory_bytes=settings.embedding_cache_max_mb * 1024 * 1024,
+    ttl_seconds=settings.embedding_cache_ttl_seconds,
+    redis_enabled=settings.embedding_cache_redis_enabled,
+    redis_dtype=settings.embedding_cache_redis_dtype,
+)
@@ -0,0 +1,307 @@
+"""
+Project Scope Cache
+
+Resolves where a project sits in the hierarchy (organization, program,
+portfolio) for the RAG services from one shared in-process LRU.
+
+- Size-bounded (least recently used entries are evicted) with a TTL
+- Misses for any number of projects are loaded with a single SELECT
+- Entries are invalidated when a project is moved in the hierarchy or deleted;
+  the TTL bounds staleness in other processes (e.g. RQ workers) that did not
+  see the change
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import get_settings
+from models.project import Project
+from utils.logger import get_logger, sanitize_for_log
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class ProjectScope:
+    """A project's place in the organization hierarchy."""
+    project_id: str
+    organization_id: str
+    program_id: Optional[str] = None
+    portfolio_id: Optional[str] = None
+
+
+class ProjectScopeCache:
+    """Bounded TTL cache for project -> organization/program/portfolio lookups."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_entries: int = 10000,
+        ttl_seconds: int = 300
+    ):
+        """
+        Initialize the project scope cache.
+
+        Args:
+            enabled: Whether resolved scopes are cached (lookups still work when disabled)
+            max_entries: Upper bound on cached projects
+            ttl_seconds: Expiry for cached entries (0 disables expiry)
+        """
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: "OrderedDict[str, tuple[ProjectScope, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'db_queries': 0,
+            'evictions': 0,
+            'expired': 0,
+            'invalidations': 0,
+        }
+
+    # ==================== Public API ====================
+
+    async def get_scopes(
+        self,
+        project_ids: Iterable[Any],
+        session: Optional[AsyncSession] = None
+    ) -> Dict[str, ProjectScope]:
+        """
+        Resolve scopes for several projects, loading all misses in one query.
+
+        Args:
+            project_ids: Project IDs (UUIDs or strings)
+            session: Optional session to run the query on (a new one is opened otherwise)
+
+        Returns:
+            Dictionary keyed by str(project_id) for every project that exists;
+            unknown or malformed IDs are omitted
+        """
+        scopes: Dict[str, ProjectScope] = {}
+        missing: Dict[str, str] = {}  # normalized key -> caller's key
+
+        for project_id in project_ids:
+            requested = str(project_id)
+            key = self._normalize(project_id)
+            if key is None or requested in scopes or key in missing:
+                continue
+
+            scope = self._memory_get(key)
+            if scope is not None:
+                scopes[requested] = scope
+                self._stats['hits'] += 1
+            else:
+                missing[key] = requested
+
+        if missing:
+            self._stats['misses'] += len(missing)
+            for key, scope in (await self._load(list(missing), session)).items():
+                scopes[missing[key]] = scope
+                self._memory_put(key, scope)
+
+        return scopes
+
+    async def get_scope(
+        self,
+        project_id: Any,
+        session: Optional[AsyncSession] = None
+    ) -> Optional[ProjectScope]:
+        """
+        Resolve the scope of one project.
+
+        Args:
+            project_id: Project ID (UUID or string)
+            session: Optional session to run the query on
+
+        Returns:
+            ProjectScope, or None if the project does not exist
+        """
+        scopes = await self.get_scopes([project_id], session)
+        return scopes.get(str(project_id))
+
+    async def get_organization_id(
+        self,
+        project_id: Any,
+        session: Optional[AsyncSession] = None
+    ) -> str:
+        """
+        Resolve the organization that owns a project.
+
+        Args:
+            project_id: Project ID (UUID or string)
+            session: Optional session to run the query on
+
+        Returns:
+            Organization ID string
+
+        Raises:
+            ValueError: If the project does not exist
+        """
+        scope = await self.get_scope(project_id, session)
+        if scope is None:
+            raise ValueError(f"Could not determine organization for project {project_id}")
+        return scope.organization_id
+
+    def invalidate(self, project_ids: Optional[Iterable[Any]] = None) -> int:
+        """
+        Drop cached scopes for the given projects, or everything.
+
+        Args:
+            project_ids: Projects to drop (None clears the whole cache)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if project_ids is None:
+                removed = len(self._memory)
+                self._memory.clear()
+            else:
+                removed = 0
+                for project_id in project_ids:
+                    key = self._normalize(project_id)
+                    if key is not None and self._memory.pop(key, None) is not None:
+                        removed += 1
+            self._stats['invalidations'] += removed
+
+        if removed:
+            logger.debug(f"Invalidated {removed} project scope cache entries")
+        return removed
+
+    def invalidate_program(self, program_id: Any) -> int:
+        """
+        Drop cached scopes of every project under a program.
+
+        Args:
+            program_id: Program whose projects changed
+
+        Returns:
+            Number of entries removed
+        """
+        program_id = str(program_id)
+        return self._invalidate_matching(lambda scope: scope.program_id == program_id)
+
+    def invalidate_portfolio(self, portfolio_id: Any) -> int:
+        """
+        Drop cached scopes of every project under a portfolio.
+
+        Args:
+            portfolio_id: Portfolio whose projects changed
+
+        Returns:
+            Number of entries removed
+        """
+        portfolio_id = str(portfolio_id)
+        return self._invalidate_matching(lambda scope: scope.portfolio_id == portfolio_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and cache size
+        """
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            'enabled': self.enabled,
+            'ttl_seconds': self.ttl_seconds,
+            'entries': len(self._memory),
+            'max_entries': self.max_entries,
+            'hit_rate': round(self._stats['hits'] / lookups, 4) if lookups else 0.0,
+            **self._stats,
+        }
+
+    # ==================== Internals ====================
+
+    @staticmethod
+    def _normalize(project_id: Any) -> Optional[str]:
+        """Canonical UUID string for a project ID, or None if malformed."""
+        if isinstance(project_id, uuid.UUID):
+            return str(project_id)
+        try:
+            return str(uuid.UUID(str(project_id)))
+        except ValueError:
+            logger.warning(f"Ignoring malformed project ID {sanitize_for_log(project_id)}")
+            return None
+
+    async def _load(
+        self,
+        keys: List[str],
+        session: Optional[AsyncSession]
+    ) -> Dict[str, ProjectScope]:
+        """Load scopes for normalized project IDs with one SELECT."""
+        stmt = select(
+            Project.id, Project.organization_id, Project.program_id, Project.portfolio_id
+        ).where(Project.id.in_([uuid.UUID(key) for key in keys]))
+
+        if session is not None:
+            rows = (await session.execute(stmt)).all()
+        else:
+            from db.database import get_db_context
+            async with get_db_context() as db_session:
+                rows = (await db_session.execute(stmt)).all()
+        self._stats['db_queries'] += 1
+
+        return {
+            str(row.id): ProjectScope(
+                project_id=str(row.id),
+                organization_id=str(row.organization_id),
+                program_id=str(row.program_id) if row.program_id else None,
+                portfolio_id=str(row.portfolio_id) if row.portfolio_id else None
+            )
+            for row in rows
+        }
+
+    def _memory_get(self, key: str) -> Optional[ProjectScope]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            scope, expires_at = entry
+            if expires_at and expires_at < time.monotonic():
+                self._memory.pop(key)
+                self._stats['expired'] += 1
+                return None
+            self._memory.move_to_end(key)
+            return scope
+
+    def _memory_put(self, key: str, scope: ProjectScope) -> None:
+        if not self.enabled or self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            self._memory.pop(key, None)
+            self._memory[key] = (scope, expires_at)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def _invalidate_matching(self, predicate: Callable[[ProjectScope], bool]) -> int:
+        with self._lock:
+            keys = [key for key, (scope, _) in self._memory.items() if predicate(scope)]
+            for key in keys:
+                del self._memory[key]
+            self._stats['invalidations'] += len(keys)
+        return len(keys)
+
+
+# Singleton instance
+project_scope_cache = ProjectScopeCache(
+    enabled=settings.enable_project_scope_cache,
+    max_entries=settings.project_scope_cache_max_entries,
+    ttl_seconds=settings.project_scope_cache_ttl_seconds,
+)
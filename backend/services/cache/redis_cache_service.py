@@ -20,6 +20,7 @@ import redis.asyncio as redis
 from redis.asyncio import Redis
 
 from config import get_settings
+from services.cache.redis_client import build_redis_url
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -44,15 +45,9 @@ class RedisCacheService:
             return self._client
 
         try:
-            # Build Redis URL
-            if settings.redis_password:
-                redis_url = f"redis://:{settings.redis_password}@{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-            else:
-                redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-
             # Create Redis client
             self._client = redis.from_url(
-                redis_url,
+                build_redis_url(),
                 encoding="utf-8",
                 decode_responses=True,
                 socket_connect_timeout=2,
@@ -0,0 +1,98 @@
+"""
+Lazily Connected Redis Client
+
+Shared connection handling for the Redis-backed caches and indexes. Each
+owner keeps its own client so decode and timeout settings can differ, but
+connection setup, failure backoff and error handling live here.
+
+A failed connection or command drops the client; reconnection is attempted
+again at most every REDIS_RETRY_INTERVAL_SECONDS, so callers degrade to their
+fallback instead of paying a connect timeout on every request.
+"""
+
+import time
+from typing import Optional
+
+import redis.asyncio as redis
+from redis.asyncio import Redis
+
+from config import get_settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Seconds to wait before retrying a failed Redis connection
+REDIS_RETRY_INTERVAL_SECONDS = 30
+
+
+def build_redis_url() -> str:
+    """Build the Redis URL from settings (password optional)."""
+    if settings.redis_password:
+        return f"redis://:{settings.redis_password}@{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
+    return f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
+
+
+class LazyRedisClient:
+    """Redis client created on first use that backs off after failures."""
+
+    def __init__(
+        self,
+        name: str,
+        fallback: str,
+        decode_responses: bool = False,
+        socket_timeout: float = 2,
+        retry_interval_seconds: float = REDIS_RETRY_INTERVAL_SECONDS
+    ):
+        """
+        Initialize the lazy client.
+
+        Args:
+            name: Owner name used in log messages (e.g. "Embedding cache")
+            fallback: What the owner does without Redis, for the warning log
+            decode_responses: Whether replies are decoded to str
+            socket_timeout: Per-command socket timeout in seconds
+            retry_interval_seconds: Backoff before reconnecting after a failure
+        """
+        self.name = name
+        self.fallback = fallback
+        self.decode_responses = decode_responses
+        self.socket_timeout = socket_timeout
+        self.retry_interval_seconds = retry_interval_seconds
+
+        self.client: Optional[Redis] = None
+        self.retry_at = 0.0
+
+    @property
+    def connected(self) -> bool:
+        return self.client is not None
+
+    async def get(self) -> Optional[Redis]:
+        """Get the Redis client, connecting at most once per retry interval."""
+        if self.client is not None:
+            return self.client
+        if time.monotonic() < self.retry_at:
+            return None
+
+        try:
+            client = redis.from_url(
+                build_redis_url(),
+                decode_responses=self.decode_responses,
+                socket_connect_timeout=2,
+                socket_timeout=self.socket_timeout
+            )
+            await client.ping()
+            self.client = client
+            logger.info(f"{self.name} connected to Redis")
+            return client
+
+        except Exception as e:
+            logger.warning(f"{self.name} Redis unavailable, {self.fallback}: {e}")
+            self.retry_at = time.monotonic() + self.retry_interval_seconds
+            return None
+
+    def drop(self, error: Exception) -> None:
+        """Discard the client after a command error and back off before reconnecting."""
+        logger.warning(f"{self.name} Redis error, {self.fallback}: {error}")
+        self.client = None
+        self.retry_at = time.monotonic() + self.retry_interval_seconds
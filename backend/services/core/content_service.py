@@ -1,7 +1,11 @@
 """Content service for handling file uploads and processing."""
 
+import hashlib
+import time
 import uuid
 import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -39,6 +43,15 @@ def _update_rq_job_progress(rq_job, progress: float, step: str, current_step: in
         'step': step
     })
 
+@dataclass
+class ChunkIndexPlan:
+    """How a content item's chunks map onto vectors already in the store."""
+    create: List[Dict[str, Any]] = field(default_factory=list)  # Chunks that need new points
+    reuse_vectors: Dict[str, Any] = field(default_factory=dict)  # chunk_hash -> stored vector of an identical chunk in the project
+    keep_updates: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # Kept point ID -> positional payload to refresh
+    kept: int = 0  # Chunks whose existing point is kept as is
+    remove: List[str] = field(default_factory=list)  # Point IDs whose chunk no longer exists
+
 # Language detection will be handled by langdetect_service
 # which initializes at startup with SSL bypass
 
@@ -223,6 +236,7 @@ class ContentService:
         """
         # Create checkpoint for cancellation checks
         checkpoint = CancellationCheckpoint(rq_job)
+        content = None
 
         try:
             # Update job progress via RQ + Redis pub/sub
@@ -247,6 +261,21 @@ class ContentService:
                 raise ValueError(f"Content {content_id} not found")
             
             logger.info(f"Starting async processing for content {content_id}")
+
+            # Skip documents already indexed in this project before any parsing or embedding work
+            content_hash = ContentService.compute_text_hash(content.content)
+            duplicate = await ContentService._find_duplicate_content(session, content, content_hash)
+            if duplicate is not None:
+                logger.info(f"Content {content_id} duplicates content {duplicate.id} in project {content.project_id}, skipping indexing")
+                content.content_hash = content_hash
+                content.processed_at = datetime.utcnow()
+                await session.commit()
+                ContentService._mark_rq_job_completed(
+                    rq_job,
+                    {"content_id": str(content_id), "chunks": 0, "duplicate_of": str(duplicate.id)},
+                    f"Duplicate of '{duplicate.title}', already indexed"
+                )
+                return
             
             # Update job: preprocessing
             _update_rq_job_progress(rq_job, 20.0, "Preprocessing content", current_step=2)
@@ -287,10 +316,11 @@ class ContentService:
             
             # Convert TextChunk objects to dictionaries for compatibility
             chunks = [chunk.to_dict() for chunk in text_chunks]
-            
-            # Update chunk count
-            content.chunk_count = len(chunks)
-            content.processed_at = datetime.utcnow()
+
+            # Hash every chunk so unchanged chunks keep their vectors on re-processing
+            for chunk in chunks:
+                chunk['chunk_hash'] = ContentService.compute_text_hash(chunk['text'])
+            previously_indexed = bool(content.chunk_hashes) or (content.chunk_count or 0) > 0
 
             # Check for cancellation before generating embeddings
             checkpoint.check("before generating embeddings")
@@ -301,7 +331,10 @@ class ContentService:
             # Generate embeddings and store in Qdrant
             from services.rag.embedding_service import embedding_service
             from db.multi_tenant_vector_store import multi_tenant_vector_store
-            from qdrant_client.models import PointStruct
+            from services.rag.keyword_index import keyword_index
+            from services.cache.answer_cache import answer_cache
+            from services.cache.project_scope_cache import project_scope_cache
+            from services.core.ingestion_pipeline import ChunkIngestionPipeline
             
             # Detect content language if multilingual support is enabled
             language_info = {}
@@ -309,252 +342,328 @@ class ContentService:
                 language_info = ContentService.detect_language(processed_content)
                 logger.info(f"Detected language: {language_info.get('language')} with confidence {language_info.get('confidence'):.2f}")
 
-            # Generate embeddings for chunks
-            chunks_with_embeddings = await embedding_service.generate_embeddings_for_chunks(
-                chunks,
-                batch_size=32
+            # Get organization_id from project (raises ValueError if the project is gone)
+            organization_id = await project_scope_cache.get_organization_id(content.project_id, session)
+
+            # Diff against stored vectors so embedding cost is proportional to the change
+            plan = await ContentService._plan_chunk_indexing(organization_id, content, chunks, previously_indexed)
+            indexing_stats = {
+                "embedded": sum(1 for chunk in plan.create if chunk['chunk_hash'] not in plan.reuse_vectors),
+                "reused": sum(1 for chunk in plan.create if chunk['chunk_hash'] in plan.reuse_vectors),
+                "unchanged": plan.kept,
+                "removed": len(plan.remove)
+            }
+            logger.info(f"Chunk indexing plan for content {content_id}: {indexing_stats}")
+
+            async def embed_batch(batch):
+                # Only chunks without a reusable stored vector are embedded, as one
+                # (n, dim) float32 array per batch; points are built and dropped per batch
+                to_embed = [chunk for chunk in batch if chunk['chunk_hash'] not in plan.reuse_vectors]
+                embeddings = iter(await embedding_service.encode_array(
+                    [chunk['text'] for chunk in to_embed],
+                    batch_size=32
+                ) if to_embed else [])
+                return [
+                    ContentService._build_chunk_point(
+                        content, chunk,
+                        plan.reuse_vectors.get(chunk['chunk_hash']) or next(embeddings),
+                        language_info
+                    )
+                    for chunk in batch
+                ]
+
+            stored_point_ids = []
+
+            async def store_batch(points):
+                # Store vectors in organization's Qdrant collection
+                success = await multi_tenant_vector_store.insert_vectors(
+                    organization_id=organization_id,
+                    points=points
+                )
+                if not success:
+                    raise Exception("Failed to store embeddings in Qdrant")
+                stored_point_ids.extend(str(point.id) for point in points)
+
+                # Index chunks for BM25 keyword search (a failed add makes the next search rebuild the index)
+                await keyword_index.add_documents(
+                    organization_id=organization_id,
+                    project_id=str(content.project_id),
+                    documents=[(str(point.id), point.payload['text']) for point in points]
+                )
+
+            def report_progress(stored):
+                _update_rq_job_progress(
+                    rq_job,
+                    60.0 + 20.0 * stored / len(plan.create),
+                    f"Embedding and storing chunks ({stored}/{len(plan.create)})",
+                    current_step=4
+                )
+
+            # Stream chunks -> embedding batches -> upsert batches with bounded queues
+            pipeline = ChunkIngestionPipeline(
+                embed_batch=embed_batch,
+                store_batch=store_batch,
+                batch_size=settings.ingestion_batch_size,
+                queue_depth=settings.ingestion_queue_depth,
+                on_progress=report_progress,
+                before_batch=lambda: checkpoint.check("before embedding batch")
             )
-            
-            # Prepare points for Qdrant
-            points = []
-            for chunk in chunks_with_embeddings:
-                # Generate a unique UUID for each chunk
-                import uuid
-                point_id = str(uuid.uuid4())
-
-                # Handle MRL (Multi-Resolution Learning) vectors
-                if settings.enable_mrl:
-                    # Create named vectors for each dimension
-                    vectors = {}
-                    full_embedding = chunk['embedding']
-                    # Get MRL dimensions - handle both property and method access
-                    mrl_dims = settings.mrl_dimensions_list() if callable(settings.mrl_dimensions_list) else settings.mrl_dimensions_list
-                    for dim in mrl_dims:
-                        # Truncate embedding to each dimension
-                        vectors[f"vector_{dim}"] = full_embedding[:dim]
-                    vector_data = vectors
-                else:
-                    # Single vector for non-MRL mode
-                    vector_data = chunk['embedding']
-
-                point = PointStruct(
-                    id=point_id,
-                    vector=vector_data,
-                    payload={
-                        'content_id': str(content_id),
-                        'project_id': str(content.project_id),
-                        'content_type': content.content_type.value,
-                        'title': content.title,
-                        'chunk_index': chunk['index'],
-                        'text': chunk['text'],
-                        'word_count': chunk['word_count'],
-                        'start_position': chunk['start_position'],
-                        'date': content.date.isoformat() if content.date else None,
-                        'uploaded_at': content.uploaded_at.isoformat(),
-                        # Add language metadata if detected
-                        'language': language_info.get('language', 'en') if language_info else 'en',
-                        'language_confidence': language_info.get('confidence', 0.0) if language_info else 0.0
-                    }
+            ingestion_start = time.perf_counter()
+            try:
+                await pipeline.run(plan.create)
+            except BaseException:
+                # Don't leave a partially indexed document behind
+                if stored_point_ids:
+                    try:
+                        await ContentService._delete_chunk_vectors(
+                            organization_id, str(content.project_id), stored_point_ids
+                        )
+                        # Answers cached meanwhile may cite the removed chunks
+                        await answer_cache.bump_content_version(organization_id, [str(content.project_id)])
+                    except Exception as cleanup_error:
+                        logger.error(f"Failed to remove partially stored vectors for content {content_id}: {cleanup_error}")
+                raise
+            stage_timings_ms = {"ingestion": round((time.perf_counter() - ingestion_start) * 1000, 1)}
+
+            # Refresh positions of kept chunks and drop chunks that no longer exist
+            await multi_tenant_vector_store.update_payloads(organization_id, plan.keep_updates)
+            if plan.remove:
+                await ContentService._delete_chunk_vectors(
+                    organization_id, str(content.project_id), plan.remove
                 )
-                points.append(point)
 
-            # Check for cancellation before storing in vector database
-            checkpoint.check("before storing vectors")
+            # New or removed chunks invalidate the project's cached RAG answers
+            if plan.create or plan.remove:
+                await answer_cache.bump_content_version(organization_id, [str(content.project_id)])
 
-            # Update job: storing in vector database
+            # Update job: storing in database
             _update_rq_job_progress(rq_job, 80.0, "Storing in database", current_step=5)
-            
-            # Get organization_id from project
-            project = await session.get(Project, content.project_id)
-            if not project:
-                raise ValueError(f"Project {content.project_id} not found")
 
-            # Store vectors in organization's Qdrant collection
-            success = await multi_tenant_vector_store.insert_vectors(
-                organization_id=str(project.organization_id),
-                points=points
-            )
-            
-            if not success:
-                raise Exception("Failed to store embeddings in Qdrant")
+            # Record the indexed state only once the vectors are stored, so a failed
+            # ingestion is never mistaken for an indexed duplicate
+            content.content_hash = content_hash
+            content.chunk_hashes = [chunk['chunk_hash'] for chunk in chunks]
+            content.chunk_count = len(chunks)
+            content.processed_at = datetime.utcnow()
+            content.processing_error = None
             
             await session.commit()
             logger.info(f"Completed processing for content {content_id}: {len(chunks)} chunks")
             
             # Update job: almost complete
             _update_rq_job_progress(rq_job, 90.0, "Preparing for summary generation", current_step=6)
+            post_processing_start = time.perf_counter()
             
             # Track partial failures for AI features
             partial_failures = {}
 
-            # Check for cancellation before summary generation
-            checkpoint.check("before summary generation")
+            from db.database import get_db_context
+            from services.core.stage_runner import Stage, StageRunner
 
-            # Auto-generate meeting summary if this is meeting content
-            summary_id = None
-            if content.content_type == ContentType.MEETING:
-                logger.info(f"Auto-generating summary for meeting content {content_id}")
-                try:
-                    # Import here to avoid circular dependency
-                    from services.summaries.summary_service_refactored import summary_service
-
-                    # Update job progress to indicate AI processing
-                    _update_rq_job_progress(rq_job, 85.0, "Generating AI summary...", current_step=6)
-
-                    # Generate meeting summary in background with job tracking
-                    summary_data = await summary_service.generate_meeting_summary(
-                        session=session,
-                        project_id=content.project_id,
-                        content_id=content_id,
-                        created_by="system",
-                        rq_job=rq_job  # Pass RQ job for progress tracking
-                    )
-                    summary_id = summary_data.get('id')
-                    logger.info(f"Auto-generated meeting summary {summary_id} for content {content_id}")
-
-                    # Update content to mark summary as generated
-                    content.summary_generated = True
-                    await session.commit()
-
-                except Exception as summary_error:
-                    error_msg = str(summary_error)
-                    logger.error(f"Failed to auto-generate summary for content {content_id}: {error_msg}")
-                    partial_failures['summary_failed'] = True
-                    partial_failures['summary_error'] = error_msg
-                    # Check if it's an AI overloaded error
-                    if 'overloaded' in error_msg.lower() or '529' in error_msg:
-                        partial_failures['ai_overloaded'] = True
-                    # Don't fail the entire process if summary generation fails
+            async def generate_summary():
+                # Check for cancellation before summary generation
+                checkpoint.check("before summary generation")
 
-            # Check for cancellation before project description update
-            checkpoint.check("before project description update")
+                # Auto-generate meeting summary if this is meeting content
+                summary_data = None
+                if content.content_type == ContentType.MEETING:
+                    logger.info(f"Auto-generating summary for meeting content {content_id}")
+                    try:
+                        # Import here to avoid circular dependency
+                        from services.summaries.summary_service_refactored import summary_service
 
-            # Process content for potential project description update
-            try:
-                logger.info(f"Processing content {content_id} for project description update")
-                from services.intelligence.project_description_service import project_description_analyzer
-                from services.hierarchy.project_service import ProjectService
-                
-                # Get last description change time for smart triggers
-                recent_changes = await ProjectService.get_description_change_history(
-                    session, content.project_id, limit=1
-                )
-                last_change_time = recent_changes[0].changed_at if recent_changes else None
-                
-                # Check if we should analyze this content
-                should_analyze = project_description_analyzer.should_trigger_analysis(
-                    content_text=content.content,
-                    content_type=content.content_type.value,
-                    last_change_time=last_change_time
-                )
-                
-                if should_analyze:
-                    # Get current project description
-                    project = await ProjectService.get_project(session, content.project_id)
-                    current_description = project.description or ""  # Use actual empty string, not placeholder
-                    
-                    # Use processed content if available, otherwise raw content
-                    content_for_analysis = processed_content if 'processed_content' in locals() else content.content
+                        # Update job progress to indicate AI processing
+                        _update_rq_job_progress(rq_job, 85.0, "Generating AI summary...", current_step=6)
+
+                        # Generate meeting summary in background with job tracking
+                        summary_data = await summary_service.generate_meeting_summary(
+                            session=session,
+                            project_id=content.project_id,
+                            content_id=content_id,
+                            created_by="system",
+                            rq_job=rq_job  # Pass RQ job for progress tracking
+                        )
+                        summary_id = summary_data.get('id')
+                        logger.info(f"Auto-generated meeting summary {summary_id} for content {content_id}")
+
+                        # Update content to mark summary as generated
+                        content.summary_generated = True
+                        await session.commit()
+
+                    except Exception as summary_error:
+                        error_msg = str(summary_error)
+                        logger.error(f"Failed to auto-generate summary for content {content_id}: {error_msg}")
+                        partial_failures['summary_failed'] = True
+                        partial_failures['summary_error'] = error_msg
+                        # Check if it's an AI overloaded error
+                        if 'overloaded' in error_msg.lower() or '529' in error_msg:
+                            partial_failures['ai_overloaded'] = True
+                        # Don't fail the entire process if summary generation fails
+                return summary_data
+
+            async def update_description(summary):
+                # Opened once the summary is ready, so no connection sits idle during the LLM call
+                async with get_db_context() as description_session:
+                    await analyze_description(description_session, summary)
+
+            async def analyze_description(description_session, summary):
+                # Check for cancellation before project description update
+                checkpoint.check("before project description update")
+
+                # Process content for potential project description update
+                try:
+                    logger.info(f"Processing content {content_id} for project description update")
+                    from services.intelligence.project_description_service import project_description_analyzer
+                    from services.hierarchy.project_service import ProjectService
                     
-                    # Prepare content data for analysis
-                    content_data = {
-                        'content_type': content.content_type.value,
-                        'title': content.title,
-                        'content': content_for_analysis,  # Use processed content
-                        'date': content.date.strftime('%Y-%m-%d') if content.date else None,
-                        'uploaded_by': content.uploaded_by,
-                        'summary': summary_data if 'summary_data' in locals() and summary_data else None  # Pass the meeting summary
-                    }
+                    # Get last description change time for smart triggers
+                    recent_changes = await ProjectService.get_description_change_history(
+                        description_session, content.project_id, limit=1
+                    )
+                    last_change_time = recent_changes[0].changed_at if recent_changes else None
                     
-                    # Analyze with Claude
-                    analysis_result = await project_description_analyzer.analyze_for_description_update(
-                        current_description=current_description,
-                        project_name=project.name,
-                        content_data=content_data
+                    # Check if we should analyze this content
+                    should_analyze = project_description_analyzer.should_trigger_analysis(
+                        content_text=content.content,
+                        content_type=content.content_type.value,
+                        last_change_time=last_change_time
                     )
                     
-                    if analysis_result and analysis_result.get('should_update'):
-                        # Update the description using ProjectService
-                        success = await ProjectService.update_project_description(
-                            session=session,
-                            project_id=content.project_id,
-                            new_description=analysis_result['new_description'],
-                            content_id=content_id,
-                            reason=analysis_result['reason'],
-                            confidence_score=analysis_result['confidence'],
-                            changed_by="system"
+                    if should_analyze:
+                        # Get current project description
+                        project = await ProjectService.get_project(description_session, content.project_id)
+                        current_description = project.description or ""  # Use actual empty string, not placeholder
+                        
+                        # Prepare content data for analysis
+                        content_data = {
+                            'content_type': content.content_type.value,
+                            'title': content.title,
+                            'content': processed_content,  # Use processed content
+                            'date': content.date.strftime('%Y-%m-%d') if content.date else None,
+                            'uploaded_by': content.uploaded_by,
+                            'summary': summary  # Pass the meeting summary
+                        }
+                        
+                        # Analyze with Claude
+                        analysis_result = await project_description_analyzer.analyze_for_description_update(
+                            current_description=current_description,
+                            project_name=project.name,
+                            content_data=content_data
                         )
-
-                        if success:
-                            logger.info(
-                                f"Project description updated for content {content_id}"
+                        
+                        if analysis_result and analysis_result.get('should_update'):
+                            # Update the description using ProjectService
+                            success = await ProjectService.update_project_description(
+                                session=description_session,
+                                project_id=content.project_id,
+                                new_description=analysis_result['new_description'],
+                                content_id=content_id,
+                                reason=analysis_result['reason'],
+                                confidence_score=analysis_result['confidence'],
+                                changed_by="system"
                             )
+
+                            if success:
+                                logger.info(
+                                    f"Project description updated for content {content_id}"
+                                )
+                            else:
+                                logger.warning(f"Failed to update project description for content {content_id}")
                         else:
-                            logger.warning(f"Failed to update project description for content {content_id}")
+                            logger.info(f"No description update recommended for content {content_id}")
                     else:
-                        logger.info(f"No description update recommended for content {content_id}")
-                else:
-                    logger.info(f"Smart triggers skipped analysis for content {content_id}")
-                    
-            except Exception as description_error:
-                error_msg = str(description_error)
-                logger.error(f"Failed to process description update for content {content_id}: {error_msg}")
-                partial_failures['description_update_failed'] = True
-                partial_failures['description_error'] = error_msg
-                # Check if it's an AI overloaded error
-                if 'overloaded' in error_msg.lower() or '529' in error_msg:
-                    partial_failures['ai_overloaded'] = True
-                # Don't fail the entire process if description update fails
-
-            # Step 4.5: Sync project risks, tasks, and lessons from summary data
-            # If we have summary_data from the meeting summary, use that to update project items
-            if 'summary_data' in locals() and summary_data:
-                try:
-                    from services.sync.project_items_sync_service import project_items_sync_service
+                        logger.info(f"Smart triggers skipped analysis for content {content_id}")
+                        
+                except Exception as description_error:
+                    error_msg = str(description_error)
+                    logger.error(f"Failed to process description update for content {content_id}: {error_msg}")
+                    partial_failures['description_update_failed'] = True
+                    partial_failures['description_error'] = error_msg
+                    # Check if it's an AI overloaded error
+                    if 'overloaded' in error_msg.lower() or '529' in error_msg:
+                        partial_failures['ai_overloaded'] = True
+                    # Don't fail the entire process if description update fails
+
+            async def load_existing_items():
+                # Read while the summary is generated; the session is released as soon as the
+                # items are loaded rather than held for the whole LLM call
+                from services.sync.project_items_sync_service import project_items_sync_service
+                async with get_db_context() as items_session:
+                    return await project_items_sync_service.get_existing_project_items(items_session, content.project_id)
+
+            async def sync_items(summary, existing_items):
+                # Step 4.5: Sync project risks, tasks, and lessons from summary data
+                # If we have summary_data from the meeting summary, use that to update project items
+                if summary:
+                    try:
+                        from services.sync.project_items_sync_service import project_items_sync_service
 
-                    logger.info(f"Syncing project items from meeting summary for content {content_id}")
+                        logger.info(f"Syncing project items from meeting summary for content {content_id}")
 
-                    sync_result = await project_items_sync_service.sync_items_from_summary(
-                        session=session,
-                        project_id=content.project_id,
-                        content_id=content_id,
-                        summary_data=summary_data
-                    )
+                        async with get_db_context() as items_session:
+                            sync_result = await project_items_sync_service.sync_items_from_summary(
+                                session=items_session,
+                                project_id=content.project_id,
+                                content_id=content_id,
+                                summary_data=summary,
+                                existing_items=existing_items
+                            )
 
-                    logger.info(
-                        f"Project items sync complete: {sync_result['risks_synced']} risks, "
-                        f"{sync_result.get('blockers_synced', 0)} blockers, "
-                        f"{sync_result['tasks_synced']} tasks, {sync_result['lessons_synced']} lessons"
-                    )
+                        logger.info(
+                            f"Project items sync complete: {sync_result['risks_synced']} risks, "
+                            f"{sync_result.get('blockers_synced', 0)} blockers, "
+                            f"{sync_result['tasks_synced']} tasks, {sync_result['lessons_synced']} lessons"
+                        )
 
-                    if sync_result.get('errors'):
-                        for error in sync_result['errors']:
-                            logger.error(f"Sync error: {error}")
-                            partial_failures['sync_error'] = error
+                        if sync_result.get('errors'):
+                            for error in sync_result['errors']:
+                                logger.error(f"Sync error: {error}")
+                                partial_failures['sync_error'] = error
 
-                except Exception as e:
-                    logger.error(f"Failed to sync project items from summary: {e}")
-                    partial_failures['sync_failed'] = True
-                    # Don't fail the entire process if sync fails
+                    except Exception as e:
+                        logger.error(f"Failed to sync project items from summary: {e}")
+                        partial_failures['sync_failed'] = True
+                        # Don't fail the entire process if sync fails
 
-            # No fallback - if summary generation fails, the entire process should fail
-            else:
-                logger.error("No summary data available - summary generation must have failed. Cannot proceed with project items sync.")
-                partial_failures['no_summary_data'] = True
+                # No fallback - if summary generation fails, the entire process should fail
+                else:
+                    logger.error("No summary data available - summary generation must have failed. Cannot proceed with project items sync.")
+                    partial_failures['no_summary_data'] = True
 
             # Old database update code has been removed - now using project_items_sync_service
             # which handles extraction, deduplication, and database updates in one place
 
+            # Description analysis and item sync both start as soon as the summary is
+            # ready and run concurrently; each stage opens its own session when it runs
+            stages = [
+                Stage("summary", generate_summary),
+                Stage("description", update_description, depends_on=("summary",)),
+            ]
+            if content.content_type == ContentType.MEETING:
+                stages += [
+                    Stage("existing_items", load_existing_items),
+                    Stage("item_sync", sync_items, depends_on=("summary", "existing_items")),
+                ]
+            else:
+                # Only meetings get a summary to sync project items from
+                partial_failures['no_summary_data'] = True
+            stage_runner = StageRunner(stages)
+            await stage_runner.run()
+            summary_data = stage_runner.results.get("summary")
+            stage_timings_ms.update(stage_runner.timings_ms)
+            stage_timings_ms["post_processing"] = round((time.perf_counter() - post_processing_start) * 1000, 1)
+
             # Mark job as completed (with partial success if applicable)
             if rq_job:
                 from queue_config import queue_config
 
                 result_data = {
                     "content_id": str(content_id),
-                    "chunks": len(chunks)
+                    "chunks": len(chunks),
+                    "indexing": indexing_stats
                 }
                 # Include summary_id if a summary was generated
-                if 'summary_data' in locals() and summary_data and summary_data.get('id'):
+                if summary_data and summary_data.get('id'):
                     result_data["summary_id"] = summary_data['id']
 
                 # Include project_was_created flag if this was an AI-matched project
@@ -582,6 +691,7 @@ class ContentService:
                 rq_job.meta['progress'] = 100.0
                 rq_job.meta['step'] = status_msg
                 rq_job.meta['result'] = result_data
+                rq_job.meta['stage_timings_ms'] = stage_timings_ms
 
                 # Add metadata about AI processing status
                 if partial_failures:
@@ -617,6 +727,174 @@ class ContentService:
                 await session.commit()
             raise
 
+    @staticmethod
+    def _build_chunk_point(
+        content: Content,
+        chunk: Dict[str, Any],
+        embedding,
+        language_info: Dict[str, Any]
+    ):
+        """Build the Qdrant point for one chunk of content."""
+        from db.multi_tenant_vector_store import multi_tenant_vector_store
+        from qdrant_client.models import PointStruct
+
+        if isinstance(embedding, dict):
+            # Stored named vectors reused from an identical chunk
+            vector_data = dict(embedding)
+        elif isinstance(embedding, list):
+            vector_data = list(embedding)
+        # Handle MRL (Multi-Resolution Learning) vectors
+        elif settings.enable_mrl:
+            # Named vectors for each dimension (lists built once at the Qdrant boundary)
+            vector_data = multi_tenant_vector_store.build_mrl_vectors(embedding)
+        else:
+            # Single vector for non-MRL mode
+            vector_data = embedding.tolist()
+
+        return PointStruct(
+            # Generate a unique UUID for each chunk
+            id=str(uuid.uuid4()),
+            vector=vector_data,
+            payload={
+                'content_id': str(content.id),
+                'project_id': str(content.project_id),
+                'content_type': content.content_type.value,
+                'title': content.title,
+                'chunk_index': chunk['index'],
+                'chunk_hash': chunk.get('chunk_hash'),
+                'text': chunk['text'],
+                'word_count': chunk['word_count'],
+                'start_position': chunk['start_position'],
+                'date': content.date.isoformat() if content.date else None,
+                'uploaded_at': content.uploaded_at.isoformat(),
+                # Add language metadata if detected
+                'language': language_info.get('language', 'en') if language_info else 'en',
+                'language_confidence': language_info.get('confidence', 0.0) if language_info else 0.0
+            }
+        )
+
+    @staticmethod
+    def compute_text_hash(text: str) -> str:
+        """SHA-256 of text with whitespace collapsed (hex digest)."""
+        return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    async def _find_duplicate_content(session: AsyncSession, content: Content, content_hash: str):
+        """Find a successfully indexed content item in the same project with identical text."""
+        result = await session.execute(
+            select(Content.id, Content.title).where(
+                Content.project_id == content.project_id,
+                Content.content_hash == content_hash,
+                Content.id != content.id,
+                Content.chunk_count > 0,
+                Content.processing_error.is_(None)
+            ).limit(1)
+        )
+        return result.first()
+
+    @staticmethod
+    async def _plan_chunk_indexing(
+        organization_id: str,
+        content: Content,
+        chunks: List[Dict[str, Any]],
+        previously_indexed: bool
+    ) -> ChunkIndexPlan:
+        """
+        Diff new chunks against the vectors already stored.
+
+        Chunks whose hash matches one of this content's stored points keep that
+        point; the remaining stored points are removed. New chunks identical to a
+        chunk stored elsewhere in the project reuse its vector instead of being
+        embedded again.
+
+        Args:
+            organization_id: Organization ID
+            content: Content being processed
+            chunks: New chunks with 'chunk_hash'
+            previously_indexed: Whether this content may already have stored points
+
+        Returns:
+            ChunkIndexPlan
+        """
+        from db.multi_tenant_vector_store import multi_tenant_vector_store
+
+        plan = ChunkIndexPlan()
+
+        existing: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        if previously_indexed:
+            stored = await multi_tenant_vector_store.find_points(
+                organization_id,
+                {'content_id': str(content.id)},
+                with_payload=['chunk_hash', 'chunk_index', 'start_position']
+            )
+            for point in stored:
+                # Points indexed before chunk hashes existed have none and are replaced
+                existing[(point['payload'] or {}).get('chunk_hash')].append(point)
+
+        for chunk in chunks:
+            matches = existing.get(chunk['chunk_hash'])
+            if not matches:
+                plan.create.append(chunk)
+                continue
+            point = matches.pop(0)
+            plan.kept += 1
+            payload = point['payload'] or {}
+            if payload.get('chunk_index') != chunk['index'] or payload.get('start_position') != chunk['start_position']:
+                plan.keep_updates[point['id']] = {
+                    'chunk_index': chunk['index'],
+                    'start_position': chunk['start_position'],
+                    'word_count': chunk['word_count']
+                }
+        plan.remove = [point['id'] for points in existing.values() for point in points]
+
+        new_hashes = list({chunk['chunk_hash'] for chunk in plan.create})
+        if new_hashes:
+            identical = await multi_tenant_vector_store.find_points(
+                organization_id,
+                {'project_id': str(content.project_id), 'chunk_hash': new_hashes},
+                with_payload=['chunk_hash'],
+                with_vectors=True
+            )
+            for point in identical:
+                vector = point['vector']
+                # Only reuse vectors stored in the current (MRL or single) layout
+                if vector and isinstance(vector, dict) == settings.enable_mrl:
+                    plan.reuse_vectors.setdefault(point['payload']['chunk_hash'], vector)
+
+        return plan
+
+    @staticmethod
+    async def _delete_chunk_vectors(organization_id: str, project_id: str, point_ids: List[str]) -> None:
+        """Delete chunk vectors and drop them from the project's BM25 keyword index."""
+        from db.multi_tenant_vector_store import multi_tenant_vector_store
+        from services.rag.keyword_index import keyword_index
+
+        await multi_tenant_vector_store.delete_vectors(
+            organization_id=organization_id,
+            points_selector=point_ids
+        )
+        await keyword_index.remove_documents(organization_id, project_id, point_ids)
+
+    @staticmethod
+    def _mark_rq_job_completed(rq_job, result_data: Dict[str, Any], status_msg: str) -> None:
+        """Mark the RQ job completed and publish the final update."""
+        if not rq_job:
+            return
+
+        from queue_config import queue_config
+
+        rq_job.meta['status'] = 'completed'
+        rq_job.meta['progress'] = 100.0
+        rq_job.meta['step'] = status_msg
+        rq_job.meta['result'] = result_data
+        rq_job.save_meta()
+
+        queue_config.publish_job_update(rq_job.id, {
+            'status': 'completed',
+            'progress': 100.0,
+            'step': status_msg
+        })
+
     # ========== OLD CODE REMOVED - Lines 623-844 contained duplicate database update code ==========
     # This has been replaced with project_items_sync_service which handles:
     # - Extraction from meeting summary data
@@ -0,0 +1,124 @@
+"""
+Bounded ingestion pipeline for content chunks.
+
+Chunks flow through three concurrent stages connected by bounded queues:
+
+    chunk batches -> embed (and build points) -> upsert
+
+When a later stage falls behind, its full queue blocks the stage before it, so
+only a fixed number of batches (and their vectors) are alive at any time no
+matter how long the document is, and the vector store receives fixed-size
+upserts instead of one request for the whole document. Embedding batch N+1
+overlaps with the upsert of batch N.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Marks the end of a stage's input
+_DONE = object()
+
+Chunk = Dict[str, Any]
+EmbedBatchFn = Callable[[List[Chunk]], Awaitable[List[Any]]]
+StoreBatchFn = Callable[[List[Any]], Awaitable[None]]
+
+
+class ChunkIngestionPipeline:
+    """Producer/consumer pipeline that embeds and stores chunks in bounded batches."""
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatchFn,
+        store_batch: StoreBatchFn,
+        batch_size: int = 64,
+        queue_depth: int = 2,
+        on_progress: Optional[Callable[[int], None]] = None,
+        before_batch: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            embed_batch: Turns a batch of chunks into points ready for storage
+            store_batch: Persists one batch of points
+            batch_size: Chunks per embedding call and per upsert
+            queue_depth: Batches buffered between two stages (backpressure bound)
+            on_progress: Called with the number of chunks stored so far after each batch
+            before_batch: Called before each batch is produced (e.g. cancellation checks)
+        """
+        self.embed_batch = embed_batch
+        self.store_batch = store_batch
+        self.batch_size = max(1, batch_size)
+        self.queue_depth = max(1, queue_depth)
+        self.on_progress = on_progress
+        self.before_batch = before_batch
+
+    async def run(self, chunks: Iterable[Chunk]) -> int:
+        """
+        Embed and store all chunks.
+
+        Args:
+            chunks: Chunks to ingest, consumed lazily in batch_size slices
+
+        Returns:
+            Number of chunks stored
+
+        Raises:
+            Exception: The first error raised by any stage; the other stages are cancelled
+        """
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        stored = 0
+
+        async def produce():
+            batch: List[Chunk] = []
+            for chunk in chunks:
+                batch.append(chunk)
+                if len(batch) == self.batch_size:
+                    await self._put_batch(embed_queue, batch)
+                    batch = []
+            if batch:
+                await self._put_batch(embed_queue, batch)
+            await embed_queue.put(_DONE)
+
+        async def embed():
+            while True:
+                batch = await embed_queue.get()
+                if batch is _DONE:
+                    await store_queue.put(_DONE)
+                    return
+                points = await self.embed_batch(batch)
+                await store_queue.put((len(batch), points))
+
+        async def store():
+            nonlocal stored
+            while True:
+                item = await store_queue.get()
+                if item is _DONE:
+                    return
+                chunk_count, points = item
+                await self.store_batch(points)
+                stored += chunk_count
+                if self.on_progress:
+                    self.on_progress(stored)
+
+        tasks = [asyncio.create_task(stage()) for stage in (produce, embed, store)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        logger.debug(f"Ingestion pipeline stored {stored} chunks in batches of {self.batch_size}")
+        return stored
+
+    async def _put_batch(self, queue: asyncio.Queue, batch: List[Chunk]) -> None:
+        if self.before_batch:
+            self.before_batch()
+        await queue.put(batch)
@@ -0,0 +1,96 @@
+"""
+Dependency-aware runner for content processing stages.
+
+Each stage declares the stages it depends on and starts as soon as all of
+them have finished, so independent stages run concurrently. A stage receives
+its dependencies' results as keyword arguments (None for a dependency that
+failed) and decides itself how to degrade, which keeps partial-failure
+handling inside the stages. Per-stage durations are recorded for job metadata.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Sequence, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Stage:
+    """A unit of work and the stages whose results it needs."""
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+
+
+class StageRunner:
+    """Runs stages concurrently in dependency order."""
+
+    def __init__(self, stages: Sequence[Stage]):
+        """
+        Initialize the runner.
+
+        Args:
+            stages: Stages to run; dependencies must be declared before their dependents
+
+        Raises:
+            ValueError: If a stage name repeats or a dependency is unknown
+        """
+        seen = set()
+        for stage in stages:
+            if stage.name in seen:
+                raise ValueError(f"Duplicate stage '{stage.name}'")
+            unknown = [dep for dep in stage.depends_on if dep not in seen]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on undeclared stages {unknown}")
+            seen.add(stage.name)
+
+        self.stages = list(stages)
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.timings_ms: Dict[str, float] = {}
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run all stages.
+
+        Exceptions raised by a stage are logged and recorded in ``errors``; its
+        dependents still run with None for that result. Cancellation stops
+        every stage and propagates.
+
+        Returns:
+            Dictionary mapping stage name to result
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage) -> None:
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+
+            start = time.perf_counter()
+            result = None
+            try:
+                result = await stage.func(**{dep: self.results.get(dep) for dep in stage.depends_on})
+            except Exception as e:
+                logger.error(f"Stage '{stage.name}' failed: {e}")
+                self.errors[stage.name] = e
+            finally:
+                self.timings_ms[stage.name] = round((time.perf_counter() - start) * 1000, 1)
+            self.results[stage.name] = result
+
+        for stage in self.stages:
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        logger.info(f"Stages completed: {self.timings_ms}")
+        return self.results
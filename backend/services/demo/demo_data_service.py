@@ -20,6 +20,7 @@ from models.risk import Risk, RiskSeverity, RiskStatus
 from models.blocker import Blocker, BlockerImpact, BlockerStatus
 from models.lesson_learned import LessonLearned, LessonCategory, LessonType, LessonLearnedImpact
 from models.activity import Activity, ActivityType
+from services.cache.project_scope_cache import project_scope_cache
 from utils.logger import get_logger
 
 from .demo_content import (
@@ -387,6 +388,7 @@ class DemoDataService:
             )
         )
         counts["projects"] = r.rowcount
+        project_scope_cache.invalidate(demo_project_ids)
 
         # Delete programs
         r = await db.execute(
@@ -12,6 +12,7 @@ from models.project import Project, ProjectStatus
 from services.hierarchy.portfolio_service import PortfolioService
 from services.hierarchy.program_service import ProgramService
 from services.hierarchy.project_service import ProjectService
+from services.cache.project_scope_cache import project_scope_cache
 from utils.logger import get_logger, sanitize_for_log
 
 logger = get_logger(__name__)
@@ -305,6 +306,7 @@ class HierarchyService:
         }
         
         await session.commit()
+        project_scope_cache.invalidate([project_id])
         
         logger.info(f"Moved project {project_name} from portfolio={old_portfolio_id}, program={old_program_id} to portfolio={new_portfolio_id}, program={new_program_id}")
         
@@ -384,6 +386,7 @@ class HierarchyService:
         )
         
         await session.commit()
+        project_scope_cache.invalidate_program(program_id)
         
         logger.info(f"Moved program {program_name} from portfolio {old_portfolio_id} to portfolio {target_parent_id}")
         
@@ -9,6 +9,7 @@ from sqlalchemy.orm import selectinload
 
 from models.project import Project, ProjectMember, ProjectStatus
 from services.activity.activity_service import ActivityService
+from services.cache.project_scope_cache import project_scope_cache
 from utils.logger import get_logger, sanitize_for_log
 
 logger = get_logger(__name__)
@@ -218,6 +219,9 @@ class ProjectService:
 
                 project.program_id = program_id
 
+            if 'portfolio_id' in kwargs or 'program_id' in kwargs:
+                project_scope_cache.invalidate([project_id])
+
             project.updated_at = datetime.utcnow()
 
             # Update members if provided
@@ -391,6 +395,8 @@ class ProjectService:
                 )
             )
 
+            project_scope_cache.invalidate([project_id])
+
             # Note: We can't log activity after deletion since the project is gone
             # Could consider logging to a separate audit table if needed
 
@@ -10,11 +10,10 @@ from datetime import datetime, timedelta
 from enum import Enum
 import json
 
-import spacy
-from sentence_transformers import SentenceTransformer
 import numpy as np
 
 from utils.logger import get_logger
+from services.rag.model_registry import shared_sentence_transformer, shared_spacy_model
 from services.transcription.advanced_transcript_parser import (
     AdvancedTranscriptAnalysis, SpeakerTurn, TopicSegment,
     DecisionPoint, ActionItem, MeetingOutcome,
@@ -256,13 +255,15 @@ class MeetingIntelligenceReport:
 
 class MeetingIntelligenceService:
     """Service for extracting deep insights and intelligence from meetings."""
+
+    # NLP models (shared process-wide, loaded on first use)
+    nlp_model = shared_spacy_model()
+    sentence_transformer = shared_sentence_transformer()
     
     def __init__(self):
         """Initialize meeting intelligence service."""
         from config import get_settings
         self.settings = get_settings()
-        self.nlp_model = None
-        self.sentence_transformer = None
         
         # Analysis parameters
         self.engagement_thresholds = {
@@ -295,9 +296,6 @@ class MeetingIntelligenceService:
         self.risk_indicators = [
             'concern', 'risk', 'issue', 'problem', 'challenge', 'blocker'
         ]
-        
-        # Initialize models
-        self._initialize_models()
     
     async def analyze_meeting(
         self,
@@ -313,10 +311,6 @@ class MeetingIntelligenceService:
         )
         from services.transcription.transcript_parser import TranscriptParser
         
-        # Initialize models if not already done
-        if not self.nlp_model:
-            self._initialize_models()
-        
         # Parse the transcript first
         parser = TranscriptParser()
         parsed_transcript = parser.parse_transcript(meeting_text)
@@ -511,32 +505,6 @@ class MeetingIntelligenceService:
         
         return report
     
-    def _initialize_models(self):
-        """Initialize NLP models for analysis."""
-        try:
-            # Load spaCy model
-            try:
-                self.nlp_model = spacy.load("en_core_web_sm")
-                logger.info("Loaded spaCy model for meeting intelligence")
-            except OSError:
-                logger.warning("spaCy model not available - some analysis will be limited")
-                self.nlp_model = None
-            
-            # Load sentence transformer
-            try:
-                self.sentence_transformer = SentenceTransformer(
-                    self.settings.sentence_transformer_model,
-                    token=self.settings.hf_token,
-                    trust_remote_code=True
-                )
-                logger.info("Loaded SentenceTransformer for semantic analysis")
-            except Exception as e:
-                logger.warning(f"Failed to load SentenceTransformer: {e}")
-                self.sentence_transformer = None
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize meeting intelligence models: {e}")
-    
     async def analyze_meeting_intelligence(
         self,
         transcript_content: str,
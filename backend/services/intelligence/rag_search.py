@@ -236,9 +236,9 @@ class RAGSearchService:
         """
         try:
             # Generate query embedding
-            query_embedding = await embedding_service.generate_embedding(question)
+            query_embedding = (await embedding_service.encode_array([question]))[0]
 
-            if not query_embedding:
+            if query_embedding.size == 0:
                 logger.warning("Failed to generate query embedding")
                 return
 
@@ -395,16 +395,11 @@ class RAGSearchService:
             True if vector store and embedding service are available
         """
         try:
-            # Check if vector store client is initialized
-            if not hasattr(multi_tenant_vector_store, '_client'):
+            # Check if vector store client (sync or async) is initialized
+            if not multi_tenant_vector_store.is_initialized:
                 logger.debug("Vector store client not initialized")
                 return False
 
-            # Verify client is not None
-            if multi_tenant_vector_store._client is None:
-                logger.debug("Vector store client is None")
-                return False
-
             # Check if embedding service is available
             # EmbeddingService uses _model (private attribute) not model
             if not hasattr(embedding_service, '_model'):
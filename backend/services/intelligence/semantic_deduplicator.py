@@ -81,7 +81,7 @@ class SemanticDeduplicator:
         # Step 1: Generate embeddings for new items
         # Combine title + description for better semantic matching
         new_texts = [self._combine_text_for_embedding(item) for item in new_items]
-        new_embeddings = await self.embedding_service.generate_embeddings_batch(new_texts)
+        new_embeddings = await self.embedding_service.encode_array(new_texts)
 
         # Step 2: Get or generate embeddings for existing items
         existing_embeddings = await self._get_existing_embeddings(existing_items)
@@ -105,7 +105,7 @@ class SemanticDeduplicator:
                 # No similar existing item found
                 unique_items.append({
                     **item,
-                    'title_embedding': new_embeddings[idx]
+                    'title_embedding': new_embeddings[idx].tolist()  # JSON column
                 })
                 duplicate_analysis[idx] = {
                     'status': 'unique',
@@ -148,7 +148,7 @@ class SemanticDeduplicator:
                 # Low similarity - treat as unique
                 unique_items.append({
                     **item,
-                    'title_embedding': new_embeddings[idx]
+                    'title_embedding': new_embeddings[idx].tolist()  # JSON column
                 })
                 duplicate_analysis[idx] = {
                     'status': 'unique_below_threshold',
@@ -190,37 +190,34 @@ class SemanticDeduplicator:
     def _find_similar_items(
         self,
         new_items: List[Dict],
-        new_embeddings: List[List[float]],
+        new_embeddings: np.ndarray,
         existing_items: List[Dict],
-        existing_embeddings: List[List[float]]
+        existing_embeddings: np.ndarray
     ) -> Dict[int, Dict]:
         """
         Find most similar existing item for each new item using cosine similarity.
 
+        Similarities for all (new, existing) pairs are computed as one matrix product.
+
         Returns:
             Dict mapping new_item_index -> {existing_item, similarity}
         """
-        if not existing_items or not existing_embeddings:
+        if not existing_items or len(existing_embeddings) == 0 or len(new_embeddings) == 0:
             return {}
 
-        matches = {}
-
-        for new_idx, new_emb in enumerate(new_embeddings):
-            best_similarity = 0.0
-            best_match = None
-
-            for existing_idx, existing_emb in enumerate(existing_embeddings):
-                similarity = self._cosine_similarity(new_emb, existing_emb)
-
-                if similarity > best_similarity and similarity >= self.LOW_SIMILARITY_THRESHOLD:
-                    best_similarity = similarity
-                    best_match = existing_items[existing_idx]
-                    logger.debug(f"Match found: '{new_items[new_idx].get('title')}' vs '{existing_items[existing_idx].get('title')}' - similarity: {similarity:.3f}")
+        similarity_matrix = self._cosine_similarity_matrix(new_embeddings, existing_embeddings)
+        best_indices = similarity_matrix.argmax(axis=1)
+        best_scores = similarity_matrix[np.arange(len(best_indices)), best_indices]
 
-            if best_match:
+        matches = {}
+        for new_idx, (existing_idx, similarity) in enumerate(zip(best_indices, best_scores)):
+            similarity = float(similarity)
+            if similarity >= self.LOW_SIMILARITY_THRESHOLD:
+                best_match = existing_items[int(existing_idx)]
+                logger.debug(f"Match found: '{new_items[new_idx].get('title')}' vs '{best_match.get('title')}' - similarity: {similarity:.3f}")
                 matches[new_idx] = {
                     'existing_item': best_match,
-                    'similarity': best_similarity
+                    'similarity': similarity
                 }
 
         return matches
@@ -257,11 +254,11 @@ class SemanticDeduplicator:
         else:
             return "untitled"
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
+    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors."""
         try:
-            v1 = np.array(vec1)
-            v2 = np.array(vec2)
+            v1 = np.asarray(vec1, dtype=np.float32)
+            v2 = np.asarray(vec2, dtype=np.float32)
 
             dot_product = np.dot(v1, v2)
             norm1 = np.linalg.norm(v1)
@@ -275,10 +272,19 @@ class SemanticDeduplicator:
             logger.error(f"Error calculating cosine similarity: {e}")
             return 0.0
 
+    @staticmethod
+    def _cosine_similarity_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Calculate pairwise cosine similarity between rows of a and rows of b."""
+        a_norms = np.linalg.norm(a, axis=1, keepdims=True)
+        b_norms = np.linalg.norm(b, axis=1, keepdims=True)
+        a_norms[a_norms == 0] = 1.0
+        b_norms[b_norms == 0] = 1.0
+        return (a / a_norms) @ (b / b_norms).T
+
     async def _get_existing_embeddings(
         self,
         existing_items: List[Dict[str, Any]]
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         """
         Get embeddings for existing items, using cached embeddings when available.
 
@@ -289,8 +295,12 @@ class SemanticDeduplicator:
 
         This optimization reduces latency by avoiding unnecessary embedding regeneration
         while maintaining correctness through cached embeddings.
+
+        Returns:
+            Float32 array with one row per existing item
         """
-        embeddings = []
+        dimension = self.embedding_service.embedding_dimension
+        embeddings = np.zeros((len(existing_items), dimension), dtype=np.float32)
         items_to_embed = []
         items_needing_embedding = []  # Track indices that need new embeddings
 
@@ -298,27 +308,26 @@ class SemanticDeduplicator:
         for idx, item in enumerate(existing_items):
             cached_embedding = item.get('title_embedding')
 
-            if cached_embedding and isinstance(cached_embedding, list) and len(cached_embedding) > 0:
+            if (
+                cached_embedding
+                and isinstance(cached_embedding, list)
+                and len(cached_embedding) == dimension
+            ):
                 # Use cached embedding
-                embeddings.append(cached_embedding)
+                embeddings[idx] = cached_embedding
                 logger.debug(f"Using cached embedding for item: {item.get('title', 'untitled')[:50]}")
             else:
                 # Need to generate embedding
-                embeddings.append(None)  # Placeholder
                 items_needing_embedding.append(idx)
                 items_to_embed.append(self._combine_text_for_embedding(item))
 
         # Generate embeddings only for items that need them
         if items_to_embed:
             logger.debug(f"Generating {len(items_to_embed)} embeddings for existing items without cached embeddings")
-            new_embeddings = await self.embedding_service.generate_embeddings_batch(
+            embeddings[items_needing_embedding] = await self.embedding_service.encode_array(
                 items_to_embed
             )
 
-            # Fill in the newly generated embeddings
-            for idx, new_emb in zip(items_needing_embedding, new_embeddings):
-                embeddings[idx] = new_emb
-
         logger.info(f"Embedding cache hit: {len(existing_items) - len(items_to_embed)}/{len(existing_items)}, "
                    f"cache miss: {len(items_to_embed)}/{len(existing_items)}")
 
@@ -359,12 +359,51 @@ class StreamRouter:
             "Expected format: prefix_uuid (e.g., q_{uuid}, a_{uuid})"
         )
 
-    async def _find_duplicate_question(self, question_text: str) -> Tuple[bool, Optional[str], float]:
+    async def _embed_text(self, text: str) -> np.ndarray:
+        """Generate a normalized EmbeddingGemma vector for a single text."""
+        embeddings = await embedding_service.encode_array([text], normalize=True)
+        return embeddings[0]
+
+    @staticmethod
+    def _best_match(
+        query_embedding: np.ndarray,
+        text_to_id: Dict[str, str],
+        embeddings: Dict[str, np.ndarray]
+    ) -> Tuple[float, Optional[str], Optional[str]]:
+        """
+        Find the stored text most similar to a query embedding.
+
+        Embeddings are normalized, so cosine similarity is a single
+        matrix-vector product over all stored vectors.
+
+        Returns:
+            Tuple of (max_similarity, best_text, best_id); (0.0, None, None) if no positive match
+        """
+        if not text_to_id:
+            return 0.0, None, None
+
+        texts = list(text_to_id.keys())
+        matrix = np.stack([embeddings[text] for text in texts])
+        similarities = matrix @ query_embedding
+
+        best = int(similarities.argmax())
+        best_similarity = float(similarities[best])
+        if best_similarity <= 0.0:
+            return 0.0, None, None
+
+        return best_similarity, texts[best], text_to_id[texts[best]]
+
+    async def _find_duplicate_question(
+        self,
+        question_text: str,
+        embedding: Optional[np.ndarray] = None
+    ) -> Tuple[bool, Optional[str], float]:
         """
         Find semantically similar duplicate question using EmbeddingGemma.
 
         Args:
             question_text: New question to check
+            embedding: Precomputed embedding for question_text, if available
 
         Returns:
             Tuple of (is_duplicate, existing_question_id, similarity_score)
@@ -373,24 +412,12 @@ class StreamRouter:
             return False, None, 0.0
 
         # Get embedding for new question using EmbeddingGemma
-        new_embedding_list = await embedding_service.generate_embedding(question_text, normalize=True)
-        new_embedding = np.array(new_embedding_list)
+        new_embedding = embedding if embedding is not None else await self._embed_text(question_text)
 
         # Compare with all existing questions
-        max_similarity = 0.0
-        most_similar_text = None
-        most_similar_id = None
-
-        for existing_text, existing_id in self.question_text_to_id.items():
-            existing_embedding = self.question_embeddings[existing_text]
-
-            # Cosine similarity (already normalized, so just dot product)
-            similarity = float(np.dot(new_embedding, existing_embedding))
-
-            if similarity > max_similarity:
-                max_similarity = similarity
-                most_similar_text = existing_text
-                most_similar_id = existing_id
+        max_similarity, most_similar_text, most_similar_id = self._best_match(
+            new_embedding, self.question_text_to_id, self.question_embeddings
+        )
 
         # Check if above threshold
         if max_similarity >= self.similarity_threshold:
@@ -403,12 +430,17 @@ class StreamRouter:
 
         return False, None, max_similarity
 
-    async def _find_duplicate_action(self, action_description: str) -> Tuple[bool, Optional[str], float]:
+    async def _find_duplicate_action(
+        self,
+        action_description: str,
+        embedding: Optional[np.ndarray] = None
+    ) -> Tuple[bool, Optional[str], float]:
         """
         Find semantically similar duplicate action using EmbeddingGemma.
 
         Args:
             action_description: New action description to check
+            embedding: Precomputed embedding for action_description, if available
 
         Returns:
             Tuple of (is_duplicate, existing_action_id, similarity_score)
@@ -417,24 +449,12 @@ class StreamRouter:
             return False, None, 0.0
 
         # Get embedding for new action using EmbeddingGemma
-        new_embedding_list = await embedding_service.generate_embedding(action_description, normalize=True)
-        new_embedding = np.array(new_embedding_list)
+        new_embedding = embedding if embedding is not None else await self._embed_text(action_description)
 
         # Compare with all existing actions
-        max_similarity = 0.0
-        most_similar_text = None
-        most_similar_id = None
-
-        for existing_text, existing_id in self.action_text_to_id.items():
-            existing_embedding = self.action_embeddings[existing_text]
-
-            # Cosine similarity (already normalized, so just dot product)
-            similarity = float(np.dot(new_embedding, existing_embedding))
-
-            if similarity > max_similarity:
-                max_similarity = similarity
-                most_similar_text = existing_text
-                most_similar_id = existing_id
+        max_similarity, most_similar_text, most_similar_id = self._best_match(
+            new_embedding, self.action_text_to_id, self.action_embeddings
+        )
 
         # Check if above threshold
         if max_similarity >= self.similarity_threshold:
@@ -484,7 +504,10 @@ class StreamRouter:
         # ========================================================================
         # STEP 2: Check for semantic duplicates using embeddings
         # ========================================================================
-        is_duplicate, existing_id, similarity = await self._find_duplicate_question(question_text)
+        question_embedding = await self._embed_text(question_text)
+        is_duplicate, existing_id, similarity = await self._find_duplicate_question(
+            question_text, question_embedding
+        )
         if is_duplicate:
             logger.info(
                 f"Skipping duplicate question (similarity={similarity:.3f}): "
@@ -501,9 +524,8 @@ class StreamRouter:
         # We must use the actual current time for accurate "time ago" display
         obj["timestamp"] = datetime.utcnow().isoformat() + "Z"
 
-        # Generate and store embedding for this question using EmbeddingGemma
-        embedding_list = await embedding_service.generate_embedding(question_text, normalize=True)
-        self.question_embeddings[question_text] = np.array(embedding_list)
+        # Store embedding for this question (computed during duplicate check)
+        self.question_embeddings[question_text] = question_embedding
 
         # Track question by ORIGINAL text and ID (for answer matching)
         self.question_text_to_id[question_text] = backend_id
@@ -556,7 +578,10 @@ class StreamRouter:
         # ========================================================================
         # STEP 2: Check for semantic duplicates using embeddings
         # ========================================================================
-        is_duplicate, existing_id, similarity = await self._find_duplicate_action(action_description)
+        action_embedding = await self._embed_text(action_description)
+        is_duplicate, existing_id, similarity = await self._find_duplicate_action(
+            action_description, action_embedding
+        )
 
         if is_duplicate:
             # Treat as action update - route through action_update_handler
@@ -587,9 +612,8 @@ class StreamRouter:
             # We must use the actual current time for accurate "time ago" display
             obj["timestamp"] = datetime.utcnow().isoformat() + "Z"
 
-            # Generate and store embedding for this action using EmbeddingGemma
-            embedding_list = await embedding_service.generate_embedding(action_description, normalize=True)
-            self.action_embeddings[action_description] = np.array(embedding_list)
+            # Store embedding for this action (computed during duplicate check)
+            self.action_embeddings[action_description] = action_embedding
 
             # Track action by ORIGINAL description and ID (for action_update matching)
             self.action_text_to_id[action_description] = backend_id
@@ -619,22 +643,12 @@ class StreamRouter:
         # If exact match fails, use semantic similarity with embeddings
         if not backend_id and self.action_text_to_id:
             # Generate embedding for action_update text
-            update_embedding_list = await embedding_service.generate_embedding(action_text, normalize=True)
-            update_embedding = np.array(update_embedding_list)
+            update_embedding = await self._embed_text(action_text)
 
             # Find best matching action using cosine similarity
-            max_similarity = 0.0
-            best_match_text = None
-            best_match_id = None
-
-            for stored_text, stored_id in self.action_text_to_id.items():
-                stored_embedding = self.action_embeddings[stored_text]
-                similarity = float(np.dot(update_embedding, stored_embedding))
-
-                if similarity > max_similarity:
-                    max_similarity = similarity
-                    best_match_text = stored_text
-                    best_match_id = stored_id
+            max_similarity, best_match_text, best_match_id = self._best_match(
+                update_embedding, self.action_text_to_id, self.action_embeddings
+            )
 
             # Use a slightly lower threshold (0.70) for matching updates
             # Updates often have minor wording differences from the original action
@@ -687,22 +701,12 @@ class StreamRouter:
         # If exact match fails, use semantic similarity with embeddings
         if not backend_id and self.question_text_to_id:
             # Generate embedding for answer's question text
-            answer_embedding_list = await embedding_service.generate_embedding(question_text, normalize=True)
-            answer_embedding = np.array(answer_embedding_list)
+            answer_embedding = await self._embed_text(question_text)
 
             # Find best matching question using cosine similarity
-            max_similarity = 0.0
-            best_match_text = None
-            best_match_id = None
-
-            for stored_text, stored_id in self.question_text_to_id.items():
-                stored_embedding = self.question_embeddings[stored_text]
-                similarity = float(np.dot(answer_embedding, stored_embedding))
-
-                if similarity > max_similarity:
-                    max_similarity = similarity
-                    best_match_text = stored_text
-                    best_match_id = stored_id
+            max_similarity, best_match_text, best_match_id = self._best_match(
+                answer_embedding, self.question_text_to_id, self.question_embeddings
+            )
 
             # Use a slightly lower threshold (0.70) for matching answers
             # Answers often paraphrase the original question
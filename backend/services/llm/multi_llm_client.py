@@ -84,6 +84,50 @@ def estimate_llm_cost(provider: str, model: str, input_tokens: int, output_token
     return round(input_cost + output_cost, 4)
 
 
+async def _prime_stream(stream: AsyncGenerator[Dict[str, Any], None]) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Start a provider stream and wait for its first event.
+
+    Connection, overload and rate limit errors surface when the first event
+    is requested, so awaiting it here lets ProviderCascade retry and fall back
+    exactly as it does for create_message. The returned generator replays the
+    first event followed by the rest of the stream.
+    """
+    try:
+        first = await stream.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def replay():
+        if first is not None:
+            yield first
+        async for event in stream:
+            yield event
+
+    return replay()
+
+
+async def _stream_openai_compatible(
+    client: AsyncOpenAI,
+    api_params: Dict[str, Any]
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Stream text deltas and final usage from an OpenAI-compatible chat completion."""
+    stream = await client.chat.completions.create(
+        **api_params,
+        stream=True,
+        stream_options={"include_usage": True}
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield {"type": "text", "text": chunk.choices[0].delta.content}
+        if getattr(chunk, "usage", None):
+            yield {
+                "type": "usage",
+                "input_tokens": chunk.usage.prompt_tokens,
+                "output_tokens": chunk.usage.completion_tokens
+            }
+
+
 class BaseProviderClient(ABC):
     """Base class for LLM provider clients."""
 
@@ -133,6 +177,25 @@ class BaseProviderClient(ABC):
         """Create a message with streaming response."""
         pass
 
+    @abstractmethod
+    async def create_text_stream(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system: Optional[str] = None,
+        **kwargs
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream a plain-text answer as it is generated.
+
+        Yields {"type": "text", "text": ...} deltas followed by one
+        {"type": "usage", "input_tokens": ..., "output_tokens": ...} event.
+        """
+        pass
+
 
 class ClaudeProviderClient(BaseProviderClient):
     """Claude (Anthropic) provider client."""
@@ -251,6 +314,45 @@ class ClaudeProviderClient(BaseProviderClient):
         raise NotImplementedError("Streaming not yet implemented for Claude provider")
         yield  # Make this an async generator
 
+    async def create_text_stream(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system: Optional[str] = None,
+        **kwargs
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream a text answer using the Claude Messages streaming API."""
+        if not self.client:
+            raise ValueError("Claude client not initialized")
+
+        api_params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system:
+            api_params["system"] = system
+
+        claude_incompatible_params = {
+            "response_format", "stream", "n", "logprobs", "top_logprobs", "system_prompt"
+        }
+        api_params.update({k: v for k, v in kwargs.items() if k not in claude_incompatible_params})
+
+        async with self.client.messages.stream(**api_params) as stream:
+            async for text in stream.text_stream:
+                yield {"type": "text", "text": text}
+            final_message = await stream.get_final_message()
+
+        yield {
+            "type": "usage",
+            "input_tokens": final_message.usage.input_tokens,
+            "output_tokens": final_message.usage.output_tokens
+        }
+
 
 class OpenAIProviderClient(BaseProviderClient):
     """OpenAI provider client."""
@@ -451,6 +553,41 @@ class OpenAIProviderClient(BaseProviderClient):
         ):
             yield obj
 
+    async def create_text_stream(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system: Optional[str] = None,
+        **kwargs
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream a text answer using OpenAI chat completions."""
+        if not self.client:
+            raise ValueError("OpenAI client not initialized")
+
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        api_params = {
+            "model": model,
+            "messages": messages,
+            **kwargs
+        }
+
+        if model.startswith(("gpt-5", "o1")):
+            # GPT-5/o1 models use max_completion_tokens and only support temperature=1
+            api_params["max_completion_tokens"] = max_tokens
+        else:
+            api_params["max_tokens"] = max_tokens
+            api_params["temperature"] = temperature
+
+        async for event in _stream_openai_compatible(self.client, api_params):
+            yield event
+
 
 class DeepSeekProviderClient(BaseProviderClient):
     """DeepSeek provider client (OpenAI-compatible API)."""
@@ -606,6 +743,36 @@ class DeepSeekProviderClient(BaseProviderClient):
         raise NotImplementedError("Streaming not yet implemented for DeepSeek provider")
         yield  # Make this an async generator
 
+    async def create_text_stream(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system: Optional[str] = None,
+        **kwargs
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream a text answer using the OpenAI-compatible DeepSeek API."""
+        if not self.client:
+            raise ValueError("DeepSeek client not initialized")
+
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        api_params = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            **kwargs
+        }
+
+        async for event in _stream_openai_compatible(self.client, api_params):
+            yield event
+
 
 class ProviderCascade:
     """
@@ -714,7 +881,7 @@ class ProviderCascade:
         Execute fallback to secondary provider.
 
         Args:
-            operation: Operation type ("create_message" or "create_conversation")
+            operation: Operation type ("create_message", "create_conversation" or "create_text_stream")
             primary_model: Primary model that failed
             fallback_reason: Reason for fallback (e.g., "overloaded", "rate_limit")
             metadata: Metadata dictionary to update
@@ -772,6 +939,8 @@ class ProviderCascade:
                     response = await self.fallback_client.create_message(**kwargs)
                 elif operation == "create_conversation":
                     response = await self.fallback_client.create_conversation(**kwargs)
+                elif operation == "create_text_stream":
+                    response = await _prime_stream(self.fallback_client.create_text_stream(**kwargs))
                 else:
                     raise ValueError(f"Unknown operation: {operation}")
 
@@ -818,7 +987,8 @@ class ProviderCascade:
         4. Track all attempts and metadata
 
         Args:
-            operation: Operation type ("create_message" or "create_conversation")
+            operation: Operation type ("create_message", "create_conversation" or
+                "create_text_stream"; streams fall back only before their first event)
             primary_model: Primary model to use
             **kwargs: Arguments to pass to the provider method
 
@@ -877,6 +1047,8 @@ class ProviderCascade:
                         response = await self.primary_client.create_message(**kwargs)
                     elif operation == "create_conversation":
                         response = await self.primary_client.create_conversation(**kwargs)
+                    elif operation == "create_text_stream":
+                        response = await _prime_stream(self.primary_client.create_text_stream(**kwargs))
                     else:
                         raise ValueError(f"Unknown operation: {operation}")
 
@@ -1513,6 +1685,130 @@ class MultiProviderLLMClient:
         ):
             yield obj
 
+    async def create_text_stream(
+        self,
+        prompt: str,
+        *,
+        session: Optional[AsyncSession] = None,
+        organization_id: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system: Optional[str] = None,
+        **kwargs
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream a plain-text answer using the active provider with automatic fallback.
+
+        The stream goes through ProviderCascade like create_message: overload
+        and rate limit errors raised before the first event retry the primary
+        provider or switch to the fallback provider. Once text has been
+        emitted the provider is fixed, so later errors propagate to the caller.
+
+        Args:
+            prompt: User prompt
+            session: Database session (optional)
+            organization_id: Organization ID for provider selection
+            model: Model name (optional, uses config if not provided)
+            max_tokens: Maximum tokens (optional, uses config if not provided)
+            temperature: Temperature setting (optional, uses config if not provided)
+            system: System prompt (optional)
+
+        Yields:
+            {"type": "text", "text": ...} deltas, then one
+            {"type": "usage", "input_tokens": ..., "output_tokens": ..., "provider": ..., "model": ...}
+        """
+        if session:
+            provider_client, ai_config = await self.get_active_provider(session, organization_id)
+        else:
+            # Use fallback provider when no session is available
+            provider_client = self.fallback_provider
+            ai_config = None
+
+        if not provider_client:
+            logger.warning("No LLM provider available for streaming")
+            raise ValueError("No LLM provider available")
+
+        if ai_config:
+            model = model or ai_config.get("model", self.fallback_model)
+            max_tokens = max_tokens or ai_config.get("max_tokens", self.fallback_max_tokens)
+            temperature = temperature or ai_config.get("temperature", self.fallback_temperature)
+        else:
+            model = model or self.fallback_model
+            max_tokens = max_tokens or self.fallback_max_tokens
+            temperature = temperature or self.fallback_temperature
+
+        if isinstance(provider_client, ClaudeProviderClient):
+            provider_name = "Claude"
+        elif isinstance(provider_client, OpenAIProviderClient):
+            provider_name = "OpenAI"
+        elif isinstance(provider_client, DeepSeekProviderClient):
+            provider_name = "DeepSeek"
+        else:
+            provider_name = "Unknown"
+
+        cascade = ProviderCascade(
+            primary_client=provider_client,
+            primary_provider_name=provider_name,
+            fallback_client=self.secondary_provider_client,
+            fallback_provider_name=self.secondary_provider_name or "None",
+            settings=self.settings
+        )
+
+        start_time = time.time()
+        stream, metadata = await cascade.execute_with_fallback(
+            operation="create_text_stream",
+            primary_model=model,
+            prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs
+        )
+
+        if metadata.get("fallback_triggered"):
+            logger.warning(
+                f"⚠️  Fallback used for stream: {metadata.get('primary_model')} → {metadata.get('fallback_model')} "
+                f"(reason: {metadata.get('fallback_reason')})"
+            )
+
+        actual_provider = metadata.get("provider_used", provider_name)
+        actual_model = metadata.get("fallback_model", model)
+        usage = {"input_tokens": 0, "output_tokens": 0}
+
+        async for event in stream:
+            if event.get("type") == "usage":
+                usage = {"input_tokens": event["input_tokens"], "output_tokens": event["output_tokens"]}
+                continue
+            yield event
+
+        yield {"type": "usage", **usage, "provider": actual_provider, "model": actual_model}
+
+        try:
+            metrics.record_llm_request(
+                provider=actual_provider.lower(),
+                model=actual_model,
+                duration=time.time() - start_time,
+                prompt_tokens=usage["input_tokens"],
+                completion_tokens=usage["output_tokens"],
+                success=True
+            )
+            if usage["input_tokens"] > 0:
+                business_metrics.record_llm_cost(
+                    provider=actual_provider.lower(),
+                    cost_cents=estimate_llm_cost(
+                        provider=actual_provider.lower(),
+                        model=actual_model,
+                        input_tokens=usage["input_tokens"],
+                        output_tokens=usage["output_tokens"]
+                    ),
+                    operation_type="query",
+                    user_id=kwargs.get("user_id")
+                )
+        except Exception as e:
+            logger.warning(f"Failed to record LLM metrics: {e}")
+
     # Note: _update_usage_stats removed (AIConfiguration table dropped)
 
     async def test_configuration(
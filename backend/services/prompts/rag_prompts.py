@@ -2,6 +2,9 @@
 Prompts for RAG (Retrieval-Augmented Generation) operations.
 """
 
+# Bump whenever a RAG prompt template changes; cached answers from older prompts are then ignored
+RAG_PROMPT_VERSION = "1"
+
 
 def get_basic_rag_prompt(question: str, context: str, strategy: str = "basic") -> str:
     """
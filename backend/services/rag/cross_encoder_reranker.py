@@ -0,0 +1,143 @@
+"""
+Cross-Encoder Reranking off the Event Loop
+
+Scores (query, passage) pairs with a cross-encoder without blocking asyncio:
+
+- Inference runs on one dedicated thread through EmbeddingBatchScheduler, so
+  pairs from concurrent queries share predict() calls and at most one rerank
+  batch runs at a time
+- An in-process LRU keyed by (query hash, chunk id) skips pairs that were
+  already scored, e.g. repeated questions or follow-ups over the same chunks
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from services.rag.embedding_batcher import EmbeddingBatchScheduler
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Passage characters sent to the cross-encoder
+MAX_PASSAGE_CHARS = 512
+
+
+class CrossEncoderReranker:
+    """Batched, cached cross-encoder scoring."""
+
+    def __init__(
+        self,
+        predict_fn: Callable[[List[List[str]]], Sequence[float]],
+        cache_size: int = 10000,
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 128
+    ):
+        """
+        Initialize the reranker.
+
+        Args:
+            predict_fn: Blocking function scoring a list of [query, passage] pairs
+            cache_size: Maximum cached pair scores (0 disables the cache)
+            max_wait_ms: Maximum time the first request waits for others to batch with
+            max_batch_size: Maximum pairs per predict call
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._scheduler = EmbeddingBatchScheduler(
+            encode_fn=lambda pairs, _normalize: predict_fn(pairs),
+            max_wait_ms=max_wait_ms,
+            max_batch_size=max_batch_size,
+            name="rerank"
+        )
+
+    @staticmethod
+    def query_hash(query: str) -> str:
+        """Stable hash of a query for cache keys."""
+        return hashlib.sha256(query.encode("utf-8")).hexdigest()[:32]
+
+    async def score(self, query: str, passages: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """
+        Score passages against a query.
+
+        Args:
+            query: Query text
+            passages: (chunk_id, text) pairs
+
+        Returns:
+            float32 array of cross-encoder scores aligned with passages
+        """
+        scores = np.zeros(len(passages), dtype=np.float32)
+        if not passages:
+            return scores
+
+        query_key = self.query_hash(query)
+        missing: List[int] = []
+        with self._lock:
+            for i, (chunk_id, _) in enumerate(passages):
+                key = (query_key, chunk_id)
+                cached = self._cache.get(key)
+                if cached is None:
+                    missing.append(i)
+                else:
+                    self._cache.move_to_end(key)
+                    scores[i] = cached
+            self._hits += len(passages) - len(missing)
+            self._misses += len(missing)
+
+        self._record_cache(len(passages) - len(missing), len(missing))
+
+        if missing:
+            pairs = [[query, passages[i][1][:MAX_PASSAGE_CHARS]] for i in missing]
+            predicted = await self._scheduler.submit(pairs)
+            scores[missing] = predicted
+            self._store(query_key, [(passages[i][0], float(scores[i])) for i in missing])
+
+        return scores
+
+    def _store(self, query_key: str, scored: List[Tuple[str, float]]) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            for chunk_id, value in scored:
+                self._cache[(query_key, chunk_id)] = value
+                self._cache.move_to_end((query_key, chunk_id))
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _record_cache(hits: int, misses: int) -> None:
+        try:
+            from observability.metrics import get_metrics
+            get_metrics().record_rerank_cache(hits=hits, misses=misses)
+        except Exception as e:
+            logger.debug(f"Failed to export rerank cache metrics: {e}")
+
+    def clear_cache(self) -> None:
+        """Drop all cached pair scores."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache and batching statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            cache_stats = {
+                'size': len(self._cache),
+                'max_size': self.cache_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+        return {'cache': cache_stats, 'batching': self._scheduler.get_stats()}
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the inference thread."""
+        self._scheduler.shutdown(timeout=timeout)
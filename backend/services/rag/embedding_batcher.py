@@ -0,0 +1,294 @@
+"""Cross-request micro-batching for embedding inference.
+
+Concurrent embedding calls (live-insight dedup, RAG queries, multi-query
+variations) are collected into shared batches and encoded on a single
+dedicated inference thread, so each model.encode call amortizes its fixed
+cost across every caller that arrived within the batching window.
+
+The scheduler only slices results by input position, so it also batches
+other per-item inference (cross-encoder reranking feeds it query/passage pairs).
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _EmbeddingRequest:
+    """A single caller's texts waiting to be encoded."""
+    texts: List[str]
+    normalize: bool
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class EmbeddingBatchScheduler:
+    """
+    Collects embedding requests and encodes them in shared batches.
+
+    Requests are queued from any event loop. A dedicated daemon thread takes
+    the first pending request, keeps draining the queue until either
+    ``max_wait_ms`` has elapsed or ``max_batch_size`` texts are collected,
+    then runs one encode call per ``normalize`` group and resolves every
+    caller's future with its own slice of the result.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str], bool], np.ndarray],
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 64,
+        stats_window: int = 1000,
+        name: str = "embedding"
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            encode_fn: Blocking function encoding a list of texts into a 2-D array
+            max_wait_ms: Maximum time to hold the first request while collecting a batch
+            max_batch_size: Maximum number of texts encoded in a single batch
+            stats_window: Number of recent batches kept for percentile stats
+            name: Scheduler name for the inference thread, logs and metrics
+        """
+        self._encode_fn = encode_fn
+        self.name = name
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._queue: "queue.Queue[Optional[_EmbeddingRequest]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._carry_over: Optional[_EmbeddingRequest] = None
+
+        # Rolling statistics (guarded by _stats_lock)
+        self._stats_lock = threading.Lock()
+        self._batch_sizes: Deque[int] = deque(maxlen=stats_window)
+        self._wait_times_ms: Deque[float] = deque(maxlen=stats_window)
+        self._encode_times_ms: Deque[float] = deque(maxlen=stats_window)
+        self._total_batches = 0
+        self._total_requests = 0
+        self._total_texts = 0
+        self._total_errors = 0
+
+    async def submit(self, texts: List[str], normalize: bool = True) -> np.ndarray:
+        """
+        Queue texts for encoding and wait for their embeddings.
+
+        Args:
+            texts: Non-empty texts to encode
+            normalize: Whether to L2-normalize the embeddings
+
+        Returns:
+            2-D float32 array with one row per input text
+        """
+        self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put(_EmbeddingRequest(
+            texts=list(texts),
+            normalize=normalize,
+            loop=loop,
+            future=future
+        ))
+        return await future
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for the inference thread."""
+        return self._queue.qsize() + (1 if self._carry_over is not None else 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics for tuning throughput against latency.
+
+        Returns:
+            Dictionary with queue depth, batch size and wait time statistics
+        """
+        with self._stats_lock:
+            batch_sizes = np.array(self._batch_sizes, dtype=np.float64)
+            wait_times = np.array(self._wait_times_ms, dtype=np.float64)
+            encode_times = np.array(self._encode_times_ms, dtype=np.float64)
+            totals = {
+                'total_batches': self._total_batches,
+                'total_requests': self._total_requests,
+                'total_texts': self._total_texts,
+                'total_errors': self._total_errors,
+            }
+
+        def _percentiles(values: np.ndarray) -> Dict[str, float]:
+            if values.size == 0:
+                return {'avg': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            return {
+                'avg': round(float(values.mean()), 3),
+                'p50': round(float(p50), 3),
+                'p95': round(float(p95), 3),
+                'p99': round(float(p99), 3),
+                'max': round(float(values.max()), 3),
+            }
+
+        return {
+            'max_wait_ms': self.max_wait_ms,
+            'max_batch_size': self.max_batch_size,
+            'queue_depth': self.queue_depth,
+            'worker_alive': self._thread is not None and self._thread.is_alive(),
+            **totals,
+            'batch_size': _percentiles(batch_sizes),
+            'wait_time_ms': _percentiles(wait_times),
+            'encode_time_ms': _percentiles(encode_times),
+        }
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the inference thread after it drains pending requests."""
+        with self._thread_lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(None)
+            thread.join(timeout=timeout)
+            self._thread = None
+
+    def _ensure_worker(self) -> None:
+        """Start the inference thread on first use."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.name}-inference",
+                    daemon=True
+                )
+                self._thread.start()
+                logger.info(
+                    f"{self.name.capitalize()} batch scheduler started "
+                    f"(max_wait_ms={self.max_wait_ms}, max_batch_size={self.max_batch_size})"
+                )
+
+    def _run(self) -> None:
+        """Inference thread main loop."""
+        while True:
+            first = self._carry_over or self._queue.get()
+            self._carry_over = None
+            if first is None:
+                return
+
+            batch = [first]
+            text_count = len(first.texts)
+            deadline = first.enqueued_at + self.max_wait_ms / 1000.0
+            stop = False
+
+            while text_count < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                if text_count + len(request.texts) > self.max_batch_size:
+                    # Keep the request whole; it starts the next batch
+                    self._carry_over = request
+                    break
+                batch.append(request)
+                text_count += len(request.texts)
+
+            self._process_batch(batch, text_count)
+
+            if stop:
+                return
+
+    def _process_batch(self, batch: List[_EmbeddingRequest], text_count: int) -> None:
+        """Encode a collected batch and resolve every caller's future."""
+        started = time.perf_counter()
+        wait_times = [(started - request.enqueued_at) * 1000 for request in batch]
+
+        groups: Dict[bool, List[_EmbeddingRequest]] = {}
+        for request in batch:
+            groups.setdefault(request.normalize, []).append(request)
+
+        errors = 0
+        for normalize, requests in groups.items():
+            texts = [text for request in requests for text in request.texts]
+            try:
+                embeddings = np.asarray(self._encode_fn(texts, normalize), dtype=np.float32)
+            except Exception as e:
+                errors += 1
+                logger.error(f"{self.name.capitalize()} batch of {len(texts)} inputs failed: {e}")
+                for request in requests:
+                    self._resolve(request, error=e)
+                continue
+
+            offset = 0
+            for request in requests:
+                count = len(request.texts)
+                self._resolve(request, result=embeddings[offset:offset + count])
+                offset += count
+
+        encode_ms = (time.perf_counter() - started) * 1000
+        self._record(len(batch), text_count, wait_times, encode_ms, errors)
+
+    @staticmethod
+    def _resolve(
+        request: _EmbeddingRequest,
+        result: Optional[np.ndarray] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Hand a result back to the caller's event loop."""
+        def _set() -> None:
+            if request.future.done():
+                return
+            if error is not None:
+                request.future.set_exception(error)
+            else:
+                request.future.set_result(result)
+
+        try:
+            request.loop.call_soon_threadsafe(_set)
+        except RuntimeError:
+            # Caller's event loop already closed; nothing left to notify
+            pass
+
+    def _record(
+        self,
+        request_count: int,
+        text_count: int,
+        wait_times: List[float],
+        encode_ms: float,
+        errors: int
+    ) -> None:
+        """Update rolling statistics and export them to OpenTelemetry."""
+        with self._stats_lock:
+            self._batch_sizes.append(text_count)
+            self._wait_times_ms.extend(wait_times)
+            self._encode_times_ms.append(encode_ms)
+            self._total_batches += 1
+            self._total_requests += request_count
+            self._total_texts += text_count
+            self._total_errors += errors
+
+        try:
+            from observability.metrics import get_metrics
+            get_metrics().record_embedding_batch(
+                batch_size=text_count,
+                request_count=request_count,
+                wait_times_ms=wait_times,
+                queue_depth=self.queue_depth,
+                scheduler=self.name
+            )
+        except Exception as e:
+            logger.debug(f"Failed to export embedding batch metrics: {e}")
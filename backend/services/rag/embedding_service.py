@@ -44,11 +44,18 @@ from sentence_transformers import SentenceTransformer
 import torch
 
 from config import get_settings
+from services.cache.embedding_cache import embedding_cache
+from services.rag.embedding_batcher import EmbeddingBatchScheduler
+from services.rag.model_registry import model_registry
 from utils.logger import get_logger
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Inference backends selectable via EMBEDDING_BACKEND
+SUPPORTED_BACKENDS = ("torch", "onnx", "onnx-int8")
+ONNX_BACKENDS = ("onnx", "onnx-int8")
+
 
 class EmbeddingService:
     """Service for generating embeddings from text using SentenceTransformers."""
@@ -82,17 +89,39 @@ class EmbeddingService:
             self.enable_multilingual = settings.enable_multilingual
             self.supported_languages = settings.supported_languages_list
 
-            # Cache for different dimension embeddings
-            self._embedding_cache = {}
+            # Inference backend (torch, onnx, onnx-int8)
+            self.backend = settings.embedding_backend.lower()
+            if self.backend not in SUPPORTED_BACKENDS:
+                logger.warning(f"Unknown embedding backend '{self.backend}', using torch")
+                self.backend = "torch"
+            self.active_backend: Optional[str] = None
+            self.onnx_dir = (
+                Path(settings.embedding_onnx_dir) if settings.embedding_onnx_dir
+                else self.cache_dir / "embeddinggemma-300m-onnx"
+            )
+
+            # Content-addressed embedding cache (memory LRU + optional Redis)
+            self._cache = embedding_cache
+
+            # Cross-request micro-batching on a dedicated inference thread
+            self.enable_batching = settings.enable_embedding_batching
+            self._batcher = EmbeddingBatchScheduler(
+                encode_fn=self._encode_sync,
+                max_wait_ms=settings.embedding_batch_max_wait_ms,
+                max_batch_size=settings.embedding_batch_max_size
+            )
 
             logger.info(f"Embedding service initialized with model: {self.model_name}")
             logger.info(f"MRL enabled: {self.enable_mrl}, dimensions: {self.mrl_dimensions}")
             logger.info(f"Multilingual enabled: {self.enable_multilingual}")
+            logger.info(f"Inference backend: {self.backend}")
 
     async def get_model(self) -> SentenceTransformer:
         """
         Get or download the embedding model.
-        Uses async lock to prevent multiple downloads.
+        Uses async lock to prevent multiple downloads. The instance is
+        registered in the process-wide model registry, so other services
+        using the same model ID share it instead of loading a copy.
         
         Returns:
             SentenceTransformer model instance
@@ -101,11 +130,12 @@ class EmbeddingService:
             if self._model is None:
                 logger.info(f"Loading embedding model: {self.model_name}")
                 
-                # Run model loading in executor to avoid blocking
+                # Load in an executor to avoid blocking
                 loop = asyncio.get_event_loop()
-                self._model = await loop.run_in_executor(
-                    None,
-                    self._load_model
+                self._model = await model_registry.acquire_async(
+                    model_registry.sentence_transformer_key(self.model_name),
+                    self._load_model,
+                    kind="sentence-transformer"
                 )
                 
                 # Verify model dimensions
@@ -131,7 +161,103 @@ class EmbeddingService:
     
     def _load_model(self) -> SentenceTransformer:
         """
-        Load the model synchronously.
+        Load the model synchronously using the configured inference backend.
+
+        Backends (EMBEDDING_BACKEND):
+        - torch: PyTorch fp32 (reference)
+        - onnx: ONNX Runtime fp32
+        - onnx-int8: ONNX Runtime with dynamic int8 quantization
+
+        ONNX backends require an export produced by scripts/export_embedding_onnx.py
+        and fall back to PyTorch if it is missing or cannot be loaded.
+
+        Returns:
+            Loaded SentenceTransformer model
+        """
+        if self.backend in ONNX_BACKENDS:
+            model = self._load_onnx_model(self.backend)
+            if model is not None:
+                self.active_backend = self.backend
+                model.max_seq_length = self.max_sequence_length
+                return model
+            logger.warning(f"Falling back to PyTorch backend (requested: {self.backend})")
+
+        model = self._load_torch_model()
+        self.active_backend = "torch"
+        return model
+
+    @property
+    def cache_backend_id(self) -> str:
+        """
+        Backend identifier for embedding cache keys.
+
+        The active backend once the model is loaded (a failed ONNX load falls
+        back to torch), the requested one before that; int8 includes the
+        quantization config.
+        """
+        backend = self.active_backend or self.backend
+        if backend == "onnx-int8":
+            return f"{backend}-{settings.embedding_onnx_quantization}"
+        return backend
+
+    def get_onnx_model_file(self, backend: str) -> str:
+        """
+        Get the ONNX file name (relative to the export directory) for a backend.
+
+        Args:
+            backend: "onnx" or "onnx-int8"
+
+        Returns:
+            Relative path of the ONNX model file
+        """
+        if backend == "onnx-int8":
+            return f"onnx/model_qint8_{settings.embedding_onnx_quantization}.onnx"
+        return "onnx/model.onnx"
+
+    def _load_onnx_model(self, backend: str) -> Optional[SentenceTransformer]:
+        """
+        Load an exported ONNX model with ONNX Runtime (CPU).
+
+        Args:
+            backend: "onnx" or "onnx-int8"
+
+        Returns:
+            Loaded SentenceTransformer model, or None if unavailable
+        """
+        file_name = self.get_onnx_model_file(backend)
+        model_file = self.onnx_dir / file_name
+
+        if not model_file.exists():
+            logger.error(
+                f"❌ ONNX model not found at {model_file}. "
+                f"Run: python scripts/export_embedding_onnx.py --backend {backend}"
+            )
+            return None
+
+        try:
+            model = SentenceTransformer(
+                str(self.onnx_dir),
+                device='cpu',
+                backend='onnx',
+                local_files_only=True,
+                model_kwargs={
+                    "file_name": file_name,
+                    "provider": "CPUExecutionProvider",
+                }
+            )
+            logger.info(f"✅ Loaded EmbeddingGemma with ONNX Runtime backend: {file_name}")
+            return model
+
+        except ImportError as e:
+            logger.error(f"❌ ONNX backend requires optimum[onnxruntime]: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Failed to load ONNX model from {model_file}: {e}")
+            return None
+
+    def _load_torch_model(self) -> SentenceTransformer:
+        """
+        Load the PyTorch (fp32) model synchronously.
 
         Returns:
             Loaded SentenceTransformer model
@@ -251,10 +377,188 @@ class EmbeddingService:
 
         return model
 
+    def _encode_sync(self, texts: List[str], normalize: bool) -> np.ndarray:
+        """
+        Encode texts with the loaded model (runs on the inference thread).
+
+        Args:
+            texts: Texts to encode
+            normalize: Whether to normalize the embedding vectors
+
+        Returns:
+            2-D array of embeddings, one row per text
+        """
+        return self._model.encode(
+            texts,
+            batch_size=max(len(texts), 1),
+            show_progress_bar=False,
+            normalize_embeddings=normalize
+        )
+
+    async def _encode_texts(
+        self,
+        texts: List[str],
+        normalize: bool = True,
+        batch_size: int = 32,
+        show_progress: bool = False
+    ) -> np.ndarray:
+        """
+        Run model inference for texts, bypassing the embedding cache.
+
+        Args:
+            texts: Non-empty texts to encode
+            normalize: Whether to normalize embedding vectors
+            batch_size: Number of texts to process at once
+            show_progress: Whether to show progress bar
+
+        Returns:
+            2-D float32 array with one row per text
+        """
+        model = await self.get_model()
+
+        if self.enable_batching:
+            # Submit slices concurrently so they coalesce with other callers' requests
+            slices = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+            results = await asyncio.gather(
+                *(self._batcher.submit(batch, normalize) for batch in slices)
+            )
+            return np.concatenate(results).astype(np.float32, copy=False)
+
+        # Process in batches for memory efficiency
+        all_embeddings = []
+        loop = asyncio.get_event_loop()
+
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
+
+            # Generate embeddings for batch
+            batch_embeddings = await loop.run_in_executor(
+                None,
+                lambda b: model.encode(
+                    b,
+                    batch_size=batch_size,
+                    show_progress_bar=show_progress,
+                    normalize_embeddings=normalize
+                ),
+                batch
+            )
+            all_embeddings.append(np.asarray(batch_embeddings, dtype=np.float32))
+
+            if show_progress and i > 0:
+                logger.info(
+                    f"Processed {min(i + batch_size, len(texts))}/{len(texts)} texts"
+                )
+
+        return np.concatenate(all_embeddings)
+
+    async def _embed_texts(
+        self,
+        texts: List[str],
+        normalize: bool = True,
+        batch_size: int = 32,
+        show_progress: bool = False,
+        use_cache: bool = True
+    ) -> np.ndarray:
+        """
+        Embed texts, serving repeats from the embedding cache.
+
+        Only cache misses reach the model; duplicate texts within the call
+        are encoded once.
+
+        Args:
+            texts: Non-empty texts to encode
+            normalize: Whether to normalize embedding vectors
+            batch_size: Number of texts to process at once
+            show_progress: Whether to show progress bar
+            use_cache: Set False to bypass the cache for this call
+
+        Returns:
+            2-D float32 array with one row per text
+        """
+        if not use_cache or not self._cache.enabled:
+            return await self._encode_texts(texts, normalize, batch_size, show_progress)
+
+        backend = self.cache_backend_id
+        cached = await self._cache.get_many(texts, self.model_name, normalize, backend)
+
+        # Unique missing texts, each mapped to the positions that need it
+        pending: Dict[str, List[int]] = {}
+        for i, (text, vector) in enumerate(zip(texts, cached)):
+            if vector is None:
+                pending.setdefault(text, []).append(i)
+
+        if not pending:
+            return np.stack(cached)
+
+        missing_texts = list(pending.keys())
+        encoded = await self._encode_texts(missing_texts, normalize, batch_size, show_progress)
+        await self._cache.put_many(missing_texts, encoded, self.model_name, normalize, self.cache_backend_id)
+
+        if self.cache_backend_id != backend:
+            # The model loaded on another backend than requested (fallback); look up
+            # again so cached vectors from the requested backend are not mixed in
+            return await self._embed_texts(texts, normalize, batch_size, show_progress, use_cache)
+
+        for text, vector in zip(missing_texts, encoded):
+            for i in pending[text]:
+                cached[i] = vector
+
+        return np.stack(cached).astype(np.float32, copy=False)
+
+    async def encode_array(
+        self,
+        texts: List[str],
+        normalize: bool = True,
+        batch_size: int = 32,
+        show_progress: bool = False,
+        use_cache: bool = True,
+        dimension: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Generate embeddings as a float32 array (array-native API).
+
+        Internal callers should prefer this over generate_embedding(s) and only
+        convert to lists at the JSON/Qdrant boundary.
+
+        Args:
+            texts: Input texts; every text must be non-empty
+            normalize: Whether to normalize embedding vectors
+            batch_size: Number of texts to process at once
+            show_progress: Whether to show progress bar
+            use_cache: Set False to bypass the embedding cache
+            dimension: Optional MRL dimension to truncate to (e.g. 128, 256)
+
+        Returns:
+            Array of shape (len(texts), dimension or embedding_dimension)
+        """
+        if not texts:
+            return np.empty((0, dimension or self.embedding_dimension), dtype=np.float32)
+
+        max_chars = self.max_sequence_length * 4  # Rough token estimation (4 chars per token)
+        prepared = []
+        for text in texts:
+            if not text or not text.strip():
+                raise ValueError("Empty text cannot be embedded")
+            prepared.append(text[:max_chars] if len(text) > max_chars else text)
+
+        embeddings = await self._embed_texts(
+            prepared,
+            normalize=normalize,
+            batch_size=batch_size,
+            show_progress=show_progress,
+            use_cache=use_cache
+        )
+
+        if dimension is not None and dimension < embeddings.shape[1]:
+            embeddings = embeddings[:, :dimension]
+
+        return embeddings
+
     async def generate_embedding(
         self,
         text: str,
-        normalize: bool = True
+        normalize: bool = True,
+        use_cache: bool = True
     ) -> List[float]:
         """
         Generate embedding for a single text.
@@ -262,6 +566,7 @@ class EmbeddingService:
         Args:
             text: Input text to embed
             normalize: Whether to normalize the embedding vector
+            use_cache: Set False to bypass the embedding cache
 
         Returns:
             Embedding vector as list of floats
@@ -275,18 +580,10 @@ class EmbeddingService:
                 logger.warning(f"Text too long ({len(text)} chars), truncating for embedding")
                 text = text[:self.max_sequence_length * 4]
 
-            model = await self.get_model()
-
-            # Generate embedding in executor
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None,
-                lambda t: model.encode(t, normalize_embeddings=normalize),
-                text
-            )
+            embeddings = await self._embed_texts([text], normalize, use_cache=use_cache)
 
             # Convert to list for JSON serialization
-            return embedding.tolist()
+            return embeddings[0].tolist()
 
         except Exception as e:
             logger.error(f"Failed to generate embedding for text (length: {len(text) if text else 0}): {e}")
@@ -364,7 +661,8 @@ class EmbeddingService:
         texts: List[str],
         batch_size: int = 32,
         normalize: bool = True,
-        show_progress: bool = False
+        show_progress: bool = False,
+        use_cache: bool = True
     ) -> List[List[float]]:
         """
         Generate embeddings for multiple texts in batches.
@@ -374,6 +672,7 @@ class EmbeddingService:
             batch_size: Number of texts to process at once
             normalize: Whether to normalize embedding vectors
             show_progress: Whether to show progress bar
+            use_cache: Set False to bypass the embedding cache
             
         Returns:
             List of embedding vectors
@@ -392,37 +691,16 @@ class EmbeddingService:
                     f"Filtered out {len(texts) - len(valid_texts)} empty texts"
                 )
             
-            model = await self.get_model()
-            
-            # Process in batches for memory efficiency
-            all_embeddings = []
-            
-            for i in range(0, len(valid_texts), batch_size):
-                batch = valid_texts[i:i + batch_size]
-                
-                # Generate embeddings for batch
-                loop = asyncio.get_event_loop()
-                batch_embeddings = await loop.run_in_executor(
-                    None,
-                    lambda b: model.encode(
-                        b, 
-                        batch_size=batch_size,
-                        show_progress_bar=show_progress,
-                        normalize_embeddings=normalize
-                    ),
-                    batch
-                )
-                
-                # Convert to list and extend results
-                all_embeddings.extend(batch_embeddings.tolist())
-                
-                if show_progress and i > 0:
-                    logger.info(
-                        f"Processed {min(i + batch_size, len(valid_texts))}/{len(valid_texts)} texts"
-                    )
-            
-            logger.info(f"Generated {len(all_embeddings)} embeddings")
-            return all_embeddings
+            embeddings = await self._embed_texts(
+                valid_texts,
+                normalize=normalize,
+                batch_size=batch_size,
+                show_progress=show_progress,
+                use_cache=use_cache
+            )
+
+            logger.info(f"Generated {len(embeddings)} embeddings")
+            return embeddings.tolist()
             
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {e}")
@@ -526,25 +804,30 @@ class EmbeddingService:
             if not query_text or not candidate_texts:
                 return []
             
-            # Generate embeddings for all texts
-            all_texts = [query_text] + candidate_texts
-            embeddings = await self.generate_embeddings_batch(all_texts)
-            
-            query_embedding = embeddings[0]
-            candidate_embeddings = embeddings[1:]
-            
-            # Calculate similarities
-            results = []
-            for i, (text, embedding) in enumerate(zip(candidate_texts, candidate_embeddings)):
-                similarity = self.calculate_similarity(query_embedding, embedding)
-                
-                if similarity >= min_similarity:
-                    results.append({
-                        'text': text,
-                        'index': i,
-                        'similarity': similarity
-                    })
-            
+            # Embed query and non-empty candidates in one call
+            candidate_indices = [i for i, t in enumerate(candidate_texts) if t and t.strip()]
+            if not candidate_indices:
+                return []
+
+            embeddings = await self.encode_array(
+                [query_text] + [candidate_texts[i] for i in candidate_indices]
+            )
+
+            # Cosine similarity of the query against every candidate at once
+            norms = np.linalg.norm(embeddings, axis=1)
+            norms[norms == 0] = 1.0
+            similarities = (embeddings[1:] @ embeddings[0]) / (norms[1:] * norms[0])
+
+            results = [
+                {
+                    'text': candidate_texts[i],
+                    'index': i,
+                    'similarity': float(similarity)
+                }
+                for i, similarity in zip(candidate_indices, similarities)
+                if similarity >= min_similarity
+            ]
+
             # Sort by similarity and return top k
             results.sort(key=lambda x: x['similarity'], reverse=True)
             return results[:top_k]
@@ -566,14 +849,28 @@ class EmbeddingService:
             'max_sequence_length': self.max_sequence_length,
             'model_loaded': self._model is not None,
             'cache_directory': str(self.cache_dir),
-            'device': 'cuda' if torch.cuda.is_available() else 'cpu',
+            'device': 'cpu' if self.active_backend in ONNX_BACKENDS else ('cuda' if torch.cuda.is_available() else 'cpu'),
+            'backend': self.backend,
+            'active_backend': self.active_backend,
             'mrl_enabled': self.enable_mrl,
             'mrl_dimensions': self.mrl_dimensions,
             'search_dimension': self.search_dimension,
             'rerank_dimension': self.rerank_dimension,
             'multilingual_enabled': self.enable_multilingual,
-            'supported_languages': self.supported_languages
+            'supported_languages': self.supported_languages,
+            'batching_enabled': self.enable_batching,
+            'batching': self.get_batching_stats(),
+            'cache': self._cache.get_stats()
         }
+
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """
+        Get micro-batching statistics (queue depth, batch sizes, wait times).
+
+        Returns:
+            Dictionary with scheduler statistics
+        """
+        return self._batcher.get_stats()
     
     async def warm_up(self) -> None:
         """
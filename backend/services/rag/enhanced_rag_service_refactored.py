@@ -2,7 +2,7 @@
 
 import asyncio
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, AsyncGenerator
 from datetime import datetime
 import uuid
 import json
@@ -23,6 +23,8 @@ from services.rag.hybrid_search import (
     hybrid_search_service, HybridSearchConfig, SearchPipeline
 )
 from services.intelligence.meeting_intelligence import MeetingIntelligenceReport
+from services.cache.answer_cache import answer_cache, AnswerCacheLookup
+from services.cache.project_scope_cache import project_scope_cache
 from services.llm.multi_llm_client import get_multi_llm_client
 from services.prompts.rag_prompts import (
     get_basic_rag_prompt,
@@ -58,11 +60,7 @@ class EnhancedRAGService:
         self.similarity_threshold = 0.05
         self.max_context_length = 8000
 
-        # Organization ID cache to avoid repeated DB lookups
-        self._org_cache = {}  # project_id -> organization_id mapping
-        self._cache_hits = 0
-        self._cache_misses = 0
-        
+
         # Strategy configurations
         self.strategy_configs = {
             RAGStrategy.BASIC: {
@@ -148,81 +146,140 @@ class EnhancedRAGService:
             logger.info(f"Auto-selected strategy: {strategy.value}")
 
         try:
-            # Execute strategy-specific retrieval and generation
-            config = self.strategy_configs[strategy]
+            # Repeated questions are answered from the cache until the project's content changes
+            cache_lookup = await self._lookup_cached_answer(
+                organization_id, project_id, question, strategy
+            )
 
-            if strategy == RAGStrategy.BASIC:
-                result = await self._execute_basic_rag(project_id, question, config)
-            elif strategy == RAGStrategy.MULTI_QUERY:
-                result = await self._execute_multi_query_rag(project_id, question, config)
-            elif strategy == RAGStrategy.HYBRID_SEARCH:
-                result = await self._execute_hybrid_search_rag(project_id, question, config)
-            elif strategy == RAGStrategy.INTELLIGENT:
-                result = await self._execute_intelligent_rag(project_id, question, config)
+            if cache_lookup is not None and cache_lookup.hit:
+                result = cache_lookup.result
+                result['cache_hit'] = cache_lookup.tier
+                logger.info(f"Answered from {cache_lookup.tier} answer cache for project {sanitize_for_log(project_id)}")
             else:
-                raise ValueError(f"Unknown strategy: {strategy}")
+                # Execute strategy-specific retrieval and generation
+                config = self.strategy_configs[strategy]
+
+                if strategy == RAGStrategy.BASIC:
+                    result = await self._execute_basic_rag(project_id, question, config)
+                elif strategy == RAGStrategy.MULTI_QUERY:
+                    result = await self._execute_multi_query_rag(project_id, question, config)
+                elif strategy == RAGStrategy.HYBRID_SEARCH:
+                    result = await self._execute_hybrid_search_rag(project_id, question, config)
+                elif strategy == RAGStrategy.INTELLIGENT:
+                    result = await self._execute_intelligent_rag(project_id, question, config)
+                else:
+                    raise ValueError(f"Unknown strategy: {strategy}")
+
+                # Only LLM-generated answers are cached (not placeholders or "nothing found")
+                if cache_lookup is not None and result.get('token_count', 0) > 0:
+                    await answer_cache.store(cache_lookup, result)
 
             # Calculate total response time
             total_time = int((time.time() - start_time) * 1000)
             result['response_time_ms'] = total_time
             result['strategy_used'] = strategy.value
 
-            # Record technical metrics
+            self._record_query_success(result, question, project_id, user_id, organization_id, start_time)
+
+            logger.info(f"Enhanced RAG query completed using {strategy.value} in {total_time}ms")
+            return result
+
+        except Exception as e:
+            # Record failure metrics
             metrics.record_rag_query(
                 duration=time.time() - start_time,
-                chunks_retrieved=len(result.get('sources', [])),
-                context_size=len(result.get('answer', '')),
-                success=True
+                chunks_retrieved=0,
+                context_size=0,
+                success=False,
+                error_type=type(e).__name__
             )
+            logger.error(f"Enhanced RAG query failed for project {sanitize_for_log(project_id)}: {e}")
+            raise
 
-            # Record business metrics
-            has_results = len(result.get('sources', [])) > 0
-            num_sources = len(result.get('sources', []))
+    async def stream_query_project(
+        self,
+        project_id: str,
+        question: str,
+        user_id: Optional[str] = None,
+        strategy: RAGStrategy = RAGStrategy.AUTO,
+        organization_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Execute enhanced RAG query, streaming the answer as the LLM produces it.
 
-            business_metrics.record_user_question(
-                user_id=user_id or "anonymous",
-                project_id=project_id,
-                has_results=has_results
+        Yields {"event": ..., "data": ...} dicts:
+        - "sources": sources and confidence, as soon as retrieval finishes
+        - "token": an answer text delta
+        - "done": the full query_project result plus time_to_first_token_ms
+
+        Cached answers are replayed as a single token event.
+        """
+        start_time = time.time()
+
+        if strategy == RAGStrategy.AUTO:
+            strategy = self._select_optimal_strategy(question)
+            logger.info(f"Auto-selected strategy: {strategy.value}")
+
+        try:
+            cache_lookup = await self._lookup_cached_answer(
+                organization_id, project_id, question, strategy
             )
 
-            # Record organization-level metrics if organization_id is available
-            if organization_id:
-                business_metrics.record_org_query(
-                    organization_id=organization_id,
-                    user_id=user_id or "anonymous",
-                    cost_cents=0  # LLM cost tracked separately
+            if cache_lookup is not None and cache_lookup.hit:
+                result = cache_lookup.result
+                result['cache_hit'] = cache_lookup.tier
+                yield self._sources_event(
+                    result['sources'], result['confidence'], result.get('chunks_retrieved', 0), strategy
                 )
+                first_token_time = time.time()
+                yield {'event': 'token', 'data': {'text': result['answer']}}
+            else:
+                chunks, details = await self._retrieve_for_strategy(strategy, project_id, question)
+                generation = self._prepare_answer(question, chunks, strategy, details)
+                yield self._sources_event(generation['sources'], generation['confidence'], len(chunks), strategy)
 
-            # Record content coverage gaps (no results or low relevance)
-            if not has_results:
-                business_metrics.record_content_coverage_gap(
-                    query=question,
-                    project_id=project_id,
-                    user_id=user_id or "anonymous",
-                    reason="no_results"
-                )
-            elif num_sources > 0 and result.get('sources', [{}])[0].get('score', 1.0) < 0.3:
-                # Low relevance score
-                business_metrics.record_low_relevance_result(
-                    query=question,
-                    project_id=project_id,
-                    relevance_score=result['sources'][0].get('score', 0),
-                    threshold=0.3
-                )
+                answer_parts = []
+                token_usage = {'input_tokens': 0, 'output_tokens': 0}
+                first_token_time = None
+                async for event in self._stream_answer(question, chunks, strategy, generation):
+                    if event['type'] == 'usage':
+                        token_usage = {
+                            'input_tokens': event['input_tokens'],
+                            'output_tokens': event['output_tokens']
+                        }
+                        continue
+                    if first_token_time is None:
+                        first_token_time = time.time()
+                    answer_parts.append(event['text'])
+                    yield {'event': 'token', 'data': {'text': event['text']}}
+
+                response = {
+                    'answer': "".join(answer_parts),
+                    'sources': generation['sources'],
+                    'confidence': generation['confidence'],
+                    'token_count': token_usage['input_tokens'] + token_usage['output_tokens'],
+                    'cost': self._calculate_cost(token_usage)
+                }
+                result = self._build_result(response, chunks, details)
 
-            # Record SLA compliance (2 second target)
-            business_metrics.record_sla_compliance(
-                operation="rag_query",
-                response_time_ms=total_time,
-                sla_threshold_ms=2000,
-                success=True
-            )
+                # Only LLM-generated answers are cached (not placeholders or "nothing found")
+                if cache_lookup is not None and result['token_count'] > 0:
+                    await answer_cache.store(cache_lookup, result)
 
-            logger.info(f"Enhanced RAG query completed using {strategy.value} in {total_time}ms")
-            return result
+            total_time = int((time.time() - start_time) * 1000)
+            result['response_time_ms'] = total_time
+            result['time_to_first_token_ms'] = int(((first_token_time or time.time()) - start_time) * 1000)
+            result['strategy_used'] = strategy.value
+
+            self._record_query_success(result, question, project_id, user_id, organization_id, start_time)
+
+            logger.info(
+                f"Streamed RAG query completed using {strategy.value} in {total_time}ms "
+                f"(first token after {result['time_to_first_token_ms']}ms)"
+            )
+            yield {'event': 'done', 'data': result}
 
         except Exception as e:
-            # Record failure metrics
             metrics.record_rag_query(
                 duration=time.time() - start_time,
                 chunks_retrieved=0,
@@ -230,7 +287,7 @@ class EnhancedRAGService:
                 success=False,
                 error_type=type(e).__name__
             )
-            logger.error(f"Enhanced RAG query failed for project {sanitize_for_log(project_id)}: {e}")
+            logger.error(f"Streamed RAG query failed for project {sanitize_for_log(project_id)}: {e}")
             raise
 
     async def query_multiple_projects(
@@ -277,7 +334,7 @@ class EnhancedRAGService:
             # Execute unified retrieval across all projects
             config = self.strategy_configs[strategy]
             result = await self._execute_unified_multi_project_search(
-                project_ids, question, config, strategy
+                project_ids, question, config, strategy, organization_id
             )
 
             # Calculate total response time
@@ -292,43 +349,126 @@ class EnhancedRAGService:
             logger.error(f"Multi-project RAG query failed: {e}")
             raise
 
-    async def _get_organization_id(self, project_id: str) -> str:
-        """Get organization ID with caching to avoid repeated DB lookups."""
-        # Check cache first
-        if project_id in self._org_cache:
-            self._cache_hits += 1
-            logger.debug(f"Organization ID cache hit for project {sanitize_for_log(project_id)} (total hits: {sanitize_for_log(self._cache_hits)})")
-            return self._org_cache[project_id]
-
-        # Cache miss - fetch from database
-        self._cache_misses += 1
-        logger.debug(f"Organization ID cache miss for project {sanitize_for_log(project_id)} (total misses: {sanitize_for_log(self._cache_misses)})")
-
-        organization_id = None
-        from db.database import get_db
-        async for session in get_db():
-            project = await session.get(Project, project_id)
-            if project:
-                organization_id = str(project.organization_id)
-                # Store in cache for future use
-                self._org_cache[project_id] = organization_id
-                logger.info(f"Cached organization {sanitize_for_log(organization_id)} for project {sanitize_for_log(project_id)}")
-            break
+    def _build_result(
+        self,
+        response: Dict[str, Any],
+        chunks: List[Dict[str, Any]],
+        details: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Combine a generated response with retrieval details."""
+        return {
+            'answer': response['answer'],
+            'sources': response['sources'],
+            'confidence': response['confidence'],
+            'chunks_retrieved': len(chunks),
+            'token_count': response.get('token_count', 0),
+            'cost': response.get('cost', 0.0),
+            **details
+        }
 
-        if not organization_id:
-            raise ValueError(f"Could not determine organization for project {project_id}")
+    async def _retrieve_for_strategy(
+        self,
+        strategy: RAGStrategy,
+        project_id: str,
+        question: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Run only the retrieval half of a strategy."""
+        retrievers = {
+            RAGStrategy.BASIC: self._retrieve_basic,
+            RAGStrategy.MULTI_QUERY: self._retrieve_multi_query,
+            RAGStrategy.HYBRID_SEARCH: self._retrieve_hybrid_search,
+            RAGStrategy.INTELLIGENT: self._retrieve_intelligent,
+        }
+        if strategy not in retrievers:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        return await retrievers[strategy](project_id, question, self.strategy_configs[strategy])
+
+    def _record_query_success(
+        self,
+        result: Dict[str, Any],
+        question: str,
+        project_id: str,
+        user_id: Optional[str],
+        organization_id: Optional[str],
+        start_time: float
+    ) -> None:
+        """Record technical and business metrics for a completed project query."""
+        # Record technical metrics
+        metrics.record_rag_query(
+            duration=time.time() - start_time,
+            chunks_retrieved=len(result.get('sources', [])),
+            context_size=len(result.get('answer', '')),
+            success=True
+        )
+
+        # Record business metrics
+        has_results = len(result.get('sources', [])) > 0
+        num_sources = len(result.get('sources', []))
+
+        business_metrics.record_user_question(
+            user_id=user_id or "anonymous",
+            project_id=project_id,
+            has_results=has_results
+        )
+
+        # Record organization-level metrics if organization_id is available
+        if organization_id:
+            business_metrics.record_org_query(
+                organization_id=organization_id,
+                user_id=user_id or "anonymous",
+                cost_cents=0  # LLM cost tracked separately
+            )
+
+        # Record content coverage gaps (no results or low relevance)
+        if not has_results:
+            business_metrics.record_content_coverage_gap(
+                query=question,
+                project_id=project_id,
+                user_id=user_id or "anonymous",
+                reason="no_results"
+            )
+        elif isinstance(result['sources'][0], dict) and result['sources'][0].get('score', 1.0) < 0.3:
+            # Low relevance score
+            business_metrics.record_low_relevance_result(
+                query=question,
+                project_id=project_id,
+                relevance_score=result['sources'][0].get('score', 0),
+                threshold=0.3
+            )
+
+        # Record SLA compliance (2 second target)
+        business_metrics.record_sla_compliance(
+            operation="rag_query",
+            response_time_ms=result['response_time_ms'],
+            sla_threshold_ms=2000,
+            success=True
+        )
+
+    async def _lookup_cached_answer(
+        self,
+        organization_id: Optional[str],
+        project_id: str,
+        question: str,
+        strategy: RAGStrategy
+    ) -> Optional[AnswerCacheLookup]:
+        """Answer cache lookup for a resolved strategy (None when the cache is disabled or unavailable)."""
+        if not answer_cache.enabled:
+            return None
+        try:
+            organization_id = organization_id or await self._get_organization_id(project_id)
+            return await answer_cache.lookup(organization_id, project_id, question, strategy.value)
+        except Exception as e:
+            logger.warning(f"Answer cache lookup failed, running full pipeline: {e}")
+            return None
 
-        return organization_id
+    async def _get_organization_id(self, project_id: str) -> str:
+        """Get organization ID from the shared project scope cache."""
+        return await project_scope_cache.get_organization_id(project_id)
 
     def clear_org_cache(self, project_id: Optional[str] = None):
-        """Clear organization cache, optionally for a specific project."""
-        if project_id:
-            self._org_cache.pop(project_id, None)
-            logger.info(f"Cleared organization cache for project {project_id}")
-        else:
-            cache_size = len(self._org_cache)
-            self._org_cache.clear()
-            logger.info(f"Cleared entire organization cache ({cache_size} entries)")
+        """Clear cached project scopes, optionally for a specific project."""
+        removed = project_scope_cache.invalidate([project_id] if project_id else None)
+        logger.info(f"Cleared {removed} project scope cache entries")
 
     async def _execute_basic_rag(
         self,
@@ -337,8 +477,19 @@ class EnhancedRAGService:
         config: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute basic 3-step RAG process."""
+        chunks, details = await self._retrieve_basic(project_id, question, config)
+        response = await self._generate_response(question, chunks, "basic")
+        return self._build_result(response, chunks, details)
+
+    async def _retrieve_basic(
+        self,
+        project_id: str,
+        question: str,
+        config: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Basic vector retrieval."""
         # Generate embedding
-        query_embedding = await embedding_service.generate_embedding(question)
+        query_embedding = (await embedding_service.encode_array([question]))[0]
 
         # Perform vector search
         chunks = []
@@ -374,16 +525,7 @@ class EnhancedRAGService:
             }
             chunks.append(chunk_data)
 
-        # Generate response
-        response = await self._generate_response(question, chunks, "basic")
-
-        return {
-            'answer': response['answer'],
-            'sources': response['sources'],
-            'confidence': response['confidence'],
-            'chunks_retrieved': len(chunks),
-            'token_count': response.get('token_count', 0),
-            'cost': response.get('cost', 0.0),
+        return chunks, {
             'retrieval_quality': {
                 'avg_score': sum(c['score'] for c in chunks) / len(chunks) if chunks else 0,
                 'score_range': f"{min(c['score'] for c in chunks):.3f}-{max(c['score'] for c in chunks):.3f}" if chunks else "0-0"
@@ -397,6 +539,17 @@ class EnhancedRAGService:
         config: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute multi-query RAG."""
+        chunks, details = await self._retrieve_multi_query(project_id, question, config)
+        response = await self._generate_response(question, chunks, "multi_query")
+        return self._build_result(response, chunks, details)
+
+    async def _retrieve_multi_query(
+        self,
+        project_id: str,
+        question: str,
+        config: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Multi-query retrieval."""
         chunks = []
         multi_results = None
 
@@ -415,21 +568,13 @@ class EnhancedRAGService:
             }
             chunks.append(chunk_data)
 
-        # Generate response
-        response = await self._generate_response(question, chunks, "multi_query")
-
-        return {
-            'answer': response['answer'],
-            'sources': response['sources'],
-            'confidence': response['confidence'],
-            'chunks_retrieved': len(chunks),
-            'token_count': response.get('token_count', 0),
-            'cost': response.get('cost', 0.0),
+        return chunks, {
             'retrieval_quality': {
                 'query_variations': multi_results.total_queries_executed,
                 'diversity_score': multi_results.result_diversity_score,
                 'coverage_score': multi_results.coverage_score,
-                'best_variation': multi_results.best_performing_variation
+                'best_variation': multi_results.best_performing_variation,
+                'stage_timings_ms': multi_results.stage_timings_ms
             },
             'query_analysis': {
                 'intent': multi_results.query_analysis.intent.value,
@@ -446,6 +591,17 @@ class EnhancedRAGService:
         config: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute hybrid search RAG."""
+        chunks, details = await self._retrieve_hybrid_search(project_id, question, config)
+        response = await self._generate_response(question, chunks, "hybrid_search")
+        return self._build_result(response, chunks, details)
+
+    async def _retrieve_hybrid_search(
+        self,
+        project_id: str,
+        question: str,
+        config: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Hybrid (semantic + keyword) retrieval."""
         chunks = []
         search_pipeline = None
 
@@ -464,16 +620,7 @@ class EnhancedRAGService:
             }
             chunks.append(chunk_data)
 
-        # Generate response
-        response = await self._generate_response(question, chunks, "hybrid_search")
-
-        return {
-            'answer': response['answer'],
-            'sources': response['sources'],
-            'confidence': response['confidence'],
-            'chunks_retrieved': len(chunks),
-            'token_count': response.get('token_count', 0),
-            'cost': response.get('cost', 0.0),
+        return chunks, {
             'retrieval_quality': {
                 'semantic_results': search_pipeline.semantic_result_count,
                 'keyword_results': search_pipeline.keyword_result_count,
@@ -489,67 +636,56 @@ class EnhancedRAGService:
         project_ids: List[str],
         question: str,
         config: Dict[str, Any],
-        strategy: RAGStrategy
+        strategy: RAGStrategy,
+        organization_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute unified search across multiple projects.
 
-        This performs a single vector search with OR filter for all project IDs,
-        then generates a unified answer from the results.
+        This performs a single grouped vector search with a match-any filter for all
+        project IDs (capped per project), then generates a unified answer from the results.
         """
-        # Generate embedding
-        query_embedding = await embedding_service.generate_embedding(question)
+        # Resolve every project's organization in one lookup and keep only the
+        # projects that live in the organization being searched
+        scopes = await project_scope_cache.get_scopes(project_ids)
+        if not organization_id:
+            first_scope = next((scopes[pid] for pid in project_ids if pid in scopes), None)
+            if first_scope is None:
+                raise ValueError(f"Could not determine organization for projects {project_ids}")
+            organization_id = first_scope.organization_id
+        in_scope = [pid for pid in project_ids if pid in scopes and scopes[pid].organization_id == str(organization_id)]
+        if len(in_scope) < len(project_ids):
+            logger.warning(f"Skipping {len(project_ids) - len(in_scope)} projects outside organization {sanitize_for_log(organization_id)}")
+        project_ids = in_scope
 
-        # Get organization_id from first project
-        organization_id = await self._get_organization_id(project_ids[0])
+        # Generate embedding
+        query_embedding = (await embedding_service.encode_array([question]))[0]
 
-        # Perform parallel vector search across all projects
-        # Search all projects in parallel and merge results by relevance score
+        # Search all projects and merge results by relevance score
         settings = get_settings()
 
         # Increase max_chunks proportionally to number of projects
         max_chunks_per_project = config['max_chunks']
         max_total_chunks = min(max_chunks_per_project * len(project_ids), 50)
 
-        # Define search function for each project
-        async def search_project(project_id: str):
-            try:
-                if settings.enable_mrl and settings.rag_use_two_stage_search:
-                    return await multi_tenant_vector_store.search_vectors_two_stage(
-                        organization_id=organization_id,
-                        query_vector=query_embedding,
-                        initial_limit=max_chunks_per_project * 3,
-                        final_limit=max_chunks_per_project,
-                        score_threshold=self.similarity_threshold,
-                        filter_dict={"project_id": project_id}
-                    )
-                else:
-                    return await multi_tenant_vector_store.search_vectors(
-                        organization_id=organization_id,
-                        query_vector=query_embedding,
-                        limit=max_chunks_per_project,
-                        score_threshold=self.similarity_threshold,
-                        filter_dict={"project_id": project_id}
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to search project {project_id}: {e}")
-                return []
-
-        # Search all projects in parallel using asyncio.gather
-        logger.info(f"Searching {len(project_ids)} projects in parallel")
-        search_tasks = [search_project(pid) for pid in project_ids]
-        project_results_list = await asyncio.gather(*search_tasks)
-
-        # Flatten and collect all results
-        all_search_results = []
-        for project_results in project_results_list:
-            all_search_results.extend(project_results)
-
-        logger.info(f"Collected {len(all_search_results)} total chunks from all projects")
+        # One grouped search over all projects (match-any project filter) with a
+        # per-project quota so no single project crowds out the others
+        logger.info(f"Searching {len(project_ids)} projects with one grouped search")
+        try:
+            results = await multi_tenant_vector_store.search_vectors_by_project(
+                organization_id=organization_id,
+                query_vector=query_embedding,
+                project_ids=project_ids,
+                per_project_limit=max_chunks_per_project,
+                total_limit=max_total_chunks,
+                score_threshold=self.similarity_threshold,
+                two_stage=settings.enable_mrl and settings.rag_use_two_stage_search
+            )
+        except Exception as e:
+            logger.warning(f"Failed to search projects {project_ids}: {e}")
+            results = []
 
-        # Sort all results by score and take top N
-        all_search_results.sort(key=lambda x: x['score'], reverse=True)
-        results = all_search_results[:max_total_chunks]
+        logger.info(f"Collected {len(results)} chunks from all projects")
 
         # Group results by project
         chunks_by_project = {}
@@ -717,6 +853,19 @@ Provide a clear, unified answer based on the relevant information found."""
         config: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute intelligent RAG."""
+        chunks, details = await self._retrieve_intelligent(project_id, question, config)
+        response = await self._generate_intelligent_response(
+            question, chunks, details['intelligence_insights']
+        )
+        return self._build_result(response, chunks, details)
+
+    async def _retrieve_intelligent(
+        self,
+        project_id: str,
+        question: str,
+        config: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Hybrid retrieval plus meeting intelligence extraction."""
         # Step 1: Hybrid search retrieval
         search_pipeline = await hybrid_search_service.hybrid_search(
             question, project_id, self.hybrid_config
@@ -744,18 +893,7 @@ Provide a clear, unified answer based on the relevant information found."""
             }
             chunks.append(chunk_data)
 
-        # Generate enhanced response
-        response = await self._generate_intelligent_response(
-            question, chunks, intelligence_insights
-        )
-
-        return {
-            'answer': response['answer'],
-            'sources': response['sources'],
-            'confidence': response['confidence'],
-            'chunks_retrieved': len(chunks),
-            'token_count': response.get('token_count', 0),
-            'cost': response.get('cost', 0.0),
+        return chunks, {
             'retrieval_quality': {
                 'semantic_results': search_pipeline.semantic_result_count,
                 'keyword_results': search_pipeline.keyword_result_count,
@@ -781,15 +919,7 @@ Provide a clear, unified answer based on the relevant information found."""
                 'cost': 0.0
             }
         
-        # Prepare context
-        context_parts = []
-        sources = set()
-        
-        for chunk in chunks:
-            context_parts.append(f"From {chunk['title']}: {chunk['text']}")
-            sources.add(chunk['title'])
-        
-        context = "\n\n".join(context_parts)
+        context, sources = self._build_context(chunks)
 
         # Generate with Claude
         if self.llm_client.is_available():
@@ -844,35 +974,7 @@ Provide a clear, unified answer based on the relevant information found."""
                 'cost': 0.0
             }
         
-        # Prepare enhanced context
-        context_parts = []
-        sources = set()
-        
-        # Add intelligence context if available
-        if intelligence_insights:
-            intel_summary = []
-            if intelligence_insights.get('decision_indicators', 0) > 0:
-                intel_summary.append(f"Content contains {intelligence_insights['decision_indicators']} decision indicators")
-            if intelligence_insights.get('action_indicators', 0) > 0:
-                intel_summary.append(f"Content contains {intelligence_insights['action_indicators']} action indicators")
-            if intelligence_insights.get('participant_mentions'):
-                intel_summary.append(f"Key participants: {', '.join(intelligence_insights['participant_mentions'][:3])}")
-            
-            if intel_summary:
-                context_parts.append(f"Meeting Intelligence: {'; '.join(intel_summary)}\n")
-        
-        # Add chunk content
-        for chunk in chunks:
-            enhanced_header = f"From {chunk['title']}"
-            if 'search_types' in chunk and chunk['search_types']:
-                enhanced_header += f" (via: {', '.join(chunk['search_types'])})"
-            if 'matched_keywords' in chunk and chunk['matched_keywords']:
-                enhanced_header += f" [keywords: {', '.join(chunk['matched_keywords'][:3])}]"
-            
-            context_parts.append(f"{enhanced_header}: {chunk['text']}")
-            sources.add(chunk['title'])
-        
-        context = "\n\n".join(context_parts)
+        context, sources = self._build_intelligent_context(chunks, intelligence_insights)
 
         # Generate with Claude
         if self.llm_client.is_available():
@@ -914,6 +1016,149 @@ Provide a clear, unified answer based on the relevant information found."""
             'token_count': token_usage.get('input_tokens', 0) + token_usage.get('output_tokens', 0),
             'cost': cost
         }
+
+    def _prepare_answer(
+        self,
+        question: str,
+        chunks: List[Dict[str, Any]],
+        strategy: RAGStrategy,
+        details: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Prompt, sampling temperature, sources and confidence for a streamed answer."""
+        if strategy == RAGStrategy.INTELLIGENT:
+            insights = details.get('intelligence_insights', {})
+            context, sources = self._build_intelligent_context(chunks, insights)
+            return {
+                'context': context,
+                'prompt': self._build_intelligent_prompt(question, context, insights),
+                'temperature': self.temperature * 0.9,
+                'sources': list(sources),
+                'confidence': self._calculate_intelligent_confidence(chunks, insights),
+                'intelligence_insights': insights
+            }
+
+        context, sources = self._build_context(chunks)
+        return {
+            'context': context,
+            'prompt': self._build_prompt(question, context, strategy.value),
+            'temperature': self.temperature,
+            'sources': list(sources),
+            'confidence': self._calculate_confidence(chunks, strategy.value)
+        }
+
+    async def _stream_answer(
+        self,
+        question: str,
+        chunks: List[Dict[str, Any]],
+        strategy: RAGStrategy,
+        generation: Dict[str, Any]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream answer text for prepared generation inputs.
+
+        Falls back to the placeholder answer (as _generate_response does) when
+        there is nothing to answer from, no LLM is available, or the provider
+        fails before producing any text. A failure mid-answer propagates.
+        """
+        if not chunks:
+            yield {'type': 'text', 'text': "I couldn't find relevant information to answer your question."}
+            return
+
+        if strategy == RAGStrategy.INTELLIGENT:
+            def placeholder() -> str:
+                return self._generate_intelligent_placeholder_response(
+                    question, generation['context'], chunks, generation['intelligence_insights']
+                )
+        else:
+            def placeholder() -> str:
+                return self._generate_placeholder_response(
+                    question, generation['context'], chunks, strategy.value
+                )
+
+        if not self.llm_client.is_available():
+            yield {'type': 'text', 'text': placeholder()}
+            return
+
+        emitted = False
+        try:
+            async for event in self.llm_client.create_text_stream(
+                prompt=generation['prompt'],
+                model=self.llm_model,
+                max_tokens=self.max_tokens,
+                temperature=generation['temperature']
+            ):
+                if event['type'] == 'text':
+                    emitted = True
+                yield event
+        except Exception as e:
+            if emitted:
+                raise
+            logger.error(f"Streaming LLM call failed: {e}")
+            yield {'type': 'text', 'text': placeholder()}
+
+    def _sources_event(
+        self,
+        sources: List[str],
+        confidence: float,
+        chunks_retrieved: int,
+        strategy: RAGStrategy
+    ) -> Dict[str, Any]:
+        """First streaming event: what the answer will be grounded on."""
+        return {
+            'event': 'sources',
+            'data': {
+                'sources': sources,
+                'confidence': confidence,
+                'chunks_retrieved': chunks_retrieved,
+                'strategy_used': strategy.value
+            }
+        }
+
+    def _build_context(self, chunks: List[Dict[str, Any]]) -> Tuple[str, set]:
+        """Prompt context and source titles for retrieved chunks."""
+        context_parts = []
+        sources = set()
+
+        for chunk in chunks:
+            context_parts.append(f"From {chunk['title']}: {chunk['text']}")
+            sources.add(chunk['title'])
+
+        return "\n\n".join(context_parts), sources
+
+    def _build_intelligent_context(
+        self,
+        chunks: List[Dict[str, Any]],
+        intelligence_insights: Dict[str, Any]
+    ) -> Tuple[str, set]:
+        """Prompt context with meeting intelligence and search annotations."""
+        context_parts = []
+        sources = set()
+
+        # Add intelligence context if available
+        if intelligence_insights:
+            intel_summary = []
+            if intelligence_insights.get('decision_indicators', 0) > 0:
+                intel_summary.append(f"Content contains {intelligence_insights['decision_indicators']} decision indicators")
+            if intelligence_insights.get('action_indicators', 0) > 0:
+                intel_summary.append(f"Content contains {intelligence_insights['action_indicators']} action indicators")
+            if intelligence_insights.get('participant_mentions'):
+                intel_summary.append(f"Key participants: {', '.join(intelligence_insights['participant_mentions'][:3])}")
+            
+            if intel_summary:
+                context_parts.append(f"Meeting Intelligence: {'; '.join(intel_summary)}\n")
+        
+        # Add chunk content
+        for chunk in chunks:
+            enhanced_header = f"From {chunk['title']}"
+            if 'search_types' in chunk and chunk['search_types']:
+                enhanced_header += f" (via: {', '.join(chunk['search_types'])})"
+            if 'matched_keywords' in chunk and chunk['matched_keywords']:
+                enhanced_header += f" [keywords: {', '.join(chunk['matched_keywords'][:3])}]"
+            
+            context_parts.append(f"{enhanced_header}: {chunk['text']}")
+            sources.add(chunk['title'])
+
+        return "\n\n".join(context_parts), sources
     
     # Helper methods remain the same...
     def _select_optimal_strategy(self, question: str) -> RAGStrategy:
@@ -1185,7 +1430,7 @@ Provide a clear, unified answer based on the relevant information found."""
 
         try:
             # Step 1: Fast vector search (typically <200ms)
-            query_embedding = await embedding_service.generate_embedding(question)
+            query_embedding = (await embedding_service.encode_array([question]))[0]
 
             # Use two-stage MRL search for better quality
             results = await multi_tenant_vector_store.search_vectors_two_stage(
@@ -3,14 +3,17 @@
 import os
 import re
 import math
+import time
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple, Set
+import weakref
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple, Set, Union
 from dataclasses import dataclass, field
 from collections import defaultdict, Counter
 from enum import Enum
 import json
 
-from sentence_transformers import SentenceTransformer, CrossEncoder
+import numpy as np
 from transformers import logging as transformers_logging
 
 # Suppress verbose transformers/safetensors output during model loading
@@ -18,12 +21,15 @@ transformers_logging.set_verbosity_error()
 
 from utils.logger import get_logger, sanitize_for_log
 from services.rag.embedding_service import embedding_service
+from services.rag.cross_encoder_reranker import CrossEncoderReranker
+from services.rag.keyword_index import keyword_index, tokenize
+from services.rag.model_registry import shared_cross_encoder
 from services.rag.multi_query_retrieval import (
     MultiQueryResults, RetrievalResult, QueryAnalysis, QueryIntent,
     multi_query_retrieval_service
 )
 from db.multi_tenant_vector_store import multi_tenant_vector_store
-from models.project import Project
+from services.cache.project_scope_cache import project_scope_cache
 
 logger = get_logger(__name__)
 
@@ -60,6 +66,9 @@ class SearchResult:
     confidence_score: float = 0.0
     source_diversity: float = 0.0
 
+    # Stored chunk vector from Qdrant (used for MMR and diversity metrics)
+    embedding: Optional[np.ndarray] = field(default=None, repr=False)
+
 
 @dataclass
 class HybridSearchConfig:
@@ -76,6 +85,7 @@ class HybridSearchConfig:
     # Cross-encoder parameters
     cross_encoder_weight: float = 0.5  # Increased from 0.3 for better relevance
     cross_encoder_threshold: float = 0.5
+    cross_encoder_top_k: int = 20  # Only the top-k merged results are cross-encoded (0 = all)
 
     # Result optimization
     max_results_per_method: int = 30  # Increased from 20 for better candidate pool
@@ -84,11 +94,15 @@ class HybridSearchConfig:
 
     # Diversity optimization
     diversity_similarity_threshold: float = 0.85  # Results with similarity > this are considered duplicates
+    mmr_lambda: float = 0.7  # MMR relevance vs. novelty trade-off (1.0 = relevance only)
 
     # Quality filters
     min_confidence_score: float = 0.3
     filter_low_quality: bool = True
 
+    # Dense + sparse retrieval fused (RRF) inside Qdrant; None follows HYBRID_SERVER_SIDE_FUSION
+    server_side_fusion: Optional[bool] = None
+
 
 @dataclass
 class SearchPipeline:
@@ -110,10 +124,58 @@ class SearchPipeline:
     diversity_score: float = 0.0
     confidence_distribution: Dict[str, int] = field(default_factory=dict)
     processing_time_ms: int = 0
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class ResultSimilarity:
+    """Pairwise cosine similarity of candidate result vectors, computed once per query."""
+    chunk_index: Dict[str, int]
+    matrix: np.ndarray
+    has_vector: np.ndarray  # Rows without a stored vector have zero similarity to everything
+
+    def submatrix(self, results: List[SearchResult]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Similarities and vector mask for a subset of the candidates (None if any are unknown)."""
+        try:
+            indices = [self.chunk_index[result.chunk_id] for result in results]
+        except KeyError:
+            return None
+        return self.matrix[np.ix_(indices, indices)], self.has_vector[indices]
+
+
+@dataclass
+class SearchContext:
+    """Per-query search state, never shared between concurrent queries."""
+    query: str
+    project_id: str
+    config: HybridSearchConfig
+    organization_id: Optional[str] = None
+
+    # BM25 statistics for the scan fallback (keyword index unavailable)
+    document_frequencies: Dict[str, int] = field(default_factory=dict)
+    total_documents: int = 0
+    average_document_length: float = 0.0
+
+    # Candidate similarity matrix shared by MMR and the diversity metric
+    similarity: Optional[ResultSimilarity] = None
+
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def timed(self, stage: str):
+        """Record the wall-clock duration of a pipeline stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings_ms[stage] = round((time.perf_counter() - start) * 1000, 2)
 
 
 class HybridSearchService:
     """Advanced hybrid search combining semantic, keyword, and cross-encoder approaches."""
+
+    # Cross-encoder for re-ranking (shared process-wide, loaded on first use)
+    cross_encoder = shared_cross_encoder()
     
     def __init__(self, config: Optional[HybridSearchConfig] = None):
         """Initialize hybrid search service with MRL optimization."""
@@ -125,16 +187,21 @@ class HybridSearchService:
         self.use_mrl_search = self.settings.enable_mrl
         self.search_dimension = self.settings.mrl_search_dimension  # 128d for fast search
         self.rerank_dimension = self.settings.mrl_rerank_dimension  # 768d for accurate rerank
+
+        # Stored vector returned with results for reranking and MMR (unnamed vector without MRL)
+        self.result_vector_name = f"vector_{self.rerank_dimension}" if self.use_mrl_search else None
         
-        # Models for different search approaches
-        self.sentence_transformer = None
-        self.cross_encoder = None
+        # Cross-encoder scoring off the event loop: batched across queries, cached per (query, chunk)
+        self.reranker = CrossEncoderReranker(
+            predict_fn=self._predict_cross_encoder,
+            cache_size=self.settings.rerank_cache_size,
+            max_wait_ms=self.settings.rerank_batch_max_wait_ms,
+            max_batch_size=self.settings.rerank_batch_max_size
+        )
         
-        # Keyword search components
-        self.document_frequencies = {}
-        self.total_documents = 0
-        self.document_lengths = {}
-        self.average_document_length = 0.0
+        # One keyword index backfill per project, shared across queries; an entry
+        # lives only while some query holds or waits on its lock
+        self._index_build_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
         
         # Search quality components
         self.quality_indicators = {
@@ -144,35 +211,11 @@ class HybridSearchService:
             'position_bonus': 1.3,
             'content_type_match': 1.2
         }
-        
-        # Initialize models
-        self._initialize_models()
     
-    def _initialize_models(self):
-        """Initialize ML models for hybrid search."""
-        try:
-            # Load sentence transformer for semantic search
-            try:
-                self.sentence_transformer = SentenceTransformer(
-                    self.settings.sentence_transformer_model,
-                    token=self.settings.hf_token,
-                    trust_remote_code=True
-                )
-                logger.info("Loaded SentenceTransformer for hybrid search")
-            except Exception as e:
-                logger.warning(f"Failed to load SentenceTransformer: {e}")
-
-            # Load cross-encoder for re-ranking (from settings)
-            try:
-                self.cross_encoder = CrossEncoder(self.settings.cross_encoder_model)
-                logger.info(f"Loaded CrossEncoder ({self.settings.cross_encoder_model}) for result re-ranking")
-            except Exception as e:
-                logger.warning(f"Failed to load CrossEncoder: {e}")
-                self.cross_encoder = None
+    def _predict_cross_encoder(self, pairs: List[List[str]]) -> np.ndarray:
+        """Blocking cross-encoder inference (runs on the rerank thread)."""
+        return self.cross_encoder.predict(pairs, show_progress_bar=False)
 
-        except Exception as e:
-            logger.error(f"Failed to initialize hybrid search models: {e}")
-    
     async def hybrid_search(
         self,
         query: str,
@@ -181,56 +224,76 @@ class HybridSearchService:
     ) -> SearchPipeline:
         """
         Perform hybrid search combining multiple approaches.
-        
+
+        All per-query state (config, organization, BM25 statistics, stage timings)
+        lives in a SearchContext, so concurrent queries never share it.
+
         Args:
             query: Search query
             project_id: Project ID for filtering
-            config: Optional search configuration
-            
+            config: Optional search configuration for this query only
+
         Returns:
             SearchPipeline with comprehensive search results
         """
-        import time
         start_time = time.time()
-        
-        if config:
-            self.config = config
-        
+        ctx = SearchContext(query=query, project_id=project_id, config=config or self.config)
+
         logger.info(f"Starting hybrid search for: '{sanitize_for_log(query)}'")
-        
+
         try:
-            # Stage 1: Semantic search
-            logger.debug("Stage 1: Performing semantic search")
-            semantic_results = await self._semantic_search(query, project_id)
-            
-            # Stage 2: Keyword search (BM25)
-            logger.debug("Stage 2: Performing keyword search")
-            keyword_results = await self._keyword_search(query, project_id)
-            
-            # Stage 3: Merge and deduplicate results
-            logger.debug("Stage 3: Merging results")
-            merged_results = await self._merge_results(
-                semantic_results, keyword_results, query
-            )
-            
+            # Resolved once and shared by the retrieval stages
+            with ctx.timed("organization_lookup"):
+                await self._context_organization_id(ctx)
+
+            fused_results = None
+            if self._use_server_side_fusion(ctx.config):
+                # Stages 1-3 in one Qdrant query: dense + sparse prefetch fused with RRF
+                logger.debug("Stages 1-3: Dense + sparse RRF fusion in Qdrant")
+                with ctx.timed("fused_retrieval"):
+                    fused_results = await self._fused_search(ctx)
+
+            if fused_results is not None:
+                semantic_results, keyword_results, merged_results = [], [], fused_results
+            else:
+                # Stages 1-2: Semantic and keyword (BM25) search are independent; run them concurrently
+                logger.debug("Stages 1-2: Performing semantic and keyword search")
+                with ctx.timed("retrieval"):
+                    semantic_results, keyword_results = await asyncio.gather(
+                        self._semantic_search(ctx),
+                        self._keyword_search(ctx)
+                    )
+
+                # Stage 3: Merge and deduplicate results
+                logger.debug("Stage 3: Merging results")
+                with ctx.timed("merge"):
+                    merged_results = await self._merge_results(
+                        semantic_results, keyword_results, query, ctx.config
+                    )
+
             # Stage 4: Cross-encoder re-ranking
             logger.debug("Stage 4: Cross-encoder re-ranking")
-            cross_encoded_results = await self._cross_encoder_rerank(
-                merged_results, query
-            )
-            
-            # Stage 5: Final optimization and diversity
+            with ctx.timed("rerank"):
+                cross_encoded_results = await self._cross_encoder_rerank(
+                    merged_results, query, ctx.config
+                )
+
+            # Stage 5: Final optimization and diversity (MMR over stored vectors, no inference)
             logger.debug("Stage 5: Final optimization")
-            final_results = await self._optimize_final_results(
-                cross_encoded_results, query
-            )
-            
+            with ctx.timed("vectors"):
+                await self._attach_missing_vectors(ctx, cross_encoded_results)
+            with ctx.timed("optimize"):
+                final_results = await self._optimize_final_results(
+                    cross_encoded_results, query, ctx.config, ctx
+                )
+
             # Calculate pipeline metrics
+            with ctx.timed("diversity_metrics"):
+                diversity_score = await self._calculate_diversity_score(final_results, ctx)
             processing_time = int((time.time() - start_time) * 1000)
-            diversity_score = await self._calculate_diversity_score(final_results)
             pipeline = SearchPipeline(
                 query=query,
-                config=self.config,
+                config=ctx.config,
                 semantic_results=semantic_results,
                 keyword_results=keyword_results,
                 merged_results=merged_results,
@@ -241,7 +304,8 @@ class HybridSearchService:
                 overlap_count=self._calculate_overlap(semantic_results, keyword_results),
                 diversity_score=diversity_score,
                 confidence_distribution=self._calculate_confidence_distribution(final_results),
-                processing_time_ms=processing_time
+                processing_time_ms=processing_time,
+                stage_timings_ms=ctx.stage_timings_ms
             )
             
             logger.info(f"Hybrid search completed in {processing_time}ms: "
@@ -255,28 +319,115 @@ class HybridSearchService:
         except Exception as e:
             logger.error(f"Hybrid search failed: {e}")
             # Fallback to semantic search only
-            return await self._fallback_search(query, project_id)
-    
-    async def _semantic_search(self, query: str, project_id: str) -> List[SearchResult]:
-        """Perform semantic vector search with MRL optimization."""
+            return await self._fallback_search(query, project_id, ctx.config)
+
+    async def _context_organization_id(self, ctx: SearchContext) -> Optional[str]:
+        """Organization for the query's project, looked up once per request."""
+        if ctx.organization_id is None:
+            ctx.organization_id = await self._get_organization_id(ctx.project_id)
+        return ctx.organization_id
+
+    def _use_server_side_fusion(self, config: HybridSearchConfig) -> bool:
+        """Whether dense + sparse retrieval is fused by Qdrant instead of merged in Python."""
+        if config.server_side_fusion is not None:
+            return config.server_side_fusion
+        return self.settings.hybrid_server_side_fusion
+
+    async def _fused_search(self, ctx: SearchContext) -> Optional[List[SearchResult]]:
+        """
+        Dense + sparse retrieval fused with RRF in a single query_points call.
+
+        Fused scores are normalized to the top result and carry the same quality
+        bonus as merged results, so cross-encoder weighting and confidence
+        filtering behave as in the client-side merge.
+
+        Returns:
+            Results sorted by hybrid score, or None when the collection has no
+            sparse vectors (caller falls back to separate searches)
+        """
+        query, project_id, config = ctx.query, ctx.project_id, ctx.config
         try:
-            # Validate query length to prevent embedding errors
+            organization_id = await self._context_organization_id(ctx)
+            if not organization_id:
+                logger.error(f"Could not determine organization for project {sanitize_for_log(project_id)}")
+                return None
+
             if len(query) > 2000:
-                logger.warning(f"Query too long ({len(query)} chars), truncating for search")
                 query = query[:2000] + "..."
+            query_embedding = (await embedding_service.encode_array([query]))[0]
 
-            if self.use_mrl_search:
-                # Multi-stage search with MRL
-                return await self._semantic_search_mrl(query, project_id)
-            else:
-                # Standard semantic search
-                return await self._semantic_search_standard(query, project_id)
+            hits = await multi_tenant_vector_store.search_hybrid(
+                organization_id=organization_id,
+                query_vector=query_embedding,
+                query_text=query,
+                limit=config.max_results_per_method,
+                dense_limit=config.max_results_per_method,
+                sparse_limit=config.max_results_per_method,
+                filter_dict={"project_id": project_id},
+                two_stage=self.use_mrl_search,
+                with_vectors=self._result_vectors_selector()
+            )
+            if hits is None:
+                logger.debug("Collection has no sparse vectors, using client-side merge")
+                return None
+            if not hits:
+                return []
+
+            query_terms = self._tokenize_query(query)
+            top_score = hits[0]['score'] or 1.0
+
+            results = []
+            for hit in hits:
+                payload = hit.get('payload') or {}
+                text = payload.get('text', payload.get('content', ''))
+                matched_keywords, positions = self._find_matched_keywords(query_terms, text)
+                fused_score = hit['score'] / top_score
+
+                result = SearchResult(
+                    chunk_id=hit['id'],
+                    text=text,
+                    metadata=payload,
+                    search_types=[SearchType.SEMANTIC, SearchType.HYBRID],
+                    matched_keywords=matched_keywords,
+                    keyword_positions=positions,
+                    confidence_score=fused_score,
+                    embedding=self._stored_vector(hit.get('vector'))
+                )
+                if matched_keywords:
+                    result.search_types.insert(1, SearchType.KEYWORD)
+                result.hybrid_score = fused_score * (1.0 + self._calculate_quality_bonus(result, query))
+                results.append(result)
+
+            results.sort(key=lambda x: x.hybrid_score, reverse=True)
+            logger.debug(f"Fused search retrieved {len(results)} results")
+            return results
 
         except Exception as e:
-            logger.error(f"Semantic search failed: {e}")
-            return []
+            logger.error(f"Fused search failed, using client-side merge: {e}")
+            return None
 
-    async def _semantic_search_mrl(self, query: str, project_id: str) -> List[SearchResult]:
+    async def _semantic_search(self, ctx: SearchContext) -> List[SearchResult]:
+        """Perform semantic vector search with MRL optimization."""
+        with ctx.timed("semantic"):
+            try:
+                query = ctx.query
+                # Validate query length to prevent embedding errors
+                if len(query) > 2000:
+                    logger.warning(f"Query too long ({len(query)} chars), truncating for search")
+                    query = query[:2000] + "..."
+
+                if self.use_mrl_search:
+                    # Multi-stage search with MRL
+                    return await self._semantic_search_mrl(ctx, query)
+                else:
+                    # Standard semantic search
+                    return await self._semantic_search_standard(ctx, query)
+
+            except Exception as e:
+                logger.error(f"Semantic search failed: {e}")
+                return []
+
+    async def _semantic_search_mrl(self, ctx: SearchContext, query: str) -> List[SearchResult]:
         """
         Multi-stage semantic search using MRL:
         1. Fast filtering with 128d embeddings
@@ -284,22 +435,24 @@ class HybridSearchService:
         """
         from services.rag.embedding_service import embedding_service
 
-        # Get organization_id from project_id
-        organization_id = await self._get_organization_id(project_id)
+        project_id, config = ctx.project_id, ctx.config
+        organization_id = await self._context_organization_id(ctx)
         if not organization_id:
             logger.error(f"Could not determine organization for project {sanitize_for_log(project_id)}")
             return []
 
-        # Generate query embeddings at different dimensions
-        query_embeddings = await embedding_service.generate_search_embeddings(query)
+        # Generate the full query embedding once; MRL dimensions are prefix slices
+        query_embedding = (await embedding_service.encode_array([query]))[0]
+        rerank_embedding = query_embedding[:embedding_service.rerank_dimension]
 
         # Stage 1: Fast filtering with 128d (get 3x candidates)
         fast_candidates = await multi_tenant_vector_store.search_vectors(
             organization_id=organization_id,
-            query_vector=query_embeddings['search'],  # 128d
-            limit=self.config.max_results_per_method * 3,
-            score_threshold=self.config.semantic_threshold,
-            filter_dict={"project_id": project_id}
+            query_vector=query_embedding[:embedding_service.search_dimension],  # 128d
+            limit=config.max_results_per_method * 3,
+            score_threshold=config.semantic_threshold,
+            filter_dict={"project_id": project_id},
+            with_vectors=self._result_vectors_selector()  # Stored 768d vectors
         )
 
         if not fast_candidates:
@@ -308,11 +461,11 @@ class HybridSearchService:
         # Stage 2: Accurate reranking with 768d
         reranked_results = []
         for candidate in fast_candidates:
-            # Calculate precise similarity with full embeddings
-            chunk_embedding_768 = candidate.get('embedding_768', candidate.get('embedding', []))
-            if chunk_embedding_768:
-                precise_score = embedding_service.calculate_similarity(
-                    query_embeddings['rerank'],  # 768d
+            # Calculate precise similarity with the stored full embedding
+            chunk_embedding_768 = self._stored_vector(candidate.get('vector'))
+            if chunk_embedding_768 is not None:
+                precise_score = self._cosine_similarity(
+                    rerank_embedding,  # 768d
                     chunk_embedding_768
                 )
             else:
@@ -329,22 +482,23 @@ class HybridSearchService:
                 semantic_score=precise_score,
                 search_types=[SearchType.SEMANTIC],
                 relevance_indicators=['mrl_optimized'],
-                confidence_score=precise_score
+                confidence_score=precise_score,
+                embedding=chunk_embedding_768
             )
             reranked_results.append(search_result)
 
         # Sort by precise scores and return top results
         reranked_results.sort(key=lambda x: x.semantic_score, reverse=True)
-        results = reranked_results[:self.config.max_results_per_method]
+        results = reranked_results[:config.max_results_per_method]
 
         logger.debug(f"MRL semantic search: {len(fast_candidates)} candidates → {len(results)} results")
         return results
 
-    async def _semantic_search_standard(self, query: str, project_id: str) -> List[SearchResult]:
+    async def _semantic_search_standard(self, ctx: SearchContext, query: str) -> List[SearchResult]:
         """Standard semantic search without MRL optimization."""
         # Use multi-query retrieval for expanded semantic search
         multi_query_results = await multi_query_retrieval_service.retrieve_with_multi_query(
-            query, project_id, self.config.max_results_per_method
+            query, ctx.project_id, ctx.config.max_results_per_method
         )
 
         # Convert to SearchResult format
@@ -357,86 +511,186 @@ class HybridSearchService:
                 semantic_score=result.score,
                 search_types=[SearchType.SEMANTIC],
                 relevance_indicators=result.relevance_factors,
-                confidence_score=result.score
+                confidence_score=result.score,
+                embedding=result.embedding
             )
             search_results.append(search_result)
 
         logger.debug(f"Standard semantic search retrieved {len(search_results)} results")
-        return search_results[:self.config.max_results_per_method]
+        return search_results[:ctx.config.max_results_per_method]
     
-    async def _keyword_search(self, query: str, project_id: str) -> List[SearchResult]:
-        """Perform keyword-based search using BM25 scoring."""
-        try:
-            # Get all documents for the project (this is a simplified approach)
-            # In a real implementation, you'd have a proper inverted index
-            all_results = await self._get_all_project_documents(project_id)
-            
-            if not all_results:
-                logger.warning("No documents found for keyword search")
-                return []
-            
-            # Update document statistics
-            await self._update_document_statistics(all_results)
-            
-            # Calculate BM25 scores for query
-            query_terms = self._tokenize_query(query)
-            scored_results = []
-            
-            for doc in all_results:
-                # Get text from payload - handle both direct text field and nested structure
-                payload = doc.get('payload', {})
-                doc_text = payload.get('text', '') or payload.get('content', '')
-
-                if not doc_text:
-                    continue
+    async def _keyword_search(self, ctx: SearchContext) -> List[SearchResult]:
+        """Perform keyword-based search using BM25 scoring over the project's inverted index."""
+        with ctx.timed("keyword"):
+            try:
+                project_id = ctx.project_id
+                query_terms = self._tokenize_query(ctx.query)
+                if not query_terms:
+                    return []
+
+                organization_id = await self._context_organization_id(ctx)
+                if not organization_id:
+                    logger.error(f"Could not determine organization for project {sanitize_for_log(project_id)}")
+                    return []
+
+                hits = await self._indexed_keyword_hits(ctx, organization_id, query_terms)
+                if hits is None:
+                    # Index unavailable: score every chunk of the project directly
+                    return await self._scan_keyword_search(ctx, organization_id, query_terms)
+
+                # Postings give IDs and scores; fetch text/metadata for the top hits only
+                points = await multi_tenant_vector_store.get_points(
+                    organization_id=organization_id,
+                    point_ids=[chunk_id for chunk_id, _, _ in hits],
+                    with_vectors=self._result_vectors_selector()
+                )
+                payloads = {point['id']: point['payload'] or {} for point in points}
+                vectors = {point['id']: point['vector'] for point in points}
 
-                bm25_score = self._calculate_bm25_score(query_terms, doc_text)
+                scored_results = []
+                for chunk_id, bm25_score, _ in hits:
+                    payload = payloads.get(chunk_id)
+                    if payload is None:
+                        continue
+                    doc_text = payload.get('text', '') or payload.get('content', '')
 
-                if bm25_score > 0:  # Only include documents with some relevance
                     # Find matched keywords and positions
                     matched_keywords, positions = self._find_matched_keywords(
                         query_terms, doc_text
                     )
 
-                    search_result = SearchResult(
-                        chunk_id=doc.get('id', ''),
+                    scored_results.append(SearchResult(
+                        chunk_id=chunk_id,
                         text=doc_text,
                         metadata=payload,
                         keyword_score=bm25_score,
                         search_types=[SearchType.KEYWORD],
                         matched_keywords=matched_keywords,
                         keyword_positions=positions,
-                        confidence_score=min(bm25_score, 1.0)
+                        confidence_score=min(bm25_score, 1.0),
+                        embedding=self._stored_vector(vectors.get(chunk_id))
+                    ))
+
+                logger.debug(f"Keyword search retrieved {len(scored_results)} results from index")
+                return scored_results
+
+            except Exception as e:
+                logger.error(f"Keyword search failed: {e}")
+                return []
+
+    async def _indexed_keyword_hits(
+        self,
+        ctx: SearchContext,
+        organization_id: str,
+        query_terms: List[str]
+    ) -> Optional[List[Tuple[str, float, List[str]]]]:
+        """BM25 postings lookup; backfills the project index on first use. None if unavailable."""
+        project_id = ctx.project_id
+        built = await keyword_index.is_built(organization_id, project_id)
+        if built is None:
+            return None
+
+        if not built:
+            # One backfill per project even under concurrent queries
+            lock = self._index_build_locks.get(project_id)
+            if lock is None:
+                lock = self._index_build_locks[project_id] = asyncio.Lock()
+            async with lock:
+                if not await keyword_index.is_built(organization_id, project_id):
+                    documents = await self._get_all_project_documents(project_id, organization_id)
+                    built = await keyword_index.rebuild(
+                        organization_id,
+                        project_id,
+                        [
+                            (str(doc['id']), doc.get('payload', {}).get('text', '') or doc.get('payload', {}).get('content', ''))
+                            for doc in documents
+                        ]
                     )
-                    scored_results.append(search_result)
-            
-            # Sort by BM25 score
-            scored_results.sort(key=lambda x: x.keyword_score, reverse=True)
-            
-            logger.debug(f"Keyword search retrieved {len(scored_results)} results")
-            return scored_results[:self.config.max_results_per_method]
-            
-        except Exception as e:
-            logger.error(f"Keyword search failed: {e}")
+                    if not built:
+                        # Scan Qdrant for this query; the next search retries the rebuild
+                        logger.warning(f"Keyword index rebuild failed for project {sanitize_for_log(project_id)}")
+                        return None
+                    logger.info(f"Built keyword index for project {sanitize_for_log(project_id)}: {len(documents)} chunks")
+
+        return await keyword_index.search(
+            organization_id,
+            project_id,
+            query_terms,
+            limit=ctx.config.max_results_per_method,
+            k1=ctx.config.bm25_k1,
+            b=ctx.config.bm25_b
+        )
+
+    async def _scan_keyword_search(
+        self,
+        ctx: SearchContext,
+        organization_id: str,
+        query_terms: List[str]
+    ) -> List[SearchResult]:
+        """Fallback BM25 over every project chunk scrolled from Qdrant (no index)."""
+        all_results = await self._get_all_project_documents(ctx.project_id, organization_id)
+
+        if not all_results:
+            logger.warning("No documents found for keyword search")
             return []
-    
+
+        # Document statistics for this query only
+        await self._update_document_statistics(all_results, ctx)
+
+        scored_results = []
+        for doc in all_results:
+            # Get text from payload - handle both direct text field and nested structure
+            payload = doc.get('payload', {})
+            doc_text = payload.get('text', '') or payload.get('content', '')
+
+            if not doc_text:
+                continue
+
+            bm25_score = self._calculate_bm25_score(query_terms, doc_text, ctx)
+
+            if bm25_score > 0:  # Only include documents with some relevance
+                # Find matched keywords and positions
+                matched_keywords, positions = self._find_matched_keywords(
+                    query_terms, doc_text
+                )
+
+                search_result = SearchResult(
+                    chunk_id=doc.get('id', ''),
+                    text=doc_text,
+                    metadata=payload,
+                    keyword_score=bm25_score,
+                    search_types=[SearchType.KEYWORD],
+                    matched_keywords=matched_keywords,
+                    keyword_positions=positions,
+                    confidence_score=min(bm25_score, 1.0)
+                )
+                scored_results.append(search_result)
+
+        # Sort by BM25 score
+        scored_results.sort(key=lambda x: x.keyword_score, reverse=True)
+
+        logger.debug(f"Keyword search (scan) retrieved {len(scored_results)} results")
+        return scored_results[:ctx.config.max_results_per_method]
+
     async def _get_organization_id(self, project_id: str) -> Optional[str]:
-        """Get organization_id from project_id using cached enhanced RAG service."""
+        """Get organization_id from project_id using the shared project scope cache."""
         try:
-            # Use the cached organization lookup from enhanced RAG service
-            from services.rag.enhanced_rag_service_refactored import enhanced_rag_service
-            org_id = await enhanced_rag_service._get_organization_id(project_id)
+            org_id = await project_scope_cache.get_organization_id(project_id)
             logger.debug(f"Hybrid search organization lookup: project_id={sanitize_for_log(project_id)} -> organization_id={sanitize_for_log(org_id)}")
             return org_id
         except Exception as e:
             logger.error(f"Failed to get organization_id for project {sanitize_for_log(project_id)}: {e}")
             return None
 
-    async def _get_all_project_documents(self, project_id: str) -> List[Dict[str, Any]]:
-        """Get all documents for BM25 calculation using scroll API."""
+    async def _get_all_project_documents(
+        self,
+        project_id: str,
+        organization_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get every chunk of a project (for index backfill or scan fallback) using scroll API."""
         try:
             # Get organization_id from project_id
-            organization_id = await self._get_organization_id(project_id)
+            organization_id = organization_id or await self._get_organization_id(project_id)
             if not organization_id:
                 logger.error(f"Could not determine organization for project {sanitize_for_log(project_id)}")
                 return []
@@ -446,7 +700,6 @@ class HybridSearchService:
                 organization_id=organization_id,
                 collection_type="content",
                 filter_dict={"project_id": project_id},
-                limit=1000,  # Get many documents for BM25
                 with_payload=True,
                 with_vectors=False  # Don't need vectors for keyword search
             )
@@ -470,22 +723,11 @@ class HybridSearchService:
                     query = query[1:].strip()
                 break
 
-        # Clean and tokenize query
-        cleaned = re.sub(r'[^\w\s]', ' ', query.lower())
-        tokens = cleaned.split()
-
-        # Extended stop words including common noise words
-        stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'what', 'when', 'where', 'who', 'how',
-            'regarding', 'about', 're', 'subject'
-        }
-
-        return [token for token in tokens if token not in stop_words and len(token) > 2]
+        # Same tokenizer as the keyword index (stop words, short tokens removed)
+        return tokenize(query)
     
-    def _calculate_bm25_score(self, query_terms: List[str], document: str) -> float:
-        """Calculate BM25 score for document given query terms."""
+    def _calculate_bm25_score(self, query_terms: List[str], document: str, ctx: SearchContext) -> float:
+        """Calculate BM25 score for document given query terms and the query's document statistics."""
         if not query_terms or not document:
             return 0.0
         
@@ -505,17 +747,17 @@ class HybridSearchService:
                 tf = doc_term_freq[term]
                 
                 # Document frequency for term (simplified - would need proper index)
-                df = self.document_frequencies.get(term, 1)
+                df = ctx.document_frequencies.get(term, 1)
                 
                 # IDF calculation
-                idf = math.log((self.total_documents + 1) / (df + 1))
+                idf = math.log((ctx.total_documents + 1) / (df + 1))
                 
                 # BM25 formula
-                numerator = tf * (self.config.bm25_k1 + 1)
+                numerator = tf * (ctx.config.bm25_k1 + 1)
                 denominator = (
-                    tf + self.config.bm25_k1 * (
-                        1 - self.config.bm25_b + 
-                        self.config.bm25_b * (doc_length / self.average_document_length)
+                    tf + ctx.config.bm25_k1 * (
+                        1 - ctx.config.bm25_b + 
+                        ctx.config.bm25_b * (doc_length / ctx.average_document_length)
                     )
                 )
                 
@@ -523,10 +765,10 @@ class HybridSearchService:
         
         return score
     
-    async def _update_document_statistics(self, documents: List[Dict[str, Any]]):
-        """Update document statistics for BM25 calculation."""
-        self.total_documents = len(documents)
-        self.document_frequencies.clear()
+    async def _update_document_statistics(self, documents: List[Dict[str, Any]], ctx: SearchContext):
+        """Compute document statistics for BM25 calculation into the query's context."""
+        ctx.total_documents = len(documents)
+        ctx.document_frequencies.clear()
         
         doc_lengths = []
         all_terms = set()
@@ -541,13 +783,13 @@ class HybridSearchService:
             all_terms.update(unique_terms)
             
             for term in unique_terms:
-                self.document_frequencies[term] = self.document_frequencies.get(term, 0) + 1
+                ctx.document_frequencies[term] = ctx.document_frequencies.get(term, 0) + 1
         
         # Calculate average document length
-        self.average_document_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0
+        ctx.average_document_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0
         
-        logger.debug(f"Updated statistics: {self.total_documents} docs, "
-                    f"avg length: {self.average_document_length:.1f}")
+        logger.debug(f"Updated statistics: {ctx.total_documents} docs, "
+                    f"avg length: {ctx.average_document_length:.1f}")
     
     def _find_matched_keywords(
         self, 
@@ -577,9 +819,11 @@ class HybridSearchService:
         self,
         semantic_results: List[SearchResult],
         keyword_results: List[SearchResult],
-        query: str
+        query: str,
+        config: Optional[HybridSearchConfig] = None
     ) -> List[SearchResult]:
         """Merge and deduplicate results from different search methods."""
+        config = config or self.config
         # Create lookup for existing results
         result_map = {}
         
@@ -596,6 +840,8 @@ class HybridSearchService:
                 existing.matched_keywords = kw_result.matched_keywords
                 existing.keyword_positions = kw_result.keyword_positions
                 existing.search_types.append(SearchType.KEYWORD)
+                if existing.embedding is None:
+                    existing.embedding = kw_result.embedding
                 
                 # Update confidence based on multiple signals
                 existing.confidence_score = max(
@@ -611,8 +857,8 @@ class HybridSearchService:
         for result in result_map.values():
             # Calculate hybrid score
             result.hybrid_score = (
-                result.semantic_score * self.config.semantic_weight +
-                result.keyword_score * self.config.keyword_weight
+                result.semantic_score * config.semantic_weight +
+                result.keyword_score * config.keyword_weight
             )
             
             # Add quality bonuses
@@ -703,40 +949,49 @@ class HybridSearchService:
     async def _cross_encoder_rerank(
         self,
         results: List[SearchResult],
-        query: str
+        query: str,
+        config: Optional[HybridSearchConfig] = None
     ) -> List[SearchResult]:
         """Re-rank results using cross-encoder model."""
+        config = config or self.config
         if not self.cross_encoder or not results:
             logger.debug("Cross-encoder not available or no results to re-rank")
             return results
         
         try:
-            # Prepare query-document pairs for cross-encoder
-            pairs = []
-            for result in results:
-                # Limit text length for cross-encoder
-                text_snippet = result.text[:512]
-                pairs.append([query, text_snippet])
-            
-            # Get cross-encoder scores
-            ce_scores = self.cross_encoder.predict(pairs)
-            
+            # Only the head of the merged list (sorted by hybrid score) is cross-encoded
+            head = results[:config.cross_encoder_top_k] if config.cross_encoder_top_k > 0 else results
+            tail = results[len(head):]
+
+            # Scored on the rerank inference thread (batched across queries, cached per pair)
+            ce_scores = await self.reranker.score(
+                query, [(result.chunk_id, result.text) for result in head]
+            )
+
             # Update results with cross-encoder scores
-            for i, result in enumerate(results):
+            for i, result in enumerate(head):
                 result.cross_encoder_score = float(ce_scores[i])
                 
                 # Calculate final score combining hybrid and cross-encoder
                 result.final_score = (
-                    result.hybrid_score * (1 - self.config.cross_encoder_weight) +
-                    result.cross_encoder_score * self.config.cross_encoder_weight
+                    result.hybrid_score * (1 - config.cross_encoder_weight) +
+                    result.cross_encoder_score * config.cross_encoder_weight
                 )
                 
                 result.search_types.append(SearchType.CROSS_ENCODED)
-            
+
+            # The unscored tail ranks as if it had the head's lowest cross-encoder score
+            floor = float(ce_scores.min())
+            for result in tail:
+                result.final_score = (
+                    result.hybrid_score * (1 - config.cross_encoder_weight) +
+                    floor * config.cross_encoder_weight
+                )
+
             # Re-sort by final score
             results.sort(key=lambda x: x.final_score, reverse=True)
             
-            logger.debug(f"Cross-encoder re-ranked {len(results)} results")
+            logger.debug(f"Cross-encoder re-ranked {len(head)} of {len(results)} results")
             return results
             
         except Exception as e:
@@ -746,31 +1001,84 @@ class HybridSearchService:
                 result.final_score = result.hybrid_score
             return results
     
+    async def _attach_missing_vectors(self, ctx: SearchContext, results: List[SearchResult]) -> None:
+        """Fetch stored vectors for results retrieved without them (one retrieve call, no inference)."""
+        missing = [result for result in results if result.embedding is None]
+        if not missing:
+            return
+
+        try:
+            organization_id = await self._context_organization_id(ctx)
+            if not organization_id:
+                return
+            points = await multi_tenant_vector_store.get_points(
+                organization_id=organization_id,
+                point_ids=[result.chunk_id for result in missing],
+                with_payload=False,
+                with_vectors=self._result_vectors_selector()
+            )
+        except Exception as e:
+            logger.warning(f"Could not fetch stored vectors for diversity: {e}")
+            return
+
+        vectors = {point['id']: point['vector'] for point in points}
+        for result in missing:
+            result.embedding = self._stored_vector(vectors.get(result.chunk_id))
+
+    def _result_vectors_selector(self) -> Union[bool, List[str]]:
+        """with_vectors argument returning only the stored vector used for reranking and MMR."""
+        return [self.result_vector_name] if self.result_vector_name else True
+
+    def _stored_vector(self, vector: Any) -> Optional[np.ndarray]:
+        """Extract the result vector from a Qdrant point vector (named dict or plain list)."""
+        if isinstance(vector, dict):
+            vector = vector.get(self.result_vector_name)
+        if vector is None or len(vector) == 0:
+            return None
+        return np.asarray(vector, dtype=np.float32)
+
+    def _result_similarity(self, results: List[SearchResult]) -> ResultSimilarity:
+        """Cosine similarity matrix over the results' stored vectors."""
+        has_vector = np.array([result.embedding is not None for result in results])
+        matrix = np.zeros((len(results), len(results)), dtype=np.float32)
+        if has_vector.any():
+            indices = np.flatnonzero(has_vector)
+            embeddings = np.stack([results[i].embedding for i in indices])
+            matrix[np.ix_(indices, indices)] = self._cosine_similarity_matrix(embeddings)
+        return ResultSimilarity(
+            chunk_index={result.chunk_id: i for i, result in enumerate(results)},
+            matrix=matrix,
+            has_vector=has_vector
+        )
+
     async def _optimize_final_results(
         self,
         results: List[SearchResult],
-        query: str
+        query: str,
+        config: Optional[HybridSearchConfig] = None,
+        ctx: Optional[SearchContext] = None
     ) -> List[SearchResult]:
         """Optimize final results for diversity and quality."""
+        config = config or self.config
         if not results:
             return results
         
         # Filter low-quality results
-        if self.config.filter_low_quality:
+        if config.filter_low_quality:
             filtered_results = [
                 r for r in results 
-                if r.confidence_score >= self.config.min_confidence_score
+                if r.confidence_score >= config.min_confidence_score
             ]
             if filtered_results:
                 results = filtered_results
         
         # Apply diversity optimization
-        diverse_results = await self._diversify_results(results, query)
+        diverse_results = await self._diversify_results(results, query, config, ctx)
         
         # Final ranking with diversity boost
         for i, result in enumerate(diverse_results):
             # Add small diversity boost based on position
-            diversity_boost = self.config.diversity_boost * (1.0 - i / len(diverse_results))
+            diversity_boost = config.diversity_boost * (1.0 - i / len(diverse_results))
             result.final_score += diversity_boost
             
             # Calculate source diversity
@@ -778,7 +1086,7 @@ class HybridSearchService:
         
         # Final sort and limit
         diverse_results.sort(key=lambda x: x.final_score, reverse=True)
-        final_results = diverse_results[:self.config.final_result_count]
+        final_results = diverse_results[:config.final_result_count]
         
         logger.debug(f"Optimized to {len(final_results)} final results")
         return final_results
@@ -786,47 +1094,69 @@ class HybridSearchService:
     async def _diversify_results(
         self,
         results: List[SearchResult],
-        query: str
+        query: str,
+        config: Optional[HybridSearchConfig] = None,
+        ctx: Optional[SearchContext] = None
     ) -> List[SearchResult]:
-        """Apply diversity optimization to avoid redundant results."""
+        """
+        Select a relevant, non-redundant result set with Maximal Marginal Relevance.
+
+        Works on the stored chunk vectors returned with the search results, so no
+        model inference happens here. Each step picks the candidate maximizing
+        lambda * relevance - (1 - lambda) * max similarity to the selected set;
+        candidates above diversity_similarity_threshold to any selected result
+        are dropped as duplicates. Results without a stored vector compete on
+        relevance alone.
+        """
+        config = config or self.config
         if not results or len(results) <= 1:
             return results
 
-        # Simple diversity based on content similarity
-        if self.sentence_transformer:
-            try:
-                # Get embeddings for result texts
-                texts = [r.text[:200] for r in results]  # Limit length
-                # Run blocking sentence transformer in thread pool to avoid blocking event loop
-                embeddings = await asyncio.to_thread(self.sentence_transformer.encode, texts)
-
-                # SIMPLIFIED: Just filter out highly similar consecutive results
-                # This is much faster than full MMR and good enough for our use case
-                diverse_results = [results[0]]  # Always keep the best result
-                selected_indices = [0]  # Track indices of selected results
-
-                for i in range(1, len(results)):
-                    # Check similarity to all selected results
-                    is_diverse = True
-                    for selected_idx in selected_indices:
-                        sim = self._cosine_similarity(embeddings[i], embeddings[selected_idx])
-
-                        # If too similar to any selected result, skip it
-                        if sim > self.config.diversity_similarity_threshold:
-                            is_diverse = False
-                            break
-
-                    if is_diverse:
-                        diverse_results.append(results[i])
-                        selected_indices.append(i)
-
-                return diverse_results
-                
-            except Exception as e:
-                logger.error(f"Diversity optimization failed: {e}")
-        
+        try:
+            similarity = self._result_similarity(results)
+            if ctx is not None:
+                ctx.similarity = similarity
+            selected = self._mmr_select(results, similarity, config)
+            return [results[i] for i in selected]
+
+        except Exception as e:
+            logger.error(f"Diversity optimization failed: {e}")
+
         # Fallback: return results as-is
         return results
+
+    @staticmethod
+    def _mmr_select(
+        results: List[SearchResult],
+        similarity: ResultSimilarity,
+        config: HybridSearchConfig
+    ) -> List[int]:
+        """Indices chosen by MMR, in selection order."""
+        scores = np.array([r.final_score for r in results], dtype=np.float32)
+        if not scores.any():
+            scores = np.array([r.hybrid_score for r in results], dtype=np.float32)
+        span = float(scores.max() - scores.min())
+        if span > 0:
+            relevance = (scores - scores.min()) / span
+        else:
+            # No score signal: keep the incoming rank order as relevance
+            relevance = 1.0 - np.arange(len(results), dtype=np.float32) / len(results)
+
+        lam = config.mmr_lambda
+        limit = min(len(results), config.final_result_count)
+        available = np.ones(len(results), dtype=bool)
+        max_similarity = np.zeros(len(results), dtype=np.float32)
+        selected: List[int] = []
+
+        while len(selected) < limit and available.any():
+            mmr = np.where(available, lam * relevance - (1 - lam) * max_similarity, -np.inf)
+            best = int(np.argmax(mmr))
+            selected.append(best)
+            available[best] = False
+            max_similarity = np.maximum(max_similarity, similarity.matrix[best])
+            available &= max_similarity <= config.diversity_similarity_threshold
+
+        return selected
     
     # Utility and metrics methods
     
@@ -840,7 +1170,11 @@ class HybridSearchService:
         keyword_ids = set(r.chunk_id for r in keyword_results)
         return len(semantic_ids.intersection(keyword_ids))
     
-    async def _calculate_diversity_score(self, results: List[SearchResult]) -> float:
+    async def _calculate_diversity_score(
+        self,
+        results: List[SearchResult],
+        ctx: Optional[SearchContext] = None
+    ) -> float:
         """Calculate diversity score for result set."""
         if len(results) <= 1:
             return 0.0
@@ -852,25 +1186,23 @@ class HybridSearchService:
 
         type_diversity = len(search_types) / 4.0  # Max 4 search types
 
-        # Content diversity (if embeddings available)
+        # Content diversity from the stored vectors (reuses the MMR similarity matrix when available)
         content_diversity = 0.5  # Default
-        if self.sentence_transformer and len(results) > 1:
-            try:
-                texts = [r.text[:100] for r in results[:10]]  # Sample for performance
-                # Run blocking sentence transformer in thread pool
-                embeddings = await asyncio.to_thread(self.sentence_transformer.encode, texts)
-                
-                similarities = []
-                for i in range(len(embeddings)):
-                    for j in range(i + 1, len(embeddings)):
-                        sim = self._cosine_similarity(embeddings[i], embeddings[j])
-                        similarities.append(sim)
-                
-                avg_similarity = sum(similarities) / len(similarities)
-                content_diversity = 1.0 - avg_similarity
-                
-            except Exception:
-                pass
+        try:
+            subset = ctx.similarity.submatrix(results) if ctx is not None and ctx.similarity else None
+            if subset is None:
+                subset = self._result_similarity(results).submatrix(results)
+            similarity_matrix, has_vector = subset
+
+            # Mean over unique pairs that both have vectors (upper triangle, excluding the diagonal)
+            upper_i, upper_j = np.triu_indices(len(similarity_matrix), k=1)
+            pairs = has_vector[upper_i] & has_vector[upper_j]
+            if pairs.any():
+                avg_similarity = float(similarity_matrix[upper_i[pairs], upper_j[pairs]].mean())
+                content_diversity = min(max(1.0 - avg_similarity, 0.0), 1.0)
+
+        except Exception:
+            pass
         
         return (type_diversity + content_diversity) / 2
     
@@ -893,14 +1225,28 @@ class HybridSearchService:
     
     def _cosine_similarity(self, a, b) -> float:
         """Calculate cosine similarity between vectors."""
-        import numpy as np
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        a = np.asarray(a, dtype=np.float32)
+        b = np.asarray(b, dtype=np.float32)
+        denominator = np.linalg.norm(a) * np.linalg.norm(b)
+        if denominator == 0:
+            return 0.0
+        return float(np.dot(a, b) / denominator)
+
+    @staticmethod
+    def _cosine_similarity_matrix(embeddings: np.ndarray) -> np.ndarray:
+        """Calculate pairwise cosine similarity between rows of an (n, d) array."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        normalized = embeddings / norms
+        return normalized @ normalized.T
     
     def _log_search_statistics(self, pipeline: SearchPipeline):
         """Log detailed search statistics."""
         logger.info("Hybrid Search Statistics:")
         logger.info(f"  Query: '{pipeline.query}'")
         logger.info(f"  Processing time: {pipeline.processing_time_ms}ms")
+        logger.info(f"  Stage timings (ms): {pipeline.stage_timings_ms}")
         logger.info(f"  Semantic results: {pipeline.semantic_result_count}")
         logger.info(f"  Keyword results: {pipeline.keyword_result_count}")
         logger.info(f"  Result overlap: {pipeline.overlap_count}")
@@ -916,31 +1262,25 @@ class HybridSearchService:
     async def _fallback_search(
         self, 
         query: str, 
-        project_id: str
+        project_id: str,
+        config: Optional[HybridSearchConfig] = None
     ) -> SearchPipeline:
         """Fallback to simple semantic search if hybrid search fails."""
+        config = config or self.config
         logger.warning("Using fallback search for hybrid service")
         
         try:
             # Simple semantic search
-            embedding = await embedding_service.generate_embedding(query)
+            embedding = (await embedding_service.encode_array([query]))[0]
             # Get organization_id for fallback
-            from db.database import get_db
-            organization_id = None
-            async for session in get_db():
-                project = await session.get(Project, project_id)
-                if project:
-                    organization_id = str(project.organization_id)
-                break
-
+            organization_id = await self._get_organization_id(project_id)
             if not organization_id:
-                logger.error(f"Could not determine organization for project {sanitize_for_log(project_id)}")
                 return []
 
             results = await multi_tenant_vector_store.search_vectors(
                 organization_id=organization_id,
                 query_vector=embedding,
-                limit=self.config.final_result_count,
+                limit=config.final_result_count,
                 score_threshold=0.1,
                 filter_dict={"project_id": project_id}
             )
@@ -961,7 +1301,7 @@ class HybridSearchService:
             
             return SearchPipeline(
                 query=query,
-                config=self.config,
+                config=config,
                 semantic_results=search_results,
                 keyword_results=[],
                 merged_results=search_results,
@@ -8,7 +8,6 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict
 from enum import Enum
 
-from sentence_transformers import SentenceTransformer
 import numpy as np
 
 from utils.logger import get_logger
@@ -17,6 +16,7 @@ from services.transcription.advanced_transcript_parser import (
     DecisionPoint, ActionItem, advanced_transcript_processor
 )
 from services.rag.chunking_service import TextChunk, ChunkingService
+from services.rag.model_registry import shared_sentence_transformer
 
 logger = get_logger(__name__)
 
@@ -117,13 +117,15 @@ class ChunkingStrategy:
 
 class IntelligentChunkingService:
     """Advanced chunking service with meeting intelligence awareness."""
+
+    # Sentence transformer for semantic analysis (shared process-wide, loaded on first use)
+    sentence_transformer = shared_sentence_transformer()
     
     def __init__(self, strategy: Optional[ChunkingStrategy] = None):
         """Initialize intelligent chunking service with EmbeddingGemma optimization."""
         from config import get_settings
         self.settings = get_settings()
         self.strategy = strategy or ChunkingStrategy()
-        self.sentence_transformer = None
 
         # Use larger chunk sizes optimized for EmbeddingGemma
         self.fallback_chunker = ChunkingService(
@@ -135,9 +137,6 @@ class IntelligentChunkingService:
         self.use_mrl_for_coherence = self.settings.enable_mrl
         self.coherence_dimension = 256  # Use 256d for fast coherence checks
         
-        # Initialize sentence transformer for semantic analysis
-        self._initialize_models()
-        
         # Content type patterns
         self.decision_patterns = [
             r'\b(decided|decision|choose|selected|approved|agreed|concluded|resolved)\b',
@@ -154,19 +153,6 @@ class IntelligentChunkingService:
             r'\b(question|concern|issue|point|idea)\b'
         ]
     
-    def _initialize_models(self):
-        """Initialize ML models for semantic analysis."""
-        try:
-            self.sentence_transformer = SentenceTransformer(
-                self.settings.sentence_transformer_model,
-                token=self.settings.hf_token,
-                trust_remote_code=True
-            )
-            logger.info("Initialized SentenceTransformer for intelligent chunking")
-        except Exception as e:
-            logger.warning(f"Failed to initialize SentenceTransformer: {e}")
-            self.sentence_transformer = None
-
     async def chunk_meeting_content(
         self,
         transcript_analysis: AdvancedTranscriptAnalysis,
@@ -325,46 +311,68 @@ class IntelligentChunkingService:
         logger.debug(f"Created {len(chunks)} content-type chunks")
         return chunks
 
+    async def _embed_turns(self, analysis: AdvancedTranscriptAnalysis) -> Optional[np.ndarray]:
+        """
+        Embed all speaker turns in one batch for semantic analysis.
+
+        With MRL enabled the turns are encoded once at the coherence dimension;
+        otherwise the sentence transformer is used if available.
+
+        Args:
+            analysis: Advanced analysis of meeting transcript
+
+        Returns:
+            Unit-normalized (n_turns, dim) float32 array, or None if no embedding method is available
+        """
+        turn_texts = [turn.text for turn in analysis.speaker_turns]
+        if not turn_texts:
+            return None
+
+        try:
+            if self.use_mrl_for_coherence:
+                # Import embedding service for MRL support
+                from services.rag.embedding_service import embedding_service
+
+                embeddings = await embedding_service.encode_array(
+                    turn_texts, dimension=self.coherence_dimension
+                )
+                logger.debug(f"Embedded {len(turn_texts)} turns at {self.coherence_dimension}d MRL")
+            elif self.sentence_transformer:
+                # Fallback to sentence transformer if available
+                embeddings = np.asarray(self.sentence_transformer.encode(turn_texts), dtype=np.float32)
+            else:
+                logger.warning("No embedding method available, using basic chunking")
+                return None
+        except Exception as e:
+            logger.error(f"Speaker turn embedding failed: {e}")
+            return None
+
+        # Truncated MRL vectors are not unit length; normalize so row dot products are cosines
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+
+    @staticmethod
+    def _consecutive_similarities(turn_embeddings: np.ndarray) -> np.ndarray:
+        """Cosine similarity of each turn with the next (unit-normalized rows), shape (n_turns - 1,)."""
+        return np.einsum('ij,ij->i', turn_embeddings[:-1], turn_embeddings[1:])
+
     async def _detect_semantic_boundaries(
         self,
         analysis: AdvancedTranscriptAnalysis,
-        base_chunks: List[IntelligentChunk]
+        base_chunks: List[IntelligentChunk],
+        turn_embeddings: Optional[np.ndarray] = None
     ) -> List[IntelligentChunk]:
         """Detect semantic boundaries using MRL for fast processing."""
         try:
-            # Import embedding service for MRL support
-            from services.rag.embedding_service import embedding_service
-
-            # Get embeddings for all speaker turns using MRL for speed
-            turn_texts = [turn.text for turn in analysis.speaker_turns]
+            if turn_embeddings is None:
+                turn_embeddings = await self._embed_turns(analysis)
+            if turn_embeddings is None:
+                return base_chunks
 
-            # Use MRL with reduced dimensions for fast coherence checking
-            if self.use_mrl_for_coherence:
-                # Generate 256d embeddings for fast semantic analysis
-                embeddings = []
-                for text in turn_texts:
-                    embedding = await embedding_service.generate_embedding_mrl(
-                        text, dimension=self.coherence_dimension
-                    )
-                    embeddings.append(embedding)
-                logger.debug(f"Using {self.coherence_dimension}d MRL for semantic boundaries")
-            else:
-                # Fallback to sentence transformer if available
-                if self.sentence_transformer:
-                    embeddings = self.sentence_transformer.encode(turn_texts)
-                else:
-                    logger.warning("No embedding method available, using basic chunking")
-                    return base_chunks
-
-            # Calculate semantic similarity between consecutive turns
-            boundaries = []
-            for i in range(len(embeddings) - 1):
-                similarity = self._cosine_similarity(embeddings[i], embeddings[i + 1])
-
-                # Low similarity indicates potential boundary
-                # With higher threshold for better coherence
-                if similarity < self.strategy.semantic_threshold:
-                    boundaries.append(i + 1)  # Boundary after turn i
+            # Low similarity between consecutive turns indicates a potential boundary
+            # (after turn i), with higher threshold for better coherence
+            similarities = self._consecutive_similarities(turn_embeddings)
+            boundaries = (np.flatnonzero(similarities < self.strategy.semantic_threshold) + 1).tolist()
 
             # Refine chunks based on semantic boundaries
             refined_chunks = await self._refine_chunks_with_boundaries(
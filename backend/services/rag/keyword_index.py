@@ -0,0 +1,464 @@
+"""
+Persistent Per-Project Keyword Index for BM25
+
+Inverted index stored in Redis so ingestion (RQ workers) and search (API)
+share it and it survives restarts.
+
+Key layout (prefix "kwidx:{organization_id}:{project_id}"):
+- :tf:{term}   hash  chunk_id -> term frequency (postings)
+- :len         hash  chunk_id -> document length in tokens
+- :terms       hash  chunk_id -> space-separated unique terms (for removal)
+- :stats       hash  n (documents), total_len (tokens)
+- :built       flag  set once the index covers every chunk in the project
+
+Chunks are added and removed by ContentService alongside their vectors;
+an organization's keys are dropped by the callers that delete its
+collections. Projects ingested before the index existed are backfilled
+from Qdrant on first search.
+
+A failed write clears the built flag so the next search rebuilds the
+project. Writes missed while Redis was unreachable cannot clear it, so the
+flag also expires after BUILT_TTL_SECONDS and the rebuild reconciles the
+index with the project's chunks.
+"""
+
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from config import get_settings
+from services.cache.redis_client import LazyRedisClient
+from utils.logger import get_logger, sanitize_for_log
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Attempts for an optimistic (WATCH) update before giving up
+WATCH_RETRIES = 5
+
+# Lifetime of the built flag; an expired flag makes the next search rebuild the project
+BUILT_TTL_SECONDS = 24 * 3600
+
+# Chunks per transaction when rebuilding a project index
+REBUILD_BATCH_SIZE = 500
+
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'what', 'when', 'where', 'who', 'how',
+    'regarding', 'about', 're', 'subject'
+})
+
+_NON_WORD = re.compile(r'[^\w\s]')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize text for keyword indexing and matching.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Lowercased tokens longer than 2 characters, stop words removed
+    """
+    tokens = _NON_WORD.sub(' ', text.lower()).split()
+    return [token for token in tokens if token not in STOP_WORDS and len(token) > 2]
+
+
+class KeywordIndex:
+    """Redis-backed inverted index with BM25 scoring per project."""
+
+    def __init__(self, enabled: bool = True, key_prefix: str = "kwidx"):
+        """
+        Initialize the keyword index.
+
+        Args:
+            enabled: Whether the index is maintained and queried
+            key_prefix: Redis key prefix
+        """
+        self.enabled = enabled
+        self.key_prefix = key_prefix
+        self._redis = LazyRedisClient(
+            "Keyword index", "keyword search will scan Qdrant",
+            decode_responses=True, socket_timeout=5
+        )
+
+    # ==================== Keys ====================
+
+    def _key(self, organization_id: str, project_id: str, *parts: str) -> str:
+        return ":".join([self.key_prefix, str(organization_id), str(project_id), *parts])
+
+    # ==================== Redis ====================
+
+    async def _invalidate_built(self, client: Redis, organization_id: str, project_id: str) -> None:
+        """Clear the built flag after a failed write so the next search rebuilds the project index."""
+        try:
+            await client.delete(self._key(organization_id, project_id, "built"))
+        except Exception as e:
+            logger.error(
+                f"Keyword index for project {sanitize_for_log(project_id)} may be missing chunks "
+                f"until it is rebuilt: {e}"
+            )
+
+    # ==================== Maintenance ====================
+
+    async def add_documents(
+        self,
+        organization_id: str,
+        project_id: str,
+        documents: Iterable[Tuple[str, str]]
+    ) -> Optional[int]:
+        """
+        Index chunks for a project (chunks already indexed are skipped).
+
+        The existence check and the postings/stats writes run in one WATCHed
+        transaction, so concurrent adds of the same chunk count it once. If
+        the add fails, the project's built flag is cleared so the next search
+        rebuilds the index instead of silently missing these chunks.
+
+        Args:
+            organization_id: Organization ID
+            project_id: Project ID
+            documents: (chunk_id, text) pairs
+
+        Returns:
+            Number of chunks added, or None when the index is unavailable or
+            the write failed
+        """
+        if not self.enabled:
+            return None
+        client = await self._redis.get()
+        if client is None:
+            return None
+
+        # Tokenize once, outside the transaction (last text wins for repeated chunk IDs)
+        term_counts_by_chunk = {
+            chunk_id: Counter(tokenize(text or "")) for chunk_id, text in documents
+        }
+        if not term_counts_by_chunk:
+            return 0
+        chunk_ids = list(term_counts_by_chunk)
+
+        len_key = self._key(organization_id, project_id, "len")
+        try:
+            for _ in range(WATCH_RETRIES):
+                async with client.pipeline(transaction=True) as pipe:
+                    try:
+                        await pipe.watch(len_key)
+                        existing = await pipe.hmget(len_key, chunk_ids)
+
+                        pipe.multi()
+                        added = 0
+                        total_len = 0
+                        for chunk_id, indexed in zip(chunk_ids, existing):
+                            if indexed is not None:
+                                continue
+                            term_counts = term_counts_by_chunk[chunk_id]
+                            doc_len = sum(term_counts.values())
+                            for term, tf in term_counts.items():
+                                pipe.hset(self._key(organization_id, project_id, "tf", term), chunk_id, tf)
+                            pipe.hset(len_key, chunk_id, doc_len)
+                            pipe.hset(self._key(organization_id, project_id, "terms"), chunk_id, " ".join(term_counts))
+                            added += 1
+                            total_len += doc_len
+
+                        if added:
+                            stats_key = self._key(organization_id, project_id, "stats")
+                            pipe.hincrby(stats_key, "n", added)
+                            pipe.hincrby(stats_key, "total_len", total_len)
+                            await pipe.execute()
+                    except WatchError:
+                        # Another writer changed the project's documents; re-check and retry
+                        continue
+
+                logger.debug(f"Keyword index: added {added} chunks for project {sanitize_for_log(project_id)}")
+                return added
+
+            logger.warning(f"Keyword index: gave up adding chunks for project {sanitize_for_log(project_id)} after {WATCH_RETRIES} conflicts")
+            await self._invalidate_built(client, organization_id, project_id)
+            return None
+        except Exception as e:
+            await self._invalidate_built(client, organization_id, project_id)
+            self._redis.drop(e)
+            return None
+
+    async def remove_documents(
+        self,
+        organization_id: str,
+        project_id: str,
+        chunk_ids: Sequence[str]
+    ) -> Optional[int]:
+        """
+        Remove chunks from a project's postings.
+
+        If the removal fails, the project's built flag is cleared so the next
+        search rebuilds the index instead of keeping stale postings.
+
+        Args:
+            organization_id: Organization ID
+            project_id: Project ID
+            chunk_ids: Chunk (point) IDs to remove
+
+        Returns:
+            Number of chunks removed, or None when the index is unavailable or
+            the write failed
+        """
+        if not self.enabled:
+            return None
+        if not chunk_ids:
+            return 0
+        client = await self._redis.get()
+        if client is None:
+            return None
+
+        chunk_ids = list(dict.fromkeys(chunk_ids))
+        len_key = self._key(organization_id, project_id, "len")
+        terms_key = self._key(organization_id, project_id, "terms")
+        try:
+            for _ in range(WATCH_RETRIES):
+                async with client.pipeline(transaction=True) as pipe:
+                    try:
+                        # Same WATCHed transaction as add_documents, so stats are decremented once
+                        await pipe.watch(len_key)
+                        lengths = await pipe.hmget(len_key, chunk_ids)
+                        terms = await pipe.hmget(terms_key, chunk_ids)
+
+                        pipe.multi()
+                        removed = 0
+                        total_len = 0
+                        for chunk_id, doc_len, doc_terms in zip(chunk_ids, lengths, terms):
+                            if doc_len is None:
+                                continue
+                            for term in (doc_terms or "").split():
+                                pipe.hdel(self._key(organization_id, project_id, "tf", term), chunk_id)
+                            pipe.hdel(len_key, chunk_id)
+                            pipe.hdel(terms_key, chunk_id)
+                            removed += 1
+                            total_len += int(doc_len)
+
+                        if removed:
+                            stats_key = self._key(organization_id, project_id, "stats")
+                            pipe.hincrby(stats_key, "n", -removed)
+                            pipe.hincrby(stats_key, "total_len", -total_len)
+                            await pipe.execute()
+                    except WatchError:
+                        continue
+
+                logger.debug(f"Keyword index: removed {removed} chunks for project {sanitize_for_log(project_id)}")
+                return removed
+
+            logger.warning(f"Keyword index: gave up removing chunks for project {sanitize_for_log(project_id)} after {WATCH_RETRIES} conflicts")
+            await self._invalidate_built(client, organization_id, project_id)
+            return None
+        except Exception as e:
+            await self._invalidate_built(client, organization_id, project_id)
+            self._redis.drop(e)
+            return None
+
+    async def rebuild(
+        self,
+        organization_id: str,
+        project_id: str,
+        documents: Sequence[Tuple[str, str]]
+    ) -> bool:
+        """
+        Reconcile a project index with its chunks and mark it built.
+
+        Indexed chunks that are no longer in the project are removed and
+        missing chunks are added in batches of REBUILD_BATCH_SIZE, so each
+        transaction stays small. The built flag is set only if every write
+        succeeded.
+
+        Args:
+            organization_id: Organization ID
+            project_id: Project ID
+            documents: (chunk_id, text) pairs for every chunk in the project
+
+        Returns:
+            True if the index now covers the project
+        """
+        if not self.enabled:
+            return False
+        client = await self._redis.get()
+        if client is None:
+            return False
+
+        try:
+            indexed = await client.hkeys(self._key(organization_id, project_id, "len"))
+        except Exception as e:
+            self._redis.drop(e)
+            return False
+
+        current = {chunk_id for chunk_id, _ in documents}
+        stale = [chunk_id for chunk_id in indexed if chunk_id not in current]
+        if stale and await self.remove_documents(organization_id, project_id, stale) is None:
+            return False
+
+        for start in range(0, len(documents), REBUILD_BATCH_SIZE):
+            batch = documents[start:start + REBUILD_BATCH_SIZE]
+            if await self.add_documents(organization_id, project_id, batch) is None:
+                return False
+
+        return await self.mark_built(organization_id, project_id)
+
+    async def remove_organization(self, organization_id: str) -> int:
+        """
+        Drop every project index for an organization.
+
+        Returns:
+            Number of Redis keys deleted
+        """
+        client = await self._redis.get()
+        if client is None:
+            return 0
+
+        deleted = 0
+        try:
+            batch: List[str] = []
+            async for key in client.scan_iter(match=f"{self.key_prefix}:{organization_id}:*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += await client.delete(*batch)
+            return deleted
+        except Exception as e:
+            self._redis.drop(e)
+            return deleted
+
+    async def is_built(self, organization_id: str, project_id: str) -> Optional[bool]:
+        """
+        Whether the project index covers every chunk.
+
+        Returns:
+            True/False, or None when the index is unavailable
+        """
+        if not self.enabled:
+            return None
+        client = await self._redis.get()
+        if client is None:
+            return None
+        try:
+            return bool(await client.exists(self._key(organization_id, project_id, "built")))
+        except Exception as e:
+            self._redis.drop(e)
+            return None
+
+    async def mark_built(self, organization_id: str, project_id: str) -> bool:
+        """Record that the project index covers every chunk, for BUILT_TTL_SECONDS."""
+        client = await self._redis.get()
+        if client is None:
+            return False
+        try:
+            await client.set(
+                self._key(organization_id, project_id, "built"), int(time.time()), ex=BUILT_TTL_SECONDS
+            )
+            return True
+        except Exception as e:
+            self._redis.drop(e)
+            return False
+
+    # ==================== Query ====================
+
+    async def search(
+        self,
+        organization_id: str,
+        project_id: str,
+        query_terms: Sequence[str],
+        limit: int,
+        k1: float = 1.2,
+        b: float = 0.5
+    ) -> Optional[List[Tuple[str, float, List[str]]]]:
+        """
+        Score chunks with BM25 using postings lookups only.
+
+        Args:
+            organization_id: Organization ID
+            project_id: Project ID
+            query_terms: Tokenized query terms
+            limit: Maximum results
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+
+        Returns:
+            (chunk_id, score, matched_terms) sorted by score, or None when the
+            index is unavailable
+        """
+        if not self.enabled:
+            return None
+        client = await self._redis.get()
+        if client is None:
+            return None
+
+        terms = list(dict.fromkeys(query_terms))
+        if not terms:
+            return []
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.hgetall(self._key(organization_id, project_id, "stats"))
+            for term in terms:
+                pipe.hgetall(self._key(organization_id, project_id, "tf", term))
+            stats, *postings = await pipe.execute()
+
+            total_documents = int(stats.get("n", 0)) if stats else 0
+            if total_documents <= 0:
+                return []
+            average_length = max(int(stats.get("total_len", 0)) / total_documents, 1.0)
+
+            candidates = sorted({chunk_id for posting in postings for chunk_id in posting})
+            if not candidates:
+                return []
+            lengths = await client.hmget(self._key(organization_id, project_id, "len"), candidates)
+            doc_lengths = {chunk_id: int(length or 0) for chunk_id, length in zip(candidates, lengths)}
+
+            scores: Dict[str, float] = defaultdict(float)
+            matched: Dict[str, List[str]] = defaultdict(list)
+            for term, posting in zip(terms, postings):
+                if not posting:
+                    continue
+                idf = math.log((total_documents + 1) / (len(posting) + 1))
+                for chunk_id, tf in posting.items():
+                    tf = int(tf)
+                    norm = k1 * (1 - b + b * doc_lengths.get(chunk_id, 0) / average_length)
+                    scores[chunk_id] += idf * (tf * (k1 + 1)) / (tf + norm)
+                    matched[chunk_id].append(term)
+
+            ranked = sorted(
+                ((chunk_id, score) for chunk_id, score in scores.items() if score > 0),
+                key=lambda item: item[1],
+                reverse=True
+            )[:limit]
+            return [(chunk_id, score, matched[chunk_id]) for chunk_id, score in ranked]
+        except Exception as e:
+            self._redis.drop(e)
+            return None
+
+    async def get_stats(self, organization_id: str, project_id: str) -> Dict[str, Any]:
+        """Document count, average length and build state for a project index."""
+        client = await self._redis.get()
+        if client is None:
+            return {"available": False}
+        try:
+            stats = await client.hgetall(self._key(organization_id, project_id, "stats"))
+            total_documents = int(stats.get("n", 0)) if stats else 0
+            return {
+                "available": True,
+                "documents": total_documents,
+                "average_length": round(int(stats.get("total_len", 0)) / total_documents, 2) if total_documents else 0.0,
+                "built": bool(await client.exists(self._key(organization_id, project_id, "built"))),
+            }
+        except Exception as e:
+            self._redis.drop(e)
+            return {"available": False}
+
+
+# Global keyword index instance
+keyword_index = KeywordIndex(enabled=settings.enable_keyword_index)
@@ -0,0 +1,309 @@
+"""
+Process-Wide Model Registry
+
+Every ML model (SentenceTransformer, CrossEncoder, spaCy pipeline) is loaded
+at most once per process and shared by all services that need it. Entries are
+reference counted so the health endpoint can show which models are resident,
+how many services hold them and their approximate size.
+
+The API preloads the service models in a thread pool at startup
+(preload_shared_models) and releases them at shutdown, so no request loads a
+model on the event loop. Elsewhere (RQ workers, scripts) a model is loaded on
+first access.
+
+The embedding model is loaded through EmbeddingService (cache directories,
+ONNX backends), so services asking for the same model ID share the exact
+instance the embedding pipeline uses.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from config import get_settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class _ModelEntry:
+    """A loaded model and its bookkeeping."""
+    key: str
+    kind: str
+    model: Any
+    refcount: int
+    load_time_ms: float
+    loaded_at: float
+    memory_bytes: Optional[int]
+
+
+def estimate_model_memory(model: Any) -> Optional[int]:
+    """
+    Approximate resident size of a model's weights in bytes.
+
+    Sums parameters and buffers of torch modules (directly or via a wrapped
+    ``.model``). Returns None for models without inspectable tensors
+    (spaCy pipelines, ONNX sessions).
+    """
+    for candidate in (model, getattr(model, "model", None)):
+        if candidate is None or not hasattr(candidate, "parameters"):
+            continue
+        try:
+            total = sum(p.numel() * p.element_size() for p in candidate.parameters())
+            if hasattr(candidate, "buffers"):
+                total += sum(b.numel() * b.element_size() for b in candidate.buffers())
+            return int(total)
+        except Exception:
+            return None
+    return None
+
+
+class ModelRegistry:
+    """Loads each model key once and tracks who holds it."""
+
+    def __init__(self):
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    # ==================== Core API ====================
+
+    def acquire(self, key: str, loader: Callable[[], Any], kind: str = "model") -> Any:
+        """
+        Get a model, loading it on first request, and take a reference.
+
+        Concurrent first requests for the same key load it once; the others
+        wait and share the result. Loader exceptions propagate and nothing is
+        registered, so a later call retries.
+
+        Args:
+            key: Model identifier (e.g. "sentence-transformer:google/embeddinggemma-300m")
+            loader: Blocking function returning the loaded model
+            kind: Model type for reporting
+
+        Returns:
+            The shared model instance
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refcount += 1
+                return entry.model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refcount += 1
+                    return entry.model
+
+            logger.info(f"Loading {kind} '{key}'")
+            started = time.perf_counter()
+            model = loader()
+            entry = _ModelEntry(
+                key=key,
+                kind=kind,
+                model=model,
+                refcount=1,
+                load_time_ms=round((time.perf_counter() - started) * 1000, 1),
+                loaded_at=time.time(),
+                memory_bytes=estimate_model_memory(model)
+            )
+            with self._lock:
+                self._entries[key] = entry
+            logger.info(f"Loaded {kind} '{key}' in {entry.load_time_ms:.0f}ms")
+            return model
+
+    async def acquire_async(self, key: str, loader: Callable[[], Any], kind: str = "model") -> Any:
+        """acquire() with loading in the default thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.acquire, key, loader, kind)
+
+    def release(self, key: str) -> None:
+        """Drop a reference; the model is unloaded when nothing holds it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refcount -= 1
+            if entry.refcount <= 0:
+                del self._entries[key]
+                logger.info(f"Unloaded {entry.kind} '{key}'")
+
+    def release_model(self, model: Any) -> None:
+        """release() for the entry holding this model instance (no-op if it is not registered)."""
+        with self._lock:
+            key = next((entry.key for entry in self._entries.values() if entry.model is model), None)
+        if key is not None:
+            self.release(key)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Loaded model for a key without taking a reference (None if not loaded)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.model if entry is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Loaded models with reference counts, load times and memory estimates."""
+        with self._lock:
+            models = [
+                {
+                    "key": entry.key,
+                    "kind": entry.kind,
+                    "refcount": entry.refcount,
+                    "load_time_ms": entry.load_time_ms,
+                    "loaded_at": entry.loaded_at,
+                    "memory_mb": round(entry.memory_bytes / (1024 * 1024), 1) if entry.memory_bytes is not None else None,
+                }
+                for entry in self._entries.values()
+            ]
+        known = [m["memory_mb"] for m in models if m["memory_mb"] is not None]
+        return {
+            "loaded_models": len(models),
+            "total_memory_mb": round(sum(known), 1),
+            "models": models,
+        }
+
+    # ==================== Model types ====================
+
+    @staticmethod
+    def sentence_transformer_key(model_name: str) -> str:
+        return f"sentence-transformer:{model_name}"
+
+    def sentence_transformer(self, model_name: str) -> Any:
+        """Shared SentenceTransformer (the embedding model comes from EmbeddingService's loader)."""
+        if model_name == settings.embedding_model:
+            from services.rag.embedding_service import embedding_service
+            loader = embedding_service._load_model
+        else:
+            def loader():
+                from sentence_transformers import SentenceTransformer
+                return SentenceTransformer(model_name, token=settings.hf_token, trust_remote_code=True)
+
+        return self.acquire(self.sentence_transformer_key(model_name), loader, kind="sentence-transformer")
+
+    def cross_encoder(self, model_name: str) -> Any:
+        """Shared CrossEncoder."""
+        def loader():
+            from sentence_transformers import CrossEncoder
+            return CrossEncoder(model_name)
+
+        return self.acquire(f"cross-encoder:{model_name}", loader, kind="cross-encoder")
+
+    def spacy_model(self, model_name: str) -> Any:
+        """Shared spaCy pipeline."""
+        def loader():
+            import spacy
+            return spacy.load(model_name)
+
+        return self.acquire(f"spacy:{model_name}", loader, kind="spacy")
+
+
+class SharedModel:
+    """
+    Service attribute that resolves to a registry model on first access.
+
+    A model that fails to load resolves to None, which services already treat
+    as "feature unavailable". Assigning the attribute overrides it for that
+    instance (tests inject mocks this way).
+
+    First access loads the model synchronously; in async code resolve it
+    beforehand with resolve_async (preload_shared_models does this at startup).
+    """
+
+    def __init__(self, acquire: Callable[[Any], Any], description: str, registry: Optional[ModelRegistry] = None):
+        """
+        Args:
+            acquire: Called with the service instance; returns the model via the registry
+            description: Model description for log messages
+            registry: Registry the model is acquired from (defaults to model_registry)
+        """
+        self._acquire = acquire
+        self.description = description
+        self._registry = registry
+        self._slot = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = f"_shared_{name}"
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        if self._slot not in instance.__dict__:
+            try:
+                model = self._acquire(instance)
+            except Exception as e:
+                logger.warning(f"Failed to load {self.description}: {e}")
+                model = None
+            instance.__dict__[self._slot] = model
+        return instance.__dict__[self._slot]
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self._slot] = value
+
+    async def resolve_async(self, instance: Any) -> Any:
+        """Resolve the attribute with any loading done in the default thread pool."""
+        if self._slot in instance.__dict__:
+            return instance.__dict__[self._slot]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.__get__, instance, type(instance))
+
+    def release(self, instance: Any) -> None:
+        """Drop the instance's reference; the next access acquires the model again."""
+        model = instance.__dict__.pop(self._slot, None)
+        if model is not None:
+            (self._registry or model_registry).release_model(model)
+
+
+def _shared_models(service: Any) -> List[SharedModel]:
+    """SharedModel attributes declared on a service's class hierarchy."""
+    found: Dict[str, SharedModel] = {}
+    for cls in reversed(type(service).__mro__):
+        for name, value in vars(cls).items():
+            if isinstance(value, SharedModel):
+                found[name] = value
+    return list(found.values())
+
+
+async def preload_shared_models(*services: Any) -> None:
+    """Load every SharedModel attribute of the given services off the event loop."""
+    for service in services:
+        for shared in _shared_models(service):
+            await shared.resolve_async(service)
+
+
+def release_shared_models(*services: Any) -> None:
+    """Release every SharedModel attribute of the given services (at shutdown)."""
+    for service in services:
+        for shared in _shared_models(service):
+            shared.release(service)
+
+
+def shared_sentence_transformer() -> SharedModel:
+    """Service attribute for the configured SentenceTransformer (settings.sentence_transformer_model)."""
+    return SharedModel(
+        lambda service: model_registry.sentence_transformer(service.settings.sentence_transformer_model),
+        "SentenceTransformer"
+    )
+
+
+def shared_cross_encoder() -> SharedModel:
+    """Service attribute for the configured CrossEncoder (settings.cross_encoder_model)."""
+    return SharedModel(
+        lambda service: model_registry.cross_encoder(service.settings.cross_encoder_model),
+        "CrossEncoder"
+    )
+
+
+def shared_spacy_model(model_name: str = "en_core_web_sm") -> SharedModel:
+    """Service attribute for a spaCy pipeline."""
+    return SharedModel(lambda service: model_registry.spacy_model(model_name), f"spaCy model '{model_name}'")
+
+
+# Global model registry instance
+model_registry = ModelRegistry()
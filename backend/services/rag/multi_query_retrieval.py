@@ -2,24 +2,30 @@
 
 import os
 import re
+import time
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Set, Union
+from dataclasses import dataclass, field
 from collections import defaultdict
 from enum import Enum
 import json
 
-import spacy
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from utils.logger import get_logger, sanitize_for_log
 from services.rag.embedding_service import embedding_service
+from services.rag.model_registry import shared_spacy_model
 from db.multi_tenant_vector_store import multi_tenant_vector_store
-from models.project import Project
+from services.cache.project_scope_cache import project_scope_cache
 
 logger = get_logger(__name__)
 
 
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since a time.perf_counter() reading."""
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
 class QueryIntent(Enum):
     """Types of query intents."""
     DECISION_LOOKUP = "decision_lookup"      # Looking for decisions made
@@ -69,6 +75,7 @@ class RetrievalResult:
     source_variation_type: str
     metadata: Dict[str, Any]
     relevance_factors: Dict[str, float]
+    embedding: Optional[np.ndarray] = field(default=None, repr=False)  # Stored chunk vector from the search
 
 
 @dataclass
@@ -82,24 +89,28 @@ class MultiQueryResults:
     coverage_score: float
     total_queries_executed: int
     best_performing_variation: str
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)
 
 
 class MultiQueryRetrievalService:
     """Service for advanced multi-query retrieval with query expansion."""
+
+    # NLP model (shared process-wide, loaded on first use)
+    nlp_model = shared_spacy_model()
     
     def __init__(self):
         """Initialize multi-query retrieval service."""
         from config import get_settings
         self.settings = get_settings()
-        self.nlp_model = None
-        self.sentence_transformer = None
         self.max_variations = 5
         self.max_results_per_query = 10
         self.similarity_threshold = self.settings.query_similarity_threshold  # Use config value
         self.deduplication_threshold = 0.9
 
-        # Organization ID cache to avoid repeated DB lookups
-        self._org_cache = {}  # project_id -> organization_id mapping
+        # Stored vector returned with search hits for deduplication and diversity (no re-encoding)
+        self.result_vector_name = (
+            f"vector_{self.settings.mrl_rerank_dimension}" if self.settings.enable_mrl else None
+        )
 
         # Query patterns for intent classification
         self.intent_patterns = {
@@ -150,63 +161,14 @@ class MultiQueryRetrievalService:
             'timeline': ['schedule', 'deadline', 'timeframe', 'duration'],
             'project': ['initiative', 'effort', 'work', 'development']
         }
-        
-        # Initialize models
-        self._initialize_models()
 
     async def _get_organization_id(self, project_id: str) -> str:
-        """Get organization ID with caching to avoid repeated DB lookups."""
-        # Check cache first
-        if project_id in self._org_cache:
-            logger.debug(f"Organization ID cache hit for project {sanitize_for_log(project_id)}")
-            return self._org_cache[project_id]
-
-        # Cache miss - fetch from database
-        logger.debug(f"Organization ID cache miss for project {sanitize_for_log(project_id)}")
-        organization_id = None
-        from db.database import get_db
-        from models.project import Project
-
-        async for session in get_db():
-            project = await session.get(Project, project_id)
-            if project:
-                organization_id = str(project.organization_id)
-                # Store in cache for future use
-                self._org_cache[project_id] = organization_id
-                logger.info(f"Cached organization {sanitize_for_log(organization_id)} for project {sanitize_for_log(project_id)}")
-            break
-
-        if not organization_id:
-            logger.error(f"Could not determine organization for project {sanitize_for_log(project_id)}")
-            raise ValueError(f"Could not determine organization for project {project_id}")
-
-        return organization_id
-
-    def _initialize_models(self):
-        """Initialize NLP models for query processing."""
+        """Get organization ID from the shared project scope cache."""
         try:
-            # Load spaCy model for NER and linguistic processing
-            try:
-                self.nlp_model = spacy.load("en_core_web_sm")
-                logger.info("Loaded spaCy model for multi-query retrieval")
-            except OSError:
-                logger.warning("spaCy model not available - entity extraction will be limited")
-                self.nlp_model = None
-            
-            # Load sentence transformer for semantic similarity
-            try:
-                self.sentence_transformer = SentenceTransformer(
-                    self.settings.sentence_transformer_model,
-                    token=self.settings.hf_token,
-                    trust_remote_code=True
-                )
-                logger.info("Loaded SentenceTransformer for query similarity")
-            except Exception as e:
-                logger.warning(f"Failed to load SentenceTransformer: {e}")
-                self.sentence_transformer = None
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize models for multi-query retrieval: {e}")
+            return await project_scope_cache.get_organization_id(project_id)
+        except ValueError:
+            logger.error(f"Could not determine organization for project {sanitize_for_log(project_id)}")
+            raise
 
     async def retrieve_with_multi_query(
         self,
@@ -226,40 +188,50 @@ class MultiQueryRetrievalService:
             MultiQueryResults with comprehensive retrieval data
         """
         logger.info(f"Starting multi-query retrieval for: '{sanitize_for_log(query)}'")
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
         
         try:
             # Step 1: Analyze the query
+            stage_start = time.perf_counter()
             query_analysis = await self._analyze_query(query)
+            timings['analysis'] = _elapsed_ms(stage_start)
             logger.debug(f"Query intent: {query_analysis.intent.value} (confidence: {query_analysis.intent_confidence:.2f})")
             
             # Step 2: Generate query variations
+            stage_start = time.perf_counter()
             variations = await self._generate_query_variations(query_analysis)
+            timings['variations'] = _elapsed_ms(stage_start)
             logger.debug(f"Generated {len(variations)} query variations")
             
-            # Step 3: Execute retrieval for each variation
-            all_results = []
-            for variation in variations:
-                results = await self._execute_single_query(
-                    variation, project_id, self.max_results_per_query
-                )
-                all_results.extend(results)
+            # Step 3: Execute retrieval for all variations (one embed call, one search request)
+            all_results = await self._execute_query_batch(
+                variations, project_id, self.max_results_per_query, timings
+            )
             
             # Step 4: Deduplicate and merge results
+            stage_start = time.perf_counter()
             deduplicated_results = await self._deduplicate_results(all_results)
+            timings['dedup'] = _elapsed_ms(stage_start)
             logger.info(f"📝 Deduplication: {len(all_results)} results -> {len(deduplicated_results)} unique results")
             if deduplicated_results:
                 scores = [r.score for r in deduplicated_results]
                 logger.info(f"📊 Deduplicated scores: min={min(scores):.3f}, max={max(scores):.3f}, avg={sum(scores)/len(scores):.3f}")
             
             # Step 5: Score and rank final results
+            stage_start = time.perf_counter()
             ranked_results = await self._score_and_rank_results(
                 deduplicated_results, query_analysis, max_results
             )
+            timings['ranking'] = _elapsed_ms(stage_start)
             
             # Step 6: Calculate quality metrics
+            stage_start = time.perf_counter()
             diversity_score = self._calculate_diversity_score(ranked_results)
             coverage_score = self._calculate_coverage_score(ranked_results, query_analysis)
             best_variation = self._find_best_variation(variations, all_results)
+            timings['metrics'] = _elapsed_ms(stage_start)
+            timings['total'] = _elapsed_ms(started)
             
             results = MultiQueryResults(
                 original_query=query,
@@ -269,11 +241,13 @@ class MultiQueryRetrievalService:
                 result_diversity_score=diversity_score,
                 coverage_score=coverage_score,
                 total_queries_executed=len(variations),
-                best_performing_variation=best_variation
+                best_performing_variation=best_variation,
+                stage_timings_ms=timings
             )
             
-            logger.info(f"Multi-query retrieval completed: {len(ranked_results)} final results, "
-                       f"diversity: {diversity_score:.2f}, coverage: {coverage_score:.2f}")
+            logger.info(f"Multi-query retrieval completed: {len(ranked_results)} final results from "
+                       f"{len(variations)} variations, diversity: {diversity_score:.2f}, "
+                       f"coverage: {coverage_score:.2f}, stage timings (ms): {timings}")
             
             return results
             
@@ -678,41 +652,65 @@ class MultiQueryRetrievalService:
 
         return variations[:2]  # Limit decompositions
 
-    async def _execute_single_query(
+    async def _execute_query_batch(
         self,
-        variation: QueryVariation,
+        variations: List[QueryVariation],
         project_id: str,
-        max_results: int
+        max_results: int,
+        timings: Optional[Dict[str, float]] = None
     ) -> List[RetrievalResult]:
-        """Execute retrieval for a single query variation."""
+        """
+        Execute retrieval for all query variations with one embedding call and one batch search.
+
+        Hits carry their stored chunk vector so deduplication and diversity scoring
+        need no further model inference. "embedding" and "search" stage times are
+        written to timings when given.
+        """
+        if not variations:
+            return []
+        timings = timings if timings is not None else {}
+
         try:
-            # Generate embedding for the variation
-            embedding = await embedding_service.generate_embedding(variation.variation_text)
-            
+            # Generate embeddings for all variations in one model call
+            stage_start = time.perf_counter()
+            embeddings = await embedding_service.encode_array(
+                [variation.variation_text for variation in variations]
+            )
+            timings['embedding'] = _elapsed_ms(stage_start)
+
             # Search vector store
+            stage_start = time.perf_counter()
             # Get organization_id using cache
             organization_id = await self._get_organization_id(project_id)
 
             # Check if we should use two-stage search
-            if self.settings.enable_mrl and self.settings.rag_use_two_stage_search:
-                logger.info(f"Using two-stage MRL search for variation: '{variation.variation_text[:30]}...'")
-                search_results = await multi_tenant_vector_store.search_vectors_two_stage(
-                    organization_id=organization_id,
-                    query_vector=embedding,
-                    initial_limit=max_results * 3,
-                    final_limit=max_results,
-                    score_threshold=self.similarity_threshold,
-                    filter_dict={"project_id": project_id}
-                )
-            else:
-                search_results = await multi_tenant_vector_store.search_vectors(
-                    organization_id=organization_id,
-                    query_vector=embedding,
-                    limit=max_results,
-                    score_threshold=self.similarity_threshold,
-                    filter_dict={"project_id": project_id}
-                )
+            two_stage = self.settings.enable_mrl and self.settings.rag_use_two_stage_search
+            if two_stage:
+                logger.info(f"Using two-stage MRL search for {len(variations)} variations")
+
+            batch_results = await multi_tenant_vector_store.search_vectors_batch(
+                organization_id=organization_id,
+                queries=[
+                    {
+                        "query_vector": embedding,
+                        "limit": max_results,
+                        "score_threshold": self.similarity_threshold,
+                        "filter_dict": {"project_id": project_id},
+                        "two_stage": two_stage,
+                        "initial_limit": max_results * 3
+                    }
+                    for embedding in embeddings
+                ],
+                with_vectors=self._result_vectors_selector()
+            )
+            timings['search'] = _elapsed_ms(stage_start)
+        except Exception as e:
+            logger.error(f"Query execution failed for {len(variations)} variations: {e}")
+            return []
 
+        # Convert to RetrievalResult format
+        results = []
+        for variation, search_results in zip(variations, batch_results):
             # Log score distribution for debugging
             if search_results:
                 scores = [r['score'] for r in search_results]
@@ -721,8 +719,6 @@ class MultiQueryRetrievalService:
                           f"avg={sum(scores)/len(scores):.3f}, "
                           f"threshold={self.similarity_threshold}")
 
-            # Convert to RetrievalResult format
-            results = []
             for result in search_results:
                 retrieval_result = RetrievalResult(
                     chunk_id=result['id'],
@@ -733,17 +729,15 @@ class MultiQueryRetrievalService:
                     metadata=result['payload'],
                     relevance_factors=self._calculate_relevance_factors(
                         result, variation
-                    )
+                    ),
+                    embedding=self._stored_vector(result.get('vector'))
                 )
                 results.append(retrieval_result)
 
-            logger.debug(f"Retrieved {len(results)} results for variation: '{variation.variation_text}'")
-            return results
-            
-        except Exception as e:
-            logger.error(f"Query execution failed for '{variation.variation_text}': {e}")
-            return []
-    
+            logger.debug(f"Retrieved {len(search_results)} results for variation: '{variation.variation_text}'")
+
+        return results
+
     def _calculate_relevance_factors(
         self,
         search_result: Dict[str, Any],
@@ -797,48 +791,59 @@ class MultiQueryRetrievalService:
         self,
         results: List[RetrievalResult]
     ) -> List[RetrievalResult]:
-        """Remove duplicate results using semantic similarity."""
-        if not results or not self.sentence_transformer:
+        """
+        Merge hits from all variations into one result per chunk, best score first.
+
+        Hits for the same chunk ID collapse to the highest-scoring one. Distinct
+        chunks whose stored vectors are more similar than deduplication_threshold
+        are near-duplicates; only the higher-scoring one is kept. Chunks without
+        a stored vector are never treated as near-duplicates.
+        """
+        if not results:
             return results
-        
-        try:
-            # Generate embeddings for all result texts
-            texts = [result.text for result in results]
-            embeddings = self.sentence_transformer.encode(texts)
-            
-            # Find duplicates using similarity threshold
-            deduplicated = []
-            used_indices = set()
-            
-            for i, result in enumerate(results):
-                if i in used_indices:
-                    continue
-                
-                deduplicated.append(result)
-                used_indices.add(i)
-                
-                # Mark similar results as used
-                for j in range(i + 1, len(results)):
-                    if j not in used_indices:
-                        similarity = self._cosine_similarity(embeddings[i], embeddings[j])
-                        if similarity > self.deduplication_threshold:
-                            used_indices.add(j)
-                            # Keep the higher scoring result
-                            if results[j].score > result.score:
-                                deduplicated[-1] = results[j]
-            
-            return deduplicated
-            
-        except Exception as e:
-            logger.error(f"Deduplication failed: {e}")
-            # Fallback to simple deduplication by chunk_id
-            seen_ids = set()
-            deduplicated = []
-            for result in results:
-                if result.chunk_id not in seen_ids:
-                    deduplicated.append(result)
-                    seen_ids.add(result.chunk_id)
-            return deduplicated
+
+        # Exact merge by chunk ID: order by score, keep the first occurrence of each ID
+        scores = np.array([result.score for result in results], dtype=np.float64)
+        order = np.argsort(-scores, kind="stable")
+        chunk_ids = np.array([results[i].chunk_id for i in order])
+        _, first = np.unique(chunk_ids, return_index=True)
+        unique = [results[i] for i in order[np.sort(first)]]
+
+        # Near-duplicate removal over stored vectors (greedy, highest score wins)
+        similarity, has_vector = self._similarity_matrix(unique)
+        if has_vector.sum() < 2:
+            return unique
+
+        keep = np.ones(len(unique), dtype=bool)
+        for i in np.flatnonzero(has_vector):
+            if keep[i]:
+                duplicates = similarity[i, i + 1:] > self.deduplication_threshold
+                keep[i + 1:] &= ~duplicates
+        return [result for result, kept in zip(unique, keep) if kept]
+
+    def _result_vectors_selector(self) -> Union[bool, List[str]]:
+        """with_vectors argument returning only the stored vector used for deduplication."""
+        return [self.result_vector_name] if self.result_vector_name else True
+
+    def _stored_vector(self, vector: Any) -> Optional[np.ndarray]:
+        """Extract the result vector from a Qdrant point vector (named dict or plain list)."""
+        if isinstance(vector, dict):
+            vector = vector.get(self.result_vector_name)
+        if vector is None or len(vector) == 0:
+            return None
+        return np.asarray(vector, dtype=np.float32)
+
+    def _similarity_matrix(self, results: List[RetrievalResult]) -> Tuple[np.ndarray, np.ndarray]:
+        """Cosine similarities between results' stored vectors (zero where a vector is missing)."""
+        has_vector = np.array([result.embedding is not None for result in results], dtype=bool)
+        similarity = np.zeros((len(results), len(results)), dtype=np.float32)
+        indices = np.flatnonzero(has_vector)
+        if len(indices):
+            embeddings = np.stack([results[i].embedding for i in indices])
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            normalized = embeddings / np.maximum(norms, 1e-12)
+            similarity[np.ix_(indices, indices)] = normalized @ normalized.T
+        return similarity, has_vector
     
     async def _score_and_rank_results(
         self,
@@ -912,25 +917,13 @@ class MultiQueryRetrievalService:
         variation_types = set(result.source_variation_type for result in results)
         type_diversity = len(variation_types) / len(results)
         
-        # Content diversity (simplified)
-        if self.sentence_transformer and len(results) > 1:
-            try:
-                texts = [result.text[:200] for result in results]  # Limit text length
-                embeddings = self.sentence_transformer.encode(texts)
-                
-                # Calculate average pairwise similarity
-                similarities = []
-                for i in range(len(embeddings)):
-                    for j in range(i + 1, len(embeddings)):
-                        sim = self._cosine_similarity(embeddings[i], embeddings[j])
-                        similarities.append(sim)
-                
-                avg_similarity = sum(similarities) / len(similarities)
-                content_diversity = 1.0 - avg_similarity  # Lower similarity = higher diversity
-                
-                return (type_diversity + content_diversity) / 2
-            except Exception:
-                return type_diversity
+        # Content diversity from the stored vectors of results that have one
+        similarity, has_vector = self._similarity_matrix(results)
+        if has_vector.sum() > 1:
+            indices = np.flatnonzero(has_vector)
+            pairwise = similarity[np.ix_(indices, indices)][np.triu_indices(len(indices), k=1)]
+            content_diversity = 1.0 - float(pairwise.mean())  # Lower similarity = higher diversity
+            return (type_diversity + content_diversity) / 2
         
         return type_diversity
     
@@ -989,11 +982,6 @@ class MultiQueryRetrievalService:
         
         return best_variation
     
-    def _cosine_similarity(self, a, b) -> float:
-        """Calculate cosine similarity between vectors."""
-        import numpy as np
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
-    
     async def _fallback_retrieval(
         self,
         query: str,
@@ -1021,16 +1009,13 @@ class MultiQueryRetrievalService:
             )
             
             # Simple retrieval
-            embedding = await embedding_service.generate_embedding(query)
-            # Get organization_id
-            from db.database import get_db
-            organization_id = None
+            embedding = (await embedding_service.encode_array([query]))[0]
             # Get organization_id using cache
             organization_id = await self._get_organization_id(project_id)
 
             # Check if we should use two-stage search
             if self.settings.enable_mrl and self.settings.rag_use_two_stage_search:
-                logger.info(f"Using two-stage MRL search for variation: '{variation.variation_text[:30]}...'")
+                logger.info(f"Using two-stage MRL search for fallback query: '{sanitize_for_log(query[:30])}...'")
                 search_results = await multi_tenant_vector_store.search_vectors_two_stage(
                     organization_id=organization_id,
                     query_vector=embedding,
@@ -0,0 +1,89 @@
+"""
+Sparse Term Vectors for Server-Side BM25
+
+Encodes text as Qdrant sparse vectors so keyword retrieval runs inside Qdrant
+next to the dense MRL vectors:
+
+- Documents carry BM25 term-frequency weights (saturated by k1, normalized by
+  length with b against a fixed average length)
+- Queries carry weight 1.0 per unique term
+- The collection's sparse vector uses the IDF modifier, so Qdrant applies
+  inverse document frequency from its own statistics at query time
+
+Terms are produced by the keyword index tokenizer and mapped to indices with
+a stable 31-bit hash (crc32), so no vocabulary has to be stored or shared.
+"""
+
+import zlib
+from collections import Counter
+from typing import Dict
+
+from qdrant_client.models import SparseVector
+
+from config import get_settings
+from services.rag.keyword_index import tokenize
+
+settings = get_settings()
+
+
+class SparseTermEncoder:
+    """Hashing BM25 encoder producing Qdrant sparse vectors."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.5, average_length: float = 256.0):
+        """
+        Initialize the encoder.
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+            average_length: Assumed average chunk length in tokens
+        """
+        self.k1 = k1
+        self.b = b
+        self.average_length = average_length
+
+    @staticmethod
+    def term_index(term: str) -> int:
+        """Stable sparse index for a term."""
+        return zlib.crc32(term.encode("utf-8")) & 0x7FFFFFFF
+
+    def _to_sparse(self, weights: Dict[int, float]) -> SparseVector:
+        indices = sorted(weights)
+        return SparseVector(indices=indices, values=[weights[i] for i in indices])
+
+    def encode_document(self, text: str) -> SparseVector:
+        """
+        Encode a chunk with BM25 term-frequency weights.
+
+        Args:
+            text: Chunk text
+
+        Returns:
+            Sparse vector (empty when the text has no indexable terms)
+        """
+        term_counts = Counter(tokenize(text or ""))
+        doc_length = sum(term_counts.values())
+        norm = self.k1 * (1 - self.b + self.b * doc_length / self.average_length)
+
+        # Hash collisions are rare; colliding terms share one dimension
+        weights: Dict[int, float] = {}
+        for term, tf in term_counts.items():
+            index = self.term_index(term)
+            weights[index] = weights.get(index, 0.0) + tf * (self.k1 + 1) / (tf + norm)
+        return self._to_sparse(weights)
+
+    def encode_query(self, text: str) -> SparseVector:
+        """
+        Encode a query as unit weights over its unique terms.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Sparse vector (empty when the query has no indexable terms)
+        """
+        return self._to_sparse({self.term_index(term): 1.0 for term in set(tokenize(text or ""))})
+
+
+# Global sparse encoder instance
+sparse_encoder = SparseTermEncoder(k1=settings.bm25_k1, b=settings.bm25_b)
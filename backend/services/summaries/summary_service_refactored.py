@@ -1236,39 +1236,45 @@ class SummaryService:
 
             from services.rag.embedding_service import embedding_service
 
-            for query in critical_queries:
-                try:
-                    # Get embedding for query
-                    query_embedding = await embedding_service.generate_embedding(query)
-
-                    # Search across all projects in the program (no project filter, org filter is automatic)
-                    results = await multi_tenant_vector_store.search_vectors(
-                        organization_id=organization_id,
-                        query_vector=query_embedding,
-                        collection_type="content",
-                        limit=5,  # Top 5 per query
-                        score_threshold=0.6  # Only high-relevance content
-                    )
-
-                    if results:
-                        logger.info(f"Semantic search for '{query}' returned {len(results)} results")
-                        context_parts.append(f"\nQuery: '{query}'\n")
-                        for result in results:
-                            payload = result.get('payload', {})
-                            content_text = payload.get('content', '')
-                            title = payload.get('title', 'Untitled')
-                            date = payload.get('date', 'Unknown date')
-
-                            # Add snippet
-                            context_parts.append(
-                                f"- [{title}] ({date}, relevance: {result['score']:.2f})\n"
-                                f"  {content_text[:300]}...\n"
-                            )
-                            logger.debug(f"Added result: {title} (score: {result['score']:.2f})")
-                    else:
-                        logger.info(f"Semantic search for '{query}' returned NO results (empty or below threshold)")
-                except Exception as e:
-                    logger.warning(f"Semantic search failed for query '{query}': {e}")
+            try:
+                # Embed all queries in one call and search them in one batch request
+                query_embeddings = await embedding_service.encode_array(critical_queries)
+
+                # Search across all projects in the program (no project filter, org filter is automatic)
+                batch_results = await multi_tenant_vector_store.search_vectors_batch(
+                    organization_id=organization_id,
+                    queries=[
+                        {
+                            "query_vector": query_embedding,
+                            "limit": 5,  # Top 5 per query
+                            "score_threshold": 0.6  # Only high-relevance content
+                        }
+                        for query_embedding in query_embeddings
+                    ],
+                    collection_type="content"
+                )
+            except Exception as e:
+                logger.warning(f"Semantic search failed for critical queries: {e}")
+                batch_results = [[] for _ in critical_queries]
+
+            for query, results in zip(critical_queries, batch_results):
+                if results:
+                    logger.info(f"Semantic search for '{query}' returned {len(results)} results")
+                    context_parts.append(f"\nQuery: '{query}'\n")
+                    for result in results:
+                        payload = result.get('payload', {})
+                        content_text = payload.get('content', '')
+                        title = payload.get('title', 'Untitled')
+                        date = payload.get('date', 'Unknown date')
+
+                        # Add snippet
+                        context_parts.append(
+                            f"- [{title}] ({date}, relevance: {result['score']:.2f})\n"
+                            f"  {content_text[:300]}...\n"
+                        )
+                        logger.debug(f"Added result: {title} (score: {result['score']:.2f})")
+                else:
+                    logger.info(f"Semantic search for '{query}' returned NO results (empty or below threshold)")
 
         # Combine all context parts
         full_context = ''.join(context_parts)
@@ -1415,33 +1421,40 @@ class SummaryService:
 
             from services.rag.embedding_service import embedding_service
 
-            for query in critical_queries:
-                try:
-                    query_embedding = await embedding_service.generate_embedding(query)
-
-                    results = await multi_tenant_vector_store.search_vectors(
-                        organization_id=organization_id,
-                        query_vector=query_embedding,
-                        collection_type="content",
-                        limit=3,  # Top 3 per query (keep it minimal for portfolio level)
-                        score_threshold=0.7  # Higher threshold for portfolio level
-                    )
-
-                    if results:
-                        logger.info(f"Portfolio semantic search for '{query}' returned {len(results)} results")
-                        context_parts.append(f"\nQuery: '{query}'\n")
-                        for result in results:
-                            payload = result.get('payload', {})
-                            title = payload.get('title', 'Untitled')
-                            context_parts.append(
-                                f"- {title} (relevance: {result['score']:.2f})\n"
-                                f"  {payload.get('content', '')[:200]}...\n"
-                            )
-                            logger.debug(f"Added portfolio result: {title} (score: {result['score']:.2f})")
-                    else:
-                        logger.info(f"Portfolio semantic search for '{query}' returned NO results (empty or below threshold)")
-                except Exception as e:
-                    logger.warning(f"Portfolio semantic search failed for '{query}': {e}")
+            try:
+                # Embed all queries in one call and search them in one batch request
+                query_embeddings = await embedding_service.encode_array(critical_queries)
+
+                batch_results = await multi_tenant_vector_store.search_vectors_batch(
+                    organization_id=organization_id,
+                    queries=[
+                        {
+                            "query_vector": query_embedding,
+                            "limit": 3,  # Top 3 per query (keep it minimal for portfolio level)
+                            "score_threshold": 0.7  # Higher threshold for portfolio level
+                        }
+                        for query_embedding in query_embeddings
+                    ],
+                    collection_type="content"
+                )
+            except Exception as e:
+                logger.warning(f"Portfolio semantic search failed for critical queries: {e}")
+                batch_results = [[] for _ in critical_queries]
+
+            for query, results in zip(critical_queries, batch_results):
+                if results:
+                    logger.info(f"Portfolio semantic search for '{query}' returned {len(results)} results")
+                    context_parts.append(f"\nQuery: '{query}'\n")
+                    for result in results:
+                        payload = result.get('payload', {})
+                        title = payload.get('title', 'Untitled')
+                        context_parts.append(
+                            f"- {title} (relevance: {result['score']:.2f})\n"
+                            f"  {payload.get('content', '')[:200]}...\n"
+                        )
+                        logger.debug(f"Added portfolio result: {title} (score: {result['score']:.2f})")
+                else:
+                    logger.info(f"Portfolio semantic search for '{query}' returned NO results (empty or below threshold)")
 
         full_context = ''.join(context_parts)
 
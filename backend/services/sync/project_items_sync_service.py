@@ -65,7 +65,8 @@ class ProjectItemsSyncService:
         session: AsyncSession,
         project_id: uuid.UUID,
         content_id: uuid.UUID,
-        summary_data: Dict[str, Any]
+        summary_data: Dict[str, Any],
+        existing_items: Optional[Dict[str, List]] = None
     ) -> Dict[str, Any]:
         """
         Synchronize project items from meeting summary data.
@@ -75,6 +76,8 @@ class ProjectItemsSyncService:
             project_id: Project ID
             content_id: Content ID (for tracking source)
             summary_data: Meeting summary data containing extracted items
+            existing_items: Plain-dict items from get_existing_project_items, possibly loaded
+                on another (already closed) session (loaded here when not provided)
 
         Returns:
             Dict with counts of synced items and any errors
@@ -99,7 +102,8 @@ class ProjectItemsSyncService:
             logger.info(f"[SYNC] Extracted items: {len(extracted_items['risks'])} risks, {len(extracted_items['blockers'])} blockers, {len(extracted_items['tasks'])} tasks, {len(extracted_items['lessons'])} lessons")
 
             # Get existing project items for deduplication
-            existing_items = await self._get_existing_project_items(session, project_id)
+            if existing_items is None:
+                existing_items = await self.get_existing_project_items(session, project_id)
             logger.info(f"[SYNC] Existing items: {len(existing_items['risks'])} risks, {len(existing_items['blockers'])} blockers, {len(existing_items['tasks'])} tasks, {len(existing_items['lessons'])} lessons")
 
             # Use semantic deduplication if enabled, otherwise fall back to AI-only
@@ -255,7 +259,7 @@ class ProjectItemsSyncService:
             'lessons': lessons
         }
 
-    async def _get_existing_project_items(
+    async def get_existing_project_items(
         self,
         session: AsyncSession,
         project_id: uuid.UUID
@@ -9,14 +9,50 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import asyncio
 
-import spacy
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from utils.logger import get_logger
+from services.rag.model_registry import shared_sentence_transformer, shared_spacy_model
 from services.transcription.transcript_parser import transcript_parser, ParsedTranscript
 
 logger = get_logger(__name__)
 
+# Simple sentiment lexicon (substring matches, can be enhanced with proper models)
+POSITIVE_WORDS = ['good', 'great', 'excellent', 'positive', 'agree', 'yes', 'perfect']
+NEGATIVE_WORDS = ['bad', 'issue', 'problem', 'concern', 'disagree', 'no', 'wrong']
+
+
+def keyword_presence(texts: List[str], keywords: List[str]) -> np.ndarray:
+    """
+    Tag many texts with many keywords at once.
+
+    Texts are joined into one corpus and each keyword is located with a single
+    scan over it; match offsets are mapped back to texts with searchsorted.
+    Equivalent to ``keyword in text`` for every (text, keyword) pair.
+
+    Args:
+        texts: Texts to tag (already lower-cased by the caller if needed)
+        keywords: Keywords (substring match)
+
+    Returns:
+        Boolean array of shape (len(texts), len(keywords))
+    """
+    presence = np.zeros((len(texts), len(keywords)), dtype=bool)
+    if not texts or not keywords:
+        return presence
+
+    # NUL cannot occur in keywords, so no match spans two texts
+    corpus = "\x00".join(texts)
+    starts = np.cumsum([0] + [len(text) + 1 for text in texts[:-1]])
+    for column, keyword in enumerate(keywords):
+        if not keyword:
+            presence[:, column] = True
+            continue
+        offsets = [match.start() for match in re.finditer(re.escape(keyword), corpus)]
+        if offsets:
+            presence[np.searchsorted(starts, offsets, side='right') - 1, column] = True
+    return presence
+
 
 @dataclass
 class SpeakerTurn:
@@ -115,13 +151,15 @@ class AdvancedTranscriptAnalysis:
 
 class AdvancedTranscriptProcessor:
     """Advanced transcript processing service with AI-powered analysis."""
+
+    # NLP models (shared process-wide, loaded on first use)
+    nlp_model = shared_spacy_model()
+    sentence_transformer = shared_sentence_transformer()
     
     def __init__(self):
         """Initialize the advanced transcript processor."""
         from config import get_settings
         self.settings = get_settings()
-        self.nlp_model = None
-        self.sentence_transformer = None
         self.semantic_threshold = 0.75  # For topic segmentation
         self.decision_keywords = [
             'decided', 'decision', 'choose', 'selected', 'approved', 'agreed',
@@ -136,38 +174,6 @@ class AdvancedTranscriptProcessor:
             'after', 'before', 'during', 'while', 'then', 'next', 'following',
             'previously', 'earlier', 'later', 'meanwhile', 'subsequently'
         ]
-        
-        # Initialize models asynchronously
-        self._initialize_models()
-    
-    def _initialize_models(self):
-        """Initialize NLP models."""
-        try:
-            # Load spaCy model for NLP processing
-            try:
-                self.nlp_model = spacy.load("en_core_web_sm")
-                logger.info("Loaded spaCy model: en_core_web_sm")
-            except OSError:
-                logger.warning("spaCy model 'en_core_web_sm' not found. Install with: python -m spacy download en_core_web_sm")
-                # Use a basic model or disable NLP features
-                self.nlp_model = None
-            
-            # Load sentence transformer for semantic analysis
-            try:
-                self.sentence_transformer = SentenceTransformer(
-                    self.settings.sentence_transformer_model,
-                    token=self.settings.hf_token,
-                    trust_remote_code=True
-                )
-                logger.info(f"Loaded SentenceTransformer: {self.settings.sentence_transformer_model}")
-            except Exception as e:
-                logger.warning(f"Failed to load SentenceTransformer: {e}")
-                self.sentence_transformer = None
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize NLP models: {e}")
-            self.nlp_model = None
-            self.sentence_transformer = None
     
     async def process_transcript(
         self,
@@ -257,43 +263,46 @@ class AdvancedTranscriptProcessor:
             raise
     
     async def _extract_speaker_turns(self, parsed: ParsedTranscript) -> List[SpeakerTurn]:
-        """Extract and analyze speaker turns."""
+        """Extract and analyze speaker turns (linear in the number of turns)."""
+        entries = [
+            (i, entry) for i, entry in enumerate(parsed.dialogue)
+            if entry.get('text', '').strip()
+        ]
+
+        # Analyze sentiment of all turns at once if NLP model is available
+        sentiments = [None] * len(entries)
+        if self.nlp_model:
+            sentiments = self._analyze_sentiments([entry.get('text', '') for _, entry in entries])
+
         turns = []
-        turn_index = 0
-        
-        for i, entry in enumerate(parsed.dialogue):
+        # Length of the turn texts joined with single spaces so far
+        offset = 0
+
+        for turn_index, (i, entry) in enumerate(entries):
             speaker = entry.get('speaker', 'Unknown')
             text = entry.get('text', '')
             timestamp = entry.get('timestamp', '')
             
-            if not text.strip():
-                continue
-            
             # Generate unique segment ID
             segment_id = f"turn_{i:03d}_{speaker.lower().replace(' ', '_')}"
             
             # Parse duration if available in timestamp
             duration_seconds = self._parse_duration_from_timestamp(timestamp)
             
-            # Analyze sentiment if NLP model is available
-            sentiment = None
-            if self.nlp_model:
-                sentiment = self._analyze_sentiment(text)
-            
             turn = SpeakerTurn(
                 speaker=speaker,
                 timestamp=timestamp,
                 text=text,
                 duration_seconds=duration_seconds,
-                start_position=len(' '.join([t.text for t in turns])),
-                end_position=len(' '.join([t.text for t in turns])) + len(text),
+                start_position=offset,
+                end_position=offset + len(text),
                 segment_id=segment_id,
-                sentiment=sentiment,
+                sentiment=sentiments[turn_index],
                 turn_index=turn_index
             )
             
             turns.append(turn)
-            turn_index += 1
+            offset += len(text) + (1 if turn_index else 0)
         
         logger.debug(f"Extracted {len(turns)} speaker turns")
         return turns
@@ -471,15 +480,15 @@ class AdvancedTranscriptProcessor:
         """Extract decision points from the meeting."""
         decisions = []
         decision_count = 0
+
+        # Check for decision keywords in all turns at once
+        presence = keyword_presence([turn.text.lower() for turn in speaker_turns], self.decision_keywords)
+        topic_by_turn = self._topic_names_by_turn(topic_segments)
         
-        for turn in speaker_turns:
-            text_lower = turn.text.lower()
-            
-            # Check for decision keywords
-            decision_indicators = []
-            for keyword in self.decision_keywords:
-                if keyword in text_lower:
-                    decision_indicators.append(keyword)
+        for turn, row in zip(speaker_turns, presence):
+            decision_indicators = [
+                keyword for keyword, present in zip(self.decision_keywords, row) if present
+            ]
             
             if decision_indicators:
                 # Analyze the decision context
@@ -491,11 +500,7 @@ class AdvancedTranscriptProcessor:
                 participants = self._find_related_participants(turn, speaker_turns)
                 
                 # Find related topic
-                related_topic = None
-                for segment in topic_segments:
-                    if turn in segment.speaker_turns:
-                        related_topic = segment.topic_name
-                        break
+                related_topic = topic_by_turn.get(id(turn))
                 
                 decision = DecisionPoint(
                     decision_id=f"decision_{decision_count:03d}",
@@ -522,15 +527,14 @@ class AdvancedTranscriptProcessor:
         """Extract action items from the meeting."""
         actions = []
         action_count = 0
+
+        # Check for action keywords in all turns at once
+        presence = keyword_presence([turn.text.lower() for turn in speaker_turns], self.action_keywords)
         
-        for turn in speaker_turns:
-            text_lower = turn.text.lower()
-            
-            # Check for action keywords
-            action_indicators = []
-            for keyword in self.action_keywords:
-                if keyword in text_lower:
-                    action_indicators.append(keyword)
+        for turn, row in zip(speaker_turns, presence):
+            action_indicators = [
+                keyword for keyword, present in zip(self.action_keywords, row) if present
+            ]
             
             if action_indicators:
                 # Extract task description
@@ -757,24 +761,30 @@ class AdvancedTranscriptProcessor:
         if not self.nlp_model:
             return None
         
-        # Simple sentiment analysis (can be enhanced with proper models)
-        positive_words = ['good', 'great', 'excellent', 'positive', 'agree', 'yes', 'perfect']
-        negative_words = ['bad', 'issue', 'problem', 'concern', 'disagree', 'no', 'wrong']
-        
-        text_lower = text.lower()
-        positive_score = sum(1 for word in positive_words if word in text_lower)
-        negative_score = sum(1 for word in negative_words if word in text_lower)
-        
-        if positive_score > negative_score:
-            return 'positive'
-        elif negative_score > positive_score:
-            return 'negative'
-        else:
-            return 'neutral'
+        return self._analyze_sentiments([text])[0]
+
+    def _analyze_sentiments(self, texts: List[str]) -> List[str]:
+        """Analyze sentiment of many texts with one keyword pass over all of them."""
+        lowered = [text.lower() for text in texts]
+        positive_scores = keyword_presence(lowered, POSITIVE_WORDS).sum(axis=1)
+        negative_scores = keyword_presence(lowered, NEGATIVE_WORDS).sum(axis=1)
+
+        labels = np.full(len(texts), 'neutral', dtype=object)
+        labels[positive_scores > negative_scores] = 'positive'
+        labels[negative_scores > positive_scores] = 'negative'
+        return labels.tolist()
+
+    @staticmethod
+    def _topic_names_by_turn(topic_segments: List[TopicSegment]) -> Dict[int, str]:
+        """Map id() of each speaker turn to the name of the first topic containing it."""
+        topic_by_turn = {}
+        for segment in topic_segments:
+            for turn in segment.speaker_turns:
+                topic_by_turn.setdefault(id(turn), segment.topic_name)
+        return topic_by_turn
     
     def _cosine_similarity(self, a, b):
         """Calculate cosine similarity between two vectors."""
-        import numpy as np
         return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
     
     def _extract_topic_name(self, text: str, segment_index: int) -> str:
@@ -853,8 +863,10 @@ class AdvancedTranscriptProcessor:
         """Find participants related to this decision/action."""
         participants = [turn.speaker]
         
-        # Look for nearby turns (context window)
-        turn_index = all_turns.index(turn) if turn in all_turns else -1
+        # Look for nearby turns (context window); turn_index is the position in all_turns
+        turn_index = turn.turn_index
+        if not (0 <= turn_index < len(all_turns) and all_turns[turn_index] is turn):
+            turn_index = all_turns.index(turn) if turn in all_turns else -1
         if turn_index >= 0:
             # Check 2 turns before and after
             start_idx = max(0, turn_index - 2)
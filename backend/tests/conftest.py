@@ -1001,14 +1001,31 @@ def mock_embedding_service():
             embeddings.append(embedding)
         return embeddings
 
+    async def mock_encode_array(
+        texts: list,
+        normalize: bool = True,
+        batch_size: int = 32,
+        show_progress: bool = False,
+        use_cache: bool = True,
+        dimension: int = None
+    ):
+        """Generate fake embeddings as a float32 (n, d) array."""
+        embeddings = np.array(
+            [text_to_simple_embedding(text, normalize) for text in texts],
+            dtype=np.float32
+        ).reshape(len(texts), 768)
+        return embeddings[:, :dimension] if dimension else embeddings
+
     # Store original methods
     original_generate_embedding = embedding_service.generate_embedding
     original_generate_embeddings_batch = embedding_service.generate_embeddings_batch
+    original_encode_array = embedding_service.encode_array
     original_get_model = embedding_service.get_model
 
     # Mock the methods
     embedding_service.generate_embedding = mock_generate_embedding
     embedding_service.generate_embeddings_batch = mock_generate_embeddings_batch
+    embedding_service.encode_array = mock_encode_array
 
     # Mock get_model to avoid downloading
     async def mock_get_model():
@@ -1027,5 +1044,6 @@ def mock_embedding_service():
     # Restore original methods
     embedding_service.generate_embedding = original_generate_embedding
     embedding_service.generate_embeddings_batch = original_generate_embeddings_batch
+    embedding_service.encode_array = original_encode_array
     embedding_service.get_model = original_get_model
     embedding_service._model = None
@@ -6,6 +6,7 @@ Covers TESTING_BACKEND.md section 6.1 - Query Endpoints (queries.py)
 Features tested:
 - [x] Query organization-wide
 - [x] Query specific project
+- [x] Stream project query answers (SSE)
 - [x] Query program
 - [x] Query portfolio
 - [x] Multi-tenant vector search
@@ -15,6 +16,7 @@ Features tested:
 Status: 40+ tests - FULLY TESTED
 """
 
+import json
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from httpx import AsyncClient
@@ -429,6 +431,62 @@ async def test_query_project_conversation_updates(
         assert conversation.messages[1]['answer'] == 'Answer 2'
 
 
+@pytest.mark.asyncio
+async def test_query_project_stream(
+    authenticated_org_client: AsyncClient,
+    test_project_with_content: Project,
+    mock_rag_response: dict,
+    db_session: AsyncSession
+):
+    """Test streamed project query emits sources, tokens and done, and saves the conversation."""
+    async def fake_stream(**kwargs):
+        yield {'event': 'sources', 'data': {'sources': mock_rag_response['sources'], 'confidence': 0.85, 'chunks_retrieved': 3, 'strategy_used': 'basic'}}
+        yield {'event': 'token', 'data': {'text': 'This is a test answer '}}
+        yield {'event': 'token', 'data': {'text': 'from the RAG system.'}}
+        yield {'event': 'done', 'data': {**mock_rag_response, 'response_time_ms': 40, 'time_to_first_token_ms': 10}}
+
+    with patch('routers.queries.enhanced_rag_service.stream_query_project', side_effect=fake_stream) as mock_stream:
+        response = await authenticated_org_client.post(
+            f"/api/v1/projects/{test_project_with_content.id}/query/stream",
+            json={"question": "What are the main goals for Q4?"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('text/event-stream')
+
+        events = []
+        for block in response.text.strip().split("\n\n"):
+            event_line, data_line = block.split("\n")
+            events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+
+        assert [name for name, _ in events] == ['sources', 'token', 'token', 'done']
+        done = events[-1][1]
+        assert done['answer'] == mock_rag_response['answer']
+        assert done['time_to_first_token_ms'] == 10
+        assert mock_stream.call_args.kwargs['project_id'] == str(test_project_with_content.id)
+
+    result = await db_session.execute(
+        select(Conversation).where(Conversation.id == done['conversation_id'])
+    )
+    conversation = result.scalar_one()
+    assert conversation.messages[0]['answer'] == mock_rag_response['answer']
+
+
+@pytest.mark.asyncio
+async def test_query_project_stream_not_found(
+    authenticated_org_client: AsyncClient
+):
+    """Test streamed query for a missing project fails before streaming starts."""
+    import uuid
+
+    response = await authenticated_org_client.post(
+        f"/api/v1/projects/{uuid.uuid4()}/query/stream",
+        json={"question": "Anything?"}
+    )
+
+    assert response.status_code == 404
+
+
 # ============================================================================
 # Test Organization Query
 # ============================================================================
@@ -0,0 +1,119 @@
+"""
+Unit tests for the RAG answer cache.
+
+Tests cover:
+- Exact hits across question normalization; misses on other strategy/project
+- Content version bumps invalidate cached answers
+- Semantic tier reuses answers for near-identical question embeddings
+- Cache bypass when Redis is unavailable
+- Hit/miss and saved-token metrics
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from services.cache.answer_cache import AnswerCache
+
+ORG = "org-1"
+PROJECT = "project-1"
+RESULT = {"answer": "The budget was approved.", "sources": ["Weekly sync"], "confidence": 0.8, "token_count": 420}
+
+
+@pytest.fixture
+async def cache():
+    cache = AnswerCache(enabled=True, ttl_seconds=60)
+    cache._redis.client = fake_aioredis.FakeRedis()
+    yield cache
+    await cache._redis.client.aclose()
+
+
+async def _answer(cache, question, strategy="hybrid_search", project_id=PROJECT):
+    lookup = await cache.lookup(ORG, project_id, question, strategy)
+    if not lookup.hit:
+        await cache.store(lookup, dict(RESULT))
+    return lookup
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_after_normalization(cache):
+    """Case, whitespace and trailing punctuation do not change the key."""
+    first = await _answer(cache, "What was decided about the budget?")
+    assert not first.hit
+
+    second = await cache.lookup(ORG, PROJECT, "  what was decided   about the BUDGET ", "hybrid_search")
+    assert second.hit and second.tier == "memory"
+    assert second.result == RESULT
+
+    await cache.clear()
+    third = await cache.lookup(ORG, PROJECT, "What was decided about the budget?", "hybrid_search")
+    assert third.tier == "redis"
+
+    assert not (await cache.lookup(ORG, PROJECT, "What was decided about the budget?", "basic")).hit
+    assert not (await cache.lookup(ORG, "project-2", "What was decided about the budget?", "hybrid_search")).hit
+
+
+@pytest.mark.asyncio
+async def test_content_version_bump_invalidates(cache):
+    """New content in a project hides its cached answers; other projects keep theirs."""
+    await _answer(cache, "status of the migration")
+    await _answer(cache, "status of the migration", project_id="project-2")
+
+    await cache.bump_content_version(ORG, [PROJECT])
+
+    assert not (await cache.lookup(ORG, PROJECT, "status of the migration", "hybrid_search")).hit
+    assert (await cache.lookup(ORG, "project-2", "status of the migration", "hybrid_search")).hit
+
+
+@pytest.mark.asyncio
+async def test_semantic_tier(cache):
+    """A paraphrase above the threshold reuses the answer; unrelated questions miss."""
+    cache.semantic_enabled = True
+    cache.semantic_threshold = 0.9
+    embeddings = {
+        "who owns the rollout plan": np.array([1.0, 0.0, 0.0], dtype=np.float32),
+        "who is responsible for the rollout plan": np.array([0.96, 0.28, 0.0], dtype=np.float32),
+        "when is the launch": np.array([0.0, 0.0, 1.0], dtype=np.float32),
+    }
+
+    async def embed(question):
+        return embeddings[question]
+
+    with patch.object(cache, "_embed_question", side_effect=embed):
+        await _answer(cache, "Who owns the rollout plan?")
+        paraphrase = await cache.lookup(ORG, PROJECT, "Who is responsible for the rollout plan?", "hybrid_search")
+        unrelated = await cache.lookup(ORG, PROJECT, "When is the launch?", "hybrid_search")
+
+    assert paraphrase.hit and paraphrase.tier == "semantic"
+    assert paraphrase.result["answer"] == RESULT["answer"]
+    assert not unrelated.hit
+
+
+@pytest.mark.asyncio
+async def test_bypassed_without_redis():
+    """Without Redis the content version is unknown, so nothing is served or stored."""
+    cache = AnswerCache(enabled=True)
+    cache._redis.retry_at = float("inf")
+
+    assert await cache.lookup(ORG, PROJECT, "anything", "basic") is None
+    assert cache.get_stats()["bypassed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_hits_and_saved_tokens(cache):
+    """Each lookup is recorded; hits report the tokens the cached answer cost."""
+    pytest.importorskip("observability.business_metrics")
+    business_metrics = MagicMock()
+    with patch("observability.business_metrics.get_business_metrics", return_value=business_metrics):
+        await _answer(cache, "budget")
+        await _answer(cache, "budget")
+
+    calls = business_metrics.record_answer_cache_lookup.call_args_list
+    assert [c.kwargs["hit"] for c in calls] == [False, True]
+    assert calls[1].kwargs["tokens_saved"] == RESULT["token_count"]
+
+    stats = cache.get_stats()
+    assert stats["hit_rate"] == 0.5
+    assert stats["tokens_saved"] == RESULT["token_count"]
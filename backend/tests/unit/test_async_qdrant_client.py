@@ -0,0 +1,72 @@
+"""
+Unit tests for MultiTenantVectorStore running on AsyncQdrantClient.
+
+Tests cover:
+- Collection creation, upsert, search, scroll and delete run on the async client
+- No thread-pool hops when the async client is enabled
+- check_connection / close lifecycle for both clients
+"""
+
+import asyncio
+import uuid
+
+import numpy as np
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+
+from db.multi_tenant_vector_store import MultiTenantVectorStore
+
+
+@pytest.fixture
+async def async_store():
+    store = MultiTenantVectorStore()
+    store.use_async_client = True
+    store._async_client = AsyncQdrantClient(":memory:")
+    yield store
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_operations_run_on_async_client(async_store, monkeypatch):
+    """Inserts, searches, scrolls and deletes never touch the thread pool."""
+    loop = asyncio.get_event_loop()
+
+    def fail_run_in_executor(*args, **kwargs):
+        raise AssertionError("run_in_executor used with async client")
+
+    monkeypatch.setattr(loop, "run_in_executor", fail_run_in_executor)
+
+    organization_id = str(uuid.uuid4())
+    rng = np.random.default_rng(3)
+    vectors = rng.standard_normal((4, 768)).astype(np.float32)
+
+    await async_store.insert_vectors(organization_id, [
+        PointStruct(id=str(uuid.uuid4()), vector=vectors[i].tolist(),
+                    payload={"project_id": "p", "content_id": f"c{i}", "chunk_index": i})
+        for i in range(4)
+    ])
+
+    results = await async_store.search_vectors(organization_id, vectors[2], limit=1)
+    assert results[0]["payload"]["chunk_index"] == 2
+
+    documents = await async_store.scroll_documents(organization_id, filter_dict={"project_id": "p"})
+    assert len(documents) == 4
+
+    await async_store.delete_vectors(organization_id, filter_dict={"content_id": "c0"})
+    documents = await async_store.scroll_documents(organization_id, filter_dict={"project_id": "p"})
+    assert len(documents) == 3
+
+    assert async_store._client is None
+
+
+@pytest.mark.asyncio
+async def test_lifecycle(async_store):
+    """check_connection works on the async client and close releases it."""
+    assert async_store.is_initialized
+    assert await async_store.check_connection()
+
+    await async_store.close()
+
+    assert async_store._async_client is None
+    assert not async_store.is_initialized
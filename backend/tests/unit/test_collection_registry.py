@@ -0,0 +1,158 @@
+"""
+Unit tests for the MultiTenantVectorStore known-collections registry.
+
+Tests cover:
+- TTL expiry and hit-rate stats
+- Warm registry skips Qdrant existence checks
+- Invalidation by delete_organization_collections
+- Lazy repopulation after a collection disappears ("Not found")
+- Searches against a vanished collection return empty results (local client errors included)
+- Deletes, payload updates and scrolls against a vanished collection are no-ops that drop the entry
+"""
+
+import uuid
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+from db.multi_tenant_vector_store import CollectionRegistry, MultiTenantVectorStore
+
+
+@pytest.fixture
+def store():
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(":memory:")
+    store.use_async_client = False
+    yield store
+    store._client.close()
+
+
+def _count_existence_checks(store):
+    calls = []
+    original = store._client.collection_exists
+
+    def counting_collection_exists(name):
+        calls.append(name)
+        return original(name)
+
+    store._client.collection_exists = counting_collection_exists
+    return calls
+
+
+def test_registry_ttl_and_stats(monkeypatch):
+    """Entries expire after the TTL; hits and misses feed the hit rate."""
+    now = [1000.0]
+    monkeypatch.setattr("db.multi_tenant_vector_store.time.monotonic", lambda: now[0])
+    registry = CollectionRegistry(ttl_seconds=10)
+
+    assert not registry.contains("a")
+    registry.add("a")
+    assert registry.contains("a")
+    now[0] += 11
+    assert not registry.contains("a")
+
+    stats = registry.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert stats["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_registry_skips_existence_checks(store):
+    """After the first call, searches do not hit Qdrant to check collections."""
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+    calls = _count_existence_checks(store)
+
+    for _ in range(3):
+        await store.search_vectors(organization_id, np.ones(768, dtype=np.float32), limit=1)
+
+    assert calls == []
+    assert store.get_collection_registry_stats()["hits"] >= 6
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_registry(store):
+    """Deleting an organization's collections removes them from the registry."""
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+    assert len(store._collection_cache) == 2
+
+    await store.delete_organization_collections(organization_id)
+
+    assert len(store._collection_cache) == 0
+    assert store.get_collection_registry_stats()["invalidations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_collection_is_recreated_on_insert(store):
+    """A collection deleted behind the registry's back is recreated lazily."""
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+    collection_name = store._get_collection_name(organization_id)
+
+    # Deleted outside the store: the registry still believes it exists
+    store._client.delete_collection(collection_name)
+
+    await store.insert_vectors(organization_id, [
+        PointStruct(id=str(uuid.uuid4()), vector=[0.1] * 768, payload={"project_id": "p"})
+    ])
+
+    assert store._client.collection_exists(collection_name)
+    assert store._client.count(collection_name).count == 1
+
+
+@pytest.mark.asyncio
+async def test_search_on_missing_collection_returns_empty(store):
+    """The local client's "not found" ValueError is treated like the REST 404."""
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+    collection_name = store._get_collection_name(organization_id)
+    store._client.delete_collection(collection_name)
+
+    query = np.ones(768, dtype=np.float32)
+    assert await store.search_vectors(organization_id, query, limit=1) == []
+    assert not store._collection_cache.contains(collection_name)
+
+    store._collection_cache.add(collection_name)
+    assert await store.search_vectors_batch(
+        organization_id, [{"query_vector": query}, {"query_vector": query}]
+    ) == [[], []]
+    assert not store._collection_cache.contains(collection_name)
+
+
+@pytest.mark.asyncio
+async def test_delete_on_missing_collection_discards_entry(store):
+    """A "Not found" from delete means nothing to delete; the stale registry entry is dropped."""
+    organization_id = str(uuid.uuid4())
+    collection_name = store._get_collection_name(organization_id)
+    store._collection_cache.add(collection_name)
+    store._sparse_support[collection_name] = True
+
+    def missing_collection(*args, **kwargs):
+        raise ValueError(f"Collection {collection_name} not found")
+
+    store._client.delete = missing_collection
+
+    assert await store.delete_vectors(organization_id, points_selector=[str(uuid.uuid4())]) is True
+    assert not store._collection_cache.contains(collection_name)
+    assert collection_name not in store._sparse_support
+
+
+@pytest.mark.asyncio
+async def test_payload_update_and_scroll_on_missing_collection(store):
+    """Payload updates are skipped and scrolls return nothing once the collection has vanished."""
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+    collection_name = store._get_collection_name(organization_id)
+    store._client.delete_collection(collection_name)
+
+    await store.update_payloads(organization_id, {str(uuid.uuid4()): {"chunk_index": 1}})
+    assert not store._collection_cache.contains(collection_name)
+
+    store._collection_cache.add(collection_name)
+    assert await store.scroll_documents(organization_id) == []
+    assert not store._collection_cache.contains(collection_name)
@@ -0,0 +1,109 @@
+"""
+Unit tests for CrossEncoderReranker and top-k cross-encoder reranking.
+
+Tests cover:
+- Inference runs off the event loop on the rerank thread
+- Pairs from concurrent queries share predict calls
+- (query hash, chunk id) score cache and LRU eviction
+- Only the top-k merged results are cross-encoded
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from services.rag.cross_encoder_reranker import CrossEncoderReranker
+
+
+class RecordingPredictor:
+    """Fake cross-encoder scoring a pair by passage length."""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def __call__(self, pairs):
+        self.batches.append([list(pair) for pair in pairs])
+        self.threads.add(threading.current_thread().name)
+        return np.array([len(passage) for _, passage in pairs], dtype=np.float32)
+
+
+@pytest.fixture
+def predictor():
+    return RecordingPredictor()
+
+
+@pytest.fixture
+def reranker(predictor):
+    reranker = CrossEncoderReranker(predictor, cache_size=4, max_wait_ms=20, max_batch_size=64)
+    yield reranker
+    reranker.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_predict_calls(reranker, predictor):
+    """Concurrent queries are scored together on the rerank thread."""
+    queries = [f"query {i}" for i in range(5)]
+    passages = [("c1", "a"), ("c2", "bbb")]
+
+    results = await asyncio.gather(*(reranker.score(q, passages) for q in queries))
+
+    assert len(predictor.batches) < len(queries)
+    assert predictor.threads == {"rerank-inference"}
+    for scores in results:
+        assert scores.tolist() == [1.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_cached_pairs_skip_inference(reranker, predictor):
+    """Only pairs not seen for this query are sent to the model."""
+    await reranker.score("budget", [("c1", "aa"), ("c2", "bbbb")])
+    scores = await reranker.score("budget", [("c2", "bbbb"), ("c3", "c")])
+
+    assert scores.tolist() == [4.0, 1.0]
+    assert [[passage for _, passage in batch] for batch in predictor.batches] == [["aa", "bbbb"], ["c"]]
+
+    # Same chunk under a different query is a miss
+    await reranker.score("vendors", [("c1", "aa")])
+    assert len(predictor.batches) == 3
+
+    stats = reranker.get_stats()["cache"]
+    assert (stats["hits"], stats["misses"]) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used(reranker, predictor):
+    """The cache holds at most cache_size pairs."""
+    await reranker.score("q", [(f"c{i}", "x" * i) for i in range(1, 6)])
+    assert reranker.get_stats()["cache"]["size"] == 4
+
+    await reranker.score("q", [("c1", "x")])
+    assert len(predictor.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_only_top_k_results_are_cross_encoded():
+    """Results past cross_encoder_top_k are ranked without inference."""
+    pytest.importorskip("sentence_transformers")
+    from services.rag.hybrid_search import HybridSearchConfig, HybridSearchService, SearchResult, SearchType
+
+    service = HybridSearchService()
+    predictor = RecordingPredictor()
+    service.cross_encoder = object()
+    service.reranker = CrossEncoderReranker(predictor, max_wait_ms=1)
+
+    results = [
+        SearchResult(chunk_id=f"c{i}", text="x" * (i + 1), metadata={}, hybrid_score=1.0 - i * 0.1)
+        for i in range(5)
+    ]
+    config = HybridSearchConfig(cross_encoder_top_k=2, cross_encoder_weight=0.5)
+    reranked = await service._cross_encoder_rerank(results, "q", config)
+    service.reranker.shutdown()
+
+    assert sum(len(batch) for batch in predictor.batches) == 2
+    scored = [r for r in reranked if SearchType.CROSS_ENCODED in r.search_types]
+    assert {r.chunk_id for r in scored} == {"c0", "c1"}
+    # c1 scored 2.0 (passage length), c0 scored 1.0; the tail uses the 1.0 floor
+    assert [r.chunk_id for r in reranked] == ["c1", "c0", "c2", "c3", "c4"]
@@ -0,0 +1,133 @@
+"""
+Unit tests for EmbeddingBatchScheduler.
+
+Tests cover:
+- Concurrent requests coalesced into shared batches
+- Per-caller result slicing and normalize grouping
+- Max batch size enforcement
+- Error propagation to every caller in a failed batch
+- Queue depth / batch size / wait time statistics
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from services.rag.embedding_batcher import EmbeddingBatchScheduler
+
+
+class RecordingEncoder:
+    """Fake encode function that records every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def __call__(self, texts, normalize):
+        self.batches.append((list(texts), normalize))
+        self.threads.add(threading.current_thread().name)
+        # Encode each text as [len(text), normalize flag]
+        return np.array([[len(t), float(normalize)] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def encoder():
+    return RecordingEncoder()
+
+
+@pytest.fixture
+def scheduler(encoder):
+    batcher = EmbeddingBatchScheduler(encoder, max_wait_ms=20, max_batch_size=16)
+    yield batcher
+    batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_batches(scheduler, encoder):
+    """Concurrent single-text calls are encoded in fewer model calls."""
+    texts = ["x" * i for i in range(1, 11)]
+
+    results = await asyncio.gather(*(scheduler.submit([t]) for t in texts))
+
+    assert len(encoder.batches) < len(texts)
+    for text, result in zip(texts, results):
+        assert result.shape == (1, 2)
+        assert result[0, 0] == len(text)
+
+
+@pytest.mark.asyncio
+async def test_inference_runs_on_dedicated_thread(scheduler, encoder):
+    """All encoding happens on the scheduler's inference thread."""
+    await scheduler.submit(["hello"])
+
+    assert encoder.threads == {"embedding-inference"}
+
+
+@pytest.mark.asyncio
+async def test_normalize_flag_grouped_separately(scheduler, encoder):
+    """Requests with different normalize flags never share an encode call."""
+    normalized, raw = await asyncio.gather(
+        scheduler.submit(["aa", "bbb"], normalize=True),
+        scheduler.submit(["c"], normalize=False),
+    )
+
+    assert normalized[:, 1].tolist() == [1.0, 1.0]
+    assert raw[:, 1].tolist() == [0.0]
+    raw_batches = [texts for texts, normalize in encoder.batches if not normalize]
+    assert raw_batches == [["c"]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_respected(encoder):
+    """Batches never exceed max_batch_size when requests fit within it."""
+    batcher = EmbeddingBatchScheduler(encoder, max_wait_ms=20, max_batch_size=4)
+    try:
+        await asyncio.gather(*(batcher.submit([f"t{i}"]) for i in range(10)))
+    finally:
+        batcher.shutdown()
+
+    assert all(len(texts) <= 4 for texts, _ in encoder.batches)
+    assert sum(len(texts) for texts, _ in encoder.batches) == 10
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_kept_whole(scheduler, encoder):
+    """A single request larger than max_batch_size is encoded in one call."""
+    result = await scheduler.submit(["t"] * 40)
+
+    assert result.shape == (40, 2)
+    assert [len(texts) for texts, _ in encoder.batches] == [40]
+
+
+@pytest.mark.asyncio
+async def test_encode_error_propagates_to_callers():
+    """A failing encode raises in every caller of that batch."""
+    def failing_encoder(texts, normalize):
+        raise RuntimeError("model exploded")
+
+    batcher = EmbeddingBatchScheduler(failing_encoder, max_wait_ms=5, max_batch_size=8)
+    try:
+        with pytest.raises(RuntimeError, match="model exploded"):
+            await batcher.submit(["boom"])
+    finally:
+        batcher.shutdown()
+
+    assert batcher.get_stats()["total_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stats_report_batches_and_wait_times(scheduler):
+    """Statistics expose queue depth, batch sizes and wait times."""
+    await asyncio.gather(*(scheduler.submit([f"t{i}"]) for i in range(5)))
+    await asyncio.sleep(0.05)
+
+    stats = scheduler.get_stats()
+
+    assert stats["queue_depth"] == 0
+    assert stats["total_requests"] == 5
+    assert stats["total_texts"] == 5
+    assert stats["batch_size"]["max"] >= 1
+    assert stats["wait_time_ms"]["p99"] >= 0
+    assert stats["worker_alive"] is True
@@ -0,0 +1,168 @@
+"""
+Unit tests for EmbeddingCache.
+
+Tests cover:
+- Content-addressed keys (model, inference backend, normalize flag, text hash)
+- Memory tier hits, misses and byte-bounded LRU eviction
+- TTL expiry
+- Bypass flag
+- Redis tier blob round-trip (float16) via FakeRedis
+- Different inference backends never share entries, even through Redis
+- EmbeddingService keys by its active backend and does not mix vectors after an ONNX fallback
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from services.cache.embedding_cache import EmbeddingCache
+
+
+def _vectors(n: int, dim: int = 8) -> np.ndarray:
+    rng = np.random.default_rng(42)
+    return rng.standard_normal((n, dim)).astype(np.float32)
+
+
+@pytest.fixture
+def cache():
+    return EmbeddingCache(enabled=True, max_memory_bytes=1024 * 1024, ttl_seconds=60)
+
+
+def test_key_depends_on_model_normalize_and_text():
+    """Keys differ for any change in model, normalize flag or text."""
+    base = EmbeddingCache.make_key("model-a", True, "hello")
+
+    assert base == EmbeddingCache.make_key("model-a", True, "hello")
+    assert base != EmbeddingCache.make_key("model-b", True, "hello")
+    assert base != EmbeddingCache.make_key("model-a", False, "hello")
+    assert base != EmbeddingCache.make_key("model-a", True, "hello!")
+    assert base != EmbeddingCache.make_key("model-a", True, "hello", backend="onnx-int8-avx512_vnni")
+
+
+@pytest.mark.asyncio
+async def test_memory_hit_after_put(cache):
+    """Stored vectors are returned on subsequent lookups."""
+    vectors = _vectors(2)
+    await cache.put_many(["a", "b"], vectors, "m", True)
+
+    results = await cache.get_many(["a", "b", "c"], "m", True)
+
+    np.testing.assert_array_equal(results[0], vectors[0])
+    np.testing.assert_array_equal(results[1], vectors[1])
+    assert results[2] is None
+
+    stats = cache.get_stats()
+    assert stats["memory_hits"] == 2
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_bounded_by_bytes():
+    """Least recently used entries are evicted once the byte budget is exceeded."""
+    vectors = _vectors(3)
+    row_bytes = vectors[0].nbytes
+    cache = EmbeddingCache(enabled=True, max_memory_bytes=row_bytes * 2, ttl_seconds=0)
+
+    await cache.put_many(["a", "b"], vectors[:2], "m", True)
+    await cache.get_many(["a"], "m", True)  # "a" becomes most recently used
+    await cache.put_many(["c"], vectors[2:], "m", True)
+
+    results = await cache.get_many(["a", "b", "c"], "m", True)
+
+    assert results[0] is not None
+    assert results[1] is None
+    assert results[2] is not None
+    assert cache.get_stats()["memory_bytes"] <= row_bytes * 2
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry(monkeypatch, cache):
+    """Entries older than the TTL are treated as misses."""
+    import services.cache.embedding_cache as module
+
+    now = [1000.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+
+    await cache.put_many(["a"], _vectors(1), "m", True)
+    now[0] += 61
+
+    assert (await cache.get_many(["a"], "m", True)) == [None]
+    assert cache.get_stats()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bypass_flag_disables_cache():
+    """A disabled cache never stores or returns vectors."""
+    cache = EmbeddingCache(enabled=False)
+    await cache.put_many(["a"], _vectors(1), "m", True)
+
+    assert (await cache.get_many(["a"], "m", True)) == [None]
+    assert cache.get_stats()["memory_entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_round_trip_float16():
+    """Vectors survive the Redis tier as float16 blobs and warm the memory tier."""
+    fake = fake_aioredis.FakeRedis()
+    writer = EmbeddingCache(enabled=True, redis_enabled=True, redis_dtype="float16")
+    reader = EmbeddingCache(enabled=True, redis_enabled=True, redis_dtype="float16")
+    writer._redis.client = fake
+    reader._redis.client = fake
+
+    vectors = _vectors(2)
+    await writer.put_many(["a", "b"], vectors, "m", True)
+
+    results = await reader.get_many(["a", "b"], "m", True)
+
+    for result, expected in zip(results, vectors):
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, atol=1e-2)
+    assert reader.get_stats()["redis_hits"] == 2
+
+    # Second lookup is served from memory
+    await reader.get_many(["a"], "m", True)
+    assert reader.get_stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_backends_do_not_share_entries():
+    """An int8 vector written to the shared tier is never served to a torch instance."""
+    fake = fake_aioredis.FakeRedis()
+    int8_worker = EmbeddingCache(enabled=True, redis_enabled=True)
+    torch_worker = EmbeddingCache(enabled=True, redis_enabled=True)
+    int8_worker._redis.client = fake
+    torch_worker._redis.client = fake
+
+    await int8_worker.put_many(["a"], _vectors(1), "m", True, backend="onnx-int8-avx512_vnni")
+
+    assert await torch_worker.get_many(["a"], "m", True, backend="torch") == [None]
+    assert await int8_worker.get_many(["a"], "m", True, backend="torch") == [None]
+    assert (await torch_worker.get_many(["a"], "m", True, backend="onnx-int8-avx512_vnni"))[0] is not None
+
+
+@pytest.mark.asyncio
+async def test_service_does_not_mix_backends_after_fallback(cache):
+    """A requested ONNX backend that falls back to torch re-encodes instead of serving ONNX hits."""
+    pytest.importorskip("sentence_transformers")
+    from services.rag.embedding_service import embedding_service
+
+    onnx_vector = np.full((1, 8), 9.0, dtype=np.float32)
+    await cache.put_many(["b"], onnx_vector, embedding_service.model_name, True, backend="onnx")
+
+    async def encode_on_torch(texts, *args):
+        embedding_service.active_backend = "torch"  # The ONNX export failed to load
+        return np.zeros((len(texts), 8), dtype=np.float32)
+
+    encode = AsyncMock(side_effect=encode_on_torch)
+    with patch.object(embedding_service, "_cache", cache), \
+         patch.object(embedding_service, "backend", "onnx"), \
+         patch.object(embedding_service, "active_backend", None), \
+         patch.object(embedding_service, "_encode_texts", encode):
+        result = await embedding_service._embed_texts(["a", "b"])
+
+    assert not result.any()
+    assert encode.await_count == 2
+    assert (await cache.get_many(["a", "b"], embedding_service.model_name, True, backend="torch"))[1] is not None
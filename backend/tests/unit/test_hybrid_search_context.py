@@ -0,0 +1,96 @@
+"""
+Unit tests for request-scoped hybrid search.
+
+Tests cover:
+- Semantic and keyword stages run concurrently (latency ~ max, not sum)
+- Per-call config does not leak into the shared service config
+- Stage timings reported in SearchPipeline
+- Scan-fallback BM25 statistics are kept per query
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from services.rag.hybrid_search import (  # noqa: E402
+    HybridSearchConfig, HybridSearchService, SearchContext, SearchResult, SearchType
+)
+
+STAGE_DELAY_SECONDS = 0.2
+
+
+@pytest.fixture
+def service():
+    service = HybridSearchService()
+    service.cross_encoder = None
+
+    async def organization_for(project_id):
+        return f"org-{project_id}"
+
+    async def slow_stage(search_type, ctx):
+        await asyncio.sleep(STAGE_DELAY_SECONDS)
+        return [SearchResult(
+            chunk_id=f"{ctx.project_id}-{search_type.value}",
+            text=f"{ctx.query} result",
+            metadata={},
+            semantic_score=0.9,
+            keyword_score=0.9,
+            search_types=[search_type],
+            confidence_score=0.9,
+            embedding=np.eye(2, dtype=np.float32)[search_type == SearchType.KEYWORD]
+        )]
+
+    service._get_organization_id = organization_for
+    service._semantic_search = lambda ctx: slow_stage(SearchType.SEMANTIC, ctx)
+    service._keyword_search = lambda ctx: slow_stage(SearchType.KEYWORD, ctx)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_stages_run_concurrently_with_timings(service):
+    """Retrieval takes about one stage's latency and each stage is timed."""
+    start = time.perf_counter()
+    pipeline = await service.hybrid_search("budget review", "p1", HybridSearchConfig(server_side_fusion=False))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < STAGE_DELAY_SECONDS * 1.75
+    assert pipeline.semantic_result_count == 1 and pipeline.keyword_result_count == 1
+    assert {"organization_lookup", "retrieval", "merge", "rerank", "optimize"} <= set(pipeline.stage_timings_ms)
+    assert pipeline.stage_timings_ms["retrieval"] >= STAGE_DELAY_SECONDS * 1000 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_call_config_is_request_scoped(service):
+    """A config passed to one call never replaces the service default."""
+    default_config = service.config
+    custom = HybridSearchConfig(final_result_count=1, server_side_fusion=False)
+
+    custom_pipeline, default_pipeline = await asyncio.gather(
+        service.hybrid_search("budget", "p1", custom),
+        service.hybrid_search("budget", "p2", HybridSearchConfig(server_side_fusion=False))
+    )
+
+    assert service.config is default_config
+    assert custom_pipeline.config is custom
+    assert len(custom_pipeline.final_results) == 1
+    assert len(default_pipeline.final_results) == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_statistics_are_per_query(service):
+    """BM25 statistics for two projects do not overwrite each other."""
+    small = [{"payload": {"text": "budget"}}]
+    large = [{"payload": {"text": f"budget item {i}"}} for i in range(3)] + [{"payload": {"text": "other"}}]
+
+    ctx_small = SearchContext(query="budget", project_id="p1", config=service.config)
+    ctx_large = SearchContext(query="budget", project_id="p2", config=service.config)
+    await service._update_document_statistics(small, ctx_small)
+    await service._update_document_statistics(large, ctx_large)
+
+    assert (ctx_small.total_documents, ctx_small.document_frequencies["budget"]) == (1, 1)
+    assert (ctx_large.total_documents, ctx_large.document_frequencies["budget"]) == (4, 3)
+    assert service._calculate_bm25_score(["budget"], "budget item 0", ctx_large) > 0
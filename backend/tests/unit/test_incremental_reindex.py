@@ -0,0 +1,234 @@
+"""
+Unit tests for incremental re-indexing with per-chunk content hashes.
+
+Tests cover:
+- Document hash ignores whitespace differences
+- Re-processing keeps unchanged chunks, refreshes moved ones and removes dropped ones
+- Points indexed without a chunk hash are replaced
+- Identical chunks elsewhere in the project reuse their stored vector
+- find_points pages through filtered points; update_payloads merges payloads
+- A failed ingestion records no hashes or chunk count, so re-uploading the same text re-indexes
+- Removed chunks leave the keyword index and bump the project's answer-cache content version
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+pytest.importorskip("sentence_transformers")
+
+from config import get_settings  # noqa: E402
+from db.multi_tenant_vector_store import MultiTenantVectorStore  # noqa: E402
+from models.content import Content, ContentType  # noqa: E402
+from services.core.content_service import ChunkIndexPlan, ContentService  # noqa: E402
+
+PROJECT_ID = str(uuid.uuid4())
+
+
+def _chunk(text, index, start_position=None):
+    return {
+        "text": text,
+        "index": index,
+        "start_position": index * 100 if start_position is None else start_position,
+        "word_count": len(text.split()),
+        "chunk_hash": ContentService.compute_text_hash(text),
+    }
+
+
+@pytest.fixture
+async def store():
+    settings = get_settings()
+    original = settings.enable_mrl
+    settings.enable_mrl = True
+
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(":memory:")
+    store.use_async_client = False
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+
+    with patch("db.multi_tenant_vector_store.multi_tenant_vector_store", store):
+        yield store, organization_id
+
+    store._client.close()
+    settings.enable_mrl = original
+
+
+async def _index(store, organization_id, content_id, chunks, project_id=PROJECT_ID, with_hash=True):
+    rng = np.random.default_rng(len(chunks))
+    ids = []
+    for chunk in chunks:
+        vector = rng.standard_normal(768).astype(np.float32)
+        payload = {
+            "project_id": project_id,
+            "content_id": content_id,
+            "chunk_index": chunk["index"],
+            "start_position": chunk["start_position"],
+            "text": chunk["text"],
+        }
+        if with_hash:
+            payload["chunk_hash"] = chunk["chunk_hash"]
+        ids.append(str(uuid.uuid4()))
+        await store.insert_vectors(organization_id, [
+            PointStruct(id=ids[-1], vector=store.build_mrl_vectors(vector), payload=payload)
+        ])
+    return ids
+
+
+def test_content_hash_ignores_whitespace():
+    """Reformatted whitespace does not change the document hash; text changes do."""
+    assert ContentService.compute_text_hash("a  b\n c ") == ContentService.compute_text_hash("a b c")
+    assert ContentService.compute_text_hash("a b c") != ContentService.compute_text_hash("a b d")
+
+
+@pytest.mark.asyncio
+async def test_reprocess_keeps_unchanged_chunks(store):
+    """Only changed chunks are created; moved chunks get new positions; dropped chunks are removed."""
+    store, organization_id = store
+    content = SimpleNamespace(id=str(uuid.uuid4()), project_id=PROJECT_ID)
+    old = [_chunk("alpha", 0), _chunk("beta", 1), _chunk("gamma", 2)]
+    alpha_id, beta_id, gamma_id = await _index(store, organization_id, content.id, old)
+
+    new = [_chunk("alpha", 0), _chunk("inserted", 1), _chunk("beta", 2)]
+    plan = await ContentService._plan_chunk_indexing(organization_id, content, new, previously_indexed=True)
+
+    assert [chunk["text"] for chunk in plan.create] == ["inserted"]
+    assert plan.kept == 2
+    assert set(plan.keep_updates) == {beta_id}
+    assert plan.keep_updates[beta_id]["chunk_index"] == 2
+    assert plan.remove == [gamma_id]
+    assert plan.reuse_vectors == {}
+
+
+@pytest.mark.asyncio
+async def test_points_without_hash_are_replaced(store):
+    """Content indexed before chunk hashes existed is fully re-embedded."""
+    store, organization_id = store
+    content = SimpleNamespace(id=str(uuid.uuid4()), project_id=PROJECT_ID)
+    chunks = [_chunk("alpha", 0), _chunk("beta", 1)]
+    legacy_ids = await _index(store, organization_id, content.id, chunks, with_hash=False)
+
+    plan = await ContentService._plan_chunk_indexing(organization_id, content, chunks, previously_indexed=True)
+
+    assert len(plan.create) == 2
+    assert sorted(plan.remove) == sorted(legacy_ids)
+
+
+@pytest.mark.asyncio
+async def test_identical_chunks_reuse_vectors_within_project(store):
+    """A chunk already stored for other content in the project is not embedded again."""
+    store, organization_id = store
+    await _index(store, organization_id, str(uuid.uuid4()), [_chunk("shared", 0)])
+    await _index(store, organization_id, str(uuid.uuid4()), [_chunk("elsewhere", 0)], project_id=str(uuid.uuid4()))
+
+    content = SimpleNamespace(id=str(uuid.uuid4()), project_id=PROJECT_ID)
+    new = [_chunk("shared", 0), _chunk("elsewhere", 1), _chunk("fresh", 2)]
+    plan = await ContentService._plan_chunk_indexing(organization_id, content, new, previously_indexed=False)
+
+    assert len(plan.create) == 3
+    assert set(plan.reuse_vectors) == {new[0]["chunk_hash"]}
+    assert set(plan.reuse_vectors[new[0]["chunk_hash"]]) >= {"vector_768", "vector_128"}
+
+
+@pytest.mark.asyncio
+async def test_find_points_and_update_payloads(store):
+    """find_points pages through every match; update_payloads merges without touching vectors."""
+    store, organization_id = store
+    content_id = str(uuid.uuid4())
+    ids = await _index(store, organization_id, content_id, [_chunk(f"chunk {i}", i) for i in range(300)])
+
+    found = await store.find_points(organization_id, {"content_id": content_id}, with_payload=["chunk_index"])
+    assert sorted(point["id"] for point in found) == sorted(ids)
+    assert found[0]["vector"] is None
+
+    await store.update_payloads(organization_id, {ids[0]: {"chunk_index": 1000}})
+    updated = await store.find_points(
+        organization_id, {"content_id": content_id, "chunk_index": 1000}, with_vectors=True
+    )
+    assert [point["id"] for point in updated] == [ids[0]]
+    assert updated[0]["payload"]["text"] == "chunk 0"
+    assert "vector_768" in updated[0]["vector"]
+
+
+class _Session:
+    """Session stub: serves the content row and records the duplicate lookup."""
+
+    def __init__(self, content, duplicate=None):
+        self.content = content
+        self.duplicate = duplicate
+        self.statements = []
+        self.commit = AsyncMock()
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = self.content
+        result.first.return_value = self.duplicate
+        return result
+
+
+def _content(text):
+    return Content(
+        id=uuid.uuid4(), project_id=uuid.UUID(PROJECT_ID), content_type=ContentType.EMAIL,
+        title="Notes", content=text, chunk_count=0
+    )
+
+
+async def _process(session, encode, remove=()):
+    async def plan(organization_id, content, chunks, previously_indexed):
+        return ChunkIndexPlan(create=[] if remove else list(chunks), remove=list(remove))
+
+    with patch("services.cache.project_scope_cache.project_scope_cache.get_organization_id",
+               AsyncMock(return_value="org-1")), \
+         patch.object(ContentService, "_plan_chunk_indexing", plan), \
+         patch("services.rag.embedding_service.embedding_service.encode_array", encode), \
+         patch("services.core.content_service.settings.enable_multilingual", False):
+        await ContentService.process_content_async(session, session.content.id)
+
+
+@pytest.mark.asyncio
+async def test_failed_ingestion_is_not_a_duplicate():
+    """A failed first ingestion leaves no indexed state; the re-upload is embedded again."""
+    text = "Budget review. " * 200
+    first = _content(text)
+
+    with pytest.raises(RuntimeError):
+        await _process(_Session(first), AsyncMock(side_effect=RuntimeError("model unavailable")))
+
+    assert first.processing_error == "model unavailable"
+    assert first.chunk_count == 0
+    assert first.content_hash is None and first.chunk_hashes is None
+
+    # Failed rows never match the duplicate lookup, so the re-upload is processed in full
+    second = _content(text)
+    session = _Session(second)
+    encode = AsyncMock(side_effect=RuntimeError("stop after embedding started"))
+    with pytest.raises(RuntimeError):
+        await _process(session, encode)
+
+    duplicate_query = str(session.statements[1].compile(compile_kwargs={"literal_binds": True}))
+    assert "content.processing_error IS NULL" in duplicate_query
+    assert "content.chunk_count > 0" in duplicate_query
+    encode.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reindex_invalidates_keyword_index_and_answers():
+    """Chunks dropped on re-processing are removed with their keyword postings; cached answers go stale."""
+    content = _content("Budget review. " * 200)
+    delete_chunks = AsyncMock()
+    bump = AsyncMock()
+
+    with patch.object(ContentService, "_delete_chunk_vectors", delete_chunks), \
+         patch("services.cache.answer_cache.answer_cache.bump_content_version", bump), \
+         patch("db.multi_tenant_vector_store.multi_tenant_vector_store.update_payloads", AsyncMock()), \
+         patch("db.database.get_db_context", MagicMock(side_effect=RuntimeError("no database"))):
+        await _process(_Session(content), AsyncMock(), remove=["stale-1", "stale-2"])
+
+    delete_chunks.assert_awaited_once_with("org-1", str(content.project_id), ["stale-1", "stale-2"])
+    bump.assert_awaited_once_with("org-1", [str(content.project_id)])
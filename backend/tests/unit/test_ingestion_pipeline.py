@@ -0,0 +1,108 @@
+"""
+Unit tests for the bounded content ingestion pipeline.
+
+Tests cover:
+- Every chunk is embedded and stored once, in order, in fixed-size batches
+- Progress reports cumulative stored chunk counts
+- Backpressure: a slow store stage bounds how far chunking and embedding run ahead
+- A failing stage stops the others and propagates its error
+- Cancellation checks run before each batch
+"""
+
+import asyncio
+
+import pytest
+
+from services.core.ingestion_pipeline import ChunkIngestionPipeline
+
+
+def _chunks(count, pulled=None):
+    for i in range(count):
+        if pulled is not None:
+            pulled.append(i)
+        yield {'index': i, 'text': f"chunk {i}"}
+
+
+async def _embed(batch):
+    return [chunk['index'] for chunk in batch]
+
+
+@pytest.mark.asyncio
+async def test_stores_all_chunks_in_batches():
+    """Batches keep their order and size; progress counts stored chunks."""
+    stored, progress = [], []
+
+    async def store(points):
+        stored.append(points)
+
+    pipeline = ChunkIngestionPipeline(_embed, store, batch_size=4, on_progress=progress.append)
+    assert await pipeline.run(_chunks(10)) == 10
+
+    assert stored == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert progress == [4, 8, 10]
+
+
+@pytest.mark.asyncio
+async def test_backpressure_bounds_work_in_flight():
+    """With a slow store, only a bounded number of batches run ahead of it."""
+    pulled, embedded, stored = [], [], []
+    max_embedded_ahead = max_pulled_ahead = 0
+
+    async def embed(batch):
+        embedded.append(batch)
+        return batch
+
+    async def store(points):
+        nonlocal max_embedded_ahead, max_pulled_ahead
+        max_embedded_ahead = max(max_embedded_ahead, len(embedded) - len(stored))
+        max_pulled_ahead = max(max_pulled_ahead, len(pulled) - 2 * len(stored))
+        await asyncio.sleep(0.001)
+        stored.append(points)
+
+    pipeline = ChunkIngestionPipeline(embed, store, batch_size=2, queue_depth=2)
+    assert await pipeline.run(_chunks(100, pulled)) == 100
+
+    assert len(stored) == 50
+    # Being stored + queued for store + embedded and waiting on the full queue
+    assert max_embedded_ahead <= 1 + 2 + 1
+    # ... plus queued for embedding and the batch the producer is filling
+    assert max_pulled_ahead <= 2 * (1 + 2 + 1 + 2 + 1)
+
+
+@pytest.mark.asyncio
+async def test_store_failure_stops_pipeline():
+    """A store error cancels chunking and embedding and is re-raised."""
+    pulled, calls = [], []
+
+    async def store(points):
+        calls.append(points)
+        if len(calls) == 2:
+            raise RuntimeError("qdrant unavailable")
+
+    pipeline = ChunkIngestionPipeline(_embed, store, batch_size=1, queue_depth=1)
+    with pytest.raises(RuntimeError, match="qdrant unavailable"):
+        await pipeline.run(_chunks(1000, pulled))
+
+    assert len(calls) == 2
+    assert len(pulled) < 10
+
+
+@pytest.mark.asyncio
+async def test_cancellation_checked_before_each_batch():
+    """The before-batch hook can cancel ingestion between batches."""
+    checks, stored = [], []
+
+    def before_batch():
+        checks.append(len(checks))
+        if len(checks) == 3:
+            raise asyncio.CancelledError("Job cancelled")
+
+    async def store(points):
+        stored.append(points)
+
+    pipeline = ChunkIngestionPipeline(_embed, store, batch_size=2, before_batch=before_batch)
+    with pytest.raises(asyncio.CancelledError):
+        await pipeline.run(_chunks(20))
+
+    assert len(checks) == 3
+    assert len(stored) <= 2
@@ -0,0 +1,97 @@
+"""
+Unit tests for speaker turn embeddings in IntelligentChunkingService.
+
+Tests cover:
+- All turns are encoded in one batch at the coherence dimension (no per-turn MRL calls)
+- Vectorized boundaries match pairwise cosine similarity of consecutive turns
+- chunk_meeting_content embeds turns once; quality scoring does not depend on them
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from services.rag.intelligent_chunking import IntelligentChunkingService  # noqa: E402
+from services.transcription.advanced_transcript_parser import SpeakerTurn  # noqa: E402
+
+EMBEDDING_SERVICE = "services.rag.embedding_service.embedding_service"
+
+
+def _analysis(turn_count, words_per_turn=40):
+    turns = [
+        SpeakerTurn(
+            speaker=f"Speaker {i % 3}", timestamp=None,
+            text=" ".join(f"word{i}_{k}." for k in range(words_per_turn)),
+            duration_seconds=None, start_position=i * 1000, end_position=i * 1000 + 500,
+            segment_id=f"turn_{i:03d}", turn_index=i
+        )
+        for i in range(turn_count)
+    ]
+    return SimpleNamespace(
+        speaker_turns=turns, topic_segments=[], decision_points=[], action_items=[],
+        meeting_statistics={}, meeting_outcome=None
+    )
+
+
+@pytest.fixture
+def service():
+    service = IntelligentChunkingService()
+    service.use_mrl_for_coherence = True
+    return service
+
+
+@pytest.mark.asyncio
+async def test_turns_encoded_in_one_batch(service):
+    """One encode_array call at the coherence dimension; rows come back unit-normalized."""
+    analysis = _analysis(5)
+    raw = np.random.default_rng(0).standard_normal((5, 256)).astype(np.float32)
+    encode = AsyncMock(return_value=raw)
+    per_turn = AsyncMock()
+
+    with patch(f"{EMBEDDING_SERVICE}.encode_array", encode), \
+         patch(f"{EMBEDDING_SERVICE}.generate_embedding_mrl", per_turn):
+        embeddings = await service._embed_turns(analysis)
+
+    encode.assert_awaited_once_with([t.text for t in analysis.speaker_turns], dimension=256)
+    per_turn.assert_not_awaited()
+    assert np.allclose(np.linalg.norm(embeddings, axis=1), 1.0)
+
+
+@pytest.mark.asyncio
+async def test_boundaries_match_pairwise_cosine(service):
+    """Vectorized consecutive similarities give the same boundaries as a per-pair loop."""
+    analysis = _analysis(50)
+    rng = np.random.default_rng(1)
+    embeddings = rng.standard_normal((50, 256)).astype(np.float32)
+    embeddings[10:20] = embeddings[10] + 0.01 * rng.standard_normal((10, 256))
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    expected = [
+        i + 1 for i in range(49)
+        if service._cosine_similarity(embeddings[i], embeddings[i + 1]) < service.strategy.semantic_threshold
+    ]
+    refine = AsyncMock(side_effect=lambda chunks, boundaries, turns: chunks)
+    with patch.object(service, "_refine_chunks_with_boundaries", refine):
+        await service._detect_semantic_boundaries(analysis, [], embeddings)
+
+    assert refine.call_args.args[1] == expected
+    assert 12 not in expected and 25 in expected
+
+
+@pytest.mark.asyncio
+async def test_chunking_embeds_turns_once(service):
+    """The whole pipeline encodes turns once; coherence scoring stays heuristic."""
+    analysis = _analysis(40)
+    encode = AsyncMock(return_value=np.ones((40, 256), dtype=np.float32))
+    coherence = patch.object(service, "_calculate_coherence_score", wraps=service._calculate_coherence_score)
+
+    with patch(f"{EMBEDDING_SERVICE}.encode_array", encode), coherence as score:
+        chunks = await service.chunk_meeting_content(analysis)
+
+    encode.assert_awaited_once()
+    assert chunks
+    assert all(len(call.args) == 1 for call in score.await_args_list)
@@ -0,0 +1,311 @@
+"""
+Unit tests for the persistent BM25 keyword index.
+
+Tests cover:
+- Incremental add (idempotent per chunk) and removal of postings
+- Concurrent adds of the same chunks count them once; a failed add or removal clears the built flag
+- The built flag expires; a rebuild drops stale chunks, adds missing ones in batches and
+  leaves the index unbuilt when a write fails
+- BM25 scores match the reference formula
+- Chunk vector deletion by ContentService removes postings; remove_organization drops every project
+- Hybrid keyword search covers chunks beyond the old 1000-chunk scroll cap, with one shared backfill
+"""
+
+import asyncio
+import math
+import uuid
+from collections import Counter
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+from services.rag.keyword_index import BUILT_TTL_SECONDS, KeywordIndex, keyword_index, tokenize
+
+ORG = "org-1"
+PROJECT = "project-1"
+
+DOCS = [
+    ("c1", "The budget review meeting discussed the budget forecast"),
+    ("c2", "Vendor contract renewal blocked on legal review"),
+    ("c3", "Launch date moved; marketing budget approved"),
+]
+
+
+@pytest.fixture
+async def index():
+    index = KeywordIndex()
+    index._redis.client = fake_aioredis.FakeRedis(decode_responses=True)
+    yield index
+    await index._redis.client.aclose()
+
+
+def _reference_bm25(query_terms, docs, chunk_id, k1=1.2, b=0.5):
+    tokenized = {cid: tokenize(text) for cid, text in docs}
+    avgdl = sum(len(t) for t in tokenized.values()) / len(tokenized)
+    tf = Counter(tokenized[chunk_id])
+    score = 0.0
+    for term in query_terms:
+        if term not in tf:
+            continue
+        df = sum(1 for t in tokenized.values() if term in t)
+        idf = math.log((len(docs) + 1) / (df + 1))
+        score += idf * tf[term] * (k1 + 1) / (tf[term] + k1 * (1 - b + b * len(tokenized[chunk_id]) / avgdl))
+    return score
+
+
+@pytest.mark.asyncio
+async def test_search_matches_reference_bm25(index):
+    """Postings-based scores equal BM25 computed from scratch."""
+    assert await index.add_documents(ORG, PROJECT, DOCS) == 3
+    # Re-adding the same chunks is a no-op
+    assert await index.add_documents(ORG, PROJECT, DOCS) is None
+    assert not await index.rebuild(ORG, PROJECT, DOCS)
+
+    query_terms = tokenize("budget review")
+    hits = await index.search(ORG, PROJECT, query_terms, limit=10)
+
+    assert [chunk_id for chunk_id, _, _ in hits][0] == "c1"
+    for chunk_id, score, matched in hits:
+        assert score == pytest.approx(_reference_bm25(query_terms, DOCS, chunk_id))
+        assert set(matched) <= set(query_terms)
+
+    stats = await index.get_stats(ORG, PROJECT)
+    assert stats["documents"] == 3
+
+
+@pytest.mark.asyncio
+async def test_remove_documents_updates_postings_and_stats(index):
+    """Removed chunks disappear from postings; N and avgdl are adjusted."""
+    await index.add_documents(ORG, PROJECT, DOCS)
+
+    assert await index.remove_documents(ORG, PROJECT, ["c1", "missing"]) == 1
+
+    hits = await index.search(ORG, PROJECT, tokenize("budget"), limit=10)
+    assert [chunk_id for chunk_id, _, _ in hits] == ["c3"]
+    remaining = DOCS[1:]
+    assert hits[0][1] == pytest.approx(_reference_bm25(["budget"], remaining, "c3"))
+
+    stats = await index.get_stats(ORG, PROJECT)
+    assert stats["documents"] == 2
+    assert stats["average_length"] == pytest.approx(
+        sum(len(tokenize(text)) for _, text in remaining) / 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_adds_count_chunks_once(index):
+    """Racing adds of the same chunks leave N and avgdl as if added once."""
+    read_response = fake_aioredis.FakeBaseAsyncConnection.read_response
+
+    async def interleaved_read_response(self, **kwargs):
+        # Yield on every reply so the adds interleave between check and write
+        await asyncio.sleep(0)
+        return await read_response(self, **kwargs)
+
+    with patch.object(fake_aioredis.FakeBaseAsyncConnection, "read_response", interleaved_read_response):
+        added = await asyncio.gather(*(index.add_documents(ORG, PROJECT, DOCS) for _ in range(4)))
+
+    assert sum(added) == 3
+    stats = await index.get_stats(ORG, PROJECT)
+    assert stats["documents"] == 3
+    assert stats["average_length"] == pytest.approx(sum(len(tokenize(text)) for _, text in DOCS) / 3)
+
+
+@pytest.mark.asyncio
+async def test_failed_add_clears_built_flag(index):
+    """A Redis error while adding un-marks the index so the next search rebuilds it."""
+    client = index._redis.client
+    await index.mark_built(ORG, PROJECT)
+
+    def broken_pipeline(*args, **kwargs):
+        raise ConnectionError("connection reset")
+
+    with patch.object(client, "pipeline", broken_pipeline):
+        assert await index.add_documents(ORG, PROJECT, DOCS) is None
+
+    index._redis.client = client
+    assert await index.is_built(ORG, PROJECT) is False
+
+
+@pytest.mark.asyncio
+async def test_failed_remove_clears_built_flag(index):
+    """A removal that fails un-marks the index instead of leaving stale postings behind."""
+    client = index._redis.client
+    await index.add_documents(ORG, PROJECT, DOCS)
+    await index.mark_built(ORG, PROJECT)
+
+    def broken_pipeline(*args, **kwargs):
+        raise ConnectionError("connection reset")
+
+    with patch.object(client, "pipeline", broken_pipeline):
+        assert await index.remove_documents(ORG, PROJECT, ["c1"]) is None
+
+    index._redis.client = client
+    assert await index.is_built(ORG, PROJECT) is False
+
+
+@pytest.mark.asyncio
+async def test_built_flag_expires(index):
+    """The built flag has a TTL so writes missed while Redis was down are eventually repaired."""
+    assert await index.mark_built(ORG, PROJECT)
+
+    ttl = await index._redis.client.ttl(index._key(ORG, PROJECT, "built"))
+    assert 0 < ttl <= BUILT_TTL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_rebuild_reconciles_in_batches(index):
+    """Stale chunks are dropped, missing chunks added in bounded batches, then the index is marked built."""
+    await index.add_documents(ORG, PROJECT, [("gone", "budget from a deleted chunk"), DOCS[0]])
+    add_documents = patch.object(index, "add_documents", wraps=index.add_documents)
+
+    with patch("services.rag.keyword_index.REBUILD_BATCH_SIZE", 2), add_documents as add:
+        assert await index.rebuild(ORG, PROJECT, DOCS)
+
+    assert [len(call.args[2]) for call in add.await_args_list] == [2, 1]
+    assert await index.is_built(ORG, PROJECT)
+    stats = await index.get_stats(ORG, PROJECT)
+    assert stats["documents"] == 3
+    hits = await index.search(ORG, PROJECT, ["budget"], limit=10)
+    assert [h[0] for h in hits] == ["c1"]
+
+
+@pytest.mark.asyncio
+async def test_failed_rebuild_is_not_marked_built(index):
+    """A backfill whose add fails leaves the index unbuilt so the next search retries it."""
+    with patch.object(index, "add_documents", AsyncMock(side_effect=[1, None])), \
+         patch("services.rag.keyword_index.REBUILD_BATCH_SIZE", 2):
+        assert not await index.rebuild(ORG, PROJECT, DOCS)
+
+    assert await index.is_built(ORG, PROJECT) is False
+
+
+@pytest.mark.asyncio
+async def test_unavailable_index_returns_none():
+    """Without Redis the index reports unavailable so callers can fall back."""
+    index = KeywordIndex()
+    index._redis.retry_at = float("inf")
+
+    assert await index.search(ORG, PROJECT, ["budget"], limit=5) is None
+    assert await index.is_built(ORG, PROJECT) is None
+    assert await index.add_documents(ORG, PROJECT, DOCS) == 0
+
+
+@pytest.fixture
+async def store_with_index():
+    from db.multi_tenant_vector_store import MultiTenantVectorStore
+
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(":memory:")
+    store.use_async_client = False
+    original_redis = keyword_index._redis.client
+    keyword_index._redis.client = fake_aioredis.FakeRedis(decode_responses=True)
+    yield store
+    await keyword_index._redis.client.aclose()
+    keyword_index._redis.client = original_redis
+    store._client.close()
+
+
+async def _insert_chunks(store, organization_id, texts, project_id=PROJECT, content_id="content-1"):
+    points = [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=[0.1] * 768,
+            payload={"project_id": project_id, "content_id": content_id, "text": text, "chunk_index": i}
+        )
+        for i, text in enumerate(texts)
+    ]
+    await store.insert_vectors(organization_id, points)
+    await keyword_index.add_documents(organization_id, project_id, [(str(p.id), p.payload["text"]) for p in points])
+    return [str(p.id) for p in points]
+
+
+@pytest.mark.asyncio
+async def test_deleted_chunks_leave_index(store_with_index):
+    """Deleting chunk vectors through ContentService removes them from the keyword index."""
+    pytest.importorskip("sentence_transformers")
+    from services.core.content_service import ContentService
+
+    store = store_with_index
+    organization_id = str(uuid.uuid4())
+    ids_a = await _insert_chunks(store, organization_id, ["budget alpha", "budget beta"], content_id="a")
+    ids_b = await _insert_chunks(store, organization_id, ["budget gamma"], content_id="b")
+    # A chunk without the term keeps its idf above zero
+    await _insert_chunks(store, organization_id, ["unrelated note"], content_id="c")
+
+    with patch("db.multi_tenant_vector_store.multi_tenant_vector_store", store):
+        await ContentService._delete_chunk_vectors(organization_id, PROJECT, [ids_a[0], *ids_b])
+
+    hits = await keyword_index.search(organization_id, PROJECT, ["budget"], limit=10)
+    assert [h[0] for h in hits] == [ids_a[1]]
+    assert (await keyword_index.get_stats(organization_id, PROJECT))["documents"] == 2
+    assert len(await store.find_points(organization_id, {"project_id": PROJECT})) == 2
+
+    await keyword_index.remove_organization(organization_id)
+    assert (await keyword_index.get_stats(organization_id, PROJECT))["documents"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_keyword_search_covers_all_chunks(store_with_index):
+    """Chunks beyond the first 1000 are found, via one shared backfill of an unbuilt index."""
+    pytest.importorskip("sentence_transformers")
+    from services.rag.hybrid_search import HybridSearchService, SearchContext
+
+    store = store_with_index
+    organization_id = str(uuid.uuid4())
+    texts = [f"routine status update number {i}" for i in range(1200)] + ["escalation about the datacenter outage"]
+    points = [
+        PointStruct(id=str(uuid.uuid4()), vector=[0.1] * 768, payload={"project_id": PROJECT, "text": text})
+        for text in texts
+    ]
+    await store.insert_vectors(organization_id, points)
+
+    with patch("services.rag.hybrid_search.multi_tenant_vector_store", store):
+        service = HybridSearchService()
+
+        async def organization_for(project_id):
+            return organization_id
+
+        service._get_organization_id = organization_for
+        scroll = patch.object(service, "_get_all_project_documents", wraps=service._get_all_project_documents)
+        with scroll as get_all_documents:
+            ctx = SearchContext(query="datacenter outage", project_id=PROJECT, config=service.config)
+            concurrent = await asyncio.gather(*(service._keyword_search(ctx) for _ in range(3)))
+        results = concurrent[0]
+
+    assert [r.chunk_id for r in results] == [str(points[-1].id)]
+    assert results[0].text == texts[-1]
+    assert all([r.chunk_id for r in other] == [str(points[-1].id)] for other in concurrent)
+    # Concurrent queries share one backfill and the lock is released afterwards
+    assert get_all_documents.await_count == 1
+    assert len(service._index_build_locks) == 0
+    assert await keyword_index.is_built(organization_id, PROJECT)
+    assert (await keyword_index.get_stats(organization_id, PROJECT))["documents"] == 1201
+
+
+@pytest.mark.asyncio
+async def test_failed_backfill_falls_back_to_scan(store_with_index):
+    """When the backfill cannot be written the query scans Qdrant and the index stays unbuilt."""
+    pytest.importorskip("sentence_transformers")
+    from services.rag.hybrid_search import HybridSearchService, SearchContext
+
+    store = store_with_index
+    organization_id = str(uuid.uuid4())
+    ids = await _insert_chunks(store, organization_id, ["datacenter outage escalation", "routine status update"])
+
+    with patch("services.rag.hybrid_search.multi_tenant_vector_store", store), \
+         patch.object(keyword_index, "add_documents", AsyncMock(return_value=None)):
+        service = HybridSearchService()
+
+        async def organization_for(project_id):
+            return organization_id
+
+        service._get_organization_id = organization_for
+        ctx = SearchContext(query="datacenter outage", project_id=PROJECT, config=service.config)
+        results = await service._keyword_search(ctx)
+
+    assert [r.chunk_id for r in results] == [ids[0]]
+    assert await keyword_index.is_built(organization_id, PROJECT) is False
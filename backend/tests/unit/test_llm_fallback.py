@@ -5,6 +5,7 @@ Tests the ProviderCascade and MultiProviderLLMClient's ability to:
 - Automatically fallback to OpenAI when Claude is overloaded (529 error)
 - Translate models to equivalent quality tiers
 - Track fallback metadata for observability
+- Fall back for streamed answers before the first token
 """
 
 import pytest
@@ -659,3 +660,112 @@ class TestCircuitBreaker:
         # Circuit should have recovered and used primary
         assert metadata3["fallback_triggered"] is False
         assert response3 == claude_success
+
+
+def _text_stream(*texts, error=None, fail_after=None):
+    """Provider create_text_stream replacement yielding texts then usage."""
+    async def stream(**kwargs):
+        for i, text in enumerate(texts):
+            if error is not None and fail_after == i:
+                raise error
+            yield {"type": "text", "text": text}
+        if error is not None and (fail_after is None or fail_after >= len(texts)):
+            raise error
+        yield {"type": "usage", "input_tokens": 10, "output_tokens": len(texts)}
+    return Mock(side_effect=stream)
+
+
+class TestStreamingFallback:
+    """Test ProviderCascade fallback for streamed text answers."""
+
+    @staticmethod
+    async def _collect(stream):
+        return [event async for event in stream]
+
+    @pytest.mark.asyncio
+    async def test_overload_before_first_token_falls_back(self, mock_settings, mock_claude_client, mock_openai_client):
+        """A 529 while opening the stream switches to the fallback provider's stream."""
+        mock_claude_client.create_text_stream = _text_stream(error=Exception("Error code: 529 - overloaded"), fail_after=0)
+        mock_openai_client.create_text_stream = _text_stream("Fallback ", "answer")
+
+        cascade = ProviderCascade(
+            primary_client=mock_claude_client,
+            primary_provider_name="Claude",
+            fallback_client=mock_openai_client,
+            fallback_provider_name="OpenAI",
+            settings=mock_settings
+        )
+
+        stream, metadata = await cascade.execute_with_fallback(
+            operation="create_text_stream",
+            primary_model="claude-3-5-haiku-latest",
+            prompt="Test prompt",
+            model="claude-3-5-haiku-latest",
+            max_tokens=100,
+            temperature=0.7
+        )
+        events = await self._collect(stream)
+
+        assert [e["text"] for e in events if e["type"] == "text"] == ["Fallback ", "answer"]
+        assert events[-1]["type"] == "usage"
+        assert metadata["fallback_triggered"] is True
+        assert metadata["provider_used"] == "OpenAI"
+        assert mock_openai_client.create_text_stream.call_args.kwargs["model"] == "gpt-4.1-mini"
+
+    @pytest.mark.asyncio
+    async def test_first_event_is_replayed(self, mock_settings, mock_claude_client, mock_openai_client):
+        """The event awaited to detect errors is not lost from the primary stream."""
+        mock_claude_client.create_text_stream = _text_stream("Hello", " world")
+        mock_openai_client.create_text_stream = _text_stream("unused")
+
+        cascade = ProviderCascade(
+            primary_client=mock_claude_client,
+            primary_provider_name="Claude",
+            fallback_client=mock_openai_client,
+            fallback_provider_name="OpenAI",
+            settings=mock_settings
+        )
+
+        stream, metadata = await cascade.execute_with_fallback(
+            operation="create_text_stream",
+            primary_model="claude-3-5-haiku-latest",
+            prompt="Test prompt",
+            model="claude-3-5-haiku-latest",
+            max_tokens=100,
+            temperature=0.7
+        )
+
+        assert "".join(e.get("text", "") for e in await self._collect(stream)) == "Hello world"
+        assert metadata["fallback_triggered"] is False
+        mock_openai_client.create_text_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_error_after_first_token_propagates(self, mock_settings, mock_claude_client, mock_openai_client):
+        """Once text was emitted the answer cannot switch providers; the error surfaces."""
+        mock_claude_client.create_text_stream = _text_stream("Partial", " answer", error=Exception("Error code: 529"), fail_after=1)
+        mock_openai_client.create_text_stream = _text_stream("unused")
+
+        cascade = ProviderCascade(
+            primary_client=mock_claude_client,
+            primary_provider_name="Claude",
+            fallback_client=mock_openai_client,
+            fallback_provider_name="OpenAI",
+            settings=mock_settings
+        )
+
+        stream, metadata = await cascade.execute_with_fallback(
+            operation="create_text_stream",
+            primary_model="claude-3-5-haiku-latest",
+            prompt="Test prompt",
+            model="claude-3-5-haiku-latest",
+            max_tokens=100,
+            temperature=0.7
+        )
+
+        received = []
+        with pytest.raises(Exception, match="529"):
+            async for event in stream:
+                received.append(event["text"])
+
+        assert received == ["Partial"]
+        mock_openai_client.create_text_stream.assert_not_called()
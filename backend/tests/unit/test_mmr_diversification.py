@@ -0,0 +1,144 @@
+"""
+Unit tests for MMR diversification over stored chunk vectors.
+
+Tests cover:
+- MMR prefers a novel result over a near-duplicate of the top hit
+- Lambda 1.0 keeps pure relevance order; duplicates above the threshold are dropped
+- Diversity score reuses the MMR similarity matrix without model inference
+- Missing vectors are fetched from Qdrant (stored 768d named vector), not re-encoded
+"""
+
+import uuid
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+pytest.importorskip("sentence_transformers")
+
+from config import get_settings  # noqa: E402
+from services.rag.hybrid_search import (  # noqa: E402
+    HybridSearchConfig, HybridSearchService, SearchContext, SearchResult, SearchType
+)
+
+
+class NoInference:
+    """Fails the test if anything tries to encode text."""
+
+    def encode(self, *args, **kwargs):
+        raise AssertionError("diversification must not run model inference")
+
+
+def _result(chunk_id, score, vector):
+    return SearchResult(
+        chunk_id=chunk_id,
+        text=chunk_id,
+        metadata={},
+        final_score=score,
+        search_types=[SearchType.SEMANTIC],
+        embedding=None if vector is None else np.asarray(vector, dtype=np.float32)
+    )
+
+
+@pytest.fixture
+def service():
+    service = HybridSearchService()
+    service.cross_encoder = None
+    service.sentence_transformer = NoInference()
+    return service
+
+
+def _candidates():
+    # b is almost a copy of a; c is less relevant but covers something else
+    return [
+        _result("a", 1.0, [1.0, 0.0, 0.0]),
+        _result("b", 0.95, [0.8, 0.6, 0.0]),
+        _result("c", 0.85, [0.0, 0.0, 1.0]),
+        _result("d", 0.5, [0.0, 1.0, 0.0]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mmr_prefers_novel_results(service):
+    """With a balanced lambda the novel result outranks the near-duplicate."""
+    config = HybridSearchConfig(mmr_lambda=0.5, diversity_similarity_threshold=0.99)
+    selected = await service._diversify_results(_candidates(), "q", config)
+    assert [r.chunk_id for r in selected] == ["a", "c", "b", "d"]
+
+
+@pytest.mark.asyncio
+async def test_lambda_and_duplicate_threshold(service):
+    """Lambda 1.0 is relevance order; results above the threshold are removed."""
+    relevance_only = HybridSearchConfig(mmr_lambda=1.0, diversity_similarity_threshold=0.99)
+    selected = await service._diversify_results(_candidates(), "q", relevance_only)
+    assert [r.chunk_id for r in selected] == ["a", "b", "c", "d"]
+
+    dedup = HybridSearchConfig(mmr_lambda=1.0, diversity_similarity_threshold=0.75)
+    selected = await service._diversify_results(_candidates(), "q", dedup)
+    assert [r.chunk_id for r in selected] == ["a", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_results_without_vectors_rank_by_relevance(service):
+    """Candidates lacking a stored vector are never treated as duplicates."""
+    results = [_result(f"r{i}", 1.0 - i * 0.1, None) for i in range(5)]
+    selected = await service._diversify_results(results, "q", HybridSearchConfig(final_result_count=3))
+    assert [r.chunk_id for r in selected] == ["r0", "r1", "r2"]
+    assert await service._calculate_diversity_score(results) == pytest.approx((0.25 + 0.5) / 2)
+
+
+@pytest.mark.asyncio
+async def test_diversity_score_reuses_mmr_matrix(service):
+    """The diversity metric reads the similarity matrix computed for MMR."""
+    ctx = SearchContext(query="q", project_id="p1", config=HybridSearchConfig(diversity_similarity_threshold=0.99))
+    selected = await service._diversify_results(_candidates(), "q", ctx.config, ctx)
+    assert ctx.similarity is not None
+
+    with patch.object(service, "_result_similarity", side_effect=AssertionError("recomputed")):
+        score = await service._calculate_diversity_score(selected, ctx)
+
+    # Pairs: a-b 0.8, b-d 0.6, all others 0.0 -> mean similarity 1.4 / 6
+    assert score == pytest.approx((0.25 + (1.0 - 1.4 / 6)) / 2, abs=1e-5)
+
+
+@pytest.fixture
+def mrl_settings():
+    settings = get_settings()
+    original = settings.enable_mrl
+    settings.enable_mrl = True
+    yield settings
+    settings.enable_mrl = original
+
+
+@pytest.mark.asyncio
+async def test_missing_vectors_fetched_from_store(mrl_settings):
+    """Results retrieved without vectors get the stored 768d vector in one retrieve."""
+    from db.multi_tenant_vector_store import MultiTenantVectorStore
+
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(":memory:")
+    store.use_async_client = False
+    organization_id = str(uuid.uuid4())
+
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((2, 768)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [str(uuid.uuid4()) for _ in range(2)]
+    await store.insert_vectors(organization_id, [
+        PointStruct(id=ids[i], vector=vectors[i].tolist(), payload={"project_id": "p1", "text": f"chunk {i}"})
+        for i in range(2)
+    ])
+
+    service = HybridSearchService()
+    ctx = SearchContext(query="q", project_id="p1", config=service.config, organization_id=organization_id)
+    results = [_result(chunk_id, 1.0, None) for chunk_id in ids]
+
+    with patch("services.rag.hybrid_search.multi_tenant_vector_store", store):
+        await service._attach_missing_vectors(ctx, results)
+
+    for result, vector in zip(results, vectors):
+        assert result.embedding.shape == (768,)
+        np.testing.assert_allclose(result.embedding, vector, atol=1e-5)
+    store._client.close()
@@ -0,0 +1,179 @@
+"""
+Unit tests for the process-wide model registry.
+
+Tests cover:
+- Concurrent first requests load a model once and share the instance
+- Reference counting and unload on last release
+- Stats with memory estimates from tensor parameters
+- SharedModel attributes: lazy, shared across services, overridable, None on load failure
+- Preloading resolves models off the event loop; releasing drops the services' references
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from services.rag.model_registry import (
+    ModelRegistry,
+    SharedModel,
+    preload_shared_models,
+    release_shared_models,
+)
+
+
+class FakeTensor:
+    def __init__(self, size):
+        self._size = size
+
+    def numel(self):
+        return self._size
+
+    def element_size(self):
+        return 4
+
+
+class FakeModel:
+    def parameters(self):
+        return [FakeTensor(1024 * 1024), FakeTensor(1024 * 1024)]
+
+    def buffers(self):
+        return []
+
+
+def test_concurrent_acquire_loads_once():
+    """Threads racing on the first request get one shared instance."""
+    registry = ModelRegistry()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.acquire("st:a", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert len({id(model) for model in results}) == 1
+    assert registry.get_stats()["models"][0]["refcount"] == 8
+
+
+def test_release_unloads_at_zero():
+    """The model stays loaded while any holder remains."""
+    registry = ModelRegistry()
+    registry.acquire("st:a", object)
+    registry.acquire("st:a", object)
+
+    registry.release("st:a")
+    assert registry.get("st:a") is not None
+
+    registry.release("st:a")
+    assert registry.get("st:a") is None
+    assert registry.get_stats()["loaded_models"] == 0
+
+    registry.release("st:unknown")
+
+
+def test_failed_load_is_retried():
+    """A loader error registers nothing; the next request loads again."""
+    registry = ModelRegistry()
+
+    def failing():
+        raise OSError("model not found")
+
+    with pytest.raises(OSError):
+        registry.acquire("spacy:missing", failing)
+    assert registry.get("spacy:missing") is None
+    assert registry.acquire("spacy:missing", object) is not None
+
+
+@pytest.mark.asyncio
+async def test_stats_report_memory():
+    """Memory is estimated from parameters; models without tensors report None."""
+    registry = ModelRegistry()
+    await registry.acquire_async("st:a", FakeModel, kind="sentence-transformer")
+    registry.acquire("spacy:b", object, kind="spacy")
+
+    stats = registry.get_stats()
+    by_key = {m["key"]: m for m in stats["models"]}
+    assert by_key["st:a"]["memory_mb"] == 8.0
+    assert by_key["st:a"]["kind"] == "sentence-transformer"
+    assert by_key["spacy:b"]["memory_mb"] is None
+    assert stats["total_memory_mb"] == 8.0
+
+
+def test_shared_model_attribute():
+    """Services share the registry model, load it on first access and accept overrides."""
+    registry = ModelRegistry()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return np.zeros(1)
+
+    class Service:
+        model = SharedModel(lambda service: registry.acquire("st:a", loader), "test model")
+
+    first, second = Service(), Service()
+    assert not loads
+
+    assert first.model is second.model
+    assert first.model is first.model
+    assert len(loads) == 1
+    assert registry.get_stats()["models"][0]["refcount"] == 2
+
+    mock = object()
+    second.model = mock
+    assert second.model is mock
+    assert first.model is not mock
+
+
+def test_shared_model_failure_resolves_to_none():
+    """A model that cannot be loaded disables the feature instead of raising."""
+    def failing(service):
+        raise OSError("no such model")
+
+    class Service:
+        nlp_model = SharedModel(failing, "spaCy model")
+
+    assert Service().nlp_model is None
+
+
+@pytest.mark.asyncio
+async def test_preload_and_release_shared_models():
+    """Preloading loads every service model in the thread pool; release unloads them."""
+    registry = ModelRegistry()
+    loader_threads = []
+
+    def loader():
+        loader_threads.append(threading.current_thread())
+        return np.zeros(1)
+
+    class Service:
+        model = SharedModel(lambda service: registry.acquire("st:a", loader), "test model", registry=registry)
+
+    class ChildService(Service):
+        nlp_model = SharedModel(lambda service: registry.acquire("spacy:b", loader), "spaCy model", registry=registry)
+
+    first, second = Service(), ChildService()
+    await preload_shared_models(first, second)
+
+    assert len(loader_threads) == 2
+    assert threading.main_thread() not in loader_threads
+    by_key = {m["key"]: m for m in registry.get_stats()["models"]}
+    assert by_key["st:a"]["refcount"] == 2
+    assert by_key["spacy:b"]["refcount"] == 1
+    # Resolved attributes are served without touching the registry again
+    assert second.nlp_model is registry.get("spacy:b")
+
+    release_shared_models(first, second)
+    assert registry.get_stats()["loaded_models"] == 0
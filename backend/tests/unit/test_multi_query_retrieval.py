@@ -0,0 +1,142 @@
+"""
+Unit tests for multi-query retrieval.
+
+Tests cover:
+- All variations are embedded in one call and searched in one batch request with stored vectors
+- Merge by chunk ID keeps the best-scoring hit; near-duplicate vectors collapse
+- Diversity score uses stored vectors (no model inference)
+- Per-stage timings and variation count are reported
+- Fallback retrieval with two-stage search enabled
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from config import get_settings  # noqa: E402
+from services.rag.multi_query_retrieval import (  # noqa: E402
+    MultiQueryRetrievalService, QueryIntent, QueryVariation, RetrievalResult
+)
+
+MODULE = "services.rag.multi_query_retrieval"
+
+
+def _variation(text, variation_type="original"):
+    return QueryVariation(
+        original_query="q", variation_text=text, variation_type=variation_type,
+        intent=QueryIntent.GENERAL, confidence=1.0, entities=[], keywords=[]
+    )
+
+
+def _hit(chunk_id, score, vector):
+    return {"id": chunk_id, "score": score, "payload": {"text": chunk_id}, "vector": vector}
+
+
+def _result(chunk_id, score, vector, source="q"):
+    return RetrievalResult(
+        chunk_id=chunk_id, text=chunk_id, score=score, source_query=source,
+        source_variation_type="original", metadata={}, relevance_factors={},
+        embedding=None if vector is None else np.asarray(vector, dtype=np.float32)
+    )
+
+
+@pytest.fixture
+def service():
+    service = MultiQueryRetrievalService()
+    service._get_organization_id = AsyncMock(return_value="org-1")
+    return service
+
+
+@pytest.mark.asyncio
+async def test_batch_embeds_once_and_searches_once(service):
+    """N variations cost one encode call and one batch search returning stored vectors."""
+    variations = [_variation("a"), _variation("b", "synonym"), _variation("c", "expansion")]
+    encode = AsyncMock(return_value=np.eye(3, dtype=np.float32))
+    search = AsyncMock(return_value=[
+        [_hit("x", 0.9, [1.0, 0.0, 0.0])],
+        [_hit("x", 0.8, [1.0, 0.0, 0.0])],
+        [_hit("y", 0.7, [0.0, 1.0, 0.0])],
+    ])
+    timings = {}
+
+    with patch(f"{MODULE}.embedding_service.encode_array", encode), \
+         patch(f"{MODULE}.multi_tenant_vector_store.search_vectors_batch", search):
+        results = await service._execute_query_batch(variations, "p1", 10, timings)
+
+    encode.assert_awaited_once_with(["a", "b", "c"])
+    search.assert_awaited_once()
+    assert len(search.call_args.kwargs["queries"]) == 3
+    assert search.call_args.kwargs["with_vectors"] == service._result_vectors_selector()
+    assert [r.source_query for r in results] == ["a", "b", "c"]
+    assert results[2].embedding.tolist() == [0.0, 1.0, 0.0]
+    assert set(timings) == {"embedding", "search"}
+
+
+@pytest.mark.asyncio
+async def test_dedup_merges_chunk_ids_and_near_duplicates(service):
+    """Best hit per chunk survives; a near-identical chunk is dropped; vectorless chunks stay."""
+    results = [
+        _result("a", 0.6, [1.0, 0.0], source="v1"),
+        _result("b", 0.7, [0.0, 1.0]),
+        _result("a", 0.9, [1.0, 0.0], source="v2"),
+        _result("a-copy", 0.5, [0.99, 0.05]),
+        _result("c", 0.4, None),
+    ]
+
+    deduplicated = await service._deduplicate_results(results)
+
+    assert [(r.chunk_id, r.score) for r in deduplicated] == [("a", 0.9), ("b", 0.7), ("c", 0.4)]
+    assert deduplicated[0].source_query == "v2"
+
+
+def test_diversity_uses_stored_vectors(service):
+    """Content diversity is one minus the mean pairwise similarity of stored vectors."""
+    results = [
+        _result("a", 0.9, [1.0, 0.0]),
+        _result("b", 0.8, [0.0, 1.0]),
+    ]
+    # One variation type over two results -> 0.5; orthogonal vectors -> content diversity 1.0
+    assert service._calculate_diversity_score(results) == pytest.approx(0.75)
+
+    results[1].embedding = None
+    assert service._calculate_diversity_score(results) == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_reports_stage_timings(service):
+    """The result reports variation count and time per stage."""
+    variations = [_variation("a"), _variation("b", "synonym")]
+    with patch.object(service, "_generate_query_variations", AsyncMock(return_value=variations)), \
+         patch.object(service, "_extract_entities", AsyncMock(return_value=[])), \
+         patch(f"{MODULE}.embedding_service.encode_array", AsyncMock(return_value=np.eye(2, dtype=np.float32))), \
+         patch(f"{MODULE}.multi_tenant_vector_store.search_vectors_batch",
+               AsyncMock(return_value=[[_hit("x", 0.9, [1.0, 0.0])], [_hit("y", 0.8, [0.0, 1.0])]])):
+        results = await service.retrieve_with_multi_query("what was decided", "p1", max_results=5)
+
+    assert results.total_queries_executed == 2
+    assert {"analysis", "variations", "embedding", "search", "dedup", "ranking", "metrics", "total"} <= set(results.stage_timings_ms)
+    assert [r.chunk_id for r in results.deduplicated_results] == ["x", "y"]
+
+
+@pytest.fixture
+def two_stage_settings():
+    settings = get_settings()
+    original = (settings.enable_mrl, settings.rag_use_two_stage_search)
+    settings.enable_mrl, settings.rag_use_two_stage_search = True, True
+    yield settings
+    settings.enable_mrl, settings.rag_use_two_stage_search = original
+
+
+@pytest.mark.asyncio
+async def test_fallback_two_stage(service, two_stage_settings):
+    """Fallback retrieval runs the two-stage search without referencing loop variables."""
+    two_stage = AsyncMock(return_value=[_hit("x", 0.9, None)])
+    with patch(f"{MODULE}.embedding_service.encode_array", AsyncMock(return_value=np.ones((1, 4), dtype=np.float32))), \
+         patch(f"{MODULE}.multi_tenant_vector_store.search_vectors_two_stage", two_stage):
+        results = await service._fallback_retrieval("status update", "p1", 5)
+
+    two_stage.assert_awaited_once()
+    assert [r.chunk_id for r in results.deduplicated_results] == ["x"]
@@ -0,0 +1,152 @@
+"""
+Unit tests for the shared project scope cache.
+
+Tests cover:
+- Repeated lookups are served from memory; misses for many projects cost one query
+- Unknown and malformed project IDs resolve to nothing (organization lookup raises)
+- LRU bound and TTL expiry
+- Invalidation by project, program and portfolio
+- Multi-project RAG search resolves all projects at once and drops other organizations
+"""
+
+import uuid
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.cache.project_scope_cache import ProjectScopeCache
+
+Row = namedtuple("Row", "id organization_id program_id portfolio_id")
+
+ORG = uuid.uuid4()
+PROGRAM = uuid.uuid4()
+PORTFOLIO = uuid.uuid4()
+
+
+def _session(rows):
+    """Fake session answering the scope SELECT with rows whose IDs were asked for."""
+    by_id = {row.id: row for row in rows}
+
+    async def execute(stmt):
+        requested = stmt.whereclause.right.value
+        result = MagicMock()
+        result.all.return_value = [by_id[pid] for pid in requested if pid in by_id]
+        return result
+
+    return MagicMock(execute=AsyncMock(side_effect=execute))
+
+
+@asynccontextmanager
+async def _context(session):
+    yield session
+
+
+def _rows(count, organization_id=ORG, program_id=None, portfolio_id=None):
+    return [Row(uuid.uuid4(), organization_id, program_id, portfolio_id) for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_batch_miss_is_one_query_then_memory():
+    """Resolving N uncached projects runs a single SELECT; the next lookups hit memory."""
+    rows = _rows(3, program_id=PROGRAM, portfolio_id=PORTFOLIO)
+    session = _session(rows)
+    cache = ProjectScopeCache()
+    project_ids = [str(row.id) for row in rows]
+
+    scopes = await cache.get_scopes(project_ids, session)
+    assert session.execute.await_count == 1
+    assert set(scopes) == set(project_ids)
+    assert scopes[project_ids[0]].organization_id == str(ORG)
+    assert scopes[project_ids[0]].program_id == str(PROGRAM)
+    assert scopes[project_ids[0]].portfolio_id == str(PORTFOLIO)
+
+    assert await cache.get_organization_id(rows[1].id, session) == str(ORG)
+    assert session.execute.await_count == 1
+
+    stats = cache.get_stats()
+    assert stats['misses'] == 3 and stats['hits'] == 1 and stats['db_queries'] == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_and_malformed_projects():
+    """Unknown IDs are omitted, malformed IDs never reach the database."""
+    session = _session([])
+    cache = ProjectScopeCache()
+
+    assert await cache.get_scopes(["not-a-uuid"], session) == {}
+    session.execute.assert_not_awaited()
+
+    with pytest.raises(ValueError, match="Could not determine organization"):
+        await cache.get_organization_id(uuid.uuid4(), session)
+
+
+@pytest.mark.asyncio
+async def test_lru_bound_and_ttl():
+    """The least recently used entry is evicted; expired entries are reloaded."""
+    rows = _rows(3)
+    session = _session(rows)
+    cache = ProjectScopeCache(max_entries=2, ttl_seconds=60)
+
+    await cache.get_scopes([rows[0].id, rows[1].id], session)
+    await cache.get_scope(rows[0].id, session)   # rows[1] is now least recently used
+    await cache.get_scope(rows[2].id, session)
+    assert cache.get_stats()['entries'] == 2
+    assert cache.get_stats()['evictions'] == 1
+
+    await cache.get_scope(rows[0].id, session)
+    assert session.execute.await_count == 2
+
+    with patch("services.cache.project_scope_cache.time.monotonic", return_value=10 ** 9):
+        await cache.get_scope(rows[0].id, session)
+    assert session.execute.await_count == 3
+    assert cache.get_stats()['expired'] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation():
+    """Moves and deletions drop exactly the affected projects."""
+    in_program = _rows(2, program_id=PROGRAM, portfolio_id=PORTFOLIO)
+    in_portfolio = _rows(1, portfolio_id=PORTFOLIO)
+    standalone = _rows(1)
+    session = _session(in_program + in_portfolio + standalone)
+    cache = ProjectScopeCache()
+    await cache.get_scopes([row.id for row in in_program + in_portfolio + standalone], session)
+
+    assert cache.invalidate([str(standalone[0].id).upper()]) == 1
+    assert cache.invalidate_program(PROGRAM) == 2
+    assert cache.invalidate_portfolio(PORTFOLIO) == 1
+    assert cache.get_stats()['entries'] == 0
+
+    await cache.get_scopes([row.id for row in in_program], session)
+    assert cache.invalidate() == 2
+
+
+@pytest.mark.asyncio
+async def test_multi_project_search_resolves_all_projects_once():
+    """Multi-project RAG looks up every project together and searches only one organization."""
+    pytest.importorskip("sentence_transformers")
+    import numpy as np
+    from services.rag.enhanced_rag_service_refactored import EnhancedRAGService, RAGStrategy
+
+    ours = _rows(2)
+    theirs = _rows(1, organization_id=uuid.uuid4())
+    session = _session(ours + theirs)
+    cache = ProjectScopeCache()
+    project_ids = [str(row.id) for row in ours + theirs]
+
+    service = EnhancedRAGService()
+    search = AsyncMock(return_value=[])
+    module = "services.rag.enhanced_rag_service_refactored"
+    with patch(f"{module}.project_scope_cache", cache), \
+         patch("db.database.get_db_context", return_value=_context(session)), \
+         patch(f"{module}.embedding_service.encode_array", AsyncMock(return_value=np.ones((1, 4), dtype=np.float32))), \
+         patch(f"{module}.multi_tenant_vector_store.search_vectors_by_project", search):
+        await service._execute_unified_multi_project_search(
+            project_ids, "status?", service.strategy_configs[RAGStrategy.BASIC], RAGStrategy.BASIC
+        )
+
+    session.execute.assert_awaited_once()
+    assert search.call_args.kwargs['organization_id'] == str(ORG)
+    assert search.call_args.kwargs['project_ids'] == project_ids[:2]
@@ -0,0 +1,125 @@
+"""
+Unit tests for streamed RAG answers.
+
+Tests cover:
+- Sources are emitted before any answer token, tokens arrive as the LLM streams them
+- The done event carries the full result with token usage and time to first token
+- Cached answers are replayed without retrieval
+- Provider failure before the first token falls back to the placeholder answer
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from services.cache.answer_cache import AnswerCacheLookup  # noqa: E402
+from services.rag.enhanced_rag_service_refactored import EnhancedRAGService, RAGStrategy  # noqa: E402
+
+CHUNKS = [
+    {'id': 'c1', 'text': 'The budget was approved on Monday.', 'title': 'Weekly sync', 'score': 0.8},
+    {'id': 'c2', 'text': 'Alice owns the rollout.', 'title': 'Planning', 'score': 0.6},
+]
+
+
+def _llm_stream(*texts, error=None):
+    async def stream(**kwargs):
+        for text in texts:
+            yield {"type": "text", "text": text}
+        if error is not None:
+            raise error
+        yield {"type": "usage", "input_tokens": 100, "output_tokens": 20, "provider": "Claude", "model": "m"}
+    return MagicMock(side_effect=stream)
+
+
+@pytest.fixture
+def service():
+    service = EnhancedRAGService()
+    service.llm_client = MagicMock()
+    service.llm_client.is_available.return_value = True
+    service._retrieve_basic = AsyncMock(return_value=(CHUNKS, {'retrieval_quality': {'avg_score': 0.7}}))
+    service._record_query_success = MagicMock()
+    return service
+
+
+async def _events(service, **kwargs):
+    with patch("services.rag.enhanced_rag_service_refactored.answer_cache") as cache:
+        cache.enabled = kwargs.pop("cache_enabled", False)
+        cache.lookup = AsyncMock(return_value=kwargs.pop("cached", None))
+        cache.store = AsyncMock()
+        events = [
+            event async for event in service.stream_query_project(
+                "p1", "What was decided?", strategy=RAGStrategy.BASIC, organization_id="org-1"
+            )
+        ]
+    return events, cache
+
+
+@pytest.mark.asyncio
+async def test_sources_then_tokens_then_done(service):
+    """Retrieval results go out first; the answer is assembled from streamed tokens."""
+    service.llm_client.create_text_stream = _llm_stream("The budget ", "was approved.")
+
+    events, _ = await _events(service)
+
+    assert [e['event'] for e in events] == ['sources', 'token', 'token', 'done']
+    assert sorted(events[0]['data']['sources']) == ['Planning', 'Weekly sync']
+    assert events[0]['data']['chunks_retrieved'] == 2
+
+    done = events[-1]['data']
+    assert done['answer'] == "The budget was approved."
+    assert done['token_count'] == 120
+    assert done['strategy_used'] == 'basic'
+    assert done['retrieval_quality'] == {'avg_score': 0.7}
+    assert 0 <= done['time_to_first_token_ms'] <= done['response_time_ms']
+    service._record_query_success.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_streamed_answer_is_cached(service):
+    """An LLM-generated streamed answer is stored for the lookup it missed."""
+    service.llm_client.create_text_stream = _llm_stream("Yes.")
+    lookup = AnswerCacheLookup(scope="s", question_digest="d")
+
+    events, cache = await _events(service, cache_enabled=True, cached=lookup)
+
+    cache.store.assert_awaited_once()
+    assert cache.store.call_args.args[1]['answer'] == "Yes."
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_replays_answer(service):
+    """A cached answer skips retrieval and generation."""
+    cached = AnswerCacheLookup(
+        scope="s", question_digest="d", tier="redis",
+        result={'answer': 'Cached answer', 'sources': ['Weekly sync'], 'confidence': 0.9, 'token_count': 50}
+    )
+
+    events, _ = await _events(service, cache_enabled=True, cached=cached)
+
+    assert [e['event'] for e in events] == ['sources', 'token', 'done']
+    assert events[1]['data']['text'] == 'Cached answer'
+    assert events[-1]['data']['cache_hit'] == 'redis'
+    service._retrieve_basic.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failure_before_first_token_uses_placeholder(service):
+    """No tokens were sent yet, so the placeholder answer can still be streamed."""
+    service.llm_client.create_text_stream = _llm_stream(error=RuntimeError("provider down"))
+
+    events, _ = await _events(service)
+
+    tokens = [e['data']['text'] for e in events if e['event'] == 'token']
+    assert len(tokens) == 1 and "Weekly sync" in tokens[0]
+    assert events[-1]['data']['token_count'] == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_mid_answer_propagates(service):
+    """A provider error after tokens were sent ends the stream with the error."""
+    service.llm_client.create_text_stream = _llm_stream("Partial", error=RuntimeError("connection reset"))
+
+    with pytest.raises(RuntimeError, match="connection reset"):
+        await _events(service)
@@ -0,0 +1,59 @@
+"""
+Unit tests for the shared lazily connected Redis client.
+
+Tests cover:
+- Redis URL built with and without a password
+- A failed connection backs off instead of reconnecting on every call
+- Command errors drop the client until the retry interval passes
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.cache.redis_client import LazyRedisClient, build_redis_url, settings
+
+
+def test_build_redis_url():
+    """The password is included only when configured."""
+    with patch.object(settings, "redis_password", None):
+        assert build_redis_url() == f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
+    with patch.object(settings, "redis_password", "secret"):
+        assert build_redis_url().startswith("redis://:secret@")
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_backs_off(monkeypatch):
+    """One connection attempt per retry interval while Redis is down."""
+    now = [1000.0]
+    monkeypatch.setattr("services.cache.redis_client.time.monotonic", lambda: now[0])
+    client = MagicMock()
+    client.ping = AsyncMock(side_effect=ConnectionError("refused"))
+    lazy = LazyRedisClient("Test cache", "bypassed", retry_interval_seconds=30)
+
+    with patch("services.cache.redis_client.redis.from_url", return_value=client) as from_url:
+        assert await lazy.get() is None
+        assert await lazy.get() is None
+        assert from_url.call_count == 1
+
+        now[0] += 31
+        client.ping = AsyncMock()
+        assert await lazy.get() is client
+        assert lazy.connected
+        assert from_url.call_args.kwargs["decode_responses"] is False
+
+
+@pytest.mark.asyncio
+async def test_drop_waits_before_reconnecting(monkeypatch):
+    """After a command error the client is discarded and not recreated until the interval passes."""
+    now = [1000.0]
+    monkeypatch.setattr("services.cache.redis_client.time.monotonic", lambda: now[0])
+    lazy = LazyRedisClient("Test cache", "bypassed", retry_interval_seconds=30)
+    lazy.client = MagicMock()
+
+    lazy.drop(ConnectionError("reset"))
+
+    assert not lazy.connected
+    with patch("services.cache.redis_client.redis.from_url") as from_url:
+        assert await lazy.get() is None
+        from_url.assert_not_called()
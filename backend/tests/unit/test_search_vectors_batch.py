@@ -0,0 +1,162 @@
+"""
+Unit tests for MultiTenantVectorStore.search_vectors_batch and search_vectors_by_project.
+
+Tests cover:
+- One result list per query, in query order
+- Per-query filter, limit and score threshold
+- Two-stage queries match search_vectors_two_stage
+- Single query_batch_points round trip
+- Match-any project filters (list values in filter_dict)
+- Grouped multi-project search with a per-project quota
+"""
+
+import uuid
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+from config import get_settings
+from db.multi_tenant_vector_store import MultiTenantVectorStore
+
+
+@pytest.fixture
+async def seeded_store():
+    settings = get_settings()
+    original = settings.enable_mrl
+    settings.enable_mrl = True
+
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(":memory:")
+    store.use_async_client = False
+    organization_id = str(uuid.uuid4())
+    await store.ensure_organization_collections(organization_id)
+
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((40, 768)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    projects = [("alpha", "beta", "gamma", "delta")[i % 4] for i in range(40)]
+    await store.insert_vectors(organization_id, [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=store.build_mrl_vectors(vectors[i]),
+            payload={"project_id": projects[i], "chunk_index": i}
+        )
+        for i in range(40)
+    ])
+
+    yield store, organization_id, vectors
+
+    store._client.close()
+    settings.enable_mrl = original
+
+
+@pytest.mark.asyncio
+async def test_per_query_filter_and_limit(seeded_store):
+    """Each query keeps its own project filter and limit."""
+    store, organization_id, vectors = seeded_store
+
+    results = await store.search_vectors_batch(organization_id, queries=[
+        {"query_vector": vectors[0], "limit": 3, "filter_dict": {"project_id": "alpha"}},
+        {"query_vector": vectors[1].tolist(), "limit": 5, "filter_dict": {"project_id": "beta"}},
+        {"query_vector": vectors[2], "limit": 2, "score_threshold": 0.99},
+    ])
+
+    assert len(results) == 3
+    assert len(results[0]) == 3
+    assert all(r["payload"]["project_id"] == "alpha" for r in results[0])
+    assert results[0][0]["payload"]["chunk_index"] == 0
+    assert len(results[1]) == 5
+    assert all(r["payload"]["project_id"] == "beta" for r in results[1])
+    # Only the exact match clears the threshold
+    assert [r["payload"]["chunk_index"] for r in results[2]] == [2]
+
+
+@pytest.mark.asyncio
+async def test_two_stage_matches_single_call(seeded_store):
+    """Two-stage batch queries return the same results as search_vectors_two_stage."""
+    store, organization_id, vectors = seeded_store
+
+    batch = await store.search_vectors_batch(organization_id, queries=[
+        {"query_vector": vectors[4], "limit": 4, "filter_dict": {"project_id": "alpha"},
+         "two_stage": True, "initial_limit": 12},
+    ])
+    single = await store.search_vectors_two_stage(
+        organization_id=organization_id,
+        query_vector=vectors[4],
+        initial_limit=12,
+        final_limit=4,
+        filter_dict={"project_id": "alpha"}
+    )
+
+    assert [r["id"] for r in batch[0]] == [r["id"] for r in single]
+
+
+@pytest.mark.asyncio
+async def test_single_round_trip(seeded_store):
+    """All queries are sent in one query_batch_points call."""
+    store, organization_id, vectors = seeded_store
+    calls = []
+    original = store._client.query_batch_points
+
+    def counting_query_batch_points(*args, **kwargs):
+        calls.append(len(kwargs["requests"]))
+        return original(*args, **kwargs)
+
+    store._client.query_batch_points = counting_query_batch_points
+    await store.search_vectors_batch(organization_id, queries=[
+        {"query_vector": vectors[i], "limit": 2} for i in range(6)
+    ])
+
+    assert calls == [6]
+    assert await store.search_vectors_batch(organization_id, queries=[]) == []
+
+
+@pytest.mark.asyncio
+async def test_list_filter_matches_any(seeded_store):
+    """List values in filter_dict match any of the listed projects."""
+    store, organization_id, vectors = seeded_store
+
+    results = await store.search_vectors(
+        organization_id=organization_id,
+        query_vector=vectors[0],
+        limit=40,
+        filter_dict={"project_id": ["alpha", "gamma"]}
+    )
+
+    assert len(results) == 20
+    assert {r["payload"]["project_id"] for r in results} == {"alpha", "gamma"}
+
+
+@pytest.mark.parametrize("two_stage", [False, True])
+@pytest.mark.asyncio
+async def test_grouped_search_enforces_per_project_quota(seeded_store, two_stage):
+    """Every requested project contributes at most per_project_limit results, sorted by score."""
+    store, organization_id, vectors = seeded_store
+
+    results = await store.search_vectors_by_project(
+        organization_id=organization_id,
+        query_vector=vectors[0],
+        project_ids=["alpha", "beta", "gamma"],
+        per_project_limit=2,
+        two_stage=two_stage
+    )
+
+    by_project = {}
+    for r in results:
+        by_project.setdefault(r["payload"]["project_id"], []).append(r)
+    assert set(by_project) == {"alpha", "beta", "gamma"}
+    assert all(len(hits) == 2 for hits in by_project.values())
+    assert results[0]["payload"]["chunk_index"] == 0
+    assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+
+    capped = await store.search_vectors_by_project(
+        organization_id=organization_id,
+        query_vector=vectors[0],
+        project_ids=["alpha", "beta", "gamma"],
+        per_project_limit=2,
+        total_limit=4,
+        two_stage=two_stage
+    )
+    assert [r["id"] for r in capped] == [r["id"] for r in results[:4]]
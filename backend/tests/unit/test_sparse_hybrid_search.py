@@ -0,0 +1,138 @@
+"""
+Unit tests for sparse BM25 vectors and server-side RRF fusion.
+
+Tests cover:
+- SparseTermEncoder document/query weights
+- Content collections created with the sparse vector; sparse vectors attached at insert
+- search_hybrid fuses dense and sparse branches under the project filter
+- Collections without the sparse vector keep working (insert) and report no fusion (None)
+"""
+
+import uuid
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct, VectorParams, Distance
+
+from config import get_settings
+from db.multi_tenant_vector_store import MultiTenantVectorStore
+from services.rag.keyword_index import tokenize
+from services.rag.sparse_encoder import SparseTermEncoder
+
+
+def test_encoder_weights():
+    """Repeated terms saturate; queries carry unit weights over unique terms."""
+    encoder = SparseTermEncoder(k1=1.2, b=0.5, average_length=4.0)
+
+    document = encoder.encode_document("budget budget forecast review")
+    weights = dict(zip(document.indices, document.values))
+    budget = weights[encoder.term_index("budget")]
+    forecast = weights[encoder.term_index("forecast")]
+    assert forecast < budget < 2 * forecast
+    assert document.indices == sorted(document.indices)
+
+    query = encoder.encode_query("the budget and the budget")
+    assert query.indices == [encoder.term_index("budget")]
+    assert query.values == [1.0]
+    assert encoder.encode_query("the and of").indices == []
+
+
+@pytest.fixture
+def sparse_settings():
+    settings = get_settings()
+    original = (settings.enable_mrl, settings.enable_sparse_vectors)
+    settings.enable_mrl = True
+    settings.enable_sparse_vectors = True
+    yield settings
+    settings.enable_mrl, settings.enable_sparse_vectors = original
+
+
+@pytest.fixture
+async def store(sparse_settings):
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(":memory:")
+    store.use_async_client = False
+    yield store
+    store._client.close()
+
+
+TEXTS = [
+    "Quarterly budget forecast approved by finance",
+    "Vendor contract renewal blocked on legal",
+    "Team offsite planning and agenda",
+    "Kubernetes migration postponed to next sprint",
+]
+
+
+async def _seed(store, organization_id, project_id="p1"):
+    rng = np.random.default_rng(3)
+    vectors = rng.standard_normal((len(TEXTS), 768)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [str(uuid.uuid4()) for _ in TEXTS]
+    await store.insert_vectors(organization_id, [
+        PointStruct(id=ids[i], vector=vectors[i].tolist(), payload={"project_id": project_id, "text": TEXTS[i]})
+        for i in range(len(TEXTS))
+    ])
+    return ids, vectors
+
+
+@pytest.mark.asyncio
+async def test_insert_attaches_sparse_vectors(store):
+    """Content points get a sparse vector built from their text."""
+    organization_id = str(uuid.uuid4())
+    ids, _ = await _seed(store, organization_id)
+
+    collection_name = store._get_collection_name(organization_id)
+    info = store._client.get_collection(collection_name)
+    assert store.SPARSE_VECTOR_NAME in info.config.params.sparse_vectors
+
+    point = store._client.retrieve(collection_name, ids=[ids[0]], with_vectors=True)[0]
+    sparse = point.vector[store.SPARSE_VECTOR_NAME]
+    assert len(sparse.indices) == len(set(tokenize(TEXTS[0])))
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_dense_and_sparse(store):
+    """A keyword-only match and the dense nearest neighbour both surface; other projects never do."""
+    organization_id = str(uuid.uuid4())
+    ids, vectors = await _seed(store, organization_id)
+    other_ids, _ = await _seed(store, organization_id, project_id="p2")
+
+    # Dense query points at chunk 2; the text matches chunk 3 only
+    results = await store.search_hybrid(
+        organization_id=organization_id,
+        query_vector=vectors[2],
+        query_text="kubernetes migration",
+        limit=4,
+        filter_dict={"project_id": "p1"}
+    )
+
+    returned = [r["id"] for r in results]
+    assert set(returned[:2]) == {ids[2], ids[3]}
+    assert not set(returned) & set(other_ids)
+    assert all(r["payload"]["project_id"] == "p1" for r in results)
+    assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_collection_without_sparse_vector(store):
+    """Collections created before sparse vectors existed: dense-only insert, no fusion."""
+    organization_id = str(uuid.uuid4())
+    for collection_type in (store.CONTENT_COLLECTION, store.SUMMARIES_COLLECTION):
+        store._client.create_collection(
+            store._get_collection_name(organization_id, collection_type),
+            vectors_config={
+                f"vector_{dim}": VectorParams(size=dim, distance=Distance.COSINE)
+                for dim in get_settings().mrl_dimensions_list
+            }
+        )
+
+    ids, vectors = await _seed(store, organization_id)
+    assert len(await store.search_vectors(organization_id, vectors[0], limit=4)) == 4
+
+    assert await store.search_hybrid(
+        organization_id=organization_id,
+        query_vector=vectors[0],
+        query_text="budget"
+    ) is None
@@ -0,0 +1,141 @@
+"""
+Unit tests for AdvancedTranscriptProcessor speaker turn extraction.
+
+Tests cover:
+- Turn positions match the text of all previous turns joined with spaces
+- Batch keyword tagging matches per-text substring checks (including overlapping keywords)
+- Batch sentiment matches the per-turn lexicon scores
+- Decision/action extraction on pre-tagged turns
+- Regression benchmark: a 5,000-turn transcript is extracted in linear time
+"""
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from services.transcription.advanced_transcript_parser import (
+    NEGATIVE_WORDS, POSITIVE_WORDS, AdvancedTranscriptProcessor, keyword_presence
+)
+
+VOCABULARY = (
+    "we agree the budget is good but there is an issue with the timeline no one "
+    "decided yet so alice will follow up next week and bob must review the problem "
+    "i disagree this is wrong we know the plan is perfect yes approved final"
+).split()
+
+
+def _dialogue(turn_count, seed=0):
+    rng = random.Random(seed)
+    speakers = ["Alice", "Bob", "Carol Smith", "Dan"]
+    dialogue = []
+    for i in range(turn_count):
+        text = " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(3, 25)))
+        if i % 97 == 5:
+            text = "   "  # Empty turns are skipped
+        dialogue.append({
+            "speaker": speakers[i % len(speakers)],
+            "text": text,
+            "timestamp": f"[{(i // 60) % 24:02d}:{i % 60:02d}]",
+        })
+    return SimpleNamespace(dialogue=dialogue)
+
+
+@pytest.fixture
+def processor():
+    processor = AdvancedTranscriptProcessor()
+    processor.nlp_model = object()  # Enables sentiment tagging without loading spaCy
+    processor.sentence_transformer = None
+    return processor
+
+
+def _reference_sentiment(text):
+    text_lower = text.lower()
+    positive = sum(1 for word in POSITIVE_WORDS if word in text_lower)
+    negative = sum(1 for word in NEGATIVE_WORDS if word in text_lower)
+    if positive > negative:
+        return "positive"
+    if negative > positive:
+        return "negative"
+    return "neutral"
+
+
+@pytest.mark.asyncio
+async def test_positions_match_joined_text(processor):
+    """start/end positions index into the turn texts joined with single spaces."""
+    parsed = _dialogue(300)
+    turns = await processor._extract_speaker_turns(parsed)
+
+    texts = [entry["text"] for entry in parsed.dialogue if entry["text"].strip()]
+    joined = " ".join(texts)
+    assert [turn.text for turn in turns] == texts
+    assert [turn.turn_index for turn in turns] == list(range(len(texts)))
+    for k, turn in enumerate(turns):
+        assert turn.start_position == len(" ".join(texts[:k]))
+        assert turn.end_position == turn.start_position + len(turn.text)
+    # start_position points at the separating space before a turn (0 for the first)
+    assert joined[turns[-1].start_position + 1:turns[-1].end_position + 1] == turns[-1].text
+    assert turns[0].segment_id == "turn_000_alice"
+
+
+def test_keyword_presence_matches_substring_checks():
+    """Overlapping keywords ('agree' in 'disagree', 'no' in 'know') are all detected."""
+    texts = ["i disagree", "we know", "", "no", "need to follow up", "nothing here"]
+    keywords = ["agree", "disagree", "no", "need to", "follow up", "absent"]
+
+    presence = keyword_presence(texts, keywords)
+
+    assert presence.shape == (len(texts), len(keywords))
+    assert presence.tolist() == [[keyword in text for keyword in keywords] for text in texts]
+    assert keyword_presence([], keywords).shape == (0, len(keywords))
+
+
+@pytest.mark.asyncio
+async def test_sentiment_matches_per_turn_lexicon(processor):
+    """Batch sentiment equals scoring each turn on its own."""
+    turns = await processor._extract_speaker_turns(_dialogue(500, seed=3))
+
+    assert [turn.sentiment for turn in turns] == [_reference_sentiment(turn.text) for turn in turns]
+    assert processor._analyze_sentiment("Great, I Agree") == "positive"
+
+    processor.nlp_model = None
+    assert all(turn.sentiment is None for turn in await processor._extract_speaker_turns(_dialogue(10)))
+
+
+@pytest.mark.asyncio
+async def test_decisions_and_actions_use_tagged_indicators(processor):
+    """Indicators keep keyword order; related participants come from neighbouring turns."""
+    turns = await processor._extract_speaker_turns(SimpleNamespace(dialogue=[
+        {"speaker": "Alice", "text": "Status is fine", "timestamp": ""},
+        {"speaker": "Bob", "text": "We agreed and decided on the final plan", "timestamp": ""},
+        {"speaker": "Carol", "text": "I will send the notes", "timestamp": ""},
+    ]))
+    segments = processor._fallback_topic_segmentation(turns)
+
+    decisions = await processor._extract_decision_points(turns, segments)
+    actions = await processor._extract_action_items(turns, segments)
+
+    assert [d.context for d in decisions] == [turns[1].text]
+    assert decisions[0].participants == ["Bob", "Alice", "Carol"]
+    assert decisions[0].related_topic == segments[0].topic_name
+    assert turns[2].text in [a.context for a in actions]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_5000_turns_is_linear(processor):
+    """Regression benchmark: 5,000 turns extract in well under a second and scale linearly."""
+    small, large = _dialogue(1000, seed=1), _dialogue(5000, seed=2)
+
+    async def timed(parsed):
+        start = time.perf_counter()
+        turns = await processor._extract_speaker_turns(parsed)
+        return time.perf_counter() - start, len(turns)
+
+    small_time = min([(await timed(small))[0] for _ in range(3)])
+    large_time, large_count = min([await timed(large) for _ in range(3)])
+
+    assert large_count > 4900
+    assert large_time < 1.0
+    # Quadratic bookkeeping would make 5x the turns cost ~25x
+    assert large_time < small_time * 12
@@ -0,0 +1,197 @@
+"""
+Unit tests for the dependency-aware stage runner.
+
+Tests cover:
+- Dependents start once their inputs are ready; independent stages overlap
+- A failed stage is recorded and its dependents receive None
+- Per-stage timings are recorded
+- Unknown or duplicate stages are rejected
+- Cancellation stops every stage
+- Content post-processing loads and syncs project items only for meetings, each stage on
+  its own short-lived session
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.core.stage_runner import Stage, StageRunner
+
+
+@pytest.mark.asyncio
+async def test_dependents_run_concurrently_after_inputs():
+    """Description and item sync both wait for the summary, then run side by side."""
+    events = []
+
+    async def summary():
+        events.append("summary:start")
+        await asyncio.sleep(0.01)
+        events.append("summary:end")
+        return {"id": "s1"}
+
+    async def existing_items():
+        events.append("existing_items")
+        return ["risk"]
+
+    def dependent(name):
+        async def run(**inputs):
+            events.append(f"{name}:start")
+            await asyncio.sleep(0.05)
+            events.append(f"{name}:end")
+            return inputs
+        return run
+
+    runner = StageRunner([
+        Stage("summary", summary),
+        Stage("existing_items", existing_items),
+        Stage("description", dependent("description"), depends_on=("summary",)),
+        Stage("item_sync", dependent("item_sync"), depends_on=("summary", "existing_items")),
+    ])
+    results = await runner.run()
+
+    assert results["description"] == {"summary": {"id": "s1"}}
+    assert results["item_sync"] == {"summary": {"id": "s1"}, "existing_items": ["risk"]}
+    # Loading existing items overlaps the summary; both dependents start before either ends
+    assert events.index("existing_items") < events.index("summary:end")
+    assert events[events.index("summary:end") + 1:][:2] == ["description:start", "item_sync:start"]
+    assert set(runner.timings_ms) == {"summary", "existing_items", "description", "item_sync"}
+    assert runner.timings_ms["description"] >= 40
+
+
+@pytest.mark.asyncio
+async def test_failed_stage_passes_none_to_dependents():
+    """A failing stage doesn't stop the run; dependents see None."""
+    async def summary():
+        raise RuntimeError("overloaded")
+
+    async def description(summary):
+        return f"summary={summary}"
+
+    runner = StageRunner([
+        Stage("summary", summary),
+        Stage("description", description, depends_on=("summary",)),
+    ])
+    results = await runner.run()
+
+    assert results == {"summary": None, "description": "summary=None"}
+    assert isinstance(runner.errors["summary"], RuntimeError)
+    assert "summary" in runner.timings_ms
+
+
+def test_invalid_stage_graph():
+    """Dependencies must be declared first; names are unique."""
+    async def noop(**_):
+        return None
+
+    with pytest.raises(ValueError, match="undeclared"):
+        StageRunner([Stage("description", noop, depends_on=("summary",)), Stage("summary", noop)])
+    with pytest.raises(ValueError, match="Duplicate"):
+        StageRunner([Stage("summary", noop), Stage("summary", noop)])
+
+
+@pytest.mark.asyncio
+async def test_cancellation_stops_all_stages():
+    """A cancelled stage (e.g. job cancelled by the user) cancels its siblings and propagates."""
+    sibling_cancelled = asyncio.Event()
+
+    async def summary():
+        raise asyncio.CancelledError("Job cancelled")
+
+    async def existing_items():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    runner = StageRunner([Stage("summary", summary), Stage("existing_items", existing_items)])
+    with pytest.raises(asyncio.CancelledError):
+        await runner.run()
+    assert sibling_cancelled.is_set()
+
+
+async def _post_process(content_type):
+    """Run content processing with indexing stubbed out; returns the stage/session event log."""
+    from models.content import Content
+    from services.core.content_service import ChunkIndexPlan, ContentService
+
+    content = Content(
+        id=uuid.uuid4(), project_id=uuid.uuid4(), content_type=content_type,
+        title="Weekly sync", content="Budget review. " * 50, chunk_count=0
+    )
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = content
+    result.first.return_value = None
+    session = MagicMock(execute=AsyncMock(return_value=result), commit=AsyncMock())
+    events = []
+
+    @asynccontextmanager
+    async def db_context():
+        events.append("session:open")
+        try:
+            yield MagicMock()
+        finally:
+            events.append("session:close")
+
+    async def generate_summary(**kwargs):
+        events.append("summary:start")
+        await asyncio.sleep(0.01)
+        events.append("summary:end")
+        return {"id": "s1"}
+
+    async def existing_items(session, project_id):
+        events.append("existing_items")
+        return {"risks": [], "blockers": [], "tasks": [], "lessons": []}
+
+    sync = AsyncMock(return_value={"risks_synced": 0, "tasks_synced": 0, "lessons_synced": 0})
+    with patch("services.cache.project_scope_cache.project_scope_cache.get_organization_id",
+               AsyncMock(return_value="org-1")), \
+         patch.object(ContentService, "_plan_chunk_indexing", AsyncMock(return_value=ChunkIndexPlan())), \
+         patch("db.multi_tenant_vector_store.multi_tenant_vector_store.update_payloads", AsyncMock()), \
+         patch("services.core.content_service.settings.enable_multilingual", False), \
+         patch("db.database.get_db_context", db_context), \
+         patch("services.summaries.summary_service_refactored.summary_service.generate_meeting_summary",
+               generate_summary), \
+         patch("services.sync.project_items_sync_service.project_items_sync_service.get_existing_project_items",
+               existing_items), \
+         patch("services.sync.project_items_sync_service.project_items_sync_service.sync_items_from_summary", sync), \
+         patch("services.hierarchy.project_service.ProjectService.get_description_change_history",
+               AsyncMock(return_value=[])), \
+         patch("services.intelligence.project_description_service.project_description_analyzer"
+               ".should_trigger_analysis", MagicMock(return_value=False)):
+        await ContentService.process_content_async(session, content.id)
+    return events, sync
+
+
+@pytest.mark.asyncio
+async def test_non_meeting_content_skips_item_stages():
+    """Only the description stage opens a session for non-meeting content, after the summary stage."""
+    pytest.importorskip("sentence_transformers")
+    from models.content import ContentType
+
+    events, sync = await _post_process(ContentType.EMAIL)
+
+    assert events == ["session:open", "session:close"]
+    sync.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_meeting_item_sessions_are_short_lived():
+    """Existing items are read on a session closed before the summary ends; sync opens its own."""
+    pytest.importorskip("sentence_transformers")
+    from models.content import ContentType
+
+    events, sync = await _post_process(ContentType.MEETING)
+
+    items_close = events.index("session:close", events.index("existing_items"))
+    assert items_close < events.index("summary:end")
+    # Before the summary ends only the existing-items session was ever opened
+    assert events[:events.index("summary:end")].count("session:open") == 1
+    # Description and item sync each get their own session once the summary is ready
+    assert events[events.index("summary:end"):].count("session:open") == 2
+    assert events.count("session:open") == events.count("session:close") == 3
+    sync.assert_awaited_once()
+    assert sync.call_args.kwargs["existing_items"]["risks"] == []
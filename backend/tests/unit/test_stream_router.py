@@ -47,7 +47,14 @@ def mock_embedding_service():
                 embedding = (np.array(embedding) / norm).tolist()
             return embedding
 
+        async def encode_array(texts, normalize: bool = True, **kwargs):
+            return np.array(
+                [await generate_embedding(text, normalize) for text in texts],
+                dtype=np.float32
+            )
+
         mock.generate_embedding = AsyncMock(side_effect=generate_embedding)
+        mock.encode_array = AsyncMock(side_effect=encode_array)
         yield mock
 
 
@@ -0,0 +1,116 @@
+"""
+Unit tests for MultiTenantVectorStore.search_vectors_two_stage.
+
+Tests cover:
+- Project filter applied to both the 128d prefetch and the 768d rescoring
+- Results are the 768d-ranked prefetch candidates, limited to final_limit
+- Fallback to single-stage search when MRL is disabled
+"""
+
+import uuid
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+from config import get_settings
+from db.multi_tenant_vector_store import MultiTenantVectorStore
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def mrl_enabled():
+    settings = get_settings()
+    original = settings.enable_mrl
+    settings.enable_mrl = True
+    yield settings
+    settings.enable_mrl = original
+
+
+@pytest.fixture
+async def store(mrl_enabled):
+    store = MultiTenantVectorStore()
+    store._client = QdrantClient(":memory:")
+    store.use_async_client = False
+    yield store
+    store._client.close()
+
+
+async def _seed(store, organization_id: str, vectors: np.ndarray, project_ids):
+    await store.ensure_organization_collections(organization_id)
+    ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
+    await store.insert_vectors(organization_id, [
+        PointStruct(
+            id=ids[i],
+            vector=store.build_mrl_vectors(vectors[i]),
+            payload={"project_id": project_ids[i], "chunk_index": i}
+        )
+        for i in range(len(vectors))
+    ])
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_project_filter_applies_to_both_stages(store):
+    """Closer points from another project never displace in-project candidates."""
+    rng = np.random.default_rng(0)
+    query = _unit(rng.standard_normal(768).astype(np.float32))
+
+    # Other project's points are near-duplicates of the query
+    other = np.stack([_unit(query + 0.001 * rng.standard_normal(768).astype(np.float32)) for _ in range(20)])
+    mine = np.stack([_unit(query + 0.03 * rng.standard_normal(768).astype(np.float32)) for _ in range(5)])
+    organization_id = str(uuid.uuid4())
+    ids = await _seed(store, organization_id, np.vstack([other, mine]), ["other"] * 20 + ["mine"] * 5)
+
+    results = await store.search_vectors_two_stage(
+        organization_id=organization_id,
+        query_vector=query,
+        initial_limit=10,
+        final_limit=5,
+        filter_dict={"project_id": "mine"}
+    )
+
+    assert {r["id"] for r in results} == set(ids[20:])
+    assert all(r["payload"]["project_id"] == "mine" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_results_ranked_by_full_dimension_scores(store):
+    """Final results are ordered by exact 768d cosine and limited to final_limit."""
+    rng = np.random.default_rng(1)
+    vectors = np.stack([_unit(rng.standard_normal(768).astype(np.float32)) for _ in range(30)])
+    query = _unit(vectors[0] + 0.3 * rng.standard_normal(768).astype(np.float32))
+    organization_id = str(uuid.uuid4())
+    ids = await _seed(store, organization_id, vectors, ["p"] * 30)
+
+    results = await store.search_vectors_two_stage(
+        organization_id=organization_id,
+        query_vector=query.tolist(),
+        initial_limit=30,
+        final_limit=3,
+        filter_dict={"project_id": "p"}
+    )
+
+    expected = np.argsort(-(vectors @ query))[:3]
+    assert [r["id"] for r in results] == [ids[i] for i in expected]
+    np.testing.assert_allclose([r["score"] for r in results], (vectors @ query)[expected], rtol=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_single_stage_without_mrl(store, mrl_enabled):
+    """With MRL disabled the call delegates to search_vectors."""
+    mrl_enabled.enable_mrl = False
+    calls = []
+
+    async def fake_search_vectors(**kwargs):
+        calls.append(kwargs)
+        return []
+
+    store.search_vectors = fake_search_vectors
+    await store.search_vectors_two_stage(organization_id="org", query_vector=[0.1] * 768, final_limit=7)
+
+    assert calls and calls[0]["limit"] == 7